@@ -0,0 +1,9 @@
+#!/bin/sh
+cd ..
+
+# Runs the pure-Python Astron stand-in in place of astrond.
+MESSAGE_DIRECTOR_IP="127.0.0.1:7199"
+CLIENT_AGENT_IP="0.0.0.0:7198"
+
+python3 -m otp.astron.AstronStart --messagedirector-ip ${MESSAGE_DIRECTOR_IP} \
+               --clientagent-ip ${CLIENT_AGENT_IP}
@@ -8,6 +8,9 @@ MESSAGE_DIRECTOR_IP="127.0.0.1:7199"
 EVENT_LOGGER_IP="127.0.0.1:7197"
 DISTRICT_NAME="Toon Valley"
 
+# Compile the quest tables, if Quests.py changed since they last were.
+python3 -m toontown.quest.QuestTableCache
+
 python3 -m toontown.ai.AIStart --base-channel ${BASE_CHANNEL} \
                --max-channels ${MAX_CHANNELS} --stateserver ${STATE_SERVER} \
                --messagedirector-ip ${MESSAGE_DIRECTOR_IP} \
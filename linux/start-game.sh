@@ -3,4 +3,7 @@ cd ..
 
 export LOGIN_TOKEN=dev
 
+# Compile the quest tables, if Quests.py changed since they last were.
+python3 -m toontown.quest.QuestTableCache
+
 python3 -m toontown.launcher.QuickStartLauncher
@@ -12,6 +12,7 @@ from direct.interval.IntervalManager import ivalMgr
 from direct.task import Task
 from direct.showbase import EventManager
 from direct.showbase import ExceptionVarDump
+import bisect
 import math
 import sys
 import time
@@ -19,6 +20,9 @@ import gc
 
 class AIBase:
     notify = directNotify.newCategory('AIBase')
+    # Upper bounds, in milliseconds, of the frame time and sleep time
+    # histogram buckets; the last bucket catches everything longer.
+    FrameTimeBuckets = (0.5, 1, 2, 5, 10, 20, 40, 80, 160, 320)
 
     def __init__(self):
         self.config = DConfig
@@ -37,6 +41,18 @@ class AIBase:
         self.AISleep = self.config.GetFloat('ai-sleep', 0.04)
         self.AIRunningNetYield = self.config.GetBool('ai-running-net-yield', 0)
         self.AIForceSleep = self.config.GetBool('ai-force-sleep', 0)
+        self.AIAdaptiveSleep = self.config.GetBool('ai-adaptive-sleep', 1)
+        self.AIMinTick = self.config.GetFloat('ai-min-tick', 0.005)
+        self.AINetPollInterval = self.config.GetFloat('ai-net-poll-interval', 0.01)
+        self.frameStatsPeriod = self.config.GetFloat('ai-frame-stats-period', 0)
+        self.frameStartTime = 0.0
+        # Never reset, unlike the histograms resetFrameStats clears, so
+        # the performance counters can export them as cumulative.
+        self.allFrameTimes = [0] * (len(self.FrameTimeBuckets) + 1)
+        self.allSleepTimes = [0] * (len(self.FrameTimeBuckets) + 1)
+        self.allFrameTime = 0.0
+        self.allSleepTime = 0.0
+        self.resetFrameStats()
         self.eventMgr = eventMgr
         self.messenger = messenger
         self.bboard = bulletinBoard
@@ -129,6 +145,54 @@ class AIBase:
             time.sleep(delta)
             delta = minFinTime - globalClock.getRealTime()
 
+    def resetFrameStats(self):
+        self.frameTimes = [0] * (len(self.FrameTimeBuckets) + 1)
+        self.sleepTimes = [0] * (len(self.FrameTimeBuckets) + 1)
+        self.totalFrameTime = 0.0
+        self.totalSleepTime = 0.0
+        self.maxFrameTime = 0.0
+
+    def recordFrame(self, frameTime, sleepTime):
+        frameBucket = bisect.bisect_left(self.FrameTimeBuckets, frameTime * 1000.0)
+        sleepBucket = bisect.bisect_left(self.FrameTimeBuckets, sleepTime * 1000.0)
+        self.frameTimes[frameBucket] += 1
+        self.sleepTimes[sleepBucket] += 1
+        self.allFrameTimes[frameBucket] += 1
+        self.allSleepTimes[sleepBucket] += 1
+        self.totalFrameTime += frameTime
+        self.totalSleepTime += sleepTime
+        self.allFrameTime += frameTime
+        self.allSleepTime += sleepTime
+        if frameTime > self.maxFrameTime:
+            self.maxFrameTime = frameTime
+
+    def formatFrameStats(self):
+        numFrames = sum(self.frameTimes)
+        if not numFrames:
+            return 'No frames recorded; ai-adaptive-sleep is off.'
+
+        totalTime = self.totalFrameTime + self.totalSleepTime
+        lines = ['%d frames, mean frame %0.2f ms, max frame %0.2f ms, %0.1f%% of the time asleep' % (
+            numFrames, self.totalFrameTime * 1000.0 / numFrames, self.maxFrameTime * 1000.0,
+            self.totalSleepTime * 100.0 / totalTime if totalTime else 0.0)]
+        lines.append('  %14s %14s %14s' % ('', 'frame time', 'sleep time'))
+        lowerBound = 0
+        for upperBound, frameCount, sleepCount in zip(self.FrameTimeBuckets + (None,), self.frameTimes, self.sleepTimes):
+            if frameCount or sleepCount:
+                if upperBound is None:
+                    bucket = '> %s ms' % lowerBound
+                else:
+                    bucket = '%s - %s ms' % (lowerBound, upperBound)
+                lines.append('  %14s %14d %14d' % (bucket, frameCount, sleepCount))
+            lowerBound = upperBound
+
+        return '\n'.join(lines)
+
+    def __logFrameStats(self, task):
+        self.notify.info(self.formatFrameStats())
+        self.resetFrameStats()
+        return Task.again
+
     def createStats(self, hostname = None, port = None):
         if not self.wantStats:
             return False
@@ -145,8 +209,60 @@ class AIBase:
         time.sleep(self.AISleep)
         return Task.cont
 
+    def __adaptiveSleepTask(self, task):
+        # Runs at the end of every frame in place of __sleepCycleTask when
+        # ai-adaptive-sleep is on.  Rather than always sleeping ai-sleep,
+        # we start the next frame as soon as a task is due or a datagram
+        # comes in, but no sooner than ai-min-tick after this frame
+        # started, and no later than ai-sleep after it ended.
+        now = globalClock.getRealTime()
+        minWakeTime = self.frameStartTime + self.AIMinTick
+        maxWakeTime = now + self.AISleep
+        # igLoop has ticked the clock already, so the tasks that are due
+        # in the next frame are still in the sleeping list.
+        nextWakeTime = self.taskMgr.mgr.getNextWakeTime()
+        if 0 <= nextWakeTime < maxWakeTime:
+            maxWakeTime = max(nextWakeTime, minWakeTime)
+
+        delta = minWakeTime - now
+        if delta > 0:
+            time.sleep(delta)
+
+        air = getattr(self, 'air', None)
+        if air is not None and air.readerPollTaskObj is not None:
+            # Any datagrams after the first are read by the reader poll
+            # task in the next frame.
+            while not air.readerPollOnce():
+                delta = maxWakeTime - globalClock.getRealTime()
+                if delta <= 0:
+                    break
+
+                self.__waitForNetwork(air, delta)
+        else:
+            delta = maxWakeTime - globalClock.getRealTime()
+            if delta > 0:
+                time.sleep(delta)
+
+        frameTime = now - self.frameStartTime
+        self.frameStartTime = globalClock.getRealTime()
+        self.recordFrame(frameTime, self.frameStartTime - now)
+        return Task.cont
+
+    def __waitForNetwork(self, air, timeout):
+        # Blocks until the repository's connection has data to read, or
+        # for timeout seconds.  Only the native connection the internal
+        # repositories use has a socket we can block on; the NET reader's
+        # waitForReaders wakes every few milliseconds anyway, so the other
+        # connect methods are polled every ai-net-poll-interval.
+        if air.connectMethod == air.CM_NATIVE:
+            air.getBdc().WaitForNetworkReadEvent(timeout)
+        else:
+            time.sleep(min(timeout, self.AINetPollInterval))
+
     def __resetPrevTransform(self, state):
-        PandaNode.resetAllPrevTransform()
+        # Nothing is rendered without a window.
+        if self.graphicsEngine.getNumWindows():
+            PandaNode.resetAllPrevTransform()
         return Task.cont
 
     def __ivalLoop(self, state):
@@ -154,13 +270,21 @@ class AIBase:
         return Task.cont
 
     def __igLoop(self, state):
-        self.graphicsEngine.renderFrame()
+        if self.graphicsEngine.getNumWindows():
+            self.graphicsEngine.renderFrame()
+        else:
+            # Without a window to render, all renderFrame would do is
+            # tick the clock and PStats.
+            globalClock.tick()
+            if self.wantStats:
+                PStatClient.mainTick()
         return Task.cont
 
     def shutdown(self):
         self.taskMgr.remove('ivalLoop')
         self.taskMgr.remove('igLoop')
         self.taskMgr.remove('aiSleep')
+        self.taskMgr.remove('aiFrameStats')
         self.eventMgr.shutdown()
 
     def restart(self):
@@ -168,7 +292,12 @@ class AIBase:
         self.taskMgr.add(self.__resetPrevTransform, 'resetPrevTransform', priority=-51)
         self.taskMgr.add(self.__ivalLoop, 'ivalLoop', priority=20)
         self.taskMgr.add(self.__igLoop, 'igLoop', priority=50)
-        if self.AISleep >= 0 and (not self.AIRunningNetYield or self.AIForceSleep):
+        if self.AISleep >= 0 and self.AIAdaptiveSleep:
+            self.frameStartTime = globalClock.getRealTime()
+            self.taskMgr.add(self.__adaptiveSleepTask, 'aiSleep', priority=55)
+            if self.frameStatsPeriod > 0:
+                self.taskMgr.doMethodLater(self.frameStatsPeriod, self.__logFrameStats, 'aiFrameStats')
+        elif self.AISleep >= 0 and (not self.AIRunningNetYield or self.AIForceSleep):
             self.taskMgr.add(self.__sleepCycleTask, 'aiSleep', priority=55)
         self.eventMgr.restart()
 
@@ -0,0 +1,100 @@
+from panda3d.direct import DCFile
+
+from direct.directnotify import DirectNotifyGlobal
+from direct.task import Task
+from otp.astron.ClientAgent import ClientAgent
+from otp.astron.DatabaseServer import DatabaseServer
+from otp.astron.FieldPacker import FieldPacker
+from otp.astron.MessageDirector import MessageDirector
+from otp.astron.StandInNetwork import StandInNetwork
+from otp.astron.StateServer import StateServer
+
+# These mirror astron/config/astrond.yml.
+STATESERVER_CONTROL = 4002
+DATABASE_CONTROL = 4003
+DATABASE_MIN_DOID = 100000000
+DATABASE_MAX_DOID = 399999999
+CLIENT_MIN_CHANNEL = 1000000000
+CLIENT_MAX_CHANNEL = 1009999999
+
+# (doId, dclass name, anonymous)
+UBERDOGS = (
+    (4688, 'CentralLogger', False),
+    (4501, 'FriendManager', False),
+    (4686, 'AvatarFriendsManager', False),
+    (4687, 'TTPlayerFriendsManager', False),
+    (4707, 'ToontownFriendsManager', False),
+    (4712, 'TTSpeedchatRelay', False),
+    (4683, 'DistributedDeliveryManager', False),
+    (4695, 'TTCodeRedemptionMgr', False),
+    (4670, 'AstronLoginManager', True),
+    (4681, 'ChatHandler', False),
+)
+
+
+class AstronStandIn:
+    """
+    A pure-Python stand-in for the astrond cluster in astron/config:
+    a message director, state server, database server (with its dbss)
+    and client agent, all running on this process's task manager.
+
+    The AI, UberDOG and game client connect to it exactly as they would
+    to astrond, or an in-process harness can talk to the message director
+    and client agent directly; see AstronStandInBenchmark.  The database
+    lives in memory only, so nothing survives a restart.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('AstronStandIn')
+
+    def __init__(self, dcFileNames=None, version=None):
+        self.dcFile = DCFile()
+        if dcFileNames is None:
+            if not self.dcFile.readAll():
+                self.notify.error('Could not read DC files.')
+        else:
+            for dcFileName in dcFileNames:
+                if not self.dcFile.read(dcFileName):
+                    self.notify.error('Could not read DC file %s.' % dcFileName)
+
+        if version is None:
+            version = config.GetString('server-version', 'no_version_set')
+
+        self.fieldPacker = FieldPacker(self.dcFile)
+        self.network = StandInNetwork()
+        self.messageDirector = MessageDirector()
+        self.databaseServer = DatabaseServer(self.messageDirector, self.dcFile, self.fieldPacker, DATABASE_CONTROL,
+                                             DATABASE_MIN_DOID, DATABASE_MAX_DOID)
+        self.stateServer = StateServer(self.messageDirector, self.dcFile, self.fieldPacker, STATESERVER_CONTROL,
+                                       self.databaseServer, ((DATABASE_MIN_DOID, DATABASE_MAX_DOID),))
+        self.clientAgent = ClientAgent(self.messageDirector, self.stateServer, self.dcFile, self.fieldPacker,
+                                       version, CLIENT_MIN_CHANNEL, CLIENT_MAX_CHANNEL, UBERDOGS,
+                                       heartbeatTimeout=config.GetFloat('astron-standin-heartbeat-timeout', 60))
+        self.pollTask = None
+
+    def start(self, mdHost='127.0.0.1', mdPort=7199, caHost='0.0.0.0', caPort=7198):
+        """
+        Starts listening for the AI and UberDOG on mdHost:mdPort and for
+        game clients on caHost:caPort.  Pass None for a port to leave that
+        role reachable only in-process.
+        """
+        if mdPort is not None:
+            self.messageDirector.listen(self.network, mdHost, mdPort)
+
+        if caPort is not None:
+            self.clientAgent.listen(self.network, caHost, caPort)
+
+        self.clientAgent.startHeartbeatCheck()
+        # Poll before the repositories read theirs, so what we route this
+        # frame is seen by an in-process AI or UberDOG on the same frame.
+        self.pollTask = taskMgr.add(self.poll, 'astronStandInPoll', priority=-40)
+
+    def poll(self, task=None):
+        self.network.poll()
+        return Task.cont
+
+    def stop(self):
+        if self.pollTask:
+            taskMgr.remove(self.pollTask)
+            self.pollTask = None
+
+        self.clientAgent.stop()
+        self.network.shutdown()
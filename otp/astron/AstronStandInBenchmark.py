@@ -0,0 +1,224 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import random
+import time
+
+parser = argparse.ArgumentParser(description='Open Toontown - Astron stand-in benchmark')
+parser.add_argument('--toons', type=int, default=2000, help='Number of simulated toons that log in.')
+parser.add_argument('--zones', type=int, default=20, help='Number of zones the toons are spread across.')
+parser.add_argument('--updates', type=int, default=5, help='Number of position updates each toon sends.')
+parser.add_argument('--zone-changes', type=int, default=500, help='Number of zone changes that are timed.')
+parser.add_argument('config', nargs='*', default=['etc/Configrc.prc'],
+                    help='PRC file(s) to load; they name the DC files.')
+args = parser.parse_args()
+
+for prc in args.config:
+    loadPrcFile(prc)
+
+
+class game:
+    name = 'astron'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from direct.distributed.MsgTypes import *
+from direct.distributed.PyDatagram import PyDatagram
+from direct.distributed.PyDatagramIterator import PyDatagramIterator
+from otp.astron.AstronStandIn import AstronStandIn, DATABASE_CONTROL, STATESERVER_CONTROL
+from otp.astron.MessageDirector import MDParticipant
+from otp.distributed import OtpDoGlobals
+
+AI_CHANNEL = 401000000
+DISTRICT_ID = AI_CHANNEL + 1
+FIRST_ZONE = 2100
+
+
+class BenchmarkAI(MDParticipant):
+    """
+    Plays the AI and the login manager UberDOG: owns the district and
+    logs the simulated clients in onto their toons.
+    """
+
+    def __init__(self, standIn):
+        MDParticipant.__init__(self, standIn.messageDirector)
+        self.dcFile = standIn.dcFile
+        self.messageDirector.connectLocal(self)
+        self.subscribeChannel(AI_CHANNEL)
+        self.subscribeChannel(OtpDoGlobals.OTP_DO_ID_ASTRON_LOGIN_MANAGER)
+        self.createdDoIds = {}
+        self.loginRequests = []
+        self.numReceived = 0
+
+    def handleDatagram(self, datagram, channels, di):
+        self.numReceived += 1
+        sender = di.getUint64()
+        msgType = di.getUint16()
+        if msgType == DBSERVER_CREATE_OBJECT_RESP:
+            context = di.getUint32()
+            self.createdDoIds[context] = di.getUint32()
+        elif msgType == STATESERVER_OBJECT_SET_FIELD and di.getUint32() == OtpDoGlobals.OTP_DO_ID_ASTRON_LOGIN_MANAGER:
+            self.loginRequests.append(sender)
+
+    def send(self, channel, msgType, *values):
+        dg = PyDatagram()
+        dg.addServerHeader(channel, AI_CHANNEL, msgType)
+        for add, value in values:
+            add(dg, value)
+
+        self.routeDatagram(dg)
+
+    def createDistrict(self):
+        dclass = self.dcFile.getClassByName('ToontownDistrict')
+        dg = PyDatagram()
+        dg.addServerHeader(STATESERVER_CONTROL, AI_CHANNEL, STATESERVER_CREATE_OBJECT_WITH_REQUIRED)
+        dg.addUint32(DISTRICT_ID)
+        dg.addUint32(OtpDoGlobals.OTP_DO_ID_TOONTOWN)
+        dg.addUint32(OtpDoGlobals.OTP_ZONE_ID_DISTRICTS)
+        dg.addUint16(dclass.getNumber())
+        for i in range(dclass.getNumInheritedFields()):
+            field = dclass.getInheritedField(i)
+            if field.isRequired() and field.asMolecularField() is None:
+                dg.appendData(field.getDefaultValue())
+
+        self.routeDatagram(dg)
+        self.send(DISTRICT_ID, STATESERVER_OBJECT_SET_AI, (PyDatagram.addUint64, AI_CHANNEL))
+
+    def createToon(self, context):
+        dclass = self.dcFile.getClassByName('DistributedToon')
+        dg = PyDatagram()
+        dg.addServerHeader(DATABASE_CONTROL, AI_CHANNEL, DBSERVER_CREATE_OBJECT)
+        dg.addUint32(context)
+        dg.addUint16(dclass.getNumber())
+        dg.addUint16(0)
+        self.routeDatagram(dg)
+        return self.createdDoIds.pop(context)
+
+    def login(self, clientChannel, accountId, avId, zoneId):
+        puppetChannel = avId + (1001 << 32)
+        self.send(clientChannel, CLIENTAGENT_SET_STATE, (PyDatagram.addUint16, 2))
+        self.send(clientChannel, CLIENTAGENT_SET_CLIENT_ID, (PyDatagram.addUint64, puppetChannel))
+        self.send(avId, DBSS_OBJECT_ACTIVATE_WITH_DEFAULTS, (PyDatagram.addUint32, avId),
+                  (PyDatagram.addUint32, DISTRICT_ID), (PyDatagram.addUint32, zoneId))
+        self.send(puppetChannel, CLIENTAGENT_ADD_SESSION_OBJECT, (PyDatagram.addUint32, avId))
+        self.send(avId, STATESERVER_OBJECT_SET_OWNER, (PyDatagram.addUint64, puppetChannel))
+
+
+class BenchmarkClient:
+    """A simulated game client connected to the client agent in-process."""
+
+    def __init__(self, standIn):
+        self.dcFile = standIn.dcFile
+        self.dcHash = standIn.clientAgent.dcHash
+        self.connection = standIn.clientAgent.connectLocal(self.receive, self.lost)
+        self.counts = {}
+        self.ejected = False
+        self.avId = 0
+        self.zoneId = 0
+        self.nextContext = 0
+
+    def receive(self, datagram):
+        msgType = PyDatagramIterator(datagram).getUint16()
+        self.counts[msgType] = self.counts.get(msgType, 0) + 1
+        if msgType == CLIENT_EJECT:
+            self.ejected = True
+
+    def lost(self):
+        self.ejected = True
+
+    def send(self, msgType, *values):
+        dg = PyDatagram()
+        dg.addUint16(msgType)
+        for add, value in values:
+            add(dg, value)
+
+        self.connection.send(dg)
+
+    def hello(self):
+        self.send(CLIENT_HELLO, (PyDatagram.addUint32, self.dcHash),
+                  (PyDatagram.addString, config.GetString('server-version', 'no_version_set')))
+
+    def sendUpdate(self, doId, dclassName, fieldName, fieldArgs):
+        dclass = self.dcFile.getClassByName(dclassName)
+        self.connection.send(dclass.clientFormatUpdate(fieldName, doId, fieldArgs))
+
+    def setInterest(self, zoneId):
+        self.nextContext += 1
+        self.send(CLIENT_ADD_INTEREST, (PyDatagram.addUint32, self.nextContext), (PyDatagram.addUint16, 1),
+                  (PyDatagram.addUint32, DISTRICT_ID), (PyDatagram.addUint32, zoneId))
+
+    def changeZone(self, zoneId):
+        self.send(CLIENT_OBJECT_LOCATION, (PyDatagram.addUint32, self.avId), (PyDatagram.addUint32, DISTRICT_ID),
+                  (PyDatagram.addUint32, zoneId))
+        self.setInterest(zoneId)
+        self.zoneId = zoneId
+
+
+def percentile(samples, fraction):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def printTimes(name, samples):
+    if not samples:
+        return
+
+    print('%-14s %8d %10.3f %10.3f %10.3f' % (name, len(samples), sum(samples) / len(samples) * 1000.0,
+                                                percentile(samples, 0.5) * 1000.0, percentile(samples, 0.95) * 1000.0))
+
+
+standIn = AstronStandIn()
+ai = BenchmarkAI(standIn)
+ai.createDistrict()
+
+start = time.perf_counter()
+avIds = [ai.createToon(i) for i in range(args.toons)]
+createTime = time.perf_counter() - start
+
+clients = []
+loginTimes = []
+for i, avId in enumerate(avIds):
+    start = time.perf_counter()
+    client = BenchmarkClient(standIn)
+    client.hello()
+    client.sendUpdate(OtpDoGlobals.OTP_DO_ID_ASTRON_LOGIN_MANAGER, 'AstronLoginManager', 'requestLogin', ['bench'])
+    client.avId = avId
+    client.zoneId = FIRST_ZONE + i % args.zones
+    ai.login(ai.loginRequests.pop(), i + 1, avId, client.zoneId)
+    client.setInterest(client.zoneId)
+    loginTimes.append(time.perf_counter() - start)
+    clients.append(client)
+
+routedBefore = standIn.messageDirector.numRouted
+start = time.perf_counter()
+for i in range(args.updates):
+    for client in clients:
+        client.sendUpdate(client.avId, 'DistributedToon', 'setSmPos', [i, i, 0, i])
+
+updateTime = time.perf_counter() - start
+numUpdates = args.updates * len(clients)
+numDelivered = sum(client.counts.get(CLIENT_OBJECT_SET_FIELD, 0) for client in clients)
+
+zoneChangeTimes = []
+for i in range(args.zone_changes):
+    client = random.choice(clients)
+    start = time.perf_counter()
+    client.changeZone(FIRST_ZONE + random.randrange(args.zones))
+    zoneChangeTimes.append(time.perf_counter() - start)
+
+numEjected = sum(client.ejected for client in clients)
+print('%d toons in %d zones, %d DC hash 0x%x' % (args.toons, args.zones, len(standIn.stateServer.objects),
+                                                  standIn.clientAgent.dcHash))
+print('created %d toons in the database in %0.3f s' % (len(avIds), createTime))
+print('%-14s %8s %10s %10s %10s' % ('operation', 'count', 'mean ms', 'p50 ms', 'p95 ms'))
+printTimes('login', loginTimes)
+printTimes('zone change', zoneChangeTimes)
+print('%d position updates in %0.3f s: %0.0f updates/s, %0.0f client deliveries/s, %d routed by the MD' % (
+    numUpdates, updateTime, numUpdates / updateTime, numDelivered / updateTime,
+    standIn.messageDirector.numRouted - routedBefore))
+if numEjected:
+    print('%d clients were ejected.' % numEjected)
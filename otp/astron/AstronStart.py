@@ -0,0 +1,49 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+
+parser = argparse.ArgumentParser(description='Open Toontown - Astron Stand-in')
+parser.add_argument('--messagedirector-ip', default='127.0.0.1:7199',
+                    help='The IP address and port the Message Director will listen on.')
+parser.add_argument('--clientagent-ip', default='0.0.0.0:7198',
+                    help='The IP address and port the Client Agent will listen on.')
+parser.add_argument('config', nargs='*', default=['etc/Configrc.prc'],
+                    help='PRC file(s) that will be loaded on this instance.')
+args = parser.parse_args()
+
+for prc in args.config:
+    loadPrcFile(prc)
+
+class game:
+    name = 'astron'
+    process = 'server'
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from otp.astron.AstronStandIn import AstronStandIn
+
+
+def splitAddress(address, defaultPort):
+    if ':' in address:
+        host, port = address.split(':', 1)
+        return host, int(port)
+
+    return address, defaultPort
+
+
+mdHost, mdPort = splitAddress(args.messagedirector_ip, 7199)
+caHost, caPort = splitAddress(args.clientagent_ip, 7198)
+
+simbase.astron = AstronStandIn()
+simbase.astron.start(mdHost, mdPort, caHost, caPort)
+
+try:
+    run()
+except SystemExit:
+    raise
+except Exception:
+    from otp.otpbase import PythonUtil
+    print(PythonUtil.describeException())
+    raise
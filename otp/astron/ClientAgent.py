@@ -0,0 +1,666 @@
+import time
+
+from direct.directnotify import DirectNotifyGlobal
+from direct.distributed.MsgTypes import *
+from direct.distributed.PyDatagram import PyDatagram
+from direct.distributed.PyDatagramIterator import PyDatagramIterator
+from direct.task import Task
+from otp.astron.MessageDirector import MDParticipant
+from otp.astron.StateServer import AUDIENCE_CLIENT, getLocationChannel
+from otp.astron.StandInNetwork import LocalConnection
+
+CLIENT_STATE_NEW = 0
+CLIENT_STATE_ANONYMOUS = 1
+CLIENT_STATE_ESTABLISHED = 2
+
+# The reasons astrond gives when it ejects a client.
+EJECT_OVERSIZED_DATAGRAM = 106
+EJECT_NO_HELLO = 107
+EJECT_INVALID_MSGTYPE = 108
+EJECT_TRUNCATED_DATAGRAM = 109
+EJECT_ANONYMOUS_VIOLATION = 113
+EJECT_FORBIDDEN_INTEREST = 115
+EJECT_MISSING_OBJECT = 117
+EJECT_FORBIDDEN_FIELD = 118
+EJECT_FORBIDDEN_RELOCATE = 119
+EJECT_BAD_VERSION = 124
+EJECT_BAD_DCHASH = 125
+EJECT_SESSION_OBJECT_DELETED = 153
+EJECT_NO_HEARTBEAT = 345
+
+
+class Client(MDParticipant):
+    """One client connected to the client agent."""
+    notify = DirectNotifyGlobal.directNotify.newCategory('Client')
+
+    def __init__(self, clientAgent, connection, channel):
+        MDParticipant.__init__(self, clientAgent.messageDirector)
+        self.clientAgent = clientAgent
+        self.stateServer = clientAgent.stateServer
+        self.dcFile = clientAgent.dcFile
+        self.fieldPacker = clientAgent.fieldPacker
+        self.connection = connection
+        self.channel = channel
+        self.allocatedChannel = channel
+        self.state = CLIENT_STATE_NEW
+        self.lastHeartbeat = time.monotonic()
+        # interestId -> (parentId, set of zoneIds)
+        self.interests = {}
+        # location channel -> number of our interests that include it
+        self.interestLocations = {}
+        # doId -> dclass, for the objects we've been sent through interest.
+        self.visibleObjects = {}
+        self.ownedObjects = {}
+        self.declaredObjects = {}
+        self.sessionObjects = set()
+        # doId -> set of field numbers we may send besides the clsend ones.
+        self.sendableFields = {}
+        self.postRemoveDatagrams = []
+        self.subscribeChannel(channel)
+        clientAgent.messageDirector.connectLocal(self)
+
+    def sendDatagram(self, datagram):
+        if self.connection is not None:
+            self.connection.sendDatagram(datagram)
+
+    def eject(self, reason, message):
+        self.notify.info('Ejecting client %d: %d %s' % (self.channel, reason, message))
+        dg = PyDatagram()
+        dg.addUint16(CLIENT_EJECT)
+        dg.addUint16(reason)
+        dg.addString(message)
+        self.sendDatagram(dg)
+        self.disconnect()
+
+    def disconnect(self):
+        if self.connection is not None:
+            self.connection.close()
+
+    def handleNetworkDisconnect(self):
+        if self.connection is None:
+            return
+
+        self.connection = None
+        self.clientAgent.removeClient(self)
+        self.messageDirector.removeParticipant(self)
+        self.handleDisconnect()
+        for datagram in self.postRemoveDatagrams:
+            self.routeDatagram(datagram)
+
+        self.postRemoveDatagrams = []
+
+    def lookupObject(self, doId):
+        dclass = self.visibleObjects.get(doId) or self.ownedObjects.get(doId) or self.declaredObjects.get(doId)
+        if dclass is None:
+            uberdog = self.clientAgent.uberdogs.get(doId)
+            if uberdog is not None:
+                dclass = uberdog[0]
+            else:
+                obj = self.stateServer.objects.get(doId)
+                if obj is not None and doId in self.sessionObjects:
+                    dclass = obj.dclass
+
+        return dclass
+
+    # Messages from the client:
+
+    def handleNetworkDatagram(self, datagram):
+        di = PyDatagramIterator(datagram)
+        try:
+            msgType = di.getUint16()
+            if self.state == CLIENT_STATE_NEW:
+                if msgType == CLIENT_HELLO:
+                    self.__handleHello(di)
+                elif msgType == CLIENT_DISCONNECT:
+                    self.disconnect()
+                else:
+                    self.eject(EJECT_NO_HELLO, 'First packet is not CLIENT_HELLO')
+
+                return
+
+            handler = self.clientHandlers.get(msgType)
+            if handler is None:
+                self.eject(EJECT_INVALID_MSGTYPE, 'Unknown message type %d' % msgType)
+                return
+
+            handler(self, di)
+        except (AssertionError, ValueError):
+            self.eject(EJECT_TRUNCATED_DATAGRAM, 'Truncated or invalid datagram')
+
+    def __handleHello(self, di):
+        dcHash = di.getUint32()
+        version = di.getString()
+        if version != self.clientAgent.version:
+            self.eject(EJECT_BAD_VERSION, 'Client version mismatch: server=%s, client=%s' % (
+                self.clientAgent.version, version))
+            return
+
+        if self.clientAgent.checkHash and dcHash != self.clientAgent.dcHash:
+            self.eject(EJECT_BAD_DCHASH, 'Client DC hash mismatch: server=0x%x, client=0x%x' % (
+                self.clientAgent.dcHash, dcHash))
+            return
+
+        self.state = CLIENT_STATE_ANONYMOUS
+        dg = PyDatagram()
+        dg.addUint16(CLIENT_HELLO_RESP)
+        self.sendDatagram(dg)
+
+    def __handleDisconnect(self, di):
+        self.disconnect()
+
+    def __handleHeartbeat(self, di):
+        self.lastHeartbeat = time.monotonic()
+
+    def __checkFieldSend(self, doId, field):
+        dclass = self.lookupObject(doId)
+        if dclass is None:
+            self.eject(EJECT_MISSING_OBJECT, 'Client tried to send update to nonexistent object %d' % doId)
+            return False
+
+        if self.state != CLIENT_STATE_ESTABLISHED:
+            uberdog = self.clientAgent.uberdogs.get(doId)
+            if uberdog is None or not uberdog[1]:
+                self.eject(EJECT_ANONYMOUS_VIOLATION, 'Anonymous client tried to send update to %d' % doId)
+                return False
+
+        if field is None or dclass.getFieldByName(field.getName()) is None:
+            self.eject(EJECT_FORBIDDEN_FIELD, 'Client tried to send update for a field not in %s' % dclass.getName())
+            return False
+
+        if field.isClsend() or (field.isOwnsend() and doId in self.ownedObjects) or \
+                field.getNumber() in self.sendableFields.get(doId, ()):
+            return True
+
+        self.eject(EJECT_FORBIDDEN_FIELD, 'Client tried to send update for non-sendable field %s on %d' % (
+            field.getName(), doId))
+        return False
+
+    def __handleObjectSetField(self, di):
+        doId = di.getUint32()
+        field = self.dcFile.getFieldByIndex(di.getUint16())
+        if not self.__checkFieldSend(doId, field):
+            return
+
+        value = self.fieldPacker.readValue(di, field)
+        dg = PyDatagram()
+        dg.addServerHeader(doId, self.channel, STATESERVER_OBJECT_SET_FIELD)
+        dg.addUint32(doId)
+        dg.addUint16(field.getNumber())
+        dg.appendData(value)
+        self.routeDatagram(dg)
+
+    def __handleObjectSetFields(self, di):
+        doId = di.getUint32()
+        count = di.getUint16()
+        pairs = self.fieldPacker.readFieldPairs(di, count)
+        for field, value in pairs:
+            if not self.__checkFieldSend(doId, field):
+                return
+
+        dg = PyDatagram()
+        dg.addServerHeader(doId, self.channel, STATESERVER_OBJECT_SET_FIELDS)
+        dg.addUint32(doId)
+        dg.addUint16(count)
+        for field, value in pairs:
+            dg.addUint16(field.getNumber())
+            dg.appendData(value)
+
+        self.routeDatagram(dg)
+
+    def __handleObjectLocation(self, di):
+        doId = di.getUint32()
+        parentId = di.getUint32()
+        zoneId = di.getUint32()
+        if not self.clientAgent.relocate or doId not in self.ownedObjects:
+            self.eject(EJECT_FORBIDDEN_RELOCATE, 'Client tried to relocate %d, which it does not own' % doId)
+            return
+
+        dg = PyDatagram()
+        dg.addServerHeader(doId, self.channel, STATESERVER_OBJECT_SET_LOCATION)
+        dg.addUint32(parentId)
+        dg.addUint32(zoneId)
+        self.routeDatagram(dg)
+
+    def __checkInterest(self):
+        if self.state != CLIENT_STATE_ESTABLISHED or not self.clientAgent.addInterest:
+            self.eject(EJECT_FORBIDDEN_INTEREST, 'Client is not allowed to add interests')
+            return False
+
+        return True
+
+    def __handleAddInterest(self, di):
+        context = di.getUint32()
+        interestId = di.getUint16()
+        parentId = di.getUint32()
+        zoneId = di.getUint32()
+        if self.__checkInterest():
+            self.addInterest(interestId, parentId, {zoneId}, context)
+
+    def __handleAddInterestMultiple(self, di):
+        context = di.getUint32()
+        interestId = di.getUint16()
+        parentId = di.getUint32()
+        zoneIds = {di.getUint32() for i in range(di.getUint16())}
+        if self.__checkInterest():
+            self.addInterest(interestId, parentId, zoneIds, context)
+
+    def __handleRemoveInterest(self, di):
+        context = di.getUint32()
+        interestId = di.getUint16()
+        self.removeInterest(interestId, context)
+
+    clientHandlers = {
+        CLIENT_DISCONNECT: __handleDisconnect,
+        CLIENT_HEARTBEAT: __handleHeartbeat,
+        CLIENT_OBJECT_SET_FIELD: __handleObjectSetField,
+        CLIENT_OBJECT_SET_FIELDS: __handleObjectSetFields,
+        CLIENT_OBJECT_LOCATION: __handleObjectLocation,
+        CLIENT_ADD_INTEREST: __handleAddInterest,
+        CLIENT_ADD_INTEREST_MULTIPLE: __handleAddInterestMultiple,
+        CLIENT_REMOVE_INTEREST: __handleRemoveInterest,
+    }
+
+    # Interests:
+
+    def addInterest(self, interestId, parentId, zoneIds, context=None):
+        """
+        Opens interest interestId in zoneIds of parentId, replacing whatever
+        it was open in before, and sends the client every object it can now
+        see.  Answers with CLIENT_DONE_INTEREST_RESP if context is given.
+        """
+        if interestId in self.interests:
+            self.__closeInterest(interestId, zoneIds if self.interests[interestId][0] == parentId else set())
+
+        self.interests[interestId] = (parentId, set(zoneIds))
+        newLocations = []
+        for zoneId in zoneIds:
+            location = getLocationChannel(parentId, zoneId)
+            count = self.interestLocations.get(location, 0)
+            self.interestLocations[location] = count + 1
+            if not count:
+                self.subscribeChannel(location)
+                newLocations.append((parentId, zoneId))
+
+        for parentId, zoneId in newLocations:
+            for obj in list(self.stateServer.getZoneObjects(parentId, zoneId).values()):
+                self.__enterObject(obj)
+
+        if context is not None:
+            dg = PyDatagram()
+            dg.addUint16(CLIENT_DONE_INTEREST_RESP)
+            dg.addUint32(context)
+            dg.addUint16(interestId)
+            self.sendDatagram(dg)
+
+    def removeInterest(self, interestId, context=None):
+        if interestId in self.interests:
+            self.__closeInterest(interestId, set())
+            del self.interests[interestId]
+
+        if context is not None:
+            dg = PyDatagram()
+            dg.addUint16(CLIENT_DONE_INTEREST_RESP)
+            dg.addUint32(context)
+            dg.addUint16(interestId)
+            self.sendDatagram(dg)
+
+    def __closeInterest(self, interestId, keepZoneIds):
+        parentId, zoneIds = self.interests[interestId]
+        for zoneId in zoneIds:
+            if zoneId in keepZoneIds:
+                # It stays in the interest; don't let the count drop to zero.
+                self.interestLocations[getLocationChannel(parentId, zoneId)] -= 1
+                continue
+
+            location = getLocationChannel(parentId, zoneId)
+            count = self.interestLocations[location] - 1
+            if count:
+                self.interestLocations[location] = count
+                continue
+
+            del self.interestLocations[location]
+            self.unsubscribeChannel(location)
+            for doId in list(self.stateServer.getZoneObjects(parentId, zoneId)):
+                if doId in self.visibleObjects and doId not in self.sessionObjects:
+                    self.__leaveObject(doId)
+
+    def __enterObject(self, obj):
+        if obj.doId in self.visibleObjects:
+            return
+
+        self.visibleObjects[obj.doId] = obj.dclass
+        hasOther, entry = self.stateServer.getEntry(obj, AUDIENCE_CLIENT)
+        dg = PyDatagram()
+        dg.addUint16(CLIENT_ENTER_OBJECT_REQUIRED_OTHER if hasOther else CLIENT_ENTER_OBJECT_REQUIRED)
+        dg.appendData(entry)
+        self.sendDatagram(dg)
+
+    def __leaveObject(self, doId):
+        del self.visibleObjects[doId]
+        dg = PyDatagram()
+        dg.addUint16(CLIENT_OBJECT_LEAVING)
+        dg.addUint32(doId)
+        self.sendDatagram(dg)
+
+    # Messages from the cluster:
+
+    def handleDatagram(self, datagram, channels, di):
+        sender = di.getUint64()
+        msgType = di.getUint16()
+        clientMsgType = self.forwardedUpdates.get(msgType)
+        if clientMsgType is not None:
+            self.__forwardUpdate(datagram, sender, di, clientMsgType)
+            return
+
+        handler = self.serverHandlers.get(msgType)
+        if handler is None:
+            self.notify.warning('Received unknown message %d from %d.' % (msgType, sender))
+            return
+
+        handler(self, sender, di)
+
+    def __handleSetState(self, sender, di):
+        self.state = di.getUint16()
+
+    def __handleSetClientId(self, sender, di):
+        channel = di.getUint64()
+        if self.channel != self.allocatedChannel:
+            self.unsubscribeChannel(self.channel)
+
+        self.channel = channel
+        self.subscribeChannel(channel)
+
+    def __handleSendDatagram(self, sender, di):
+        self.sendDatagram(PyDatagram(di.getBlob()))
+
+    def __handleEject(self, sender, di):
+        reason = di.getUint16()
+        self.eject(reason, di.getString())
+
+    def __handleDrop(self, sender, di):
+        self.disconnect()
+
+    def __handleGetNetworkAddress(self, sender, di):
+        context = di.getUint32()
+        host, port = self.connection.getAddress() if self.connection else ('', 0)
+        dg = PyDatagram()
+        dg.addServerHeader(sender, self.channel, CLIENTAGENT_GET_NETWORK_ADDRESS_RESP)
+        dg.addUint32(context)
+        dg.addString(host)
+        dg.addUint16(port)
+        dg.addString(self.clientAgent.host)
+        dg.addUint16(self.clientAgent.port)
+        self.routeDatagram(dg)
+
+    def __handleDeclareObject(self, sender, di):
+        doId = di.getUint32()
+        self.declaredObjects[doId] = self.dcFile.getClass(di.getUint16())
+
+    def __handleUndeclareObject(self, sender, di):
+        self.declaredObjects.pop(di.getUint32(), None)
+
+    def __handleAddSessionObject(self, sender, di):
+        self.sessionObjects.add(di.getUint32())
+
+    def __handleRemoveSessionObject(self, sender, di):
+        self.sessionObjects.discard(di.getUint32())
+
+    def __handleSetFieldsSendable(self, sender, di):
+        doId = di.getUint32()
+        self.sendableFields[doId] = {di.getUint16() for i in range(di.getUint16())}
+
+    def __handleOpenChannel(self, sender, di):
+        self.subscribeChannel(di.getUint64())
+
+    def __handleCloseChannel(self, sender, di):
+        channel = di.getUint64()
+        if channel != self.channel and channel != self.allocatedChannel:
+            self.unsubscribeChannel(channel)
+
+    def __handleAddPostRemove(self, sender, di):
+        self.postRemoveDatagrams.append(PyDatagram(di.getBlob()))
+
+    def __handleClearPostRemoves(self, sender, di):
+        self.postRemoveDatagrams = []
+
+    def __handleServerAddInterest(self, sender, di):
+        di.getUint32()
+        interestId = di.getUint16()
+        parentId = di.getUint32()
+        self.addInterest(interestId, parentId, {di.getUint32()})
+
+    def __handleServerAddInterestMultiple(self, sender, di):
+        di.getUint32()
+        interestId = di.getUint16()
+        parentId = di.getUint32()
+        self.addInterest(interestId, parentId, {di.getUint32() for i in range(di.getUint16())})
+
+    def __handleServerRemoveInterest(self, sender, di):
+        di.getUint32()
+        self.removeInterest(di.getUint16())
+
+    def __forwardUpdate(self, datagram, sender, di, clientMsgType):
+        if sender == self.channel:
+            # Don't echo the client's own updates back to it.
+            return
+
+        # An update in a busy zone goes to every client there, so the client
+        # datagram is built once for all of them.
+        lastDatagram, doId, dg = self.clientAgent.lastForwardedUpdate
+        if lastDatagram is not datagram:
+            doId = PyDatagramIterator(datagram, di.getCurrentIndex()).getUint32()
+            dg = PyDatagram()
+            dg.addUint16(clientMsgType)
+            dg.appendData(di.getRemainingBytes())
+            self.clientAgent.lastForwardedUpdate = (datagram, doId, dg)
+
+        if self.lookupObject(doId) is not None:
+            self.sendDatagram(dg)
+
+    def __handleEnterLocation(self, sender, di):
+        doId = di.getUint32()
+        parentId = di.getUint32()
+        zoneId = di.getUint32()
+        if doId in self.visibleObjects or getLocationChannel(parentId, zoneId) not in self.interestLocations:
+            return
+
+        obj = self.stateServer.objects.get(doId)
+        if obj is not None:
+            self.__enterObject(obj)
+
+    def __enterOwner(self, di, clientMsgType):
+        entry = di.getRemainingBytes()
+        doId = di.getUint32()
+        di.getUint32()
+        di.getUint32()
+        self.ownedObjects[doId] = self.dcFile.getClass(di.getUint16())
+        dg = PyDatagram()
+        dg.addUint16(clientMsgType)
+        dg.appendData(entry)
+        self.sendDatagram(dg)
+
+    def __handleEnterOwner(self, sender, di):
+        self.__enterOwner(di, CLIENT_ENTER_OBJECT_REQUIRED_OWNER)
+
+    def __handleEnterOwnerOther(self, sender, di):
+        self.__enterOwner(di, CLIENT_ENTER_OBJECT_REQUIRED_OTHER_OWNER)
+
+    def __handleChangingLocation(self, sender, di):
+        doId = di.getUint32()
+        parentId = di.getUint32()
+        zoneId = di.getUint32()
+        if doId in self.visibleObjects and getLocationChannel(parentId, zoneId) not in self.interestLocations and \
+                doId not in self.sessionObjects:
+            self.__leaveObject(doId)
+            return
+
+        if doId in self.visibleObjects or doId in self.ownedObjects:
+            dg = PyDatagram()
+            dg.addUint16(CLIENT_OBJECT_LOCATION)
+            dg.addUint32(doId)
+            dg.addUint32(parentId)
+            dg.addUint32(zoneId)
+            self.sendDatagram(dg)
+
+    def __handleChangingOwner(self, sender, di):
+        doId = di.getUint32()
+        newOwner = di.getUint64()
+        if newOwner != self.channel and doId in self.ownedObjects:
+            del self.ownedObjects[doId]
+            dg = PyDatagram()
+            dg.addUint16(CLIENT_OBJECT_LEAVING_OWNER)
+            dg.addUint32(doId)
+            self.sendDatagram(dg)
+
+    def __handleDeleteRam(self, sender, di):
+        doId = di.getUint32()
+        if doId in self.visibleObjects:
+            self.__leaveObject(doId)
+
+        if doId in self.ownedObjects:
+            del self.ownedObjects[doId]
+            dg = PyDatagram()
+            dg.addUint16(CLIENT_OBJECT_LEAVING_OWNER)
+            dg.addUint32(doId)
+            self.sendDatagram(dg)
+
+        if doId in self.sessionObjects:
+            self.eject(EJECT_SESSION_OBJECT_DELETED, 'The session object %d has been deleted' % doId)
+
+    forwardedUpdates = {
+        STATESERVER_OBJECT_SET_FIELD: CLIENT_OBJECT_SET_FIELD,
+        STATESERVER_OBJECT_SET_FIELDS: CLIENT_OBJECT_SET_FIELDS,
+    }
+
+    serverHandlers = {
+        CLIENTAGENT_SET_STATE: __handleSetState,
+        CLIENTAGENT_SET_CLIENT_ID: __handleSetClientId,
+        CLIENTAGENT_SEND_DATAGRAM: __handleSendDatagram,
+        CLIENTAGENT_EJECT: __handleEject,
+        CLIENTAGENT_DROP: __handleDrop,
+        CLIENTAGENT_GET_NETWORK_ADDRESS: __handleGetNetworkAddress,
+        CLIENTAGENT_DECLARE_OBJECT: __handleDeclareObject,
+        CLIENTAGENT_UNDECLARE_OBJECT: __handleUndeclareObject,
+        CLIENTAGENT_ADD_SESSION_OBJECT: __handleAddSessionObject,
+        CLIENTAGENT_REMOVE_SESSION_OBJECT: __handleRemoveSessionObject,
+        CLIENTAGENT_SET_FIELDS_SENDABLE: __handleSetFieldsSendable,
+        CLIENTAGENT_OPEN_CHANNEL: __handleOpenChannel,
+        CLIENTAGENT_CLOSE_CHANNEL: __handleCloseChannel,
+        CLIENTAGENT_ADD_POST_REMOVE: __handleAddPostRemove,
+        CLIENTAGENT_CLEAR_POST_REMOVES: __handleClearPostRemoves,
+        CLIENTAGENT_ADD_INTEREST: __handleServerAddInterest,
+        CLIENTAGENT_ADD_INTEREST_MULTIPLE: __handleServerAddInterestMultiple,
+        CLIENTAGENT_REMOVE_INTEREST: __handleServerRemoveInterest,
+        STATESERVER_OBJECT_ENTER_LOCATION_WITH_REQUIRED: __handleEnterLocation,
+        STATESERVER_OBJECT_ENTER_LOCATION_WITH_REQUIRED_OTHER: __handleEnterLocation,
+        STATESERVER_OBJECT_ENTER_OWNER_WITH_REQUIRED: __handleEnterOwner,
+        STATESERVER_OBJECT_ENTER_OWNER_WITH_REQUIRED_OTHER: __handleEnterOwnerOther,
+        STATESERVER_OBJECT_CHANGING_LOCATION: __handleChangingLocation,
+        STATESERVER_OBJECT_CHANGING_OWNER: __handleChangingOwner,
+        STATESERVER_OBJECT_DELETE_RAM: __handleDeleteRam,
+    }
+
+
+class ClientAgent:
+    """
+    The stand-in's client agent.  Clients can connect over TCP, like the
+    game client does to astrond, or in-process through connectLocal(),
+    which is how benchmarks drive thousands of them without a socket each.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('ClientAgent')
+
+    def __init__(self, messageDirector, stateServer, dcFile, fieldPacker, version, minChannel, maxChannel,
+                 uberdogs=(), relocate=True, addInterest=True, heartbeatTimeout=60, checkHash=True):
+        self.messageDirector = messageDirector
+        self.stateServer = stateServer
+        self.dcFile = dcFile
+        # DCFile.getHash() walks the whole file every time it's called.
+        self.dcHash = dcFile.getHash()
+        self.fieldPacker = fieldPacker
+        self.version = version
+        self.minChannel = minChannel
+        self.maxChannel = maxChannel
+        self.nextChannel = minChannel
+        self.freeChannels = []
+        # doId -> (dclass, anonymous)
+        self.uberdogs = {}
+        for doId, className, anonymous in uberdogs:
+            dclass = dcFile.getClassByName(className)
+            if dclass is None:
+                self.notify.warning('Unknown UberDOG class %s.' % className)
+                continue
+
+            self.uberdogs[doId] = (dclass, anonymous)
+
+        self.relocate = relocate
+        self.addInterest = addInterest
+        self.heartbeatTimeout = heartbeatTimeout
+        self.checkHash = checkHash
+        self.clients = set()
+        # (routed datagram, doId, client datagram) of the last update forwarded
+        self.lastForwardedUpdate = (None, 0, None)
+        self.host = ''
+        self.port = 0
+        self.heartbeatTask = None
+
+    def listen(self, network, host, port):
+        self.host = host
+        self.port = port
+        network.listen(host, port, self.__acceptConnection)
+
+    def startHeartbeatCheck(self):
+        if self.heartbeatTimeout:
+            self.heartbeatTask = taskMgr.doMethodLater(self.heartbeatTimeout / 2.0, self.__checkHeartbeats,
+                                                       'clientAgentHeartbeats')
+
+    def stop(self):
+        if self.heartbeatTask:
+            taskMgr.remove(self.heartbeatTask)
+            self.heartbeatTask = None
+
+        for client in list(self.clients):
+            client.disconnect()
+
+    def __allocateChannel(self):
+        if self.freeChannels:
+            return self.freeChannels.pop()
+
+        if self.nextChannel > self.maxChannel:
+            return 0
+
+        channel = self.nextChannel
+        self.nextChannel += 1
+        return channel
+
+    def __acceptConnection(self, connection):
+        channel = self.__allocateChannel()
+        if not channel:
+            self.notify.warning('Out of client channels.')
+            connection.close()
+            return None
+
+        client = Client(self, connection, channel)
+        self.clients.add(client)
+        return client
+
+    def connectLocal(self, receive, disconnect=None):
+        """
+        Connects an in-process client; receive(datagram) gets everything we
+        send it.  Returns the LocalConnection, whose send() it talks to us
+        through.
+        """
+        connection = LocalConnection(receive, disconnect)
+        connection.handler = self.__acceptConnection(connection)
+        return connection
+
+    def removeClient(self, client):
+        self.clients.discard(client)
+        self.freeChannels.append(client.allocatedChannel)
+
+    def __checkHeartbeats(self, task):
+        deadline = time.monotonic() - self.heartbeatTimeout
+        for client in list(self.clients):
+            if client.lastHeartbeat < deadline:
+                client.eject(EJECT_NO_HEARTBEAT, 'Server timed out while waiting for heartbeat.')
+
+        return Task.again
@@ -0,0 +1,272 @@
+from direct.directnotify import DirectNotifyGlobal
+from direct.distributed.MsgTypes import *
+from direct.distributed.PyDatagram import PyDatagram
+from otp.astron.MessageDirector import MDParticipant
+
+
+class DatabaseObject:
+    __slots__ = ('doId', 'dclass', 'fields')
+
+    def __init__(self, doId, dclass, fields):
+        self.doId = doId
+        self.dclass = dclass
+        # field number -> packed value
+        self.fields = fields
+
+
+class DatabaseServer(MDParticipant):
+    """
+    The stand-in's database server.  It keeps every object in memory,
+    in the same form astrond's yaml backend keeps on disk: a dclass and
+    the packed values of the object's db fields.  Nothing is written out,
+    so each run starts with an empty database.
+
+    The state server reads and writes it directly to activate objects
+    and save their db fields.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('DatabaseServer')
+
+    def __init__(self, messageDirector, dcFile, fieldPacker, controlChannel, minDoId, maxDoId):
+        MDParticipant.__init__(self, messageDirector)
+        self.dcFile = dcFile
+        self.fieldPacker = fieldPacker
+        self.controlChannel = controlChannel
+        self.minDoId = minDoId
+        self.maxDoId = maxDoId
+        self.nextDoId = minDoId
+        self.objects = {}
+        # dclass -> [(field number, default value)] of its required db fields
+        self.defaultFields = {}
+        messageDirector.connectLocal(self)
+        self.subscribeChannel(controlChannel)
+
+    def allocateDoId(self):
+        if self.nextDoId > self.maxDoId:
+            return 0
+
+        doId = self.nextDoId
+        self.nextDoId += 1
+        return doId
+
+    def createObject(self, dclass, fields):
+        """
+        Stores a new object of dclass with fields, a dict of field number
+        to packed value, and returns its doId, or 0 if we're out of them.
+        Required db fields that aren't given get their default values.
+        """
+        doId = self.allocateDoId()
+        if not doId:
+            return 0
+
+        defaultFields = self.defaultFields.get(dclass)
+        if defaultFields is None:
+            defaultFields = self.defaultFields[dclass] = []
+            for i in range(dclass.getNumInheritedFields()):
+                field = dclass.getInheritedField(i)
+                if field.isDb() and field.isRequired() and field.asMolecularField() is None:
+                    defaultFields.append((field.getNumber(), field.getDefaultValue()))
+
+        for fieldNumber, value in defaultFields:
+            if fieldNumber not in fields:
+                fields[fieldNumber] = value
+
+        self.objects[doId] = DatabaseObject(doId, dclass, fields)
+        return doId
+
+    def getObject(self, doId):
+        return self.objects.get(doId)
+
+    def setFields(self, doId, fields):
+        obj = self.objects.get(doId)
+        if obj is not None:
+            obj.fields.update(fields)
+
+    def deleteObject(self, doId):
+        self.objects.pop(doId, None)
+
+    def handleDatagram(self, datagram, channels, di):
+        sender = di.getUint64()
+        msgType = di.getUint16()
+        handler = self.handlers.get(msgType)
+        if handler is None:
+            self.notify.warning('Received unknown message %d from %d.' % (msgType, sender))
+            return
+
+        try:
+            handler(self, sender, di)
+        except ValueError as e:
+            self.notify.warning('Dropped message %d from %d: %s' % (msgType, sender, e))
+
+    def __sendResponse(self, sender, msgType, context):
+        dg = PyDatagram()
+        dg.addServerHeader(sender, self.controlChannel, msgType)
+        dg.addUint32(context)
+        return dg
+
+    @staticmethod
+    def __addFields(dg, fields):
+        dg.addUint16(len(fields))
+        for fieldNumber, value in fields:
+            dg.addUint16(fieldNumber)
+            dg.appendData(value)
+
+    def __readFieldNumbers(self, di, count):
+        fields = []
+        for i in range(count):
+            field = self.dcFile.getFieldByIndex(di.getUint16())
+            if field is None:
+                raise ValueError('Unknown field.')
+
+            fields.append(field)
+
+        return fields
+
+    def __handleCreateObject(self, sender, di):
+        context = di.getUint32()
+        dclass = self.dcFile.getClass(di.getUint16())
+        pairs = self.fieldPacker.readFieldPairs(di, di.getUint16())
+        doId = self.createObject(dclass, {field.getNumber(): value for field, value in pairs})
+        dg = self.__sendResponse(sender, DBSERVER_CREATE_OBJECT_RESP, context)
+        dg.addUint32(doId)
+        self.routeDatagram(dg)
+
+    def __handleGetAll(self, sender, di):
+        context = di.getUint32()
+        obj = self.objects.get(di.getUint32())
+        dg = self.__sendResponse(sender, DBSERVER_OBJECT_GET_ALL_RESP, context)
+        if obj is None:
+            dg.addUint8(0)
+        else:
+            dg.addUint8(1)
+            dg.addUint16(obj.dclass.getNumber())
+            self.__addFields(dg, list(obj.fields.items()))
+
+        self.routeDatagram(dg)
+
+    def __handleGetField(self, sender, di):
+        context = di.getUint32()
+        obj = self.objects.get(di.getUint32())
+        fieldNumber = di.getUint16()
+        dg = self.__sendResponse(sender, DBSERVER_OBJECT_GET_FIELD_RESP, context)
+        if obj is None or fieldNumber not in obj.fields:
+            dg.addUint8(0)
+        else:
+            dg.addUint8(1)
+            dg.addUint16(fieldNumber)
+            dg.appendData(obj.fields[fieldNumber])
+
+        self.routeDatagram(dg)
+
+    def __handleGetFields(self, sender, di):
+        context = di.getUint32()
+        obj = self.objects.get(di.getUint32())
+        fieldNumbers = [di.getUint16() for i in range(di.getUint16())]
+        dg = self.__sendResponse(sender, DBSERVER_OBJECT_GET_FIELDS_RESP, context)
+        if obj is None:
+            dg.addUint8(0)
+        else:
+            dg.addUint8(1)
+            self.__addFields(dg, [(fieldNumber, obj.fields[fieldNumber]) for fieldNumber in fieldNumbers
+                                  if fieldNumber in obj.fields])
+
+        self.routeDatagram(dg)
+
+    def __handleSetField(self, sender, di):
+        doId = di.getUint32()
+        field = self.__readFieldNumbers(di, 1)[0]
+        self.setFields(doId, {field.getNumber(): self.fieldPacker.readValue(di, field)})
+
+    def __handleSetFields(self, sender, di):
+        doId = di.getUint32()
+        pairs = self.fieldPacker.readFieldPairs(di, di.getUint16())
+        self.setFields(doId, {field.getNumber(): value for field, value in pairs})
+
+    def __handleSetFieldIfEquals(self, sender, di):
+        context = di.getUint32()
+        obj = self.objects.get(di.getUint32())
+        field = self.__readFieldNumbers(di, 1)[0]
+        expected, value = self.fieldPacker.readValues(di, (field, field))
+        dg = self.__sendResponse(sender, DBSERVER_OBJECT_SET_FIELD_IF_EQUALS_RESP, context)
+        fieldNumber = field.getNumber()
+        if obj is not None and obj.fields.get(fieldNumber) == expected:
+            obj.fields[fieldNumber] = value
+            dg.addUint8(1)
+        else:
+            dg.addUint8(0)
+            if obj is not None and fieldNumber in obj.fields:
+                dg.addUint16(fieldNumber)
+                dg.appendData(obj.fields[fieldNumber])
+
+        self.routeDatagram(dg)
+
+    def __handleSetFieldsIfEquals(self, sender, di):
+        context = di.getUint32()
+        obj = self.objects.get(di.getUint32())
+        updates = []
+        for i in range(di.getUint16()):
+            field = self.__readFieldNumbers(di, 1)[0]
+            expected, value = self.fieldPacker.readValues(di, (field, field))
+            updates.append((field.getNumber(), expected, value))
+
+        dg = self.__sendResponse(sender, DBSERVER_OBJECT_SET_FIELDS_IF_EQUALS_RESP, context)
+        if obj is not None and all(obj.fields.get(fieldNumber) == expected for fieldNumber, expected, value in updates):
+            for fieldNumber, expected, value in updates:
+                obj.fields[fieldNumber] = value
+
+            dg.addUint8(1)
+        else:
+            dg.addUint8(0)
+            if obj is not None:
+                self.__addFields(dg, [(fieldNumber, obj.fields[fieldNumber]) for fieldNumber, expected, value in updates
+                                      if fieldNumber in obj.fields])
+
+        self.routeDatagram(dg)
+
+    def __handleSetFieldIfEmpty(self, sender, di):
+        context = di.getUint32()
+        obj = self.objects.get(di.getUint32())
+        field = self.__readFieldNumbers(di, 1)[0]
+        value = self.fieldPacker.readValue(di, field)
+        dg = self.__sendResponse(sender, DBSERVER_OBJECT_SET_FIELD_IF_EMPTY_RESP, context)
+        fieldNumber = field.getNumber()
+        if obj is not None and fieldNumber not in obj.fields:
+            obj.fields[fieldNumber] = value
+            dg.addUint8(1)
+        else:
+            dg.addUint8(0)
+            if obj is not None:
+                dg.addUint16(fieldNumber)
+                dg.appendData(obj.fields[fieldNumber])
+
+        self.routeDatagram(dg)
+
+    def __handleDeleteFields(self, sender, di, count=None):
+        obj = self.objects.get(di.getUint32())
+        if count is None:
+            count = di.getUint16()
+
+        for i in range(count):
+            fieldNumber = di.getUint16()
+            if obj is not None:
+                obj.fields.pop(fieldNumber, None)
+
+    def __handleDeleteField(self, sender, di):
+        self.__handleDeleteFields(sender, di, 1)
+
+    def __handleDelete(self, sender, di):
+        self.deleteObject(di.getUint32())
+
+    handlers = {
+        DBSERVER_CREATE_OBJECT: __handleCreateObject,
+        DBSERVER_OBJECT_GET_ALL: __handleGetAll,
+        DBSERVER_OBJECT_GET_FIELD: __handleGetField,
+        DBSERVER_OBJECT_GET_FIELDS: __handleGetFields,
+        DBSERVER_OBJECT_SET_FIELD: __handleSetField,
+        DBSERVER_OBJECT_SET_FIELDS: __handleSetFields,
+        DBSERVER_OBJECT_SET_FIELD_IF_EQUALS: __handleSetFieldIfEquals,
+        DBSERVER_OBJECT_SET_FIELDS_IF_EQUALS: __handleSetFieldsIfEquals,
+        DBSERVER_OBJECT_SET_FIELD_IF_EMPTY: __handleSetFieldIfEmpty,
+        DBSERVER_OBJECT_DELETE_FIELD: __handleDeleteField,
+        DBSERVER_OBJECT_DELETE_FIELDS: __handleDeleteFields,
+        DBSERVER_OBJECT_DELETE: __handleDelete,
+    }
@@ -0,0 +1,76 @@
+from panda3d.direct import DCPacker
+
+
+class FieldPacker:
+    """
+    Splits the packed field values in a datagram into one bytes object
+    per field, so the stand-in can store and forward them without ever
+    unpacking them into Python values.
+    """
+
+    def __init__(self, dcFile):
+        self.dcFile = dcFile
+
+    def readValues(self, di, fields):
+        """Reads one value for each of fields, in order, from di."""
+        data = di.getRemainingBytes()
+        packer = DCPacker()
+        packer.setUnpackData(data)
+        values = []
+        start = 0
+        for field in fields:
+            packer.beginUnpack(field)
+            packer.unpackSkip()
+            if not packer.endUnpack():
+                raise ValueError('Truncated or invalid value for %s.' % field.getName())
+
+            end = packer.getNumUnpackedBytes()
+            values.append(data[start:end])
+            start = end
+
+        di.skipBytes(start)
+        return values
+
+    def readValue(self, di, field):
+        return self.readValues(di, (field,))[0]
+
+    def readFieldPairs(self, di, count):
+        """Reads count (field number, value) pairs from di."""
+        data = di.getRemainingBytes()
+        packer = DCPacker()
+        packer.setUnpackData(data)
+        pairs = []
+        for i in range(count):
+            fieldNumber = packer.rawUnpackUint16()
+            field = self.dcFile.getFieldByIndex(fieldNumber)
+            if field is None:
+                raise ValueError('Unknown field %d.' % fieldNumber)
+
+            start = packer.getNumUnpackedBytes()
+            packer.beginUnpack(field)
+            packer.unpackSkip()
+            if not packer.endUnpack():
+                raise ValueError('Truncated or invalid value for %s.' % field.getName())
+
+            pairs.append((field, data[start:packer.getNumUnpackedBytes()]))
+
+        di.skipBytes(packer.getNumUnpackedBytes())
+        return pairs
+
+    def splitMolecular(self, field, value):
+        """Returns the (atomic field, value) pairs of a molecular field's value."""
+        molecular = field.asMolecularField()
+        atomics = [molecular.getAtomic(i) for i in range(molecular.getNumAtomics())]
+        packer = DCPacker()
+        packer.setUnpackData(value)
+        pairs = []
+        start = 0
+        for atomic in atomics:
+            packer.beginUnpack(atomic)
+            packer.unpackSkip()
+            packer.endUnpack()
+            end = packer.getNumUnpackedBytes()
+            pairs.append((atomic, value[start:end]))
+            start = end
+
+        return pairs
@@ -0,0 +1,244 @@
+from collections import deque
+
+from panda3d.core import Datagram
+
+from direct.directnotify import DirectNotifyGlobal
+from direct.distributed.MsgTypes import *
+from direct.distributed.PyDatagramIterator import PyDatagramIterator
+
+# These aren't in every version of MsgTypes.
+CONTROL_SET_CON_NAME = 9012
+CONTROL_SET_CON_URL = 9013
+CONTROL_LOG_MESSAGE = 9014
+
+
+def addServerHeaderMultiple(dg, channels, sender, msgType):
+    """Like PyDatagram.addServerHeader, for a list of recipient channels."""
+    dg.addUint8(len(channels))
+    for channel in channels:
+        dg.addChannel(channel)
+
+    dg.addChannel(sender)
+    dg.addUint16(msgType)
+
+
+class MDParticipant:
+    """
+    Something the message director delivers datagrams to: one of the
+    stand-in's own roles, a client of the client agent, or an AI or
+    UberDOG connected over the network.
+    """
+
+    def __init__(self, messageDirector):
+        self.messageDirector = messageDirector
+        self.channels = set()
+        self.ranges = []
+        # sender channel -> [datagram]
+        self.postRemoves = {}
+        self.name = ''
+        self.url = ''
+
+    def subscribeChannel(self, channel):
+        self.messageDirector.subscribeChannel(self, channel)
+
+    def unsubscribeChannel(self, channel):
+        self.messageDirector.unsubscribeChannel(self, channel)
+
+    def subscribeRange(self, low, high):
+        self.messageDirector.subscribeRange(self, low, high)
+
+    def unsubscribeRange(self, low, high):
+        self.messageDirector.unsubscribeRange(self, low, high)
+
+    def unsubscribeAll(self):
+        for channel in list(self.channels):
+            self.unsubscribeChannel(channel)
+
+        for low, high in list(self.ranges):
+            self.unsubscribeRange(low, high)
+
+    def addPostRemove(self, sender, datagram):
+        self.postRemoves.setdefault(sender, []).append(datagram)
+
+    def clearPostRemoves(self, sender):
+        self.postRemoves.pop(sender, None)
+
+    def routeDatagram(self, datagram):
+        self.messageDirector.routeDatagram(datagram, self)
+
+    def handleDatagram(self, datagram, channels, di):
+        """
+        Handles a datagram sent to one or more of our channels.  di points
+        at the sender, just past the recipient channels.
+        """
+        raise NotImplementedError
+
+    def handleDisconnect(self):
+        """Unsubscribes us and sends our post-removes."""
+        self.unsubscribeAll()
+        postRemoves = self.postRemoves
+        self.postRemoves = {}
+        for datagrams in postRemoves.values():
+            for datagram in datagrams:
+                self.routeDatagram(datagram)
+
+
+class NetworkParticipant(MDParticipant):
+    """An AI or UberDOG connected to the message director."""
+    notify = DirectNotifyGlobal.directNotify.newCategory('NetworkParticipant')
+
+    def __init__(self, messageDirector, connection):
+        MDParticipant.__init__(self, messageDirector)
+        self.connection = connection
+
+    def handleDatagram(self, datagram, channels, di):
+        self.connection.sendDatagram(datagram)
+
+    def handleNetworkDatagram(self, datagram):
+        self.routeDatagram(datagram)
+
+    def handleNetworkDisconnect(self):
+        self.notify.info('Lost %s.' % (self.name or 'a participant'))
+        self.messageDirector.removeParticipant(self)
+        self.handleDisconnect()
+
+
+class MessageDirector:
+    """
+    The stand-in's message director: routes every datagram to the
+    participants subscribed to any of its recipient channels, once each,
+    and never back to the participant that sent it.
+
+    Datagrams are queued and delivered in the order they were routed, so
+    datagrams a participant sends while handling one are delivered after
+    it, as they would be by astrond.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('MessageDirector')
+
+    def __init__(self):
+        # channel -> set of participants
+        self.subscriptions = {}
+        # [(low, high, participant)]
+        self.ranges = []
+        self.participants = set()
+        self.queue = deque()
+        self.routing = False
+        self.numRouted = 0
+
+    def listen(self, network, host, port):
+        network.listen(host, port, self.__acceptConnection)
+
+    def __acceptConnection(self, connection):
+        participant = NetworkParticipant(self, connection)
+        self.participants.add(participant)
+        return participant
+
+    def connectLocal(self, participant):
+        """Adds an in-process participant."""
+        self.participants.add(participant)
+
+    def removeParticipant(self, participant):
+        self.participants.discard(participant)
+
+    def subscribeChannel(self, participant, channel):
+        if channel in participant.channels:
+            return
+
+        participant.channels.add(channel)
+        subscribers = self.subscriptions.get(channel)
+        if subscribers is None:
+            self.subscriptions[channel] = {participant}
+        else:
+            subscribers.add(participant)
+
+    def unsubscribeChannel(self, participant, channel):
+        if channel not in participant.channels:
+            return
+
+        participant.channels.discard(channel)
+        subscribers = self.subscriptions[channel]
+        subscribers.discard(participant)
+        if not subscribers:
+            del self.subscriptions[channel]
+
+    def subscribeRange(self, participant, low, high):
+        participant.ranges.append((low, high))
+        self.ranges.append((low, high, participant))
+
+    def unsubscribeRange(self, participant, low, high):
+        if (low, high) in participant.ranges:
+            participant.ranges.remove((low, high))
+            self.ranges.remove((low, high, participant))
+
+    def routeDatagram(self, datagram, sender=None):
+        self.queue.append((datagram, sender))
+        if self.routing:
+            return
+
+        self.routing = True
+        try:
+            while self.queue:
+                self.__deliver(*self.queue.popleft())
+        finally:
+            self.routing = False
+
+    def __deliver(self, datagram, origin):
+        self.numRouted += 1
+        di = PyDatagramIterator(datagram)
+        numChannels = di.getUint8()
+        channels = [di.getUint64() for i in range(numChannels)]
+        if numChannels == 1 and channels[0] == CONTROL_CHANNEL:
+            if origin is not None:
+                self.__handleControl(origin, di)
+
+            return
+
+        recipients = set()
+        for channel in channels:
+            subscribers = self.subscriptions.get(channel)
+            if subscribers:
+                recipients.update(subscribers)
+
+            for low, high, participant in self.ranges:
+                if low <= channel <= high:
+                    recipients.add(participant)
+
+        recipients.discard(origin)
+        if not recipients:
+            return
+
+        index = di.getCurrentIndex()
+        for participant in recipients:
+            participant.handleDatagram(datagram, channels, PyDatagramIterator(datagram, index))
+
+    def __handleControl(self, participant, di):
+        msgType = di.getUint16()
+        if msgType == CONTROL_ADD_CHANNEL:
+            participant.subscribeChannel(di.getUint64())
+        elif msgType == CONTROL_REMOVE_CHANNEL:
+            participant.unsubscribeChannel(di.getUint64())
+        elif msgType == CONTROL_ADD_RANGE:
+            low = di.getUint64()
+            participant.subscribeRange(low, di.getUint64())
+        elif msgType == CONTROL_REMOVE_RANGE:
+            low = di.getUint64()
+            participant.unsubscribeRange(low, di.getUint64())
+        elif msgType == CONTROL_ADD_POST_REMOVE:
+            # Older repositories send the blob without a sender channel.
+            sender = 0
+            peek = PyDatagramIterator(di.getDatagram(), di.getCurrentIndex())
+            if peek.getUint16() + 2 != di.getRemainingSize():
+                sender = di.getUint64()
+
+            participant.addPostRemove(sender, Datagram(di.getBlob()))
+        elif msgType == CONTROL_CLEAR_POST_REMOVES:
+            participant.clearPostRemoves(di.getUint64())
+        elif msgType == CONTROL_SET_CON_NAME:
+            participant.name = di.getString()
+            self.notify.info('%s connected.' % participant.name)
+        elif msgType == CONTROL_SET_CON_URL:
+            participant.url = di.getString()
+        elif msgType == CONTROL_LOG_MESSAGE:
+            pass
+        else:
+            self.notify.warning('Received unknown control message %d.' % msgType)
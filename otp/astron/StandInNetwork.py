@@ -0,0 +1,159 @@
+from panda3d.core import ConnectionWriter, NetAddress, NetDatagram, PointerToConnection, QueuedConnectionListener, \
+    QueuedConnectionManager, QueuedConnectionReader
+
+from direct.directnotify import DirectNotifyGlobal
+
+
+class StandInNetwork:
+    """
+    Accepts and polls the TCP connections of the Astron stand-in's roles.
+
+    Both the message director and the client agent listen through this;
+    every connection they accept is handed to an acceptor, which returns
+    the handler for the connection's datagrams.  A handler has
+    handleNetworkDatagram(datagram) and handleNetworkDisconnect() methods.
+
+    All of the reading happens in poll(), on the task manager's thread,
+    like everything else in the stand-in.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('StandInNetwork')
+
+    def __init__(self):
+        self.manager = QueuedConnectionManager()
+        self.listener = QueuedConnectionListener(self.manager, 0)
+        self.reader = QueuedConnectionReader(self.manager, 0)
+        self.writer = ConnectionWriter(self.manager, 0)
+        self.rendezvous = []
+        # Connection -> acceptor, for our rendezvous connections.
+        self.acceptors = {}
+        # Connection -> handler, for everything we have accepted.
+        self.handlers = {}
+
+    def listen(self, host, port, acceptor, backlog=1000):
+        rendezvous = self.manager.openTCPServerRendezvous(host, port, backlog)
+        if not rendezvous:
+            self.notify.error('Could not listen on %s:%d.' % (host, port))
+
+        self.listener.addConnection(rendezvous)
+        self.rendezvous.append(rendezvous)
+        self.acceptors[rendezvous] = acceptor
+        self.notify.info('Listening on %s:%d.' % (host, port))
+
+    def poll(self):
+        while self.listener.newConnectionAvailable():
+            rendezvous = PointerToConnection()
+            address = NetAddress()
+            newConnection = PointerToConnection()
+            if not self.listener.getNewConnection(rendezvous, address, newConnection):
+                break
+
+            connection = newConnection.p()
+            acceptor = self.acceptors.get(rendezvous.p())
+            if acceptor is None:
+                self.manager.closeConnection(connection)
+                continue
+
+            # astrond writes every datagram as it's sent, whatever collect-tcp
+            # says; a collected write would sit until the next one.
+            connection.setNoDelay(True)
+            connection.setCollectTcp(False)
+            self.reader.addConnection(connection)
+            self.handlers[connection] = acceptor(NetworkConnection(self, connection, address))
+
+        datagram = NetDatagram()
+        while self.reader.dataAvailable():
+            if not self.reader.getData(datagram):
+                break
+
+            handler = self.handlers.get(datagram.getConnection())
+            if handler is not None:
+                handler.handleNetworkDatagram(datagram)
+
+            datagram = NetDatagram()
+
+        while self.manager.resetConnectionAvailable():
+            resetConnection = PointerToConnection()
+            if not self.manager.getResetConnection(resetConnection):
+                break
+
+            self.__dropConnection(resetConnection.p())
+
+    def send(self, connection, datagram):
+        self.writer.send(datagram, connection)
+
+    def close(self, connection):
+        # We drop our handler right away; the reset that follows is ignored.
+        if self.__dropConnection(connection):
+            self.manager.closeConnection(connection)
+
+    def __dropConnection(self, connection):
+        handler = self.handlers.pop(connection, None)
+        if handler is None:
+            return False
+
+        self.reader.removeConnection(connection)
+        handler.handleNetworkDisconnect()
+        return True
+
+    def shutdown(self):
+        for connection in list(self.handlers):
+            self.close(connection)
+
+        for rendezvous in self.rendezvous:
+            self.listener.removeConnection(rendezvous)
+            self.manager.closeConnection(rendezvous)
+
+        self.rendezvous = []
+        self.acceptors = {}
+
+
+class NetworkConnection:
+    """One accepted TCP connection."""
+
+    def __init__(self, network, connection, address):
+        self.network = network
+        self.connection = connection
+        self.address = address
+
+    def sendDatagram(self, datagram):
+        self.network.send(self.connection, datagram)
+
+    def close(self):
+        self.network.close(self.connection)
+
+    def getAddress(self):
+        return self.address.getIpString(), self.address.getPort()
+
+
+class LocalConnection:
+    """
+    Stands in for a network connection when the other end lives in the
+    same process, such as the synthetic clients of a benchmark.  Datagrams
+    sent to it are handed to receive(datagram) straight away.
+    """
+
+    def __init__(self, receive, disconnect=None):
+        self.receive = receive
+        self.disconnect = disconnect
+        self.handler = None
+
+    def sendDatagram(self, datagram):
+        self.receive(datagram)
+
+    def close(self):
+        handler = self.handler
+        if handler is None:
+            return
+
+        self.handler = None
+        handler.handleNetworkDisconnect()
+        if self.disconnect:
+            self.disconnect()
+
+    def getAddress(self):
+        return '127.0.0.1', 0
+
+    def send(self, datagram):
+        """Sends a datagram from the other end of the connection."""
+        if self.handler is not None:
+            self.handler.handleNetworkDatagram(datagram)
@@ -0,0 +1,619 @@
+from direct.directnotify import DirectNotifyGlobal
+from direct.distributed.MsgTypes import *
+from direct.distributed.PyDatagram import PyDatagram
+from direct.distributed.PyDatagramIterator import PyDatagramIterator
+from otp.astron.MessageDirector import MDParticipant, addServerHeaderMultiple
+
+# Who an object's fields are being packed for.
+AUDIENCE_AI = 0
+AUDIENCE_OWNER = 1
+AUDIENCE_CLIENT = 2
+
+
+def getLocationChannel(parentId, zoneId):
+    return (parentId << 32) | zoneId
+
+
+class ClassInfo:
+    """The fields of a dclass the state server cares about, by audience."""
+
+    def __init__(self, dclass):
+        self.required = ([], [], [])
+        self.other = (set(), set(), set())
+        for i in range(dclass.getNumInheritedFields()):
+            field = dclass.getInheritedField(i)
+            if field.asMolecularField() is not None:
+                continue
+
+            audiences = [AUDIENCE_AI]
+            if field.isBroadcast() or field.isOwnrecv():
+                audiences.append(AUDIENCE_OWNER)
+
+            if field.isBroadcast():
+                audiences.append(AUDIENCE_CLIENT)
+
+            for audience in audiences:
+                if field.isRequired():
+                    self.required[audience].append(field)
+                elif field.isRam():
+                    self.other[audience].add(field.getNumber())
+
+
+class StateObject:
+    """One distributed object in the state server's memory."""
+
+    def __init__(self, doId, dclass, parentId, zoneId, fields, dbBacked):
+        self.doId = doId
+        self.dclass = dclass
+        self.parentId = parentId
+        self.zoneId = zoneId
+        # field number -> packed value, for the required and ram fields.
+        self.fields = fields
+        self.dbBacked = dbBacked
+        self.aiChannel = 0
+        self.aiExplicit = False
+        self.ownerChannel = 0
+        # audience -> (has other fields, packed entry), see StateServer.getEntry.
+        self.entries = {}
+
+    def getLocationChannel(self):
+        return getLocationChannel(self.parentId, self.zoneId)
+
+
+class StateServer(MDParticipant):
+    """
+    The stand-in's state server, including the database-state server
+    that activates objects stored in the database server.
+
+    Objects are kept by doId and indexed by location, so the client agent
+    can answer interest requests with a dict lookup per zone instead of
+    the round trip astrond makes through the parent object.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('StateServer')
+
+    def __init__(self, messageDirector, dcFile, fieldPacker, controlChannel, databaseServer=None, dbssRanges=()):
+        MDParticipant.__init__(self, messageDirector)
+        self.dcFile = dcFile
+        self.fieldPacker = fieldPacker
+        self.controlChannel = controlChannel
+        self.databaseServer = databaseServer
+        self.dbssRanges = dbssRanges
+        self.objects = {}
+        # location channel -> {doId: object}
+        self.zoneObjects = {}
+        # parentId -> {doId: object}
+        self.children = {}
+        self.classInfos = {}
+        messageDirector.connectLocal(self)
+        self.subscribeChannel(controlChannel)
+        if databaseServer:
+            for low, high in dbssRanges:
+                self.subscribeRange(low, high)
+
+    def getClassInfo(self, dclass):
+        info = self.classInfos.get(dclass.getNumber())
+        if info is None:
+            info = self.classInfos[dclass.getNumber()] = ClassInfo(dclass)
+
+        return info
+
+    def getZoneObjects(self, parentId, zoneId):
+        return self.zoneObjects.get(getLocationChannel(parentId, zoneId), {})
+
+    def isDbssObject(self, doId):
+        for low, high in self.dbssRanges:
+            if low <= doId <= high:
+                return True
+
+        return False
+
+    def getEntry(self, obj, audience):
+        """
+        Packs obj's location, dclass and the required and other fields that
+        audience gets to see, the way the *_ENTER_*_WITH_REQUIRED(_OTHER)
+        messages carry them.  Returns (has other fields, packed entry).
+        """
+        entry = obj.entries.get(audience)
+        if entry is not None:
+            return entry
+
+        info = self.getClassInfo(obj.dclass)
+        fields = obj.fields
+        dg = PyDatagram()
+        dg.addUint32(obj.doId)
+        dg.addUint32(obj.parentId)
+        dg.addUint32(obj.zoneId)
+        dg.addUint16(obj.dclass.getNumber())
+        for field in info.required[audience]:
+            value = fields.get(field.getNumber())
+            if value is None:
+                value = field.getDefaultValue()
+
+            dg.appendData(value)
+
+        otherFields = info.other[audience]
+        other = [(fieldNumber, value) for fieldNumber, value in fields.items() if fieldNumber in otherFields]
+        if other:
+            dg.addUint16(len(other))
+            for fieldNumber, value in other:
+                dg.addUint16(fieldNumber)
+                dg.appendData(value)
+
+        entry = obj.entries[audience] = (bool(other), dg.getMessage())
+        return entry
+
+    def __sendEntry(self, obj, channel, audience, msgType, otherMsgType):
+        hasOther, entry = self.getEntry(obj, audience)
+        dg = PyDatagram()
+        dg.addServerHeader(channel, obj.doId, otherMsgType if hasOther else msgType)
+        dg.appendData(entry)
+        self.routeDatagram(dg)
+
+    def __sendToChannels(self, channels, sender, msgType, *values):
+        channels = [channel for channel in channels if channel]
+        if not channels:
+            return
+
+        dg = PyDatagram()
+        addServerHeaderMultiple(dg, channels, sender, msgType)
+        for value in values:
+            dg.addUint32(value)
+
+        self.routeDatagram(dg)
+
+    def __sendChannelChange(self, channel, sender, msgType, doId, newChannel, oldChannel):
+        dg = PyDatagram()
+        dg.addServerHeader(channel, sender, msgType)
+        dg.addUint32(doId)
+        dg.addUint64(newChannel)
+        dg.addUint64(oldChannel)
+        self.routeDatagram(dg)
+
+    # Creating and deleting objects:
+
+    def createObject(self, doId, dclass, parentId, zoneId, fields, dbBacked=False):
+        if doId in self.objects:
+            self.notify.warning('Tried to create %d, which already exists.' % doId)
+            return None
+
+        obj = StateObject(doId, dclass, parentId, zoneId, fields, dbBacked)
+        self.objects[doId] = obj
+        self.subscribeChannel(doId)
+        self.__addToLocation(obj)
+        self.__sendEntry(obj, obj.getLocationChannel(), AUDIENCE_CLIENT, STATESERVER_OBJECT_ENTER_LOCATION_WITH_REQUIRED,
+                         STATESERVER_OBJECT_ENTER_LOCATION_WITH_REQUIRED_OTHER)
+        parent = self.objects.get(parentId)
+        if parent and parent.aiChannel:
+            self.__changeAI(obj, parent.aiChannel)
+
+        return obj
+
+    def deleteObject(self, obj):
+        for child in list(self.children.get(obj.doId, {}).values()):
+            self.deleteObject(child)
+
+        self.__sendToChannels((obj.getLocationChannel(), obj.aiChannel, obj.ownerChannel), obj.doId,
+                              STATESERVER_OBJECT_DELETE_RAM, obj.doId)
+        self.__removeFromLocation(obj)
+        del self.objects[obj.doId]
+        self.unsubscribeChannel(obj.doId)
+
+    def __addToLocation(self, obj):
+        self.zoneObjects.setdefault(obj.getLocationChannel(), {})[obj.doId] = obj
+        self.children.setdefault(obj.parentId, {})[obj.doId] = obj
+
+    def __removeFromLocation(self, obj):
+        for index, key in ((self.zoneObjects, obj.getLocationChannel()), (self.children, obj.parentId)):
+            objects = index[key]
+            del objects[obj.doId]
+            if not objects:
+                del index[key]
+
+    def __readObjectFields(self, dclass, di, other):
+        fields = {}
+        required = self.getClassInfo(dclass).required[AUDIENCE_AI]
+        for field, value in zip(required, self.fieldPacker.readValues(di, required)):
+            fields[field.getNumber()] = value
+
+        if other:
+            for field, value in self.fieldPacker.readFieldPairs(di, di.getUint16()):
+                self.__storeField(fields, field, value)
+
+        return fields
+
+    def __storeField(self, fields, field, value):
+        if field.asMolecularField() is not None:
+            for atomic, atomicValue in self.fieldPacker.splitMolecular(field, value):
+                if atomic.isRequired() or atomic.isRam():
+                    fields[atomic.getNumber()] = atomicValue
+        elif field.isRequired() or field.isRam():
+            fields[field.getNumber()] = value
+
+    def __handleCreateObject(self, sender, di, other=False):
+        doId = di.getUint32()
+        parentId = di.getUint32()
+        zoneId = di.getUint32()
+        dclass = self.dcFile.getClass(di.getUint16())
+        self.createObject(doId, dclass, parentId, zoneId, self.__readObjectFields(dclass, di, other))
+
+    def __handleCreateObjectOther(self, sender, di):
+        self.__handleCreateObject(sender, di, True)
+
+    def __handleDeleteAIObjects(self, sender, di):
+        aiChannel = di.getUint64()
+        for obj in list(self.objects.values()):
+            if obj.aiChannel == aiChannel and obj.doId in self.objects:
+                self.deleteObject(obj)
+
+    # Changing an object's location, AI and owner:
+
+    def setLocation(self, obj, parentId, zoneId, sender):
+        oldParentId, oldZoneId = obj.parentId, obj.zoneId
+        if (parentId, zoneId) == (oldParentId, oldZoneId):
+            return
+
+        if parentId == obj.doId:
+            self.notify.warning('Tried to parent %d to itself.' % obj.doId)
+            return
+
+        self.__removeFromLocation(obj)
+        obj.parentId = parentId
+        obj.zoneId = zoneId
+        obj.entries = {}
+        self.__addToLocation(obj)
+
+        dg = PyDatagram()
+        channels = [channel for channel in (getLocationChannel(oldParentId, oldZoneId), obj.aiChannel,
+                                            obj.ownerChannel) if channel]
+        addServerHeaderMultiple(dg, channels, sender, STATESERVER_OBJECT_CHANGING_LOCATION)
+        for value in (obj.doId, parentId, zoneId, oldParentId, oldZoneId):
+            dg.addUint32(value)
+
+        self.routeDatagram(dg)
+
+        if not obj.aiExplicit:
+            parent = self.objects.get(parentId)
+            aiChannel = parent.aiChannel if parent else 0
+            if aiChannel != obj.aiChannel:
+                self.__changeAI(obj, aiChannel)
+
+        self.__sendEntry(obj, obj.getLocationChannel(), AUDIENCE_CLIENT, STATESERVER_OBJECT_ENTER_LOCATION_WITH_REQUIRED,
+                         STATESERVER_OBJECT_ENTER_LOCATION_WITH_REQUIRED_OTHER)
+
+    def __changeAI(self, obj, aiChannel):
+        oldChannel = obj.aiChannel
+        obj.aiChannel = aiChannel
+        if oldChannel:
+            self.__sendChannelChange(oldChannel, obj.doId, STATESERVER_OBJECT_CHANGING_AI, obj.doId, aiChannel,
+                                     oldChannel)
+
+        if aiChannel:
+            self.__sendEntry(obj, aiChannel, AUDIENCE_AI, STATESERVER_OBJECT_ENTER_AI_WITH_REQUIRED,
+                             STATESERVER_OBJECT_ENTER_AI_WITH_REQUIRED_OTHER)
+
+        for child in list(self.children.get(obj.doId, {}).values()):
+            if not child.aiExplicit and child.aiChannel != aiChannel:
+                self.__changeAI(child, aiChannel)
+
+    def __handleSetLocation(self, obj, sender, di):
+        parentId = di.getUint32()
+        self.setLocation(obj, parentId, di.getUint32(), sender)
+
+    def __handleSetAI(self, obj, sender, di):
+        aiChannel = di.getUint64()
+        obj.aiExplicit = bool(aiChannel)
+        if aiChannel != obj.aiChannel:
+            self.__changeAI(obj, aiChannel)
+
+    def __handleSetOwner(self, obj, sender, di):
+        ownerChannel = di.getUint64()
+        oldChannel = obj.ownerChannel
+        if ownerChannel == oldChannel:
+            return
+
+        obj.ownerChannel = ownerChannel
+        if oldChannel:
+            self.__sendChannelChange(oldChannel, sender, STATESERVER_OBJECT_CHANGING_OWNER, obj.doId, ownerChannel,
+                                     oldChannel)
+
+        if ownerChannel:
+            self.__sendEntry(obj, ownerChannel, AUDIENCE_OWNER, STATESERVER_OBJECT_ENTER_OWNER_WITH_REQUIRED,
+                             STATESERVER_OBJECT_ENTER_OWNER_WITH_REQUIRED_OTHER)
+
+    def __handleDeleteRam(self, obj, sender, di):
+        self.deleteObject(obj)
+
+    def __deleteChildren(self, obj, zoneIds=None):
+        for child in list(self.children.get(obj.doId, {}).values()):
+            if (zoneIds is None or child.zoneId in zoneIds) and child.doId in self.objects:
+                self.deleteObject(child)
+
+    def __handleDeleteZone(self, obj, sender, di):
+        di.getUint32()
+        self.__deleteChildren(obj, {di.getUint32()})
+
+    def __handleDeleteZones(self, obj, sender, di):
+        di.getUint32()
+        self.__deleteChildren(obj, {di.getUint32() for i in range(di.getUint16())})
+
+    def __handleDeleteChildren(self, obj, sender, di):
+        self.__deleteChildren(obj)
+
+    # Field updates:
+
+    def updateField(self, obj, sender, field, value):
+        channels = []
+        if field.isBroadcast():
+            channels.append(obj.getLocationChannel())
+
+        if field.isAirecv() and obj.aiChannel and obj.aiChannel != sender:
+            channels.append(obj.aiChannel)
+
+        if field.isOwnrecv() and obj.ownerChannel and obj.ownerChannel != sender:
+            channels.append(obj.ownerChannel)
+
+        if channels:
+            dg = PyDatagram()
+            addServerHeaderMultiple(dg, channels, sender, STATESERVER_OBJECT_SET_FIELD)
+            dg.addUint32(obj.doId)
+            dg.addUint16(field.getNumber())
+            dg.appendData(value)
+            self.routeDatagram(dg)
+
+        if field.isRequired() or field.isRam() or field.asMolecularField() is not None:
+            self.__storeField(obj.fields, field, value)
+            obj.entries = {}
+
+        if obj.dbBacked and field.isDb():
+            dbFields = {}
+            self.__storeField(dbFields, field, value)
+            self.databaseServer.setFields(obj.doId, dbFields)
+
+    def __handleSetField(self, obj, sender, di):
+        di.getUint32()
+        field = self.dcFile.getFieldByIndex(di.getUint16())
+        if field is None:
+            return
+
+        self.updateField(obj, sender, field, self.fieldPacker.readValue(di, field))
+
+    def __handleSetFields(self, obj, sender, di):
+        di.getUint32()
+        for field, value in self.fieldPacker.readFieldPairs(di, di.getUint16()):
+            self.updateField(obj, sender, field, value)
+
+    def __deleteFields(self, obj, fieldNumbers):
+        # A required field goes back to its default; any other is dropped.
+        for fieldNumber in fieldNumbers:
+            field = self.dcFile.getFieldByIndex(fieldNumber)
+            if field is None:
+                continue
+
+            if field.isRequired():
+                obj.fields[fieldNumber] = field.getDefaultValue()
+            else:
+                obj.fields.pop(fieldNumber, None)
+
+        obj.entries = {}
+
+    def __handleDeleteFieldRam(self, obj, sender, di):
+        di.getUint32()
+        self.__deleteFields(obj, (di.getUint16(),))
+
+    def __handleDeleteFieldsRam(self, obj, sender, di):
+        di.getUint32()
+        self.__deleteFields(obj, [di.getUint16() for i in range(di.getUint16())])
+
+    # Queries:
+
+    def __sendResponse(self, sender, obj, msgType, context):
+        dg = PyDatagram()
+        dg.addServerHeader(sender, obj.doId, msgType)
+        dg.addUint32(context)
+        return dg
+
+    def __handleGetAll(self, obj, sender, di):
+        dg = self.__sendResponse(sender, obj, STATESERVER_OBJECT_GET_ALL_RESP, di.getUint32())
+        dg.appendData(self.getEntry(obj, AUDIENCE_AI)[1])
+        self.routeDatagram(dg)
+
+    def __handleGetField(self, obj, sender, di):
+        dg = self.__sendResponse(sender, obj, STATESERVER_OBJECT_GET_FIELD_RESP, di.getUint32())
+        di.getUint32()
+        fieldNumber = di.getUint16()
+        value = obj.fields.get(fieldNumber)
+        if value is None:
+            dg.addUint8(0)
+        else:
+            dg.addUint8(1)
+            dg.addUint16(fieldNumber)
+            dg.appendData(value)
+
+        self.routeDatagram(dg)
+
+    def __handleGetFields(self, obj, sender, di):
+        dg = self.__sendResponse(sender, obj, STATESERVER_OBJECT_GET_FIELDS_RESP, di.getUint32())
+        di.getUint32()
+        fieldNumbers = [di.getUint16() for i in range(di.getUint16())]
+        values = [(fieldNumber, obj.fields[fieldNumber]) for fieldNumber in fieldNumbers if fieldNumber in obj.fields]
+        dg.addUint8(1)
+        dg.addUint16(len(values))
+        for fieldNumber, value in values:
+            dg.addUint16(fieldNumber)
+            dg.appendData(value)
+
+        self.routeDatagram(dg)
+
+    def __handleGetLocation(self, obj, sender, di):
+        dg = self.__sendResponse(sender, obj, STATESERVER_OBJECT_GET_LOCATION_RESP, di.getUint32())
+        dg.addUint32(obj.doId)
+        dg.addUint32(obj.parentId)
+        dg.addUint32(obj.zoneId)
+        self.routeDatagram(dg)
+
+    def __handleGetAI(self, obj, sender, di):
+        dg = self.__sendResponse(sender, obj, STATESERVER_OBJECT_GET_AI_RESP, di.getUint32())
+        dg.addUint32(obj.doId)
+        dg.addUint64(obj.aiChannel)
+        self.routeDatagram(dg)
+
+    def __handleGetOwner(self, obj, sender, di):
+        dg = self.__sendResponse(sender, obj, STATESERVER_OBJECT_GET_OWNER_RESP, di.getUint32())
+        dg.addUint32(obj.doId)
+        dg.addUint64(obj.ownerChannel)
+        self.routeDatagram(dg)
+
+    # The database-state server:
+
+    def activateObject(self, doId, parentId, zoneId, otherFields=()):
+        """Loads doId from the database server into RAM at parentId, zoneId."""
+        if doId in self.objects:
+            return self.objects[doId]
+
+        dbObject = self.databaseServer.getObject(doId)
+        if dbObject is None:
+            self.notify.warning('Tried to activate %d, which is not in the database.' % doId)
+            return None
+
+        dclass = dbObject.dclass
+        fields = {}
+        for fieldNumber, value in dbObject.fields.items():
+            field = self.dcFile.getFieldByIndex(fieldNumber)
+            if field.isRequired() or field.isRam():
+                fields[fieldNumber] = value
+
+        for field, value in otherFields:
+            self.__storeField(fields, field, value)
+
+        return self.createObject(doId, dclass, parentId, zoneId, fields, dbBacked=True)
+
+    def __handleActivate(self, doId, sender, di, other=False):
+        di.getUint32()
+        parentId = di.getUint32()
+        zoneId = di.getUint32()
+        otherFields = ()
+        if other:
+            otherFields = self.fieldPacker.readFieldPairs(di, di.getUint16())
+
+        self.activateObject(doId, parentId, zoneId, otherFields)
+
+    def __handleActivateOther(self, doId, sender, di):
+        self.__handleActivate(doId, sender, di, True)
+
+    def __handleGetActivated(self, doId, sender, di):
+        context = di.getUint32()
+        dg = PyDatagram()
+        dg.addServerHeader(sender, doId, DBSS_OBJECT_GET_ACTIVATED_RESP)
+        dg.addUint32(context)
+        dg.addUint32(doId)
+        dg.addBool(doId in self.objects)
+        self.routeDatagram(dg)
+
+    def __handleDeleteDisk(self, doId, sender, di):
+        self.databaseServer.deleteObject(doId)
+        obj = self.objects.get(doId)
+        if obj is not None:
+            self.deleteObject(obj)
+
+    def __getInactiveObject(self, doId):
+        dbObject = self.databaseServer.getObject(doId)
+        if dbObject is None:
+            return None
+
+        return StateObject(doId, dbObject.dclass, 0, 0, dict(dbObject.fields), True)
+
+    def __handleInactiveQuery(self, doId, sender, di, handler):
+        obj = self.__getInactiveObject(doId)
+        if obj is not None:
+            handler(self, obj, sender, di)
+
+    def __handleInactiveSetFields(self, doId, sender, di, pairs):
+        dbFields = {}
+        for field, value in pairs:
+            if field.isDb():
+                self.__storeField(dbFields, field, value)
+
+        self.databaseServer.setFields(doId, dbFields)
+
+    def __handleInactiveSetField(self, doId, sender, di):
+        di.getUint32()
+        field = self.dcFile.getFieldByIndex(di.getUint16())
+        if field is not None:
+            self.__handleInactiveSetFields(doId, sender, di, [(field, self.fieldPacker.readValue(di, field))])
+
+    def __handleInactiveSetFieldsPairs(self, doId, sender, di):
+        di.getUint32()
+        self.__handleInactiveSetFields(doId, sender, di, self.fieldPacker.readFieldPairs(di, di.getUint16()))
+
+    def handleDatagram(self, datagram, channels, di):
+        sender = di.getUint64()
+        msgType = di.getUint16()
+        index = di.getCurrentIndex()
+        for channel in channels:
+            try:
+                obj = self.objects.get(channel)
+                if obj is not None:
+                    handler = self.objectHandlers.get(msgType)
+                    if handler is not None:
+                        handler(self, obj, sender, PyDatagramIterator(datagram, index))
+                    elif msgType == DBSS_OBJECT_GET_ACTIVATED:
+                        self.__handleGetActivated(channel, sender, PyDatagramIterator(datagram, index))
+                    elif msgType not in self.dbssHandlers:
+                        self.notify.warning('Received unknown message %d for %d.' % (msgType, channel))
+                elif channel == self.controlChannel:
+                    handler = self.controlHandlers.get(msgType)
+                    if handler is not None:
+                        handler(self, sender, PyDatagramIterator(datagram, index))
+                    else:
+                        self.notify.warning('Received unknown control message %d.' % msgType)
+                elif self.databaseServer and self.isDbssObject(channel):
+                    handler = self.dbssHandlers.get(msgType)
+                    if handler is not None:
+                        handler(self, channel, sender, PyDatagramIterator(datagram, index))
+                    elif msgType in self.inactiveQueryHandlers:
+                        self.__handleInactiveQuery(channel, sender, PyDatagramIterator(datagram, index),
+                                                   self.inactiveQueryHandlers[msgType])
+            except (ValueError, AssertionError) as e:
+                self.notify.warning('Dropped message %d for %d: %s' % (msgType, channel, e))
+
+    objectHandlers = {
+        STATESERVER_OBJECT_SET_FIELD: __handleSetField,
+        STATESERVER_OBJECT_SET_FIELDS: __handleSetFields,
+        STATESERVER_OBJECT_DELETE_FIELD_RAM: __handleDeleteFieldRam,
+        STATESERVER_OBJECT_DELETE_FIELDS_RAM: __handleDeleteFieldsRam,
+        STATESERVER_OBJECT_SET_LOCATION: __handleSetLocation,
+        STATESERVER_OBJECT_SET_AI: __handleSetAI,
+        STATESERVER_OBJECT_SET_OWNER: __handleSetOwner,
+        STATESERVER_OBJECT_DELETE_RAM: __handleDeleteRam,
+        STATESERVER_OBJECT_DELETE_ZONE: __handleDeleteZone,
+        STATESERVER_OBJECT_DELETE_ZONES: __handleDeleteZones,
+        STATESERVER_OBJECT_DELETE_CHILDREN: __handleDeleteChildren,
+        STATESERVER_OBJECT_GET_ALL: __handleGetAll,
+        STATESERVER_OBJECT_GET_FIELD: __handleGetField,
+        STATESERVER_OBJECT_GET_FIELDS: __handleGetFields,
+        STATESERVER_OBJECT_GET_LOCATION: __handleGetLocation,
+        STATESERVER_OBJECT_GET_AI: __handleGetAI,
+        STATESERVER_OBJECT_GET_OWNER: __handleGetOwner,
+    }
+
+    controlHandlers = {
+        STATESERVER_CREATE_OBJECT_WITH_REQUIRED: __handleCreateObject,
+        STATESERVER_CREATE_OBJECT_WITH_REQUIRED_OTHER: __handleCreateObjectOther,
+        STATESERVER_DELETE_AI_OBJECTS: __handleDeleteAIObjects,
+    }
+
+    # For objects in the database that aren't active:
+    dbssHandlers = {
+        DBSS_OBJECT_ACTIVATE_WITH_DEFAULTS: __handleActivate,
+        DBSS_OBJECT_ACTIVATE_WITH_DEFAULTS_OTHER: __handleActivateOther,
+        DBSS_OBJECT_GET_ACTIVATED: __handleGetActivated,
+        DBSS_OBJECT_DELETE_DISK: __handleDeleteDisk,
+        STATESERVER_OBJECT_SET_FIELD: __handleInactiveSetField,
+        STATESERVER_OBJECT_SET_FIELDS: __handleInactiveSetFieldsPairs,
+    }
+
+    inactiveQueryHandlers = {
+        STATESERVER_OBJECT_GET_ALL: __handleGetAll,
+        STATESERVER_OBJECT_GET_FIELD: __handleGetField,
+        STATESERVER_OBJECT_GET_FIELDS: __handleGetFields,
+    }
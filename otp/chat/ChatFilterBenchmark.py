@@ -0,0 +1,114 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import random
+import time
+from bisect import bisect_left
+
+parser = argparse.ArgumentParser(description='Open Toontown - Chat whitelist filter benchmark')
+parser.add_argument('--messages', type=int, default=200000, help='Number of chat messages in the synthetic corpus.')
+parser.add_argument('--vocabulary', type=int, default=3000,
+                    help='Number of distinct whitelisted words the corpus is written with.')
+parser.add_argument('--unknown', type=float, default=0.05,
+                    help='Fraction of the words that are not whitelisted.')
+parser.add_argument('--seed', type=int, default=0, help='Seed of the synthetic corpus.')
+args = parser.parse_args()
+# The chat handler loads the whitelist from the game's resources.
+loadPrcFile('etc/Configrc.prc')
+
+
+class game:
+    name = 'uberDog'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from otp.chat import ChatHandlerUD
+
+
+class BenchmarkDClasses(dict):
+
+    def __missing__(self, className):
+        return className
+
+
+class BenchmarkAir:
+
+    def __init__(self):
+        self.dclassesByName = BenchmarkDClasses()
+
+
+def makeCorpus(rng, words):
+    vocabulary = rng.sample(words, min(args.vocabulary, len(words)))
+    # Chat is dominated by a few common words.
+    weights = [1.0 / (rank + 1) for rank in range(len(vocabulary))]
+    messages = []
+    for i in range(args.messages):
+        messageWords = rng.choices(vocabulary, weights, k=rng.randint(1, 8))
+        for j, word in enumerate(messageWords):
+            roll = rng.random()
+            if roll < args.unknown:
+                messageWords[j] = word + rng.choice('xzq') + word[:2]
+            elif roll < 0.15:
+                messageWords[j] = word.capitalize()
+
+        if rng.random() < 0.3:
+            messageWords[-1] += rng.choice('.!?')
+
+        messages.append(' '.join(messageWords))
+
+    return messages
+
+
+def filterBisect(whiteList, message):
+    """The filter as it was, with a bisect over the sorted words per word."""
+    words = message.split(' ')
+    offset = 0
+    mods = []
+    for word in words:
+        text = whiteList.cleanText(word)
+        i = bisect_left(whiteList.words, text)
+        if i == whiteList.numWords or whiteList.words[i] != text:
+            mods.append((offset, offset + len(word) - 1))
+
+        offset += len(word) + 1
+
+    return mods
+
+
+def timeFilter(filterMessage, messages):
+    start = time.perf_counter()
+    results = [filterMessage(message) for message in messages]
+    elapsed = time.perf_counter() - start
+    return len(messages) / elapsed, results
+
+
+whiteList = ChatHandlerUD.whiteList
+words = []
+for word in whiteList.words:
+    try:
+        word = word.decode('utf-8')
+    except UnicodeDecodeError:
+        continue
+
+    if word.isalpha():
+        words.append(word)
+
+messages = makeCorpus(random.Random(args.seed), words)
+chatHandler = ChatHandlerUD.ChatHandlerUD(BenchmarkAir())
+print('%d whitelisted words, %d messages' % (whiteList.numWords, len(messages)))
+print('%24s %14s' % ('filter', 'messages/s'))
+rate, expected = timeFilter(lambda message: filterBisect(whiteList, message), messages)
+print('%24s %14.0f' % ('bisect per word', rate))
+verdictCacheSize = whiteList.VerdictCacheSize
+for name, cacheSize in (('set, no verdict cache', 0), ('set, verdict cache', verdictCacheSize)):
+    whiteList.VerdictCacheSize = cacheSize
+    whiteList.setWords(whiteList.words)
+    rate, results = timeFilter(chatHandler.filterWhitelist, messages)
+    print('%24s %14.0f' % (name, rate))
+    if results != expected:
+        print('The %s filter disagrees with the bisect filter.' % name)
+        raise SystemExit(1)
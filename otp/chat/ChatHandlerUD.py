@@ -22,6 +22,10 @@ class ChatHandlerUD(DistributedObjectGlobalUD):
         Returns:
             mods (string): the filtered message
         """
+        # Most messages are made up of whitelisted words only.
+        if whiteList.isMessage(message):
+            return []
+
         words = message.split(' ')
         offset = 0
         mods = []
@@ -54,6 +58,8 @@ class ChatHandlerUD(DistributedObjectGlobalUD):
         args = [avId, 0, '', message, mods, 0]
         datagram = do.aiFormatUpdate('setTalk', avId, channel, self.air.ourChannel, args)
         self.air.send(datagram)
+        if self.air.outboundBatcher is not None:
+            self.air.outboundBatcher.sentField('setTalk')
 
     def whisperMessage(self, message, receiverAvId):
         """
@@ -73,4 +79,6 @@ class ChatHandlerUD(DistributedObjectGlobalUD):
         do = self.air.dclassesByName['DistributedPlayerUD']
         args = [avId, 0, '', message, mods, 0]
         datagram = do.aiFormatUpdate('setTalkWhisper', receiverAvId, receiverAvId, self.air.ourChannel, args)
-        self.air.send(datagram)
\ No newline at end of file
+        self.air.send(datagram)
+        if self.air.outboundBatcher is not None:
+            self.air.outboundBatcher.sentField('setTalkWhisper')
\ No newline at end of file
@@ -1,26 +1,54 @@
 from bisect import bisect_left
+from functools import lru_cache
+
+from panda3d.core import ConfigVariableInt
 
 class WhiteList:
+    VerdictCacheSize = ConfigVariableInt('whitelist-verdict-cache-size', 10000).value
 
     def __init__(self, wordlist):
+        self.setWords(wordlist)
+
+    def setWords(self, wordlist):
         self.words = []
         for line in wordlist:
             self.words.append(line.strip(b'\n\r').lower())
 
+        # The sorted list answers the prefix queries; whole words are
+        # looked up in a set.
         self.words.sort()
         self.numWords = len(self.words)
+        self.wordSet = frozenset(self.words)
+
+        # The words as text, for isMessage.
+        textSet = set()
+        for word in self.wordSet:
+            try:
+                textSet.add(word.decode('utf-8'))
+            except UnicodeDecodeError:
+                pass
+
+        self.textSet = frozenset(textSet)
+
+        # isWord remembers its verdicts on the most recently checked
+        # words, until the words change.
+        self.isWord = self.checkWord
+        if self.VerdictCacheSize > 0:
+            self.isWord = lru_cache(maxsize=self.VerdictCacheSize)(self.checkWord)
 
     def cleanText(self, text):
         text = text.strip('.,?!')
         text = text.lower().encode('utf-8')
         return text
 
-    def isWord(self, text):
-        text = self.cleanText(text)
-        i = bisect_left(self.words, text)
-        if i == self.numWords:
-            return False
-        return self.words[i] == text
+    def checkWord(self, text):
+        return self.cleanText(text) in self.wordSet
+
+    def isMessage(self, text):
+        # Returns True if every space separated word of text is in the
+        # whitelist as it is, bar its case.  A False result only means the
+        # words must be checked one by one with isWord.
+        return self.textSet.issuperset(text.lower().split(' '))
 
     def isPrefix(self, text):
         text = self.cleanText(text)
@@ -45,12 +45,12 @@ class EntityTypeDesc:
             return
         c = entTypeClass
         EntityTypeDesc.notify.debug('compiling attrib descriptors for %s' % c.__name__)
-        for base in c.__bases__:
+        bases = [base for base in c.__bases__ if base is not object]
+        for base in bases:
             EntityTypeDesc.privCompileAttribDescs(base)
 
         blockAttribs = c.__dict__.get('blockAttribs', [])
         baseADs = []
-        bases = list(c.__bases__)
         mostDerivedLast(bases)
         for base in bases:
             for desc in base._attribDescs:
@@ -1,6 +1,8 @@
 from panda3d.core import *
 from direct.directnotify import DirectNotifyGlobal
 from direct.showbase.PythonUtil import list2dict, uniqueElements
+from otp.otpbase.PythonUtil import repeatableRepr
+import copy
 import string
 from . import LevelConstants
 import types
@@ -8,18 +10,75 @@ import importlib
 if __dev__:
     import os
 
+class CompiledLevelSpec:
+    """
+    The levelSpec of a spec module, read once and shared by every
+    LevelSpec made from it.  It is never changed; a LevelSpec copies an
+    entity's dict before it edits it.
+    """
+
+    def __init__(self, specDict, modTime = None):
+        self.specDict = specDict
+        self.modTime = modTime
+        # entity type registry hash -> CompiledLevelSpec with the
+        # registry's defaults filled in
+        self.typeRegSpecs = {}
+        # scenario -> repr of a LevelSpec of it, and the hash of that
+        self.reprs = {}
+        self.stringHashes = {}
+
+    def makeSpecDict(self):
+        # New dicts of entities, holding the shared entity dicts.
+        specDict = dict(self.specDict)
+        specDict['globalEntities'] = dict(specDict['globalEntities'])
+        specDict['scenarios'] = [dict(scenario) for scenario in specDict['scenarios']]
+        return specDict
+
+    if __dev__:
+
+        def getTypeRegSpec(self, entTypeReg):
+            hashStr = entTypeReg.getHashStr()
+            typeRegSpec = self.typeRegSpecs.get(hashStr)
+            if typeRegSpec is None:
+                levelSpec = LevelSpec(self)
+                levelSpec.privFillDefaults(entTypeReg)
+                typeRegSpec = CompiledLevelSpec(levelSpec.specDict, self.modTime)
+                self.typeRegSpecs[hashStr] = typeRegSpec
+                levelSpec.destroy()
+            return typeRegSpec
+
+        def getRepr(self, scenario):
+            if scenario not in self.reprs:
+                self.reprs[scenario] = LevelSpec.makeRepr(self.specDict, scenario)
+            return self.reprs[scenario]
+
+        def getStringHash(self, scenario):
+            if scenario not in self.stringHashes:
+                self.stringHashes[scenario] = LevelSpec.makeStringHash(self.getRepr(scenario))
+            return self.stringHashes[scenario]
+
+
 class LevelSpec:
     notify = DirectNotifyGlobal.directNotify.newCategory('LevelSpec')
     SystemEntIds = (LevelConstants.UberZoneEntId, LevelConstants.LevelMgrEntId, LevelConstants.EditMgrEntId)
+    # spec module name -> CompiledLevelSpec
+    CompiledSpecs = {}
 
     def __init__(self, spec = None, scenario = 0):
         newSpec = 0
+        # While we share our entity dicts with compiledSpec, the ids of the
+        # ones we have copied to edit.
+        self.compiledSpec = None
+        self.ownEntIds = set()
+        self.edited = 0
         if type(spec) is types.ModuleType:
-            if __dev__:
-                importlib.reload(spec)
-            self.specDict = spec.levelSpec
+            self.compiledSpec = self.getCompiledSpec(spec)
+            self.specDict = self.compiledSpec.makeSpecDict()
             if __dev__:
                 self.setFilename(spec.__file__)
+        elif isinstance(spec, CompiledLevelSpec):
+            self.compiledSpec = spec
+            self.specDict = spec.makeSpecDict()
         elif type(spec) is dict:
             self.specDict = spec
         elif spec is None:
@@ -27,11 +86,7 @@ class LevelSpec:
                 newSpec = 1
                 self.specDict = {'globalEntities': {},
                  'scenarios': [{}]}
-        self.entId2specDict = {}
-        self.entId2specDict.update(list2dict(self.getGlobalEntIds(), value=self.privGetGlobalEntityDict()))
-        for i in range(self.getNumScenarios()):
-            self.entId2specDict.update(list2dict(self.getScenarioEntIds(i), value=self.privGetScenarioEntityDict(i)))
-
+        self.privMapEntIds()
         self.setScenario(scenario)
         if __dev__:
             if newSpec:
@@ -50,6 +105,40 @@ class LevelSpec:
                 self.doSetAttrib(entId, 'name', 'EditMgr')
         return
 
+    @staticmethod
+    def getCompiledSpec(specModule):
+        name = specModule.__name__
+        compiledSpec = LevelSpec.CompiledSpecs.get(name)
+        if __dev__:
+            # The spec is read again only when it has been saved since.
+            try:
+                modTime = os.path.getmtime(specModule.__file__)
+            except OSError:
+                modTime = None
+            if compiledSpec is None or compiledSpec.modTime != modTime:
+                importlib.reload(specModule)
+                compiledSpec = None
+        else:
+            modTime = None
+        if compiledSpec is None:
+            compiledSpec = CompiledLevelSpec(specModule.levelSpec, modTime)
+            LevelSpec.CompiledSpecs[name] = compiledSpec
+        return compiledSpec
+
+    def privMapEntIds(self):
+        self.entId2specDict = {}
+        self.entId2specDict.update(list2dict(self.getGlobalEntIds(), value=self.privGetGlobalEntityDict()))
+        for i in range(self.getNumScenarios()):
+            self.entId2specDict.update(list2dict(self.getScenarioEntIds(i), value=self.privGetScenarioEntityDict(i)))
+
+    def privGetEntitySpecForEdit(self, entId):
+        specDict = self.entId2specDict[entId]
+        if self.compiledSpec is not None and entId not in self.ownEntIds:
+            specDict[entId] = dict(specDict[entId])
+            self.ownEntIds.add(entId)
+        self.edited = 1
+        return specDict[entId]
+
     def destroy(self):
         del self.specDict
         del self.entId2specDict
@@ -91,15 +180,7 @@ class LevelSpec:
         return specDict[entId]
 
     def getCopyOfSpec(self, spec):
-        specCopy = {}
-        if not __debug__ or __execWarnings__:
-            print('EXECWARNING LevelSpec exec: %s' % self.getSpecImportsModuleName())
-            printStack()
-        exec('from %s import *' % self.getSpecImportsModuleName())
-        for key in list(spec.keys()):
-            specCopy[key] = eval(repr(spec[key]))
-
-        return specCopy
+        return copy.deepcopy(spec)
 
     def getEntitySpecCopy(self, entId):
         specDict = self.entId2specDict[entId]
@@ -150,6 +231,17 @@ class LevelSpec:
             return hasattr(self, 'level')
 
         def setEntityTypeReg(self, entTypeReg):
+            if self.compiledSpec is not None and not self.edited:
+                # Every LevelSpec of this spec and registry comes out the
+                # same, so only the first one fills in the defaults.
+                self.entTypeReg = entTypeReg
+                self.compiledSpec = self.compiledSpec.getTypeRegSpec(entTypeReg)
+                self.specDict = self.compiledSpec.makeSpecDict()
+                self.privMapEntIds()
+                return
+            self.privFillDefaults(entTypeReg)
+
+        def privFillDefaults(self, entTypeReg):
             self.entTypeReg = entTypeReg
             for entId in self.getAllEntIds():
                 spec = self.getEntitySpec(entId)
@@ -158,6 +250,7 @@ class LevelSpec:
                 attribDescDict = typeDesc.getAttribDescDict()
                 for attribName, desc in attribDescDict.items():
                     if attribName not in spec:
+                        spec = self.privGetEntitySpecForEdit(entId)
                         spec[attribName] = desc.getDefaultValue()
 
             self.checkSpecIntegrity()
@@ -169,8 +262,7 @@ class LevelSpec:
             self.filename = filename
 
         def doSetAttrib(self, entId, attrib, value):
-            specDict = self.entId2specDict[entId]
-            specDict[entId][attrib] = value
+            self.privGetEntitySpecForEdit(entId)[attrib] = value
 
         def setAttribChange(self, entId, attrib, value, username):
             LevelSpec.notify.info('setAttribChange(%s): %s, %s = %s' % (username,
@@ -186,6 +278,8 @@ class LevelSpec:
             globalEnts = self.privGetGlobalEntityDict()
             self.entId2specDict[entId] = globalEnts
             globalEnts[entId] = {}
+            self.ownEntIds.add(entId)
+            self.edited = 1
             spec = globalEnts[entId]
             attribDescs = self.entTypeReg.getTypeDesc(entType).getAttribDescDict()
             for name, desc in list(attribDescs.items()):
@@ -208,6 +302,8 @@ class LevelSpec:
             dict = self.entId2specDict[entId]
             del dict[entId]
             del self.entId2specDict[entId]
+            self.ownEntIds.discard(entId)
+            self.edited = 1
 
         def removeZoneReferences(self, removedZoneNums):
             type2ids = self.getEntType2ids(self.getAllEntIdsFromAllScenarios())
@@ -218,9 +314,9 @@ class LevelSpec:
                     for entId in type2ids[type]:
                         spec = self.getEntitySpec(entId)
                         for attribName in visZoneListAttribs:
-                            for zoneNum in removedZoneNums:
-                                while zoneNum in spec[attribName]:
-                                    spec[attribName].remove(zoneNum)
+                            zoneNums = [zoneNum for zoneNum in spec[attribName] if zoneNum not in removedZoneNums]
+                            if len(zoneNums) != len(spec[attribName]):
+                                self.privGetEntitySpecForEdit(entId)[attribName] = zoneNums
 
         def getSpecImportsModuleName(self):
             return 'toontown.coghq.SpecImports'
@@ -400,7 +496,7 @@ class LevelSpec:
                     for attrib in list(spec.keys()):
                         if attrib not in attribNames:
                             LevelSpec.notify.warning("entId %s (%s): unknown attrib '%s', omitting" % (entId, spec['type'], attrib))
-                            del spec[attrib]
+                            del self.privGetEntitySpecForEdit(entId)[attrib]
 
                     for attribName in attribNames:
                         if attribName not in spec:
@@ -409,8 +505,14 @@ class LevelSpec:
             return
 
         def stringHash(self):
+            if self.compiledSpec is not None and not self.edited:
+                return self.compiledSpec.getStringHash(self.scenario)
+            return self.makeStringHash(repr(self))
+
+        @staticmethod
+        def makeStringHash(specRepr):
             h = HashVal()
-            h.hashString(repr(self))
+            h.hashString(specRepr)
             return h.asHex()
 
         def __hash__(self):
@@ -420,4 +522,12 @@ class LevelSpec:
             return 'LevelSpec'
 
         def __repr__(self):
-            return 'LevelSpec(%s, scenario=%s)' % (repeatableRepr(self.specDict), repeatableRepr(self.scenario))
+            # The spec goes to the client by its repr, and is hashed by it;
+            # unedited specs share theirs, made once.
+            if self.compiledSpec is not None and not self.edited:
+                return self.compiledSpec.getRepr(self.scenario)
+            return self.makeRepr(self.specDict, self.scenario)
+
+        @staticmethod
+        def makeRepr(specDict, scenario):
+            return 'LevelSpec(%s, scenario=%s)' % (repeatableRepr(specDict), repeatableRepr(scenario))
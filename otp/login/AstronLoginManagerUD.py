@@ -1,6 +1,7 @@
 import json
 import time
 import os
+from collections import OrderedDict
 from datetime import datetime
 
 from direct.directnotify import DirectNotifyGlobal
@@ -341,41 +342,51 @@ class GetAvatarsOperation(AvatarOperation):
         self.setCallback(self._handleQueryAvatars)
         self.pendingAvatars = None
         self.avatarFields = None
+        self.failed = False
 
     def _handleQueryAvatars(self):
+        # If the account's avatars haven't changed since we last sent
+        # its avatar list, send the same list again.
+        potentialAvatars = self.loginManager.getCachedAvatarList(self.sender, self.avList)
+        if potentialAvatars is not None:
+            self.__sendAvatars(potentialAvatars)
+            return
+
         # Now, we will query the avatars that exist in the account.
-        self.pendingAvatars = set()
+        # The queries are all sent at once, and pendingAvatars is the
+        # barrier that tells us when the last one has come back.
+        self.pendingAvatars = set([avId for avId in self.avList if avId])
         self.avatarFields = {}
-
-        # Loop through the list of avatars:
-        for avId in self.avList:
-            if avId:
-                # This index contains an avatar! Add it to the pending avatars.
-                self.pendingAvatars.add(avId)
-
-                # This is our callback function that queryObject
-                # will call when done querying each avatar object.
-                def response(dclass, fields, avId=avId):
-                    if dclass != self.loginManager.air.dclassesByName['DistributedToonUD']:
-                        # The dclass is invalid! Close the connection:
-                        self._handleCloseConnection('One of the account\'s avatars is invalid! dclass = %s, expected = %s' % (
-                            dclass, self.loginManager.air.dclassesByName['DistributedToonUD'].getName()))
-                        return
-
-                    # Otherwise, we're all set! Add the queried avatar fields to the
-                    # avatarFields array, remove from the pending list, and call the
-                    # __handleSendAvatars function.
-                    self.avatarFields[avId] = fields
-                    self.pendingAvatars.remove(avId)
-                    if not self.pendingAvatars:
-                        self.__handleSendAvatars()
-
-                # Query the avatar object.
-                self.loginManager.air.dbInterface.queryObject(self.loginManager.air.dbId, avId, response)
-
         if not self.pendingAvatars:
             # No pending avatars! Call the __handleSendAvatars function:
             self.__handleSendAvatars()
+            return
+
+        for avId in list(self.pendingAvatars):
+            # This is our callback function that queryObject
+            # will call when done querying each avatar object.
+            def response(dclass, fields, avId=avId):
+                if self.failed:
+                    # We've already given up on this account.
+                    return
+
+                if dclass != self.loginManager.air.dclassesByName['DistributedToonUD']:
+                    # The dclass is invalid! Close the connection:
+                    self.failed = True
+                    self._handleCloseConnection('One of the account\'s avatars is invalid! dclass = %s, expected = %s' % (
+                        dclass, self.loginManager.air.dclassesByName['DistributedToonUD'].getName()))
+                    return
+
+                # Otherwise, we're all set! Add the queried avatar fields to the
+                # avatarFields array, remove from the pending list, and call the
+                # __handleSendAvatars function.
+                self.avatarFields[avId] = fields
+                self.pendingAvatars.discard(avId)
+                if not self.pendingAvatars:
+                    self.__handleSendAvatars()
+
+            # Query the avatar object.
+            self.loginManager.air.dbInterface.queryObject(self.loginManager.air.dbId, avId, response)
 
     def __handleSendAvatars(self):
         potentialAvatars = []
@@ -401,6 +412,10 @@ class GetAvatarsOperation(AvatarOperation):
 
             potentialAvatars.append([avId, name, fields['setDNAString'][0], index, nameState])
 
+        self.loginManager.cacheAvatarList(self.sender, self.avList, potentialAvatars)
+        self.__sendAvatars(potentialAvatars)
+
+    def __sendAvatars(self, potentialAvatars):
         self.loginManager.sendUpdateToAccountId(self.sender, 'avatarListResponse', [potentialAvatars])
         self._handleDone()
 
@@ -502,6 +517,7 @@ class CreateAvatarOperation(GameOperation):
             return
 
         # Otherwise, we're done!
+        self.loginManager.invalidateAvatarList(self.sender)
         self.loginManager.air.writeServerEvent('avatar-created', self.avId, self.sender, self.avPosition)
         self.loginManager.sendUpdateToAccountId(self.sender, 'createAvatarResponse', [self.avId])
         self._handleDone()
@@ -570,6 +586,8 @@ class SetNamePatternOperation(AvatarOperation):
                                                        {'WishNameState': ('LOCKED',),
                                                         'WishName': ('',),
                                                         'setName': (name,)})
+        self.loginManager.air.toontownFriendsManager.invalidateAvatarSummary(self.avId)
+        self.loginManager.invalidateAvatarList(self.sender)
 
         self.loginManager.sendUpdateToAccountId(self.sender, 'namePatternAnswer', [self.avId, 1])
         self._handleDone()
@@ -627,6 +645,7 @@ class SetNameTypedOperation(AvatarOperation):
                                                            self.loginManager.air.dclassesByName['DistributedToonUD'],
                                                            {'WishNameState': ('PENDING',),
                                                             'WishName': (self.name,)})
+            self.loginManager.invalidateAvatarList(self.sender)
 
         self.loginManager.sendUpdateToAccountId(self.sender, 'nameTypedResponse', [self.avId, status])
         self._handleDone()
@@ -681,6 +700,8 @@ class AcknowledgeNameOperation(AvatarOperation):
                                                        {'WishNameState': fields['WishNameState'],
                                                         'WishName': fields['WishName'],
                                                         'setName': fields['setName']})
+        self.loginManager.air.toontownFriendsManager.invalidateAvatarSummary(self.avId)
+        self.loginManager.invalidateAvatarList(self.sender)
 
         self.loginManager.sendUpdateToAccountId(self.sender, 'acknowledgeAvatarNameResponse', [])
         self._handleDone()
@@ -729,6 +750,7 @@ class RemoveAvatarOperation(GetAvatarsOperation):
             self._handleCloseConnection('Database failed to mark the avatar as removed!')
             return
 
+        self.loginManager.invalidateAvatarList(self.sender)
         self._handleQueryAvatars()
 
 
@@ -755,6 +777,8 @@ class LoadAvatarOperation(AvatarOperation):
             return
 
         self.avatar = fields
+        # The avatar's DNA may change while it is played.
+        self.loginManager.invalidateAvatarList(self.sender)
         self.__handleSetAvatar()
 
     def __handleSetAvatar(self):
@@ -858,6 +882,13 @@ class AstronLoginManagerUD(DistributedObjectGlobalUD):
         self.accountDb = None
         self.sender2loginOperation = {}
         self.account2operation = {}
+        # accountId -> (avList, potentialAvatars, time cached) of the last
+        # avatar list sent to the account, least recently used first.
+        self.avatarListCache = OrderedDict()
+        self.avatarListCacheSize = config.GetInt('avatar-list-cache-size', 20000)
+        # Changes made straight in the database, like a moderator approving
+        # a wish name, show up once an entry is this many seconds old.
+        self.avatarListCacheTTL = config.GetFloat('avatar-list-cache-ttl', 60.0)
 
     def announceGenerate(self):
         DistributedObjectGlobalUD.announceGenerate(self)
@@ -869,6 +900,36 @@ class AstronLoginManagerUD(DistributedObjectGlobalUD):
         # TODO: In the future, add more database interfaces & make this configurable.
         self.accountDb = DeveloperAccountDB(self)
 
+    def getCachedAvatarList(self, accountId, avList):
+        # Returns the avatar list last sent to the account, provided it
+        # was built from the same avatar slots no longer than
+        # avatar-list-cache-ttl seconds ago, or None.
+        entry = self.avatarListCache.get(accountId)
+        if entry is None or entry[0] != avList:
+            return None
+
+        if self.avatarListCacheTTL > 0 and time.monotonic() - entry[2] >= self.avatarListCacheTTL:
+            del self.avatarListCache[accountId]
+            return None
+
+        self.avatarListCache.move_to_end(accountId)
+        return entry[1]
+
+    def cacheAvatarList(self, accountId, avList, potentialAvatars):
+        if self.avatarListCacheSize <= 0:
+            return
+
+        self.avatarListCache[accountId] = (list(avList), potentialAvatars, time.monotonic())
+        self.avatarListCache.move_to_end(accountId)
+        while len(self.avatarListCache) > self.avatarListCacheSize:
+            self.avatarListCache.popitem(last=False)
+
+    def invalidateAvatarList(self, accountId):
+        # Called whenever one of the account's avatars is created,
+        # removed, renamed or played.  Tools that change an avatar in the
+        # database directly can call it too, rather than wait out the TTL.
+        self.avatarListCache.pop(accountId, None)
+
     def closeConnection(self, connectionId, reason='', forOperations=False, isAccount=False):
         if forOperations:
             if isAccount:
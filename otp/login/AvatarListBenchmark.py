@@ -0,0 +1,156 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import random
+import time
+
+parser = argparse.ArgumentParser(description='Open Toontown - Login storm avatar list benchmark')
+parser.add_argument('--accounts', type=int, default=2000, help='Number of accounts asking for their avatar list at once.')
+parser.add_argument('--latency', type=float, default=2.0,
+                    help='Milliseconds of network round trip to the fake database server.')
+parser.add_argument('--service-time', type=float, default=0.05,
+                    help='Milliseconds the fake database server spends on each query; queries are served one at a time.')
+parser.add_argument('--retries', type=float, default=0.5,
+                    help='Fraction of the accounts that ask for their avatar list again before picking an avatar.')
+parser.add_argument('--frame-sleep', type=float, default=1.0,
+                    help='Longest time, in milliseconds, the task loop sleeps between frames (ai-sleep).')
+parser.add_argument('--seed', type=int, default=0, help='Seed of the synthetic accounts.')
+args = parser.parse_args()
+# The name generator the login manager builds needs the game's resources.
+loadPrcFile('etc/Configrc.prc')
+loadPrcFileData('AvatarListBenchmark', 'ai-sleep %f' % (args.frame_sleep / 1000.0))
+
+
+class game:
+    name = 'uberDog'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from otp.login.AstronLoginManagerUD import AstronLoginManagerUD
+
+
+class BenchmarkDClasses(dict):
+
+    def __missing__(self, className):
+        # Any name is a valid dclass; the operations only compare them.
+        return className
+
+
+class BenchmarkDBServer:
+    """
+    Stands in for the database server: every query travels half the round
+    trip there, waits for the queries ahead of it to be served, and comes
+    back after another half.
+    """
+
+    def __init__(self, air, latency, serviceTime):
+        self.air = air
+        self.latency = latency
+        self.serviceTime = serviceTime
+        self.busyUntil = 0.0
+        self.objects = {}
+        self.numQueries = 0
+
+    def queryObject(self, dbId, doId, callback):
+        self.numQueries += 1
+        now = globalClock.getRealTime()
+        self.busyUntil = max(now + self.latency / 2.0, self.busyUntil) + self.serviceTime
+        dclass, fields = self.objects[doId]
+        taskMgr.doMethodLater(self.busyUntil + self.latency / 2.0 - now, callback,
+                              'benchmarkQuery-%d' % self.numQueries, extraArgs=[dclass, fields])
+
+
+class BenchmarkAir:
+
+    def __init__(self):
+        self.dbId = 4003
+        self.ourChannel = 4670
+        self.dclassesByName = BenchmarkDClasses()
+        self.dbInterface = BenchmarkDBServer(self, args.latency / 1000.0, args.service_time / 1000.0)
+        self.sender = 0
+
+    def getAccountIdFromSender(self):
+        return self.sender
+
+    def send(self, datagram):
+        pass
+
+
+class BenchmarkLoginManager(AstronLoginManagerUD):
+
+    def __init__(self, air):
+        AstronLoginManagerUD.__init__(self, air)
+        self.requestTimes = {}
+        self.responseTimes = []
+        self.ejected = 0
+
+    def requestAvatarListFor(self, accountId):
+        self.air.sender = accountId
+        self.requestTimes[accountId] = globalClock.getRealTime()
+        self.requestAvatarList()
+
+    def sendUpdateToAccountId(self, accountId, fieldName, args):
+        if fieldName == 'avatarListResponse':
+            self.responseTimes.append(globalClock.getRealTime() - self.requestTimes.pop(accountId))
+
+    def closeConnection(self, connectionId, reason='', forOperations=False, isAccount=False):
+        self.ejected += 1
+        self.requestTimes.pop(connectionId, None)
+
+
+def makeAccounts(air, rng):
+    accountIds = []
+    avId = 100000000
+    for i in range(args.accounts):
+        accountId = 1000000 + i
+        avList = [0] * 6
+        for index in rng.sample(range(6), rng.randint(1, 6)):
+            avId += 1
+            avList[index] = avId
+            air.dbInterface.objects[avId] = ('DistributedToonUD', {'setName': ['Toon %d' % avId],
+                                                                   'setDNAString': [b'dna'],
+                                                                   'WishNameState': ['LOCKED'],
+                                                                   'WishName': ['']})
+
+        air.dbInterface.objects[accountId] = ('AstronAccountUD', {'ACCOUNT_AV_SET': avList})
+        accountIds.append(accountId)
+
+    return accountIds
+
+
+def runStorm(loginManager, accountIds):
+    """Every account asks for its avatar list in the same frame; returns the p50 and p99 in ms."""
+    loginManager.responseTimes = []
+    numQueries = loginManager.air.dbInterface.numQueries
+    for accountId in accountIds:
+        loginManager.requestAvatarListFor(accountId)
+
+    while loginManager.requestTimes:
+        taskMgr.step()
+
+    responseTimes = sorted(loginManager.responseTimes)
+    if len(responseTimes) != len(accountIds):
+        print('%d of %d avatar list requests failed.' % (len(accountIds) - len(responseTimes), len(accountIds)))
+        raise SystemExit(1)
+
+    p50 = responseTimes[len(responseTimes) // 2] * 1000.0
+    p99 = responseTimes[min(len(responseTimes) - 1, len(responseTimes) * 99 // 100)] * 1000.0
+    return p50, p99, loginManager.air.dbInterface.numQueries - numQueries
+
+
+rng = random.Random(args.seed)
+print('%d accounts, %.1f ms round trip, %.3f ms per query' % (args.accounts, args.latency, args.service_time))
+print('%28s %10s %10s %10s' % ('storm', 'p50 ms', 'p99 ms', 'queries'))
+for cacheSize in (0, args.accounts):
+    air = BenchmarkAir()
+    accountIds = makeAccounts(air, rng)
+    loginManager = BenchmarkLoginManager(air)
+    loginManager.avatarListCacheSize = cacheSize
+    retryIds = rng.sample(accountIds, int(len(accountIds) * args.retries))
+    cacheName = 'cache' if cacheSize else 'no cache'
+    print('%28s %10.1f %10.1f %10d' % (('login, %s' % cacheName,) + runStorm(loginManager, accountIds)))
+    print('%28s %10.1f %10.1f %10d' % (('retry, %s' % cacheName,) + runStorm(loginManager, retryIds)))
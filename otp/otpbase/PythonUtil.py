@@ -4,7 +4,8 @@ import math
 import random
 import time
 
-__all__ = ['enumerate', 'nonRepeatingRandomList', 'describeException', 'pdir', 'choice', 'cmp', 'lerp', 'triglerp']
+__all__ = ['enumerate', 'nonRepeatingRandomList', 'describeException', 'pdir', 'choice', 'cmp', 'lerp', 'triglerp',
+           'repeatableRepr']
 
 if not hasattr(builtins, 'enumerate'):
     def enumerate(L):
@@ -173,6 +174,16 @@ def isClient():
 def cmp(a, b):
     return (a > b) - (a < b)
 
+def repeatableRepr(obj):
+    """repr(obj), but with dicts and sets in sorted order, so that equal
+    objects always get the same string."""
+    if type(obj) is dict:
+        return '{' + ', '.join(['%s: %s' % (repeatableRepr(key), repeatableRepr(obj[key]))
+                                for key in sorted(obj.keys())]) + '}'
+    elif type(obj) is set:
+        return 'set(%s)' % repeatableRepr(sorted(obj))
+    return repr(obj)
+
 
 builtins.pdir = pdir
 builtins.isClient = isClient
@@ -180,3 +191,4 @@ builtins.lerp = lerp
 builtins.triglerp = triglerp
 builtins.choice = choice
 builtins.cmp = cmp
+builtins.repeatableRepr = repeatableRepr
@@ -0,0 +1,91 @@
+import threading
+import time
+
+from direct.directnotify import DirectNotifyGlobal
+from panda3d.toontown import *
+from toontown.toonbase import ToontownGlobals
+
+
+class DNAPreloaderAI:
+    """
+    Parses the DNA of every hood and street ahead of createZones.
+
+    With want-dna-preload on, the preloader starts on a background thread as
+    soon as the AI repository is constructed, so the parsing overlaps with
+    connecting to the message director and creating the global and local
+    objects.  createZones then picks the parsed stores up through takeZone
+    instead of parsing each file as its hood is generated.
+
+    The parse only overlaps with the main thread's Python code if
+    loadDNAFileAI releases the GIL; otherwise it overlaps only with the time
+    the main thread spends waiting on the network.  DNAPreloaderBenchmark
+    measures both, so it is off by default.
+
+    The DNA parser keeps global state, so only one file can be parsed at a
+    time; every parse, here or on the main thread, goes through
+    ToontownAIRepository.loadDNAFileAI, which serializes them.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('DNAPreloaderAI')
+
+    def __init__(self, air):
+        self.air = air
+        self.zoneIds = self.getZoneIds()
+        # zoneId -> (dnaStore, dnaData)
+        self.preloaded = {}
+        self.loadTimes = {}
+        self.totalTime = 0.0
+        self.thread = None
+
+    @staticmethod
+    def getZoneIds():
+        zoneIds = []
+        for hoodId in ToontownGlobals.HoodsForTeleportAll:
+            # Bossbot HQ doesn't use DNA.
+            if hoodId == ToontownGlobals.BossbotHQ:
+                continue
+
+            zoneIds.append(hoodId)
+            zoneIds.extend(ToontownGlobals.HoodHierarchy.get(hoodId, ()))
+
+        return zoneIds
+
+    def start(self):
+        self.thread = threading.Thread(target=self.__preload, name='DNAPreloaderAI')
+        self.thread.daemon = True
+        self.thread.start()
+
+    def __preload(self):
+        startTime = time.perf_counter()
+        try:
+            for zoneId in self.zoneIds:
+                zoneStartTime = time.perf_counter()
+                dnaStore = DNAStorage()
+                dnaData = self.air.loadDNAFileAI(dnaStore, self.air.genDNAFileName(zoneId))
+                self.preloaded[zoneId] = (dnaStore, dnaData)
+                self.loadTimes[zoneId] = time.perf_counter() - zoneStartTime
+        except Exception as e:
+            # Whatever didn't get preloaded is simply loaded by createZones.
+            self.notify.warning('Preloading DNA failed: %s' % e)
+
+        self.totalTime = time.perf_counter() - startTime
+
+    def wait(self):
+        if self.thread is None:
+            return
+
+        startTime = time.perf_counter()
+        self.thread.join()
+        self.thread = None
+        self.notify.info('Preloaded %d DNA files in %0.2f seconds, waited %0.2f seconds for them.' % (
+            len(self.preloaded), self.totalTime, time.perf_counter() - startTime))
+        for zoneId in self.zoneIds:
+            if zoneId in self.loadTimes:
+                self.notify.debug('%s: %0.3f seconds' % (self.air.genDNAFileName(zoneId), self.loadTimes[zoneId]))
+
+    def takeZone(self, zoneId):
+        """
+        Returns (dnaStore, dnaData) for zoneId, waiting for the preload to
+        finish if needed, or None if the zone was not preloaded.
+        """
+        self.wait()
+        return self.preloaded.pop(zoneId, None)
@@ -0,0 +1,127 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import threading
+import time
+
+parser = argparse.ArgumentParser(description='Open Toontown - DNA preloader benchmark')
+parser.add_argument('--runs', type=int, default=3, help='Number of simulated startups each way; the best run counts.')
+parser.add_argument('--handshake', type=float, default=0.5,
+                    help='Seconds the main thread waits on the message director before creating objects.')
+parser.add_argument('--work', type=float, default=1.0,
+                    help='Seconds of Python work standing in for createGlobals and createLocals.')
+parser.add_argument('config', nargs='*', default=['etc/Configrc.prc'],
+                    help='PRC file(s) to load; they set the model path the DNA is found on.')
+args = parser.parse_args()
+
+for prc in args.config:
+    loadPrcFile(prc)
+
+
+class game:
+    name = 'toontown'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from panda3d.toontown import *
+from toontown.ai.DNAPreloaderAI import DNAPreloaderAI
+from toontown.ai.ToontownAIRepository import ToontownAIRepository
+
+
+class BenchmarkAir:
+    """What the preloader needs of the AI repository."""
+    genDNAFileName = ToontownAIRepository.genDNAFileName
+    loadDNAFileAI = ToontownAIRepository.loadDNAFileAI
+
+    def __init__(self):
+        self.dnaLoadLock = threading.Lock()
+
+
+def pythonWork(iterations):
+    total = 0
+    for i in range(iterations):
+        total += i * i
+
+    return total
+
+
+def measureWorkRate():
+    """Returns the iterations of pythonWork the main thread does per second."""
+    iterations = 100000
+    while True:
+        startTime = time.perf_counter()
+        pythonWork(iterations)
+        elapsed = time.perf_counter() - startTime
+        if elapsed > 0.2:
+            return iterations / elapsed
+
+        iterations *= 2
+
+
+def loadSerially(air, zoneIds):
+    startTime = time.perf_counter()
+    for zoneId in zoneIds:
+        air.loadDNAFileAI(DNAStorage(), air.genDNAFileName(zoneId))
+
+    return time.perf_counter() - startTime
+
+
+def measureSharedRate(air, chunk):
+    """
+    Returns the iterations of pythonWork per second the main thread keeps
+    up while the preloader parses on its own thread.  It is about the rate
+    alone if loadDNAFileAI releases the GIL, and well below it if not.
+    """
+    preloader = DNAPreloaderAI(air)
+    preloader.start()
+    iterations = 0
+    startTime = time.perf_counter()
+    while preloader.thread.is_alive():
+        pythonWork(chunk)
+        iterations += chunk
+
+    elapsed = time.perf_counter() - startTime
+    preloader.wait()
+    return iterations / elapsed
+
+
+def startup(air, zoneIds, workIterations, preload):
+    """Times the part of a district startup the preloader overlaps with, up to the last zone's DNA."""
+    startTime = time.perf_counter()
+    preloader = None
+    if preload:
+        preloader = DNAPreloaderAI(air)
+        preloader.start()
+
+    time.sleep(args.handshake)
+    pythonWork(workIterations)
+    for zoneId in zoneIds:
+        preloaded = None
+        if preloader is not None:
+            preloaded = preloader.takeZone(zoneId)
+
+        if preloaded is None:
+            air.loadDNAFileAI(DNAStorage(), air.genDNAFileName(zoneId))
+
+    return time.perf_counter() - startTime
+
+
+air = BenchmarkAir()
+zoneIds = DNAPreloaderAI.getZoneIds()
+parseTime = min([loadSerially(air, zoneIds) for i in range(args.runs)])
+rate = measureWorkRate()
+sharedRate = measureSharedRate(air, max(int(rate / 1000), 1))
+print('Parsing the DNA of %d zones takes %.2f s.' % (len(zoneIds), parseTime))
+print('While it is parsed on the preloader thread, the main thread keeps %.0f%% of its Python throughput.' % (
+    sharedRate * 100.0 / rate))
+
+workIterations = int(rate * args.work)
+serialTime = min([startup(air, zoneIds, workIterations, False) for i in range(args.runs)])
+preloadTime = min([startup(air, zoneIds, workIterations, True) for i in range(args.runs)])
+print('Startup with a %.2f s handshake and %.2f s of object creation:' % (args.handshake, args.work))
+print('  want-dna-preload 0  %8.2f s' % serialTime)
+print('  want-dna-preload 1  %8.2f s  (%+.2f s)' % (preloadTime, preloadTime - serialTime))
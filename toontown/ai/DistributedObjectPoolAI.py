@@ -0,0 +1,353 @@
+import time
+
+from direct.directnotify import DirectNotifyGlobal
+from direct.distributed.MsgTypes import *
+from direct.distributed.PyDatagram import PyDatagram
+from direct.task import Task
+from panda3d.core import NodePath
+from panda3d.direct import DCPacker
+
+# Values of these types are compared by the leak check; anything else is
+# only checked for its type.
+PlainTypes = (type(None), bool, int, float, str, bytes)
+
+# Kept from one life to the next: who the object is and where it lives.
+IdentityKeys = ('doId', 'parentId', 'zoneId', 'lastNonQuietZone', '_zoneData', 'poolKey')
+
+
+class DistributedObjectPoolAI:
+    """
+    Recycles the distributed objects that come and go most often on the
+    AI, the street Cogs and the playground treasures.
+
+    When want-do-pool is on, an object its owner is done with is not
+    deleted.  It stops what it was doing, and is moved into a zone of
+    its own that no client is interested in; the clients that could see
+    it see it leave, just as if it had been deleted.  The next time the
+    owner needs an object of that class in the same zone, the parked
+    one is initialized afresh, the required fields that differ from
+    the copy the state server parked are sent in one message while it
+    is still out of sight, and then it is moved into the zone it was
+    wanted in.  That saves the doId and building the Python object.
+
+    It is not a performance option, and is off by default.  Astron has
+    no message that both sets fields and moves an object, so a recycled
+    life costs the two moves, plus the field refresh when anything
+    changed and the ram field delete when anything was set, where a new
+    one costs its generate and its delete; and packing the fields to
+    compare costs the AI more than building the object did.
+    DistributedObjectPoolBenchmark publishes both ways.
+
+    A class can be pooled if it has a recycle() method, which stops
+    whatever the object was doing in its last life.  If it has ram
+    fields that aren't required, getRamFieldsSet() returns the names of
+    the ones it set, and only those are deleted when it is parked; a
+    class without it has all of them deleted.  Only what __init__
+    sets is reset, so do-pool-check-leaks compares each recycled object
+    with a new one before handing it out, and hands out the new one
+    instead if they differ.
+
+    When the pool is off, acquire(), generate() and release() construct,
+    generate and delete objects as their owners used to.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('DistributedObjectPoolAI')
+
+    def __init__(self, air):
+        self.air = air
+        self.enabled = config.GetBool('want-do-pool', False)
+        self.checkLeaks = config.GetBool('do-pool-check-leaks', False)
+        self.maxFree = config.GetInt('do-pool-max-free', 16)
+        self.statsPeriod = config.GetFloat('do-pool-stats-period', 3600)
+        self.zoneId = None
+        if self.enabled:
+            self.zoneId = self.air.allocateZone()
+        # (class, poolKey) -> [parked objects]
+        self.freeLists = {}
+        # doIds of the objects acquired from a free list but not yet
+        # generated again.
+        self.pending = set()
+        # class -> the attribute names its objects have when they are new
+        # and generated; anything else was added during a life.
+        self.classKeys = {}
+        # dclass -> the numbers of its ram fields that aren't required.
+        self.ramFields = {}
+        # dclass -> its required fields.
+        self.requiredFields = {}
+        # doId -> {field number: packed value} of the parked objects,
+        # as the state server has them.
+        self.parkedFields = {}
+        self.numCreated = 0
+        self.numRecycled = 0
+        self.numParked = 0
+        self.numDeleted = 0
+        self.numLeaks = 0
+        self.startTime = time.time()
+        self.taskName = 'distributedObjectPoolAI'
+        if self.enabled and self.statsPeriod > 0:
+            taskMgr.doMethodLater(self.statsPeriod, self.__logStats, self.taskName + '-stats')
+
+    def delete(self):
+        taskMgr.remove(self.taskName + '-stats')
+        for freeList in self.freeLists.values():
+            for obj in freeList:
+                obj.requestDelete()
+
+        self.freeLists = {}
+        self.pending = set()
+        self.parkedFields = {}
+
+    def acquire(self, doClass, poolKey, *args):
+        """
+        Returns an object of doClass constructed with (air, *args), for
+        use in the zone poolKey.  It may be one recycled from that zone;
+        either way, set it up as a new one and pass it to generate().
+        """
+        freeList = self.freeLists.get((doClass, poolKey))
+        if freeList:
+            obj = freeList.pop()
+            self.__reset(obj, args)
+            if self.checkLeaks:
+                fresh = doClass(self.air, *args)
+                leaks = self.__findLeaks(obj, fresh)
+                if leaks:
+                    self.numLeaks += 1
+                    self.notify.warning('%s %d kept %s from its last life; deleting it.' % (
+                        doClass.__name__, obj.doId, ', '.join(leaks)))
+                    del self.parkedFields[obj.doId]
+                    obj.requestDelete()
+                    self.numDeleted += 1
+                    return self.__adopt(fresh, poolKey)
+
+                if isinstance(fresh, NodePath):
+                    fresh.removeNode()
+
+            obj.poolKey = poolKey
+            self.pending.add(obj.doId)
+            return obj
+
+        return self.__adopt(doClass(self.air, *args), poolKey)
+
+    def __adopt(self, obj, poolKey):
+        self.numCreated += 1
+        if self.enabled and hasattr(obj, 'recycle'):
+            keys = self.classKeys.setdefault(obj.__class__, set())
+            keys.update(obj.__dict__)
+            obj.poolKey = poolKey
+        return obj
+
+    def isPending(self, obj):
+        """
+        Returns true if obj was recycled by acquire() and is not generated
+        again yet; its updates would only reach the parked copy, which
+        generate() refreshes anyway.
+        """
+        return getattr(obj, 'doId', None) in self.pending
+
+    def generate(self, obj, zoneId):
+        """Generates an object from acquire() in zoneId, or brings a recycled one there."""
+        if not obj.isGenerated():
+            keys = set(obj.__dict__)
+            obj.generateWithRequired(zoneId)
+            if obj.__class__ in self.classKeys:
+                # What generating adds is the object's too.
+                self.classKeys[obj.__class__].update(set(obj.__dict__) - keys)
+            return
+
+        self.pending.remove(obj.doId)
+        self.numRecycled += 1
+        self.__sendRequiredFields(obj, self.parkedFields.pop(obj.doId))
+        # Owners set zoneId before generating; put it back where it is
+        # parked so the move is seen.
+        obj.parentId = self.air.districtId
+        obj.zoneId = self.zoneId
+        obj.b_setLocation(self.air.districtId, zoneId)
+
+    def release(self, obj):
+        """
+        Parks an object from acquire() its owner is done with, in place
+        of requestDelete().  Anything else is simply deleted.
+        """
+        if obj.isDeleted():
+            return
+
+        poolKey = getattr(obj, 'poolKey', None)
+        if not self.enabled or poolKey == None:
+            obj.requestDelete()
+            return
+
+        freeList = self.freeLists.setdefault((obj.__class__, poolKey), [])
+        if obj in freeList:
+            return
+
+        if obj.doId in self.pending:
+            # Acquired, but never used after all.
+            freeList.append(obj)
+            return
+
+        if len(freeList) >= self.maxFree:
+            obj.requestDelete()
+            self.numDeleted += 1
+            return
+
+        fields = self.__packRequiredFields(obj)
+        if fields == None:
+            obj.requestDelete()
+            self.numDeleted += 1
+            return
+
+        obj.sendDeleteEvent()
+        obj.recycle()
+        obj.b_setLocation(self.air.districtId, self.zoneId)
+        self.__deleteRamFields(obj)
+        self.parkedFields[obj.doId] = fields
+        freeList.append(obj)
+        self.numParked += 1
+
+    def deleteZone(self, poolKey):
+        """Deletes the objects parked for poolKey, when nothing there will need them again."""
+        for key in list(self.freeLists.keys()):
+            if key[1] == poolKey:
+                for obj in self.freeLists.pop(key):
+                    self.pending.discard(obj.doId)
+                    del self.parkedFields[obj.doId]
+                    obj.requestDelete()
+                    self.numDeleted += 1
+
+    def __reset(self, obj, args):
+        # Forget everything the last life added, then initialize it again.
+        # The distributed object and NodePath bases guard their __init__,
+        # so the doId, dclass and node survive.
+        keys = self.classKeys.get(obj.__class__, ())
+        identity = dict((key, obj.__dict__[key]) for key in IdentityKeys if key in obj.__dict__)
+        for key in list(obj.__dict__.keys()):
+            if key not in keys:
+                del obj.__dict__[key]
+
+        obj.__init__(self.air, *args)
+        obj.__dict__.update(identity)
+
+    def __findLeaks(self, obj, fresh):
+        """Returns the attributes in which the recycled obj differs from a new one."""
+        leaks = []
+        keys = self.classKeys.get(obj.__class__, ())
+        for key, value in obj.__dict__.items():
+            if key in IdentityKeys or key.startswith('_DistributedObjectAI__'):
+                continue
+
+            if key not in fresh.__dict__:
+                if key not in keys:
+                    leaks.append(key)
+                continue
+
+            freshValue = fresh.__dict__[key]
+            if type(value) is not type(freshValue):
+                leaks.append(key)
+            elif isinstance(value, PlainTypes) and value != freshValue:
+                leaks.append(key)
+            elif isinstance(value, (tuple, list, dict, set)) and len(value) != len(freshValue):
+                leaks.append(key)
+
+        if isinstance(obj, NodePath):
+            if obj.hasParent() or obj.getNumChildren() or not obj.getTransform().isIdentity():
+                leaks.append('its node')
+
+        return leaks
+
+    def __packRequiredFields(self, obj):
+        """Returns {field number: packed value} of obj's required fields, or None if one won't pack."""
+        dclass = obj.dclass
+        fields = self.requiredFields.get(dclass)
+        if fields == None:
+            fields = []
+            for i in range(dclass.getNumInheritedFields()):
+                field = dclass.getInheritedField(i)
+                if field.isRequired() and field.asMolecularField() == None:
+                    fields.append(field)
+
+            self.requiredFields[dclass] = fields
+
+        packer = DCPacker()
+        offsets = []
+        for field in fields:
+            offsets.append(packer.getLength())
+            packer.beginPack(field)
+            if not dclass.packRequiredField(packer, obj, field) or not packer.endPack():
+                self.notify.warning('Could not pack %s of %s %d.' % (field.getName(), dclass.getName(), obj.doId))
+                return None
+
+        data = packer.getBytes()
+        offsets.append(len(data))
+        packed = {}
+        for i in range(len(fields)):
+            packed[fields[i].getNumber()] = data[offsets[i]:offsets[i + 1]]
+
+        return packed
+
+    def __sendRequiredFields(self, obj, parkedFields):
+        # The required fields that differ from the parked copy, in one
+        # message.  The parked copy is what the object had when it was
+        # released, which is what the state server has, as long as it
+        # changed its required fields with their b_ setters.
+        fields = self.__packRequiredFields(obj)
+        if fields == None:
+            fields = {}
+
+        changed = [(fieldNumber, value) for fieldNumber, value in fields.items()
+                   if parkedFields.get(fieldNumber) != value]
+        if not changed:
+            return
+
+        dg = PyDatagram()
+        dg.addServerHeader(obj.doId, self.air.ourChannel, STATESERVER_OBJECT_SET_FIELDS)
+        dg.addUint32(obj.doId)
+        dg.addUint16(len(changed))
+        for fieldNumber, value in changed:
+            dg.addUint16(fieldNumber)
+            dg.appendData(value)
+
+        self.air.send(dg)
+
+    def __deleteRamFields(self, obj):
+        # Ram fields set in the last life, like a treasure's setGrab,
+        # would otherwise be sent to clients with the next one.
+        dclass = obj.dclass
+        fields = self.ramFields.get(dclass)
+        if fields == None:
+            fields = {}
+            for i in range(dclass.getNumInheritedFields()):
+                field = dclass.getInheritedField(i)
+                if field.isRam() and not field.isRequired() and field.asMolecularField() == None:
+                    fields[field.getName()] = field.getNumber()
+
+            self.ramFields[dclass] = fields
+        if not fields:
+            return
+
+        if hasattr(obj, 'getRamFieldsSet'):
+            fieldNumbers = [fields[fieldName] for fieldName in obj.getRamFieldsSet()]
+        else:
+            fieldNumbers = list(fields.values())
+        if not fieldNumbers:
+            return
+
+        dg = PyDatagram()
+        dg.addServerHeader(obj.doId, self.air.ourChannel, STATESERVER_OBJECT_DELETE_FIELDS_RAM)
+        dg.addUint32(obj.doId)
+        dg.addUint16(len(fieldNumbers))
+        for fieldNumber in fieldNumbers:
+            dg.addUint16(fieldNumber)
+
+        self.air.send(dg)
+
+    def getNumFree(self):
+        return sum([len(freeList) for freeList in self.freeLists.values()])
+
+    def formatStats(self):
+        hours = max(time.time() - self.startTime, 1.0) / 3600.0
+        return '%d objects recycled (%0.0f allocations avoided per hour), %d created, %d parked, %d free, %d deleted, %d leaks' % (
+            self.numRecycled, self.numRecycled / hours, self.numCreated, self.numParked, self.getNumFree(),
+            self.numDeleted, self.numLeaks)
+
+    def __logStats(self, task):
+        self.notify.info(self.formatStats())
+        return Task.again
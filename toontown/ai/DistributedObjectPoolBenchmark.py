@@ -0,0 +1,298 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import random
+import time
+
+parser = argparse.ArgumentParser(description='Open Toontown - distributed object pool benchmark')
+parser.add_argument('--lives', type=int, default=5000, help='Number of Cogs and treasures generated in each run.')
+parser.add_argument('--population', type=int, default=200, help='Number of them alive at once.')
+parser.add_argument('--zones', type=int, default=8, help='Number of zones they live in, each watched by a client.')
+parser.add_argument('--seed', type=int, default=0, help='Seed of the lives they lead.')
+parser.add_argument('config', nargs='*', default=['etc/Configrc.prc'],
+                    help='PRC file(s) to load; they name the DC files.')
+args = parser.parse_args()
+
+for prc in args.config:
+    loadPrcFile(prc)
+
+
+class game:
+    name = 'toontown'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from direct.distributed.MsgTypes import *
+from direct.distributed.PyDatagram import PyDatagram
+from direct.distributed.PyDatagramIterator import PyDatagramIterator
+from otp.astron.AstronStandIn import AstronStandIn, STATESERVER_CONTROL
+from otp.astron.MessageDirector import MDParticipant
+from otp.distributed import OtpDoGlobals
+from panda3d.direct import DCPacker
+from toontown.ai.DistributedObjectPoolAI import DistributedObjectPoolAI
+from toontown.safezone import DistributedTTTreasureAI
+from toontown.suit import DistributedSuitAI
+
+AI_CHANNEL = 401000000
+DISTRICT_ID = AI_CHANNEL + 1
+FIRST_DO_ID = AI_CHANNEL + 2
+FIRST_ZONE = 2100
+POOL_ZONE = 60000
+
+
+class BenchmarkAir(MDParticipant):
+    """
+    Plays the parts of the AI repository the pool and its objects use,
+    talking to the stand-in's message director in-process.  It also
+    plays the login manager, to let the clients in.
+    """
+
+    def __init__(self, standIn):
+        MDParticipant.__init__(self, standIn.messageDirector)
+        self.dcFile = standIn.dcFile
+        self.dclassesByName = {}
+        for i in range(self.dcFile.getNumClasses()):
+            dclass = self.dcFile.getClass(i)
+            self.dclassesByName[dclass.getName()] = dclass
+            self.dclassesByName[dclass.getName() + 'AI'] = dclass
+
+        self.ourChannel = AI_CHANNEL
+        self.serverId = STATESERVER_CONTROL
+        self.districtId = DISTRICT_ID
+        self.doId2do = {}
+        self.nextDoId = FIRST_DO_ID
+        self.loginRequests = []
+        self.doPool = None
+        self.numSent = 0
+        self.bytesSent = 0
+        # Seconds spent in the stand-in, routing what we send; Astron
+        # spends them in its own processes.
+        self.routeTime = 0.0
+        self.messageDirector.connectLocal(self)
+        self.subscribeChannel(AI_CHANNEL)
+        self.subscribeChannel(OtpDoGlobals.OTP_DO_ID_ASTRON_LOGIN_MANAGER)
+
+    def handleDatagram(self, datagram, channels, di):
+        sender = di.getUint64()
+        msgType = di.getUint16()
+        if msgType == STATESERVER_OBJECT_DELETE_RAM:
+            # The state server deleted it; now we do.
+            obj = self.doId2do.pop(di.getUint32(), None)
+            if obj:
+                obj.delete()
+        elif msgType == STATESERVER_OBJECT_SET_FIELD and di.getUint32() == OtpDoGlobals.OTP_DO_ID_ASTRON_LOGIN_MANAGER:
+            self.loginRequests.append(sender)
+
+    def send(self, dg):
+        self.numSent += 1
+        self.bytesSent += dg.getLength()
+        start = time.perf_counter()
+        self.routeDatagram(dg)
+        self.routeTime += time.perf_counter() - start
+
+    def sendControl(self, channel, msgType, *values):
+        dg = PyDatagram()
+        dg.addServerHeader(channel, AI_CHANNEL, msgType)
+        for add, value in values:
+            add(dg, value)
+
+        self.routeDatagram(dg)
+
+    def createDistrict(self):
+        dclass = self.dcFile.getClassByName('ToontownDistrict')
+        dg = PyDatagram()
+        dg.addServerHeader(STATESERVER_CONTROL, AI_CHANNEL, STATESERVER_CREATE_OBJECT_WITH_REQUIRED)
+        dg.addUint32(DISTRICT_ID)
+        dg.addUint32(OtpDoGlobals.OTP_DO_ID_TOONTOWN)
+        dg.addUint32(OtpDoGlobals.OTP_ZONE_ID_DISTRICTS)
+        dg.addUint16(dclass.getNumber())
+        for i in range(dclass.getNumInheritedFields()):
+            field = dclass.getInheritedField(i)
+            if field.isRequired() and field.asMolecularField() is None:
+                dg.appendData(field.getDefaultValue())
+
+        self.routeDatagram(dg)
+        self.sendControl(DISTRICT_ID, STATESERVER_OBJECT_SET_AI, (PyDatagram.addUint64, AI_CHANNEL))
+
+    def allocateChannel(self):
+        doId = self.nextDoId
+        self.nextDoId += 1
+        return doId
+
+    def deallocateChannel(self, doId):
+        pass
+
+    def allocateZone(self):
+        return POOL_ZONE
+
+    def generateWithRequired(self, do, parentId, zoneId, optionalFields=[]):
+        do.doId = self.allocateChannel()
+        self.doId2do[do.doId] = do
+        do.parentId = parentId
+        do.zoneId = zoneId
+        do.sendGenerateWithRequired(self, parentId, zoneId, optionalFields)
+
+    def requestDelete(self, do):
+        dg = PyDatagram()
+        dg.addServerHeader(do.doId, self.ourChannel, STATESERVER_OBJECT_DELETE_RAM)
+        dg.addUint32(do.doId)
+        self.send(dg)
+
+    def sendSetLocation(self, do, parentId, zoneId):
+        dg = PyDatagram()
+        dg.addServerHeader(do.doId, self.ourChannel, STATESERVER_OBJECT_SET_LOCATION)
+        dg.addUint32(parentId)
+        dg.addUint32(zoneId)
+        self.send(dg)
+
+    def storeObjectLocation(self, do, parentId, zoneId):
+        do.parentId = parentId
+        do.zoneId = zoneId
+
+    def sendUpdate(self, do, fieldName, args):
+        self.send(do.dclass.aiFormatUpdate(fieldName, do.doId, do.doId, self.ourChannel, args))
+
+
+class BenchmarkClient:
+    """A game client watching one zone, remembering what it was last told each object looks like."""
+
+    def __init__(self, standIn, air, zoneId):
+        self.zoneId = zoneId
+        # doId -> (dclass number, the required fields it entered with)
+        self.visible = {}
+        self.numReceived = 0
+        self.bytesReceived = 0
+        self.numOther = 0
+        self.connection = standIn.clientAgent.connectLocal(self.receive)
+        self.send(CLIENT_HELLO, (PyDatagram.addUint32, standIn.clientAgent.dcHash),
+                  (PyDatagram.addString, config.GetString('server-version', 'no_version_set')))
+        loginManager = standIn.dcFile.getClassByName('AstronLoginManager')
+        self.connection.send(loginManager.clientFormatUpdate('requestLogin', OtpDoGlobals.OTP_DO_ID_ASTRON_LOGIN_MANAGER,
+                                                             ['bench']))
+        air.sendControl(air.loginRequests.pop(), CLIENTAGENT_SET_STATE, (PyDatagram.addUint16, 2))
+        self.send(CLIENT_ADD_INTEREST, (PyDatagram.addUint32, 1), (PyDatagram.addUint16, 1),
+                  (PyDatagram.addUint32, DISTRICT_ID), (PyDatagram.addUint32, zoneId))
+
+    def send(self, msgType, *values):
+        dg = PyDatagram()
+        dg.addUint16(msgType)
+        for add, value in values:
+            add(dg, value)
+
+        self.connection.send(dg)
+
+    def receive(self, datagram):
+        self.numReceived += 1
+        self.bytesReceived += datagram.getLength()
+        di = PyDatagramIterator(datagram)
+        msgType = di.getUint16()
+        if msgType in (CLIENT_ENTER_OBJECT_REQUIRED, CLIENT_ENTER_OBJECT_REQUIRED_OTHER):
+            doId = di.getUint32()
+            di.getUint32()
+            di.getUint32()
+            dclassNumber = di.getUint16()
+            self.visible[doId] = (dclassNumber, di.getRemainingBytes())
+            if msgType == CLIENT_ENTER_OBJECT_REQUIRED_OTHER:
+                # Only the last life's setGrab could be here.
+                self.numOther += 1
+        elif msgType == CLIENT_OBJECT_LEAVING:
+            del self.visible[di.getUint32()]
+
+
+def packClientFields(obj):
+    """The required fields of obj a client is sent when it enters, as the AI has them now."""
+    packer = DCPacker()
+    dclass = obj.dclass
+    for i in range(dclass.getNumInheritedFields()):
+        field = dclass.getInheritedField(i)
+        if field.isRequired() and field.isBroadcast() and field.asMolecularField() == None:
+            packer.beginPack(field)
+            dclass.packRequiredField(packer, obj, field)
+            packer.endPack()
+
+    return packer.getBytes()
+
+
+class BenchmarkTreasurePlanner:
+    healAmount = 3
+
+
+def makeObject(pool, zoneId, rng):
+    """Acquires, sets up and generates a Cog or treasure, as their planners do."""
+    if rng.random() < 0.5:
+        suitType = rng.randint(1, 8)
+        suit = pool.acquire(DistributedSuitAI.DistributedSuitAI, zoneId, None)
+        suit.setupSuitDNA(suitType + rng.randrange(5), suitType, rng.choice('cslm'))
+        suit.setSkelecog(rng.random() < 0.1)
+        suit.pathState = 1
+        pool.generate(suit, zoneId)
+        return suit
+
+    treasure = pool.acquire(DistributedTTTreasureAI.DistributedTTTreasureAI, zoneId, BenchmarkTreasurePlanner,
+                            rng.uniform(-50, 50), rng.uniform(-50, 50), 0)
+    pool.generate(treasure, zoneId)
+    return treasure
+
+
+def run(wantPool, checkLeaks):
+    page = loadPrcFileData('pool benchmark', 'want-do-pool %d\ndo-pool-check-leaks %d\ndo-pool-max-free %d' % (
+        wantPool, checkLeaks, args.population))
+    standIn = AstronStandIn()
+    air = BenchmarkAir(standIn)
+    air.createDistrict()
+    zones = [FIRST_ZONE + i for i in range(args.zones)]
+    clients = [BenchmarkClient(standIn, air, zoneId) for zoneId in zones]
+    pool = DistributedObjectPoolAI(air)
+    air.doPool = pool
+    rng = random.Random(args.seed)
+    live = []
+    numSent = air.numSent
+    bytesSent = air.bytesSent
+    routeTime = air.routeTime
+    start = time.perf_counter()
+    for life in range(args.lives):
+        if len(live) >= args.population:
+            pool.release(live.pop(rng.randrange(len(live))))
+
+        obj = makeObject(pool, rng.choice(zones), rng)
+        if isinstance(obj, DistributedTTTreasureAI.DistributedTTTreasureAI) and rng.random() < 0.5:
+            obj.d_setGrab(rng.randint(100000000, 100000100))
+        live.append(obj)
+
+    elapsed = time.perf_counter() - start
+    unloadPrcFile(page)
+
+    # Every client must see exactly the objects alive in its zone, as
+    # they are now.
+    mismatches = 0
+    for client in clients:
+        expected = dict((obj.doId, (obj.dclass.getNumber(), packClientFields(obj))) for obj in live
+                        if obj.zoneId == client.zoneId)
+        mismatches += len(set(expected.items()) ^ set(client.visible.items()))
+
+    numReceived = sum([client.numReceived for client in clients])
+    bytesReceived = sum([client.bytesReceived for client in clients])
+    numOther = sum([client.numOther for client in clients])
+    routeTime = air.routeTime - routeTime
+    return (elapsed / args.lives * 1000000.0, (elapsed - routeTime) / args.lives * 1000000.0, pool.numCreated, (air.numSent - numSent) / args.lives,
+            (air.bytesSent - bytesSent) / args.lives, numReceived / args.lives, bytesReceived / args.lives,
+            pool.numLeaks, mismatches + numOther)
+
+
+print('%d lives, %d alive at once in %d zones' % (args.lives, args.population, args.zones))
+print('%-12s %10s %10s %10s %10s %10s %10s %10s %8s %10s' % ('pool', 'us/life', 'AI us/life', 'created', 'AI msgs',
+                                                            'AI bytes', 'client msgs', 'client B', 'leaks', 'mismatches'))
+failed = False
+for name, wantPool, checkLeaks in (('off', 0, 0), ('on', 1, 0), ('on, checked', 1, 1)):
+    results = run(wantPool, checkLeaks)
+    print('%-12s %10.1f %10.1f %10d %10.2f %10.1f %10.2f %10.1f %8d %10d' % ((name,) + results))
+    if results[-1] or results[-2]:
+        failed = True
+
+if failed:
+    print('Clients saw objects that differ from the AI, or recycled objects leaked state.')
+    raise SystemExit(1)
@@ -0,0 +1,174 @@
+import time
+
+from direct.directnotify import DirectNotifyGlobal
+from direct.task import Task
+
+
+class TimerWheelAI:
+    """
+    A hashed timing wheel shared by the per-object timers of the AI.
+
+    Many AI objects (suits, toons healing in a safezone, pets, treasure
+    planners) used to schedule their own uniquely named doMethodLater and
+    re-arm it every time it fired.  Each of those costs a task object, a
+    formatted task name and a heap insert/removal.  Here, timers are plain
+    entries hashed into a ring of slots by their due tick and addressed by an
+    integer handle.  A single task advances the wheel once per frame and
+    fires every callback that has come due in one batch.
+
+    Delays are rounded up to the wheel's resolution, so a timer never fires
+    early, and fires at most one resolution (plus a frame) late.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('TimerWheelAI')
+
+    def __init__(self, air):
+        self.air = air
+        self.resolution = config.GetFloat('ai-timer-wheel-resolution', 0.05)
+        self.numSlots = config.GetInt('ai-timer-wheel-slots', 1024)
+        self.statsPeriod = config.GetFloat('ai-timer-wheel-stats-period', 0)
+        self.slots = [{} for i in range(self.numSlots)]
+        # handle -> [dueTick, periodTicks, method, extraArgs, subsystem]
+        self.timers = {}
+        self.nextHandle = 1
+        self.currentTick = self.__getTick()
+        # subsystem -> [callbacks, seconds] for the last frame the wheel
+        # advanced, the running totals and the worst single frame since the
+        # stats were last reset.
+        self.frameStats = {}
+        self.totalStats = {}
+        self.maxFrameStats = {}
+        self.taskName = 'timerWheelAI'
+        taskMgr.add(self.__advance, self.taskName, priority=-40)
+        if self.statsPeriod > 0:
+            taskMgr.doMethodLater(self.statsPeriod, self.__logStats, self.taskName + '-stats')
+
+    def delete(self):
+        taskMgr.remove(self.taskName)
+        taskMgr.remove(self.taskName + '-stats')
+        self.slots = [{} for i in range(self.numSlots)]
+        self.timers = {}
+
+    def __getTick(self):
+        return int(globalClock.getFrameTime() / self.resolution)
+
+    def __ticksFor(self, delay):
+        return max(1, int(-(-delay // self.resolution)))
+
+    def __schedule(self, handle, dueTick):
+        timer = self.timers[handle]
+        timer[0] = dueTick
+        self.slots[dueTick % self.numSlots][handle] = timer
+
+    def doMethodLater(self, delay, method, subsystem, extraArgs=()):
+        """
+        Calls method(*extraArgs) once, delay seconds from now.
+        Returns an integer handle that can be given to remove().
+        """
+        handle = self.nextHandle
+        self.nextHandle += 1
+        self.timers[handle] = [0, 0, method, extraArgs, subsystem]
+        self.__schedule(handle, self.currentTick + self.__ticksFor(delay))
+        return handle
+
+    def addRecurring(self, period, method, subsystem, firstDelay=None, extraArgs=()):
+        """
+        Calls method(*extraArgs) every period seconds until the handle is
+        removed.  The first call happens after firstDelay seconds, which
+        defaults to one period; pass a random fraction of the period to
+        spread many timers of the same kind across frames.
+        """
+        if firstDelay is None:
+            firstDelay = period
+
+        handle = self.nextHandle
+        self.nextHandle += 1
+        self.timers[handle] = [0, self.__ticksFor(period), method, extraArgs, subsystem]
+        self.__schedule(handle, self.currentTick + self.__ticksFor(firstDelay))
+        return handle
+
+    def remove(self, handle):
+        """Cancels a timer.  Removing an unknown or already fired handle is harmless."""
+        timer = self.timers.pop(handle, None)
+        if timer is None:
+            return False
+
+        self.slots[timer[0] % self.numSlots].pop(handle, None)
+        return True
+
+    def hasTimer(self, handle):
+        return handle in self.timers
+
+    def getNumTimers(self):
+        return len(self.timers)
+
+    def __advance(self, task):
+        targetTick = self.__getTick()
+        if targetTick <= self.currentTick:
+            return Task.cont
+
+        self.frameStats = {}
+        while self.currentTick < targetTick:
+            self.currentTick += 1
+            slot = self.slots[self.currentTick % self.numSlots]
+            if not slot:
+                continue
+
+            due = [(handle, timer) for handle, timer in slot.items() if timer[0] <= self.currentTick]
+            for handle, timer in due:
+                # An earlier callback in this batch may have removed it.
+                if self.timers.get(handle) is not timer:
+                    continue
+
+                del slot[handle]
+                if timer[1]:
+                    self.__schedule(handle, self.currentTick + timer[1])
+                else:
+                    del self.timers[handle]
+
+                self.__fire(timer)
+
+        for subsystem, (count, elapsed) in self.frameStats.items():
+            total = self.totalStats.setdefault(subsystem, [0, 0.0])
+            total[0] += count
+            total[1] += elapsed
+            peak = self.maxFrameStats.setdefault(subsystem, [0, 0.0])
+            peak[0] = max(peak[0], count)
+            peak[1] = max(peak[1], elapsed)
+
+        return Task.cont
+
+    def __fire(self, timer):
+        start = time.perf_counter()
+        try:
+            timer[2](*timer[3])
+        finally:
+            stats = self.frameStats.get(timer[4])
+            if stats is None:
+                stats = self.frameStats[timer[4]] = [0, 0.0]
+            stats[0] += 1
+            stats[1] += time.perf_counter() - start
+
+    def getFrameStats(self):
+        """Returns {subsystem: (callbacks, seconds)} for the last frame the wheel advanced."""
+        return dict((subsystem, tuple(stats)) for subsystem, stats in self.frameStats.items())
+
+    def getTotalStats(self):
+        return dict((subsystem, tuple(stats)) for subsystem, stats in self.totalStats.items())
+
+    def resetStats(self):
+        self.totalStats = {}
+        self.maxFrameStats = {}
+
+    def formatStats(self):
+        lines = ['%d timers, %d ticks/s' % (len(self.timers), round(1.0 / self.resolution))]
+        for subsystem in sorted(self.totalStats):
+            count, elapsed = self.totalStats[subsystem]
+            maxCount, maxElapsed = self.maxFrameStats[subsystem]
+            lines.append('  %s: %d calls, %0.1f ms total, peak %d calls / %0.2f ms in one frame' % (subsystem, count, elapsed * 1000.0, maxCount, maxElapsed * 1000.0))
+
+        return '\n'.join(lines)
+
+    def __logStats(self, task):
+        self.notify.info(self.formatStats())
+        self.resetStats()
+        return Task.again
@@ -1,3 +1,4 @@
+import threading
 import time
 from direct.directnotify import DirectNotifyGlobal
 from direct.distributed.PyDatagram import PyDatagram
@@ -8,8 +9,11 @@ from otp.ai.AIZoneData import AIZoneDataStore
 from otp.ai.AIMsgTypes import *
 from otp.ai.TimeManagerAI import TimeManagerAI
 from otp.distributed.OtpDoGlobals import *
+from toontown.ai.DNAPreloaderAI import DNAPreloaderAI
 from toontown.ai.HolidayManagerAI import HolidayManagerAI
 from toontown.ai.NewsManagerAI import NewsManagerAI
+from toontown.ai.TimerWheelAI import TimerWheelAI
+from toontown.ai.DistributedObjectPoolAI import DistributedObjectPoolAI
 from toontown.ai.WelcomeValleyManagerAI import WelcomeValleyManagerAI
 from toontown.building.DistributedTrophyMgrAI import DistributedTrophyMgrAI
 from toontown.catalog.CatalogManagerAI import CatalogManagerAI
@@ -30,6 +34,7 @@ from toontown.hood.CSHoodDataAI import CSHoodDataAI
 from toontown.hood.CashbotHQDataAI import CashbotHQDataAI
 from toontown.hood.DDHoodDataAI import DDHoodDataAI
 from toontown.hood.DGHoodDataAI import DGHoodDataAI
+from toontown.hood.DNASceneIndex import getDNASceneIndex
 from toontown.hood.DLHoodDataAI import DLHoodDataAI
 from toontown.hood.GSHoodDataAI import GSHoodDataAI
 from toontown.hood.GZHoodDataAI import GZHoodDataAI
@@ -39,6 +44,7 @@ from toontown.hood.OZHoodDataAI import OZHoodDataAI
 from toontown.hood.TTHoodDataAI import TTHoodDataAI
 from toontown.parties.ToontownTimeManager import ToontownTimeManager
 from toontown.pets.PetManagerAI import PetManagerAI
+from toontown.pets.PetMoodBatchAI import PetMoodBatchAI
 from toontown.quest.QuestManagerAI import QuestManagerAI
 from toontown.racing import RaceGlobals
 from toontown.fishing.DistributedFishingPondAI import DistributedFishingPondAI
@@ -76,11 +82,14 @@ class ToontownAIRepository(ToontownInternalRepository):
         self.districtId = None
         self.district = None
         self.districtStats = None
+        self.timerWheel = None
+        self.petMoodBatch = None
         self.holidayManager = None
         self.zoneDataStore = None
         self.petMgr = None
         self.suitInvasionManager = None
         self.zoneAllocator = None
+        self.doPool = None
         self.zoneId2owner = {}
         self.questManager = None
         self.promotionMgr = None
@@ -106,10 +115,20 @@ class ToontownAIRepository(ToontownInternalRepository):
         self.zoneTable = {}
         self.dnaStoreMap = {}
         self.dnaDataMap = {}
+        self.dnaIndexMap = {}
+        self.dnaLoadTime = 0.0
+        self.dnaIndexTime = 0.0
+        self.dnaLoadLock = threading.Lock()
+        self.dnaPreloader = None
         self.hoods = []
         self.buildingManagers = {}
         self.suitPlanners = {}
 
+        # Start parsing the hood DNA while we connect...
+        if config.GetBool('want-dna-preload', False):
+            self.dnaPreloader = DNAPreloaderAI(self)
+            self.dnaPreloader.start()
+
     def handleConnected(self):
         ToontownInternalRepository.handleConnected(self)
 
@@ -138,7 +157,10 @@ class ToontownAIRepository(ToontownInternalRepository):
 
         # Create our zones.
         self.notify.info('Creating zones...')
+        startTime = time.perf_counter()
         self.createZones()
+        self.notify.info('Created zones in %0.2f seconds (%0.2f loading DNA, %0.2f indexing DNA).' % (
+            time.perf_counter() - startTime, self.dnaLoadTime, self.dnaIndexTime))
 
         # Make our district available, and we're done.
         self.district.b_setAvailable(True)
@@ -149,6 +171,9 @@ class ToontownAIRepository(ToontownInternalRepository):
         Creates "local" (non-distributed) objects.
         """
 
+        # Create our shared timer wheel...
+        self.timerWheel = TimerWheelAI(self)
+
         # Create our holiday manager...
         self.holidayManager = HolidayManagerAI(self)
 
@@ -158,12 +183,22 @@ class ToontownAIRepository(ToontownInternalRepository):
         # Create our pet manager...
         self.petMgr = PetManagerAI(self)
 
+        # Drift every pet's mood in one batched step, if asked to...
+        if simbase.wantPets and config.GetBool('want-pet-mood-batch', False):
+            if PetMoodBatchAI.isAvailable():
+                self.petMoodBatch = PetMoodBatchAI(self)
+            else:
+                self.notify.warning('want-pet-mood-batch requires numpy, drifting pet moods individually.')
+
         # Create our suit invasion manager...
         self.suitInvasionManager = SuitInvasionManagerAI(self)
 
         # Create our zone allocator...
         self.zoneAllocator = UniqueIdAllocator(ToontownGlobals.DynamicZonesBegin, ToontownGlobals.DynamicZonesEnd)
 
+        # Create our pool of recycled Cogs and treasures...
+        self.doPool = DistributedObjectPoolAI(self)
+
         # Create our quest manager...
         self.questManager = QuestManagerAI(self)
 
@@ -263,18 +298,21 @@ class ToontownAIRepository(ToontownInternalRepository):
         self.partyManager.generateWithRequired(OTP_ZONE_ID_MANAGEMENT)
 
     def generateHood(self, hoodConstructor, zoneId):
+        startTime = time.perf_counter()
+        dnaStartTime = self.dnaLoadTime + self.dnaIndexTime
+
         # Bossbot HQ doesn't use DNA, so we skip over that.
         if zoneId != ToontownGlobals.BossbotHQ:
-            self.dnaStoreMap[zoneId] = DNAStorage()
-            self.dnaDataMap[zoneId] = loadDNAFileAI(self.dnaStoreMap[zoneId], self.genDNAFileName(zoneId))
+            self.loadDNAZone(zoneId)
             if zoneId in ToontownGlobals.HoodHierarchy:
                 for streetId in ToontownGlobals.HoodHierarchy[zoneId]:
-                    self.dnaStoreMap[streetId] = DNAStorage()
-                    self.dnaDataMap[streetId] = loadDNAFileAI(self.dnaStoreMap[streetId], self.genDNAFileName(streetId))
+                    self.loadDNAZone(streetId)
 
         hood = hoodConstructor(self, zoneId)
         hood.startup()
         self.hoods.append(hood)
+        self.notify.info('Generated hood %s in %0.2f seconds (%0.2f on DNA).' % (
+            zoneId, time.perf_counter() - startTime, self.dnaLoadTime + self.dnaIndexTime - dnaStartTime))
 
     def createZones(self):
         # First, generate our zone2NpcDict...
@@ -408,56 +446,86 @@ class ToontownAIRepository(ToontownInternalRepository):
             return filename.getFullpath()
 
     def loadDNAFileAI(self, dnaStore, dnaFileName):
-        return loadDNAFileAI(dnaStore, dnaFileName)
+        # The DNA parser isn't reentrant, and the preloader may be using it.
+        with self.dnaLoadLock:
+            return loadDNAFileAI(dnaStore, dnaFileName)
+
+    def loadDNAZone(self, zoneId):
+        """
+        Loads the DNA file of a canonical zone into dnaStoreMap and
+        dnaDataMap, and indexes it into dnaIndexMap.  Does nothing if the
+        zone is already loaded.
+        """
+        if zoneId in self.dnaDataMap:
+            return self.dnaDataMap[zoneId]
 
-    def findFishingPonds(self, dnaData, zoneId, area):
+        dnaFileName = self.genDNAFileName(zoneId)
+        startTime = time.perf_counter()
+        preloaded = None
+        if self.dnaPreloader is not None:
+            preloaded = self.dnaPreloader.takeZone(zoneId)
+
+        if preloaded is not None:
+            dnaStore, dnaData = preloaded
+        else:
+            dnaStore = DNAStorage()
+            dnaData = self.loadDNAFileAI(dnaStore, dnaFileName)
+
+        self.dnaLoadTime += time.perf_counter() - startTime
+        self.dnaStoreMap[zoneId] = dnaStore
+        self.dnaDataMap[zoneId] = dnaData
+        if isinstance(dnaData, DNAData):
+            startTime = time.perf_counter()
+            self.dnaIndexMap[zoneId] = getDNASceneIndex(dnaFileName, dnaData, dnaStore)
+            self.dnaIndexTime += time.perf_counter() - startTime
+
+        return dnaData
+
+    def findDNANodes(self, dnaZoneId, pattern, outermostOnly=False):
+        """
+        Returns a list of (dnaGroup, visZoneId) for the DNA nodes of a loaded
+        zone whose name contains pattern.  See DNASceneIndex.findNodes.
+        """
+        dnaIndex = self.dnaIndexMap.get(dnaZoneId)
+        if dnaIndex is None:
+            return []
+
+        return dnaIndex.findNodes(self.dnaDataMap[dnaZoneId], pattern, outermostOnly)
+
+    def findFishingPonds(self, dnaZoneId, zoneId, area):
         fishingPonds, fishingPondGroups = [], []
+        for dnaGroup, visZoneId in self.findDNANodes(dnaZoneId, 'fishing_pond', outermostOnly=True):
+            pondZoneId = zoneId
+            if visZoneId is not None:
+                pondZoneId = ZoneUtil.getHoodId(zoneId) + visZoneId % 1000
 
-        if "fishing_pond" in dnaData.getName():
-            fishingPondGroups.append(dnaData)
+            fishingPondGroups.append(dnaGroup)
             pond = DistributedFishingPondAI(self)
             pond.setArea(area)
-            pond.generateWithRequired(zoneId)
+            pond.generateWithRequired(pondZoneId)
             fishingPonds.append(pond)
-        else:
-            if isinstance(dnaData, DNAVisGroup):
-                name = dnaData.getName()
-                visId = int(name.split(":", 1)[0]) % 1000
-                zoneId = ZoneUtil.getHoodId(zoneId) + visId
-
-            for i in range(dnaData.getNumChildren()):
-                foundFishingPonds, foundFishingPondGroups = self.findFishingPonds(dnaData.at(i), zoneId, area)
-                fishingPonds.extend(foundFishingPonds)
-                fishingPondGroups.extend(foundFishingPondGroups)
 
         return fishingPonds, fishingPondGroups
 
     def findFishingSpots(self, dnaData, pond):
         return []  # TODO
 
-    def findPartyHats(self, dnaData, zoneId):
+    def findPartyHats(self, dnaZoneId, zoneId):
         partyHats = []
-        if 'party_gate' in dnaData.getName():
-            x, y, z = dnaData.getPos()
-            h, p, r = dnaData.getHpr()
+        for dnaGroup, visZoneId in self.findDNANodes(dnaZoneId, 'party_gate'):
+            hatZoneId = zoneId
+            if visZoneId is not None:
+                hatZoneId = ZoneUtil.getHoodId(zoneId) + visZoneId % 1000
+
             partyHat = DistributedPartyGateAI.DistributedPartyGateAI(self)
-            partyHat.generateWithRequired(zoneId)
+            partyHat.generateWithRequired(hatZoneId)
             partyHats.append(partyHat)
-        else:
-            if isinstance(dnaData, DNAVisGroup):
-                name = dnaData.getName()
-                visId = int(name.split(":", 1)[0]) % 1000
-                zoneId = ZoneUtil.getHoodId(zoneId) + visId
-
-        for i in range(dnaData.getNumChildren()):
-            foundPartyHats = self.findPartyHats(dnaData.at(i), zoneId)
-            partyHats.extend(foundPartyHats)
 
         return partyHats
 
-    def findRacingPads(self, dnaData, zoneId, area, type='racing_pad', overrideDNAZone=False):
+    def findRacingPads(self, dnaZoneId, zoneId, area, type='racing_pad', overrideDNAZone=False):
         kartPads, kartPadGroups = [], []
-        if type in dnaData.getName():
+        for dnaData, visZoneId in self.findDNANodes(dnaZoneId, type):
             if type == 'racing_pad':
                 nameSplit = dnaData.getName().split('_')
                 racePad = DistributedRacePadAI(self)
@@ -477,11 +545,6 @@ class ToontownAIRepository(ToontownInternalRepository):
                 kartPads.append(viewPad)
                 kartPadGroups.append(dnaData)
 
-        for i in range(dnaData.getNumChildren()):
-            foundKartPads, foundKartPadGroups = self.findRacingPads(dnaData.at(i), zoneId, area, type, overrideDNAZone)
-            kartPads.extend(foundKartPads)
-            kartPadGroups.extend(foundKartPadGroups)
-
         return kartPads, kartPadGroups
 
     def findStartingBlocks(self, dnaData, kartPad):
@@ -501,19 +564,15 @@ class ToontownAIRepository(ToontownInternalRepository):
 
         return startingBlocks
 
-    def findLeaderBoards(self, dnaData, zoneId):
+    def findLeaderBoards(self, dnaZoneId, zoneId):
         leaderBoards = []
-        if 'leaderBoard' in dnaData.getName():
+        for dnaData, visZoneId in self.findDNANodes(dnaZoneId, 'leaderBoard'):
             x, y, z = dnaData.getPos()
             h, p, r = dnaData.getHpr()
             leaderBoard = DistributedLeaderBoardAI(self, dnaData.getName(), x, y, z, h, p, r)
             leaderBoard.generateWithRequired(zoneId)
             leaderBoards.append(leaderBoard)
 
-        for i in range(dnaData.getNumChildren()):
-            foundLeaderBoards = self.findLeaderBoards(dnaData.at(i), zoneId)
-            leaderBoards.extend(foundLeaderBoards)
-
         return leaderBoards
 
     def getTrackClsends(self):
@@ -0,0 +1,514 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import multiprocessing
+import os
+import random
+import time
+
+
+class game:
+    name = 'toontown'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from toontown.battle import BattleCalculatorAI, SuitBattleGlobals
+from toontown.battle.BattleBase import *
+from toontown.suit import DistributedSuitBaseAI, SuitDNA
+from toontown.toon import Experience
+from toontown.toonbase.ToontownBattleGlobals import *
+
+FIRST_TOON_ID = 100000001
+FIRST_SUIT_ID = 200000001
+OFFENSIVE_TRACKS = (TRAP, LURE, SOUND, THROW, SQUIRT, DROP)
+
+
+class SimulatorDClasses(dict):
+
+    def __missing__(self, className):
+        return className
+
+
+class SimulatorAir:
+    """What the calculator and the suits need of the AI repository; nothing goes on the wire."""
+
+    def __init__(self):
+        self.doId2do = {}
+        self.dclassesByName = SimulatorDClasses()
+
+    def sendUpdate(self, do, fieldName, args):
+        pass
+
+    def writeServerEvent(self, eventType, who, description):
+        pass
+
+
+class SimulatedToonAI:
+    """
+    A toon with a laff meter and a gag track level for each track, as
+    the calculator sees it.  Its experience is the least that gets it
+    the gags it carries, and it never runs out of them.
+    """
+
+    def __init__(self, doId, maxHp, gagLevels):
+        self.doId = doId
+        self.hp = maxHp
+        self.maxHp = maxHp
+        # The highest gag level it carries in each track, or -1.
+        self.gagLevels = gagLevels
+        self.experience = Experience.Experience()
+        for track in range(len(gagLevels)):
+            if gagLevels[track] >= 0:
+                self.experience.setExp(track, Levels[track][gagLevels[track]])
+            else:
+                self.experience.setExp(track, 0)
+
+        self.instantKillMode = 0
+        self.immortalMode = 0
+
+    def getDoId(self):
+        return self.doId
+
+    def getHp(self):
+        return self.hp
+
+    def checkGagBonus(self, track, level):
+        return False
+
+    def toonUp(self, hpGained, quietly=0):
+        self.hp = min(max(self.hp, 0) + hpGained, self.maxHp)
+
+    def takeDamage(self, hpLost, quietly=0):
+        if hpLost > 0 and self.hp > 0:
+            self.hp -= hpLost
+            if self.hp <= 0:
+                self.hp = -1
+
+
+class SimulatedSuitAI(DistributedSuitBaseAI.DistributedSuitBaseAI):
+    """A suit that counts the damage it takes."""
+
+    def __init__(self, air, doId, name, level, revives):
+        DistributedSuitBaseAI.DistributedSuitBaseAI.__init__(self, air, None)
+        dna = SuitDNA.SuitDNA()
+        dna.newSuit(name)
+        self.dna = dna
+        self.setLevel(level)
+        self.setSkeleRevives(revives)
+        self.doId = doId
+        self.battleTrap = NO_TRAP
+        self.damageTaken = 0
+
+    def setHP(self, hp):
+        if hp < self.currHP:
+            self.damageTaken += self.currHP - max(hp, 0)
+        DistributedSuitBaseAI.DistributedSuitBaseAI.setHP(self, hp)
+
+
+class SimulatedBattleAI(BattleBase):
+    """
+    Stands in for DistributedBattleBaseAI around a BattleCalculatorAI:
+    every toon and suit is active from the start, the toons choose their
+    gags as soon as a round begins, and what __movieDone does with the
+    calculator's results is done as soon as the round is calculated.
+    """
+
+    def __init__(self, air, toons, suits):
+        BattleBase.__init__(self)
+        self.air = air
+        self.toonsById = {}
+        for toon in toons:
+            self.toonsById[toon.doId] = toon
+            self.toons.append(toon.doId)
+            self.activeToons.append(toon.doId)
+
+        for suit in suits:
+            self.suits.append(suit)
+            self.activeSuits.append(suit)
+
+        self.battleCalc = BattleCalculatorAI.BattleCalculatorAI(self)
+        self.clearAttacks()
+
+    def cleanup(self):
+        self.battleCalc.cleanup()
+        for suit in self.suits:
+            suit.delete()
+
+        self.resetLists()
+
+    def clearAttacks(self):
+        self.toonAttacks = {}
+        self.suitAttacks = getDefaultSuitAttacks()
+
+    def getToon(self, toonId):
+        return self.toonsById.get(toonId)
+
+    def findSuit(self, id):
+        for s in self.suits:
+            if s.doId == id:
+                return s
+
+        return None
+
+    def getInteractivePropTrackBonus(self):
+        return -1
+
+    def chooseToonAttacks(self):
+        """
+        Each toon heals another toon below half laff if it can, and
+        otherwise picks one of its attack tracks at random, at the
+        highest level it has, against the weakest suit.  It won't lure
+        when every suit is lured, or trap or drop on a lured suit.
+        """
+        calc = self.battleCalc
+        target = None
+        for suit in self.activeSuits:
+            if target == None or suit.getHP() < target.getHP():
+                target = suit
+
+        lured = target.doId in calc.currentlyLuredSuits
+        anyUnlured = 0
+        for suit in self.activeSuits:
+            if suit.doId not in calc.currentlyLuredSuits:
+                anyUnlured = 1
+
+        for toonId in self.activeToons:
+            toon = self.toonsById[toonId]
+            healLevel = toon.gagLevels[HEAL]
+            if healLevel >= 0 and len(self.activeToons) > 1:
+                hurt = None
+                for otherId in self.activeToons:
+                    other = self.toonsById[otherId]
+                    if otherId != toonId and other.hp * 2 < other.maxHp and (hurt == None or other.hp < hurt.hp):
+                        hurt = other
+
+                if hurt != None:
+                    self.toonAttacks[toonId] = getToonAttack(toonId, track=HEAL, level=healLevel, target=hurt.doId)
+                    continue
+            tracks = []
+            for track in OFFENSIVE_TRACKS:
+                if toon.gagLevels[track] < 0:
+                    continue
+                if track == LURE and not anyUnlured:
+                    continue
+                if (track == TRAP or track == DROP) and lured:
+                    continue
+                if track == TRAP and target.doId in calc.traps:
+                    continue
+                tracks.append(track)
+
+            if not tracks:
+                self.toonAttacks[toonId] = getToonAttack(toonId)
+                continue
+            track = random.choice(tracks)
+            level = toon.gagLevels[track]
+            if attackAffectsGroup(track, level):
+                targetId = -1
+            else:
+                targetId = target.doId
+            self.toonAttacks[toonId] = getToonAttack(toonId, track=track, level=level, target=targetId)
+
+    def finishRound(self):
+        """
+        Heals and hurts the toons as the round's movie would, and takes
+        the dead toons and suits out of the battle.  Returns the hp the
+        toons were healed and hurt.
+        """
+        healed = 0
+        hurt = 0
+        toonHpDict = {}
+        for toonId in self.activeToons:
+            toonHpDict[toonId] = [0, 0]
+
+        for toonId in self.activeToons:
+            attack = self.toonAttacks[toonId]
+            if attack[TOON_TRACK_COL] != HEAL:
+                continue
+            hps = attack[TOON_HP_COL]
+            if levelAffectsGroup(HEAL, attack[TOON_LVL_COL]):
+                for i in range(len(self.activeToons)):
+                    if self.activeToons[i] != toonId and i < len(hps) and hps[i] > 0:
+                        toonHpDict[self.activeToons[i]][0] += hps[i]
+
+            elif attack[TOON_TGT_COL] in self.activeToons:
+                i = self.activeToons.index(attack[TOON_TGT_COL])
+                if i < len(hps) and hps[i] > 0:
+                    toonHpDict[attack[TOON_TGT_COL]][0] += hps[i]
+
+        for i in range(len(self.suitAttacks)):
+            attack = self.suitAttacks[i]
+            if attack[SUIT_ATK_COL] == NO_ATTACK:
+                continue
+            suit = self.findSuit(attack[SUIT_ID_COL])
+            if suit == None:
+                continue
+            adict = SuitBattleGlobals.getSuitAttack(suit.getStyleName(), suit.getLevel(), attack[SUIT_ATK_COL])
+            hps = attack[SUIT_HP_COL]
+            if adict['group'] == SuitBattleGlobals.ATK_TGT_GROUP:
+                targets = range(len(self.activeToons))
+            else:
+                targets = [attack[SUIT_TGT_COL]]
+            for targetIndex in targets:
+                if 0 <= targetIndex < len(self.activeToons) and targetIndex < len(hps) and hps[targetIndex] > 0:
+                    toonHpDict[self.activeToons[targetIndex]][1] += hps[targetIndex]
+
+        deadToons = []
+        for toonId in self.activeToons:
+            toon = self.toonsById[toonId]
+            heal, damage = toonHpDict[toonId]
+            if heal - damage >= 0:
+                toon.toonUp(heal - damage, quietly=1)
+            else:
+                toon.takeDamage(damage - heal, quietly=1)
+            healed += heal
+            hurt += damage
+            if toon.hp <= 0:
+                deadToons.append(toonId)
+
+        for toonId in deadToons:
+            self.activeToons.remove(toonId)
+            self.toons.remove(toonId)
+            self.battleCalc.toonLeftBattle(toonId)
+
+        for suit in self.activeSuits[:]:
+            if suit.getHP() <= 0:
+                self.activeSuits.remove(suit)
+                self.suits.remove(suit)
+                self.battleCalc.suitLeftBattle(suit.doId)
+                suit.delete()
+
+        self.clearAttacks()
+        return healed, hurt
+
+
+def parseToon(spec):
+    """
+    Parses a toon as LAFF/LEVELS, where LEVELS has a digit for each
+    track from toon-up to drop: the number of gags it has in that
+    track, 7 with the uber gag, or 0 without the track.
+    """
+    laff, levels = spec.split('/')
+    if len(levels) != NUM_GAG_TRACKS:
+        raise ValueError('toon %s needs a gag level for each of the %d tracks' % (spec, NUM_GAG_TRACKS))
+    gagLevels = []
+    for level in levels:
+        if not 0 <= int(level) <= MAX_LEVEL_INDEX + 1:
+            raise ValueError('toon %s has more gags than there are' % spec)
+        gagLevels.append(int(level) - 1)
+
+    return (int(laff), gagLevels)
+
+
+def parseSuit(spec):
+    """Parses a suit as NAME:LEVEL, or NAME:LEVEL:REVIVES for a skelecog that revives."""
+    fields = spec.split(':')
+    name = fields[0]
+    level = int(fields[1])
+    revives = 0
+    if len(fields) > 2:
+        revives = int(fields[2])
+    if name not in SuitBattleGlobals.SuitAttributes:
+        raise ValueError('there is no suit %s' % name)
+    lowest = SuitBattleGlobals.SuitAttributes[name]['level'] + 1
+    if not lowest <= level < lowest + len(SuitBattleGlobals.SuitAttributes[name]['hp']):
+        raise ValueError('a %s is level %d to %d' % (name, lowest, lowest + len(SuitBattleGlobals.SuitAttributes[name]['hp']) - 1))
+    return (name, level, revives)
+
+
+class SimulationStats:
+    """What happened in a number of battles, and how long the calculator took over them."""
+
+    def __init__(self):
+        self.battles = 0
+        self.wins = 0
+        self.losses = 0
+        self.rounds = 0
+        # rounds -> the number of battles the toons won in that many
+        self.roundsToClear = {}
+        self.cogDamage = 0
+        self.toonDamage = 0
+        self.toonHealing = 0
+        self.toonDeaths = 0
+        self.calcTime = 0.0
+        self.lureTrapRounds = 0
+        self.lureTrapTime = 0.0
+
+    def add(self, other):
+        self.battles += other.battles
+        self.wins += other.wins
+        self.losses += other.losses
+        self.rounds += other.rounds
+        for rounds, count in other.roundsToClear.items():
+            self.roundsToClear[rounds] = self.roundsToClear.get(rounds, 0) + count
+
+        self.cogDamage += other.cogDamage
+        self.toonDamage += other.toonDamage
+        self.toonHealing += other.toonHealing
+        self.toonDeaths += other.toonDeaths
+        self.calcTime += other.calcTime
+        self.lureTrapRounds += other.lureTrapRounds
+        self.lureTrapTime += other.lureTrapTime
+
+    def getRoundsPercentile(self, fraction):
+        count = 0
+        for rounds in sorted(self.roundsToClear.keys()):
+            count += self.roundsToClear[rounds]
+            if count >= fraction * self.wins:
+                return rounds
+
+        return 0
+
+
+def simulateBattle(stats, toonSpecs, suitSpecs, seed, maxRounds):
+    """Fights one battle to the end, or for maxRounds rounds, adding what happened to stats."""
+    random.seed(seed)
+    air = SimulatorAir()
+    toons = []
+    for i in range(len(toonSpecs)):
+        laff, gagLevels = toonSpecs[i]
+        toons.append(SimulatedToonAI(FIRST_TOON_ID + i, laff, gagLevels))
+
+    suits = []
+    for i in range(len(suitSpecs)):
+        name, level, revives = suitSpecs[i]
+        suits.append(SimulatedSuitAI(air, FIRST_SUIT_ID + i, name, level, revives))
+
+    battle = SimulatedBattleAI(air, toons, suits)
+    calc = battle.battleCalc
+    rounds = 0
+    while battle.activeToons and battle.activeSuits and rounds < maxRounds:
+        rounds += 1
+        lureTrap = len(calc.currentlyLuredSuits) or len(calc.traps)
+        battle.chooseToonAttacks()
+        for attack in battle.toonAttacks.values():
+            if attack[TOON_TRACK_COL] == LURE or attack[TOON_TRACK_COL] == TRAP:
+                lureTrap = 1
+
+        start = time.perf_counter()
+        calc.calculateRound()
+        elapsed = time.perf_counter() - start
+        stats.calcTime += elapsed
+        if lureTrap:
+            stats.lureTrapRounds += 1
+            stats.lureTrapTime += elapsed
+        numToons = len(battle.activeToons)
+        healed, hurt = battle.finishRound()
+        stats.toonHealing += healed
+        stats.toonDamage += hurt
+        stats.toonDeaths += numToons - len(battle.activeToons)
+
+    stats.battles += 1
+    stats.rounds += rounds
+    for suit in suits:
+        stats.cogDamage += suit.damageTaken
+
+    if not battle.activeSuits:
+        stats.wins += 1
+        stats.roundsToClear[rounds] = stats.roundsToClear.get(rounds, 0) + 1
+    elif not battle.activeToons:
+        stats.losses += 1
+    battle.cleanup()
+
+
+def simulateBattles(job):
+    """
+    Simulates a run of battles in a worker.  Each battle is seeded with
+    seed * 1000003 + its number, so its outcome depends only on --seed
+    and its number, not on which worker runs it.
+    """
+    toonSpecs, suitSpecs, seed, firstBattle, numBattles, maxRounds = job
+    stats = SimulationStats()
+    for battle in range(firstBattle, firstBattle + numBattles):
+        simulateBattle(stats, toonSpecs, suitSpecs, seed * 1000003 + battle, maxRounds)
+
+    return stats
+
+
+def printStats(stats, elapsed):
+    print('%d battles, %d rounds in %.1f s' % (stats.battles, stats.rounds, elapsed))
+    print('  toons won      %6.1f%%' % (100.0 * stats.wins / stats.battles))
+    print('  toons lost     %6.1f%%' % (100.0 * stats.losses / stats.battles))
+    print('  unfinished     %6.1f%%' % (100.0 * (stats.battles - stats.wins - stats.losses) / stats.battles))
+    if stats.wins:
+        wonRounds = sum([rounds * count for rounds, count in stats.roundsToClear.items()])
+        print('  rounds to clear: mean %.2f, median %d, 90th percentile %d, most %d' % (
+            float(wonRounds) / stats.wins, stats.getRoundsPercentile(0.5), stats.getRoundsPercentile(0.9),
+            max(stats.roundsToClear.keys())))
+    print('  damage to cogs  %8.1f per round' % (float(stats.cogDamage) / max(stats.rounds, 1)))
+    print('  damage to toons %8.1f per battle' % (float(stats.toonDamage) / stats.battles))
+    print('  toon-ups        %8.1f per battle' % (float(stats.toonHealing) / stats.battles))
+    print('  toons gone sad  %8.2f per battle' % (float(stats.toonDeaths) / stats.battles))
+    otherRounds = stats.rounds - stats.lureTrapRounds
+    print('calculateRound:  %.1f us per round; %.1f us with lures or traps (%d rounds), %.1f us without (%d rounds)' % (
+        stats.calcTime / max(stats.rounds, 1) * 1000000.0,
+        stats.lureTrapTime / max(stats.lureTrapRounds, 1) * 1000000.0, stats.lureTrapRounds,
+        (stats.calcTime - stats.lureTrapTime) / max(otherRounds, 1) * 1000000.0, otherRounds))
+
+
+def profileBattles(job, numFunctions):
+    """Simulates a run of battles under the profiler, and prints where the calculator spends its time."""
+    import cProfile
+    import pstats
+    profiler = cProfile.Profile()
+    profiler.enable()
+    simulateBattles(job)
+    profiler.disable()
+    print('Where BattleCalculatorAI spends its time, over %d battles:' % job[4])
+    pstats.Stats(profiler).sort_stats('tottime').print_stats('BattleCalculatorAI', numFunctions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Open Toontown - headless Monte Carlo battle simulator')
+    parser.add_argument('--toons', default='100/4655456,100/4655456,100/4655456,100/4655456',
+                        help='Comma separated toons, each LAFF/LEVELS with a gag count from toon-up to drop, '
+                             '7 with the uber gag and 0 without the track.')
+    parser.add_argument('--suits', default='ym:6,mm:6,ds:7,hh:8',
+                        help='Comma separated suits, each NAME:LEVEL or NAME:LEVEL:REVIVES.')
+    parser.add_argument('--battles', type=int, default=10000, help='Number of battles to fight.')
+    parser.add_argument('--max-rounds', type=int, default=50, help='Number of rounds after which a battle is unfinished.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the battles; each is seeded by this and its number.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Number of worker processes.')
+    parser.add_argument('--chunk', type=int, default=200, help='Number of battles a worker fights at a time.')
+    parser.add_argument('--profile', type=int, default=0,
+                        help='Profile one chunk first and print this many of the calculator\'s costliest functions.')
+    args = parser.parse_args()
+    try:
+        toonSpecs = [parseToon(spec) for spec in args.toons.split(',')]
+        suitSpecs = [parseSuit(spec) for spec in args.suits.split(',')]
+    except ValueError as e:
+        parser.error(str(e))
+    if not 1 <= len(toonSpecs) <= 4 or not 1 <= len(suitSpecs) <= 4:
+        parser.error('a battle has one to four toons and one to four suits')
+
+    BattleCalculatorAI.BattleCalculatorAI.notify.setInfo(0)
+    if args.profile:
+        profileBattles((toonSpecs, suitSpecs, args.seed, 0, min(args.chunk, args.battles), args.max_rounds),
+                       args.profile)
+
+    jobs = []
+    for firstBattle in range(0, args.battles, args.chunk):
+        jobs.append((toonSpecs, suitSpecs, args.seed, firstBattle, min(args.chunk, args.battles - firstBattle),
+                     args.max_rounds))
+
+    stats = SimulationStats()
+    start = time.perf_counter()
+    if args.workers > 1:
+        pool = multiprocessing.Pool(args.workers)
+        for chunkStats in pool.imap_unordered(simulateBattles, jobs):
+            stats.add(chunkStats)
+
+        pool.close()
+        pool.join()
+    else:
+        for job in jobs:
+            stats.add(simulateBattles(job))
+
+    printStats(stats, time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,520 @@
+import json
+import random
+
+from panda3d.direct import DCPacker
+
+from direct.directnotify import DirectNotifyGlobal
+from direct.distributed.MsgTypes import *
+from direct.distributed.PyDatagram import PyDatagram
+from direct.distributed.PyDatagramIterator import PyDatagramIterator
+from direct.showbase.DirectObject import DirectObject
+from direct.task import Task
+from otp.distributed import OtpDoGlobals
+from otp.otpbase import OTPGlobals
+from toontown.battle import BattleBase
+from toontown.toon.ToonDNA import ToonDNA
+
+
+class BotObject:
+    """What a bot knows about a distributed object it can see."""
+    __slots__ = ('doId', 'dclass', 'parentId', 'zoneId', 'fields')
+
+    def __init__(self, doId, dclass, parentId, zoneId):
+        self.doId = doId
+        self.dclass = dclass
+        self.parentId = parentId
+        self.zoneId = zoneId
+        # field name -> args, for the fields the bot decodes
+        self.fields = {}
+
+
+class BotClient(DirectObject):
+    """
+    A headless game client.  It speaks the client protocol directly and
+    walks the same Astron login and avatar flow OTPClientRepository does,
+    without loading a model or opening a window.
+
+    A bot is driven by a script: a generator function that takes the bot
+    and yields what to wait for next.  Each action below sends its
+    request and returns the name of the event that completes it; a number
+    waits that many seconds.  The script gets the event's argument back
+    from the yield, or None if it timed out.  See BotScripts.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('BotClient')
+
+    # Only these classes have their required fields decoded on entry.
+    DecodedClasses = frozenset(('ToontownDistrict', 'DistributedSuit', 'DistributedBattle'))
+    # Only these fields are decoded when they're updated.
+    DecodedFields = frozenset(('setName', 'setAvailable', 'setPathState', 'setMembers', 'setState', 'setTalk',
+                               'adjust', 'denyBattle', 'loginResponse', 'avatarListResponse',
+                               'createAvatarResponse', 'generateResponse'))
+
+    HeartbeatInterval = 10.0
+    # Interest handles
+    WorldInterest = 1
+    DistrictsInterest = 2
+    UberZoneInterest = 3
+
+    def __init__(self, swarm, botId, playToken):
+        self.swarm = swarm
+        self.botId = botId
+        self.playToken = playToken
+        self.dcFile = swarm.dcFile
+        self.connection = None
+        self.objects = {}
+        self.avId = 0
+        self.shardId = 0
+        self.zoneId = 0
+        self.pendingZoneId = 0
+        self.nextContext = 0
+        self.interestContexts = {}
+        self.requestTimes = {}
+        self.battleId = 0
+        self.battleState = None
+        self.attackChoices = ()
+        self.script = None
+        self.scriptEvent = None
+        self.stepping = False
+        self.earlyResults = {}
+        self.ejected = False
+
+    def uniqueName(self, name):
+        return 'bot-%d-%s' % (self.botId, name)
+
+    # Running a script:
+
+    def runScript(self, script):
+        self.script = script(self)
+        taskMgr.doMethodLater(self.HeartbeatInterval, self.__sendHeartbeat, self.uniqueName('heartbeat'))
+        self.__resume(None)
+
+    def __resume(self, result=None):
+        self.__clearWait()
+        while self.script is not None:
+            # A request can finish while the script is still sending it, as
+            # it does against an in-process stand-in; keep what it finished
+            # with rather than waiting for an event that has already gone.
+            self.stepping = True
+            try:
+                wait = self.script.send(result)
+            except StopIteration:
+                self.stepping = False
+                self.stop()
+                return
+
+            self.stepping = False
+            finished = self.earlyResults
+            self.earlyResults = {}
+            if wait in finished:
+                result = finished[wait]
+                continue
+
+            if isinstance(wait, str):
+                self.scriptEvent = wait
+                self.acceptOnce(wait, self.__resume)
+                timeout = self.swarm.requestTimeout
+                taskMgr.doMethodLater(timeout, self.__scriptTimedOut, self.uniqueName('scriptTimeout'),
+                                      extraArgs=[wait])
+            else:
+                taskMgr.doMethodLater(wait, self.__resume, self.uniqueName('scriptWait'), extraArgs=[])
+
+            return
+
+    def __clearWait(self):
+        if self.scriptEvent:
+            self.ignore(self.scriptEvent)
+            self.scriptEvent = None
+
+        taskMgr.remove(self.uniqueName('scriptTimeout'))
+        taskMgr.remove(self.uniqueName('scriptWait'))
+
+    def __scriptTimedOut(self, event):
+        self.notify.warning('Bot %d timed out waiting for %s.' % (self.botId, event))
+        self.swarm.recordTimeout(event.split('-', 2)[2])
+        self.__resume(None)
+
+    def stop(self):
+        self.__clearWait()
+        taskMgr.remove(self.uniqueName('heartbeat'))
+        self.ignoreAll()
+        self.script = None
+        if self.connection is not None:
+            connection = self.connection
+            self.connection = None
+            connection.close()
+
+        self.swarm.botStopped(self)
+
+    def handleDisconnect(self):
+        if self.connection is not None:
+            self.connection = None
+            self.notify.warning('Bot %d lost its connection.' % self.botId)
+            self.stop()
+
+    # Sending:
+
+    def send(self, datagram):
+        if self.connection is not None:
+            self.connection.send(datagram)
+
+    def sendUpdate(self, doId, fieldName, args=()):
+        obj = self.objects.get(doId)
+        if obj is not None:
+            dclass = obj.dclass
+        else:
+            dclass = self.swarm.uberdogClasses[doId]
+
+        self.send(dclass.clientFormatUpdate(fieldName, doId, list(args)))
+
+    def __sendHeartbeat(self, task):
+        datagram = PyDatagram()
+        datagram.addUint16(CLIENT_HEARTBEAT)
+        self.send(datagram)
+        return Task.again
+
+    def __startRequest(self, name):
+        self.requestTimes[name] = globalClock.getRealTime()
+
+    def __finishRequest(self, name, arg=None):
+        start = self.requestTimes.pop(name, None)
+        if start is not None:
+            self.swarm.recordLatency(name, globalClock.getRealTime() - start)
+
+        self.__complete(name, arg)
+
+    def __complete(self, name, arg=None):
+        if self.stepping:
+            self.earlyResults[self.uniqueName(name)] = arg
+        else:
+            messenger.send(self.uniqueName(name), [arg])
+
+    def addInterest(self, handle, parentId, zoneIds, requestName=None):
+        """
+        Opens interest handle in zoneIds of parentId.  If requestName is
+        given, that request finishes when the server is done with it.
+        """
+        self.nextContext += 1
+        if requestName:
+            self.interestContexts[self.nextContext] = requestName
+
+        datagram = PyDatagram()
+        if len(zoneIds) == 1:
+            datagram.addUint16(CLIENT_ADD_INTEREST)
+            datagram.addUint32(self.nextContext)
+            datagram.addUint16(handle)
+            datagram.addUint32(parentId)
+            datagram.addUint32(zoneIds[0])
+        else:
+            datagram.addUint16(CLIENT_ADD_INTEREST_MULTIPLE)
+            datagram.addUint32(self.nextContext)
+            datagram.addUint16(handle)
+            datagram.addUint32(parentId)
+            datagram.addUint16(len(zoneIds))
+            for zoneId in zoneIds:
+                datagram.addUint32(zoneId)
+
+        self.send(datagram)
+
+    # Actions:
+
+    def login(self):
+        """Logs in with our play token and plays our first toon, making one if we have none."""
+        self.__startRequest('login')
+        datagram = PyDatagram()
+        datagram.addUint16(CLIENT_HELLO)
+        datagram.addUint32(self.swarm.dcHash)
+        datagram.addString(self.swarm.serverVersion)
+        self.send(datagram)
+        return self.uniqueName('login')
+
+    def enterShard(self, zoneId):
+        """Finds the districts, picks the emptiest available one and goes to zoneId in it."""
+        self.pendingZoneId = zoneId
+        self.__startRequest('shard')
+        self.addInterest(self.DistrictsInterest, OtpDoGlobals.OTP_DO_ID_TOONTOWN,
+                         [OtpDoGlobals.OTP_ZONE_ID_DISTRICTS], 'districtsDone')
+        return self.uniqueName('shard')
+
+    def setZone(self, zoneId, visibleZoneIds=None):
+        """Moves our toon to zoneId and sets our interest to visibleZoneIds, or just zoneId."""
+        self.__startRequest('zone')
+        self.__setLocation(zoneId, visibleZoneIds, 'zone')
+        return self.uniqueName('zone')
+
+    def __setLocation(self, zoneId, visibleZoneIds, requestName):
+        self.zoneId = zoneId
+        datagram = PyDatagram()
+        datagram.addUint16(CLIENT_OBJECT_LOCATION)
+        datagram.addUint32(self.avId)
+        datagram.addUint32(self.shardId)
+        datagram.addUint32(zoneId)
+        self.send(datagram)
+        self.addInterest(self.WorldInterest, self.shardId, visibleZoneIds or [zoneId], requestName)
+
+    def chat(self, message):
+        """Says message through the chat handler; done when our toon says it."""
+        self.__startRequest('chat')
+        self.sendUpdate(OtpDoGlobals.OTP_DO_ID_CHAT_HANDLER, 'chatMessage', [message])
+        return self.uniqueName('chat')
+
+    def magicWord(self, word):
+        """Runs a server magic word on ourselves; done with its response text."""
+        for obj in self.objects.values():
+            if obj.dclass.getName() == 'ToontownMagicWordManager':
+                self.__startRequest('magicWord')
+                self.sendUpdate(obj.doId, 'requestExecuteMagicWord', [0, 0, 0, 0, word])
+                return self.uniqueName('magicWord')
+
+        return 0
+
+    def findSuits(self):
+        """Returns the doIds of the walking suits we can see."""
+        return [obj for obj in self.objects.values()
+                if obj.dclass.getName() == 'DistributedSuit' and obj.fields.get('setPathState') == (1,)]
+
+    def battle(self, suit, attackChoices):
+        """
+        Asks suit for a battle and fights it out, picking each round's
+        gag from attackChoices, (track, level) pairs tried in order.
+        Done with True when the battle ends, or False if the suit said no.
+        """
+        self.attackChoices = attackChoices
+        self.battleId = 0
+        self.battleState = None
+        self.__startRequest('battleStart')
+        self.sendUpdate(suit.doId, 'requestBattle', [0, 0, 0, 0, 0, 0])
+        return self.uniqueName('battle')
+
+    # Receiving:
+
+    def handleDatagram(self, datagram):
+        di = PyDatagramIterator(datagram)
+        msgType = di.getUint16()
+        handler = self.messageHandlers.get(msgType)
+        if handler is not None:
+            handler(self, di)
+
+    def __handleHelloResp(self, di):
+        self.sendUpdate(OtpDoGlobals.OTP_DO_ID_ASTRON_LOGIN_MANAGER, 'requestLogin', [self.playToken])
+
+    def __handleEject(self, di):
+        code = di.getUint16()
+        self.notify.warning('Bot %d was ejected: %d %s' % (self.botId, code, di.getString()))
+        self.ejected = True
+        self.swarm.recordEject(code)
+
+    def __handleDoneInterest(self, di):
+        requestName = self.interestContexts.pop(di.getUint32(), None)
+        if requestName == 'districtsDone':
+            self.__pickShard()
+        elif requestName == 'uberZone':
+            self.__setLocation(self.pendingZoneId, None, 'shard')
+        elif requestName:
+            self.__finishRequest(requestName)
+
+    def __pickShard(self):
+        districts = [obj for obj in self.objects.values()
+                     if obj.dclass.getName() == 'ToontownDistrict' and obj.fields.get('setAvailable', (0,))[0]]
+        if not districts:
+            self.notify.warning('Bot %d found no available district.' % self.botId)
+            return
+
+        self.shardId = random.choice(districts).doId
+        self.addInterest(self.UberZoneInterest, self.shardId, [OTPGlobals.UberZone], 'uberZone')
+
+    def __handleEnter(self, di, other=False, owner=False):
+        doId = di.getUint32()
+        parentId = di.getUint32()
+        zoneId = di.getUint32()
+        dclass = self.dcFile.getClass(di.getUint16())
+        obj = self.objects.get(doId)
+        if obj is None:
+            obj = self.objects[doId] = BotObject(doId, dclass, parentId, zoneId)
+        else:
+            obj.parentId = parentId
+            obj.zoneId = zoneId
+
+        if owner:
+            if dclass.getName() == 'DistributedToon' and not self.avId:
+                self.avId = doId
+                self.__finishRequest('login', doId)
+
+            return
+
+        if dclass.getName() not in self.DecodedClasses:
+            return
+
+        packer = DCPacker()
+        packer.setUnpackData(di.getRemainingBytes())
+        for i in range(dclass.getNumInheritedFields()):
+            field = dclass.getInheritedField(i)
+            if field.asMolecularField() is None and field.isRequired() and field.isBroadcast():
+                self.__unpackField(packer, obj, field)
+
+        if other:
+            for i in range(packer.rawUnpackUint16()):
+                self.__unpackField(packer, obj, self.dcFile.getFieldByIndex(packer.rawUnpackUint16()))
+
+        if dclass.getName() == 'DistributedBattle':
+            self.__checkBattle(obj)
+
+    def __handleEnterOther(self, di):
+        self.__handleEnter(di, other=True)
+
+    def __handleEnterOwner(self, di):
+        self.__handleEnter(di, owner=True)
+
+    def __handleEnterOwnerOther(self, di):
+        self.__handleEnter(di, other=True, owner=True)
+
+    def __unpackField(self, packer, obj, field):
+        packer.beginUnpack(field)
+        if field.getName() in self.DecodedFields:
+            obj.fields[field.getName()] = field.unpackArgs(packer)
+        else:
+            packer.unpackSkip()
+
+        packer.endUnpack()
+
+    def __handleSetField(self, di):
+        doId = di.getUint32()
+        field = self.dcFile.getFieldByIndex(di.getUint16())
+        if field is None or field.getName() not in self.DecodedFields:
+            return
+
+        packer = DCPacker()
+        packer.setUnpackData(di.getRemainingBytes())
+        packer.beginUnpack(field)
+        args = field.unpackArgs(packer)
+        packer.endUnpack()
+        obj = self.objects.get(doId)
+        if obj is not None:
+            obj.fields[field.getName()] = args
+
+        handler = self.fieldHandlers.get(field.getName())
+        if handler is not None:
+            handler(self, doId, obj, args)
+
+    def __handleLocation(self, di):
+        obj = self.objects.get(di.getUint32())
+        if obj is not None:
+            obj.parentId = di.getUint32()
+            obj.zoneId = di.getUint32()
+
+    def __handleLeaving(self, di):
+        obj = self.objects.pop(di.getUint32(), None)
+        if obj is not None and obj.doId == self.battleId:
+            self.__battleOver(True)
+
+    # Field updates:
+
+    def __loginResponse(self, doId, obj, args):
+        response = json.loads(args[0])
+        if response.get('returnCode') != 0:
+            self.notify.warning('Bot %d could not log in: %s' % (self.botId, response.get('respString')))
+            return
+
+        self.sendUpdate(OtpDoGlobals.OTP_DO_ID_ASTRON_LOGIN_MANAGER, 'requestAvatarList')
+
+    def __avatarListResponse(self, doId, obj, args):
+        avatars = args[0]
+        if avatars:
+            self.sendUpdate(OtpDoGlobals.OTP_DO_ID_ASTRON_LOGIN_MANAGER, 'requestPlayAvatar', [avatars[0][0]])
+            return
+
+        dna = ToonDNA()
+        dna.newToonRandom()
+        self.sendUpdate(OtpDoGlobals.OTP_DO_ID_ASTRON_LOGIN_MANAGER, 'createAvatar', [dna.makeNetString(), 0])
+
+    def __createAvatarResponse(self, doId, obj, args):
+        self.sendUpdate(OtpDoGlobals.OTP_DO_ID_ASTRON_LOGIN_MANAGER, 'requestPlayAvatar', [args[0]])
+
+    def __setTalk(self, doId, obj, args):
+        if doId == self.avId:
+            self.__finishRequest('chat')
+
+    def __generateResponse(self, doId, obj, args):
+        self.__finishRequest('magicWord', args[3])
+
+    def __denyBattle(self, doId, obj, args):
+        self.requestTimes.pop('battleStart', None)
+        self.__complete('battle', False)
+
+    def __setMembers(self, doId, obj, args):
+        if obj is not None and obj.dclass.getName() == 'DistributedBattle':
+            self.__checkBattle(obj)
+
+    def __checkBattle(self, obj):
+        if self.battleId or self.avId not in obj.fields.get('setMembers', ((), ) * 7)[6]:
+            return
+
+        self.battleId = obj.doId
+        self.__finishRequest('battleStart')
+        state = obj.fields.get('setState')
+        if state:
+            self.__setState(obj.doId, obj, state)
+
+    def __setState(self, doId, obj, args):
+        if doId != self.battleId:
+            return
+
+        state = args[0]
+        if state == self.battleState:
+            return
+
+        self.battleState = state
+        if state == 'FaceOff':
+            self.sendUpdate(doId, 'faceOffDone')
+        elif state == 'WaitForInput':
+            self.__chooseAttack(obj)
+        elif state == 'PlayMovie':
+            self.__finishRequest('battleRound')
+            self.sendUpdate(doId, 'movieDone')
+        elif state == 'Reward':
+            self.sendUpdate(doId, 'rewardDone')
+        elif state in ('Resume', 'Off'):
+            self.__battleOver(True)
+
+    def __chooseAttack(self, obj):
+        suitIds = obj.fields.get('setMembers', ((),))[0]
+        track, level = self.attackChoices[0] if self.attackChoices else (BattleBase.PASS, -1)
+        self.__startRequest('battleRound')
+        self.sendUpdate(obj.doId, 'requestAttack', [track, level, suitIds[0] if suitIds else -1])
+
+    def __adjust(self, doId, obj, args):
+        if doId == self.battleId:
+            self.sendUpdate(doId, 'adjustDone')
+
+    def __battleOver(self, result):
+        if not self.battleId:
+            return
+
+        self.battleId = 0
+        self.battleState = None
+        self.requestTimes.pop('battleRound', None)
+        self.__complete('battle', result)
+
+    messageHandlers = {
+        CLIENT_HELLO_RESP: __handleHelloResp,
+        CLIENT_EJECT: __handleEject,
+        CLIENT_DONE_INTEREST_RESP: __handleDoneInterest,
+        CLIENT_ENTER_OBJECT_REQUIRED: __handleEnter,
+        CLIENT_ENTER_OBJECT_REQUIRED_OTHER: __handleEnterOther,
+        CLIENT_ENTER_OBJECT_REQUIRED_OWNER: __handleEnterOwner,
+        CLIENT_ENTER_OBJECT_REQUIRED_OTHER_OWNER: __handleEnterOwnerOther,
+        CLIENT_OBJECT_SET_FIELD: __handleSetField,
+        CLIENT_OBJECT_LOCATION: __handleLocation,
+        CLIENT_OBJECT_LEAVING: __handleLeaving,
+    }
+
+    fieldHandlers = {
+        'loginResponse': __loginResponse,
+        'avatarListResponse': __avatarListResponse,
+        'createAvatarResponse': __createAvatarResponse,
+        'setTalk': __setTalk,
+        'generateResponse': __generateResponse,
+        'denyBattle': __denyBattle,
+        'setMembers': __setMembers,
+        'setState': __setState,
+        'adjust': __adjust,
+    }
@@ -0,0 +1,81 @@
+from panda3d.core import ConnectionWriter, NetDatagram, PointerToConnection, QueuedConnectionManager, \
+    QueuedConnectionReader
+
+from direct.directnotify import DirectNotifyGlobal
+
+
+class BotNetwork:
+    """
+    The TCP connections of every bot in the swarm.  One reader serves all
+    of them, so a process can run thousands of bots without a thread or a
+    poll task each.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('BotNetwork')
+
+    def __init__(self):
+        self.manager = QueuedConnectionManager()
+        self.reader = QueuedConnectionReader(self.manager, 0)
+        self.writer = ConnectionWriter(self.manager, 0)
+        # Connection -> bot
+        self.bots = {}
+
+    def connect(self, host, port, bot, timeout=5000):
+        connection = self.manager.openTCPClientConnection(host, port, timeout)
+        if not connection:
+            return None
+
+        # Send every request at once, like the client does by flushing.
+        connection.setNoDelay(True)
+        connection.setCollectTcp(False)
+        self.reader.addConnection(connection)
+        self.bots[connection] = bot
+        return BotConnection(self, connection)
+
+    def poll(self):
+        datagram = NetDatagram()
+        while self.reader.dataAvailable():
+            if not self.reader.getData(datagram):
+                break
+
+            bot = self.bots.get(datagram.getConnection())
+            if bot is not None:
+                bot.handleDatagram(datagram)
+
+            datagram = NetDatagram()
+
+        while self.manager.resetConnectionAvailable():
+            resetConnection = PointerToConnection()
+            if not self.manager.getResetConnection(resetConnection):
+                break
+
+            self.__dropConnection(resetConnection.p())
+
+    def send(self, connection, datagram):
+        self.writer.send(datagram, connection)
+
+    def close(self, connection):
+        if self.__dropConnection(connection):
+            self.manager.closeConnection(connection)
+
+    def __dropConnection(self, connection):
+        bot = self.bots.pop(connection, None)
+        if bot is None:
+            return False
+
+        self.reader.removeConnection(connection)
+        bot.handleDisconnect()
+        return True
+
+
+class BotConnection:
+    """A bot's connection to the client agent."""
+
+    def __init__(self, network, connection):
+        self.network = network
+        self.connection = connection
+
+    def send(self, datagram):
+        self.network.send(self.connection, datagram)
+
+    def close(self):
+        self.network.close(self.connection)
@@ -0,0 +1,80 @@
+import random
+
+from toontown.toonbase import ToontownBattleGlobals
+from toontown.toonbase import ToontownGlobals
+
+Playgrounds = (ToontownGlobals.ToontownCentral, ToontownGlobals.DonaldsDock, ToontownGlobals.TheBrrrgh,
+               ToontownGlobals.MinniesMelodyland, ToontownGlobals.DaisyGardens, ToontownGlobals.DonaldsDreamland)
+Phrases = ('hi', 'hello', 'how are you', 'see you later', 'good luck', 'lets go', 'thanks', 'wow')
+# A new toon has the first throw and squirt gags.
+StarterGags = ((ToontownBattleGlobals.THROW_TRACK, 0), (ToontownBattleGlobals.SQUIRT_TRACK, 0))
+
+
+def streetZones(branchZoneId):
+    """The zones the suits of a street walk through."""
+    return [branchZoneId + i for i in range(1, 100)]
+
+
+def wander(bot, rounds=None):
+    """Walks between the playgrounds, chatting in each."""
+    i = 0
+    while rounds is None or i < rounds:
+        yield bot.setZone(random.choice(Playgrounds))
+        yield random.uniform(1.0, 5.0)
+        yield bot.chat(random.choice(Phrases))
+        yield random.uniform(1.0, 5.0)
+        i += 1
+
+
+def fight(bot, branchZoneId):
+    """Looks for a suit on a street and fights it."""
+    yield bot.setZone(branchZoneId, streetZones(branchZoneId))
+    for attempt in range(5):
+        suits = bot.findSuits()
+        if not suits:
+            yield 2.0
+            continue
+
+        suit = random.choice(suits)
+        yield bot.setZone(suit.zoneId, streetZones(branchZoneId))
+        gags = list(StarterGags)
+        random.shuffle(gags)
+        if (yield bot.battle(suit, gags)):
+            return
+
+
+def default(bot):
+    """Logs in, wanders and chats, then fights on Toontown Central's streets, forever."""
+    if not (yield bot.login()):
+        return
+
+    yield bot.enterShard(ToontownGlobals.ToontownCentral)
+    while True:
+        yield from wander(bot, 2)
+        yield from fight(bot, random.choice(ToontownGlobals.HoodHierarchy[ToontownGlobals.ToontownCentral]))
+
+
+def social(bot):
+    """Logs in, then only wanders and chats."""
+    if not (yield bot.login()):
+        return
+
+    yield bot.enterShard(ToontownGlobals.ToontownCentral)
+    yield from wander(bot)
+
+
+def idle(bot):
+    """Logs in and stands in the playground."""
+    if not (yield bot.login()):
+        return
+
+    yield bot.enterShard(ToontownGlobals.ToontownCentral)
+    while True:
+        yield 60.0
+
+
+Scripts = {
+    'default': default,
+    'social': social,
+    'idle': idle,
+}
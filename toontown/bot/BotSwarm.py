@@ -0,0 +1,223 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import sys
+
+parser = argparse.ArgumentParser(description='Open Toontown - Bot Swarm')
+parser.add_argument('--bots', type=int, default=50, help='Number of bots to run.')
+parser.add_argument('--spawn-rate', type=float, default=10.0, help='Bots started per second.')
+parser.add_argument('--duration', type=float, default=300.0, help='Seconds to run before reporting and exiting.')
+parser.add_argument('--script', default='default', help='Bot script to run; see toontown.bot.BotScripts.')
+parser.add_argument('--server', default='127.0.0.1:7198', help='The IP address and port of the Client Agent.')
+parser.add_argument('--standin', action='store_true',
+                    help='Run an Astron stand-in in this process and connect the bots to it directly. '
+                         'Its Message Director still listens for the AI and UberDOG.')
+parser.add_argument('--messagedirector-ip', default='127.0.0.1:7199',
+                    help='The IP address and port the stand-in Message Director will listen on.')
+parser.add_argument('--token-prefix', default='bot', help='Play tokens are this prefix and the bot number.')
+parser.add_argument('--timeout', type=float, default=30.0, help='Seconds a bot waits for any one request.')
+parser.add_argument('--no-framestats', action='store_true',
+                    help="Don't read the district's frame stats through the framestats magic word.")
+parser.add_argument('config', nargs='*', default=['etc/Configrc.prc'],
+                    help='PRC file(s) that will be loaded on this instance.')
+args = parser.parse_args()
+
+for prc in args.config:
+    loadPrcFile(prc)
+
+# Poll the bots' connections about every millisecond, so that the
+# latencies we measure are the server's and not our own frame time.
+loadPrcFileData('Bot swarm', 'window-type none\naudio-library-name null\nai-sleep 0.001\nai-min-tick 0')
+
+
+class game:
+    name = 'toontown'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from panda3d.direct import DCFile
+from direct.directnotify import DirectNotifyGlobal
+from direct.task import Task
+from otp.distributed import OtpDoGlobals
+from toontown.bot.BotClient import BotClient
+from toontown.bot.BotNetwork import BotNetwork
+from toontown.bot import BotScripts
+from toontown.toonbase import ToontownGlobals
+
+
+class BotSwarm:
+    """
+    Runs many BotClients in one process and collects how long the server
+    takes to answer them.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('BotSwarm')
+
+    def __init__(self, host, port, script, tokenPrefix, requestTimeout, standIn=None):
+        self.host = host
+        self.port = port
+        self.script = script
+        self.tokenPrefix = tokenPrefix
+        self.requestTimeout = requestTimeout
+        self.standIn = standIn
+        if standIn:
+            self.dcFile = standIn.dcFile
+            self.dcHash = standIn.clientAgent.dcHash
+        else:
+            self.dcFile = DCFile()
+            self.dcFile.readAll()
+            self.dcHash = self.dcFile.getHash()
+
+        self.serverVersion = config.GetString('server-version', 'no_version_set')
+        self.uberdogClasses = {
+            OtpDoGlobals.OTP_DO_ID_ASTRON_LOGIN_MANAGER: self.dcFile.getClassByName('AstronLoginManager'),
+            OtpDoGlobals.OTP_DO_ID_CHAT_HANDLER: self.dcFile.getClassByName('ChatHandler'),
+        }
+        self.network = BotNetwork()
+        self.bots = {}
+        self.nextBotId = 0
+        self.numToSpawn = 0
+        self.numStopped = 0
+        # request name -> [latency in seconds]
+        self.latencies = {}
+        self.timeouts = {}
+        self.ejects = {}
+        self.frameStats = None
+
+    def start(self, numBots, spawnRate):
+        """Starts numBots bots running our script, spawnRate of them a second."""
+        self.numToSpawn = numBots
+        taskMgr.add(self.__poll, 'botSwarmPoll', priority=-30)
+        taskMgr.doMethodLater(0, self.__spawn, 'botSwarmSpawn', extraArgs=[1.0 / spawnRate], appendTask=True)
+
+    def __spawn(self, interval, task):
+        if self.numToSpawn <= 0:
+            return Task.done
+
+        self.numToSpawn -= 1
+        self.spawnBot(self.script)
+        task.delayTime = interval
+        return Task.again
+
+    def spawnBot(self, script):
+        self.nextBotId += 1
+        bot = BotClient(self, self.nextBotId, '%s%d' % (self.tokenPrefix, self.nextBotId))
+        if self.standIn:
+            bot.connection = self.standIn.clientAgent.connectLocal(bot.handleDatagram, bot.handleDisconnect)
+        else:
+            bot.connection = self.network.connect(self.host, self.port, bot)
+            if bot.connection is None:
+                self.notify.warning('Bot %d could not connect to %s:%d.' % (bot.botId, self.host, self.port))
+                self.recordTimeout('connect')
+                return None
+
+        self.bots[bot.botId] = bot
+        bot.runScript(script)
+        return bot
+
+    def __poll(self, task):
+        self.network.poll()
+        return Task.cont
+
+    def botStopped(self, bot):
+        if self.bots.pop(bot.botId, None) is not None:
+            self.numStopped += 1
+
+    def recordLatency(self, name, latency):
+        self.latencies.setdefault(name, []).append(latency)
+
+    def recordTimeout(self, name):
+        self.timeouts[name] = self.timeouts.get(name, 0) + 1
+
+    def recordEject(self, code):
+        self.ejects[code] = self.ejects.get(code, 0) + 1
+
+    def stop(self):
+        taskMgr.remove('botSwarmPoll')
+        taskMgr.remove('botSwarmSpawn')
+        for bot in list(self.bots.values()):
+            bot.stop()
+
+    def report(self):
+        print('%d bots started, %d still running' % (self.nextBotId, len(self.bots)))
+        print('%-14s %8s %10s %10s %10s %10s' % ('request', 'count', 'mean ms', 'p50 ms', 'p95 ms', 'timeouts'))
+        for name in sorted(set(self.latencies) | set(self.timeouts)):
+            samples = sorted(self.latencies.get(name, ()))
+            if samples:
+                print('%-14s %8d %10.2f %10.2f %10.2f %10d' % (
+                    name, len(samples), sum(samples) / len(samples) * 1000.0,
+                    samples[len(samples) // 2] * 1000.0, samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000.0,
+                    self.timeouts.get(name, 0)))
+            else:
+                print('%-14s %8d %10s %10s %10s %10d' % (name, 0, '-', '-', '-', self.timeouts.get(name, 0)))
+
+        for code, count in sorted(self.ejects.items()):
+            print('%d bots were ejected with code %d.' % (count, code))
+
+        if self.frameStats:
+            print('district frame stats:')
+            print(self.frameStats)
+
+
+def frameStatsScript(swarm, duration):
+    """
+    The observer bot: resets the district's frame stats once the swarm
+    is up, and reads them back at the end.
+    """
+    def script(bot):
+        if not (yield bot.login()):
+            return
+
+        yield bot.enterShard(ToontownGlobals.ToontownCentral)
+        yield bot.magicWord('framestats 1')
+        yield duration
+        swarm.frameStats = yield bot.magicWord('framestats')
+        while True:
+            yield 60.0
+
+    return script
+
+
+def splitAddress(address, defaultPort):
+    if ':' in address:
+        host, port = address.split(':', 1)
+        return host, int(port)
+
+    return address, defaultPort
+
+
+standIn = None
+if args.standin:
+    from otp.astron.AstronStandIn import AstronStandIn
+
+    standIn = AstronStandIn()
+    mdHost, mdPort = splitAddress(args.messagedirector_ip, 7199)
+    standIn.start(mdHost, mdPort, caPort=None)
+
+host, port = splitAddress(args.server, 7198)
+swarm = BotSwarm(host, port, BotScripts.Scripts[args.script], args.token_prefix, args.timeout, standIn)
+if not args.no_framestats:
+    swarm.spawnBot(frameStatsScript(swarm, args.duration))
+
+swarm.start(args.bots, args.spawn_rate)
+
+
+def finish(task):
+    swarm.report()
+    swarm.stop()
+    sys.exit(0)
+
+
+taskMgr.doMethodLater(args.duration + args.timeout, finish, 'botSwarmFinish')
+
+try:
+    run()
+except SystemExit:
+    raise
+except Exception:
+    from otp.otpbase import PythonUtil
+    print(PythonUtil.describeException())
+    raise
@@ -102,9 +102,16 @@ class DistributedBuildingMgrAI:
         petshopBlocks = []
         kartshopBlocks = []
         animBldgBlocks = []
-        for i in range(self.dnaStore.getNumBlockNumbers()):
-            blockNumber = self.dnaStore.getBlockNumberAt(i)
-            buildingType = self.dnaStore.getBlockBuildingType(blockNumber)
+        dnaIndex = self.air.dnaIndexMap.get(self.canonicalBranchID)
+        if dnaIndex is not None:
+            dnaBlocks = dnaIndex.getBlocks()
+        else:
+            dnaBlocks = []
+            for i in range(self.dnaStore.getNumBlockNumbers()):
+                blockNumber = self.dnaStore.getBlockNumberAt(i)
+                dnaBlocks.append((blockNumber, self.dnaStore.getBlockBuildingType(blockNumber)))
+
+        for blockNumber, buildingType in dnaBlocks:
             if buildingType == 'hq':
                 hqBlocks.append(blockNumber)
             elif buildingType == 'gagshop':
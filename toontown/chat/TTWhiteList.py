@@ -135,12 +135,7 @@ class TTWhiteList(WhiteList, DirectObject):
             return
         data = vfs.readFile(localFilename, 1)
         lines = data.split(b'\n')
-        self.words = []
-        for line in lines:
-            self.words.append(line.strip(b'\n\r').lower())
-
-        self.words.sort()
-        self.numWords = len(self.words)
+        self.setWords(lines)
         self.defaultWord = TTLocalizer.ChatGarblerDefault[0]
 
     def handleNewWhitelist(self):
@@ -220,7 +220,7 @@ class CogdoMazeFactory:
 
                         row += newData + [1]
                     else:
-                        row += self.quadrantData[x][1][y] + [1]
+                        row += list(self.quadrantData[x][1][y]) + [1]
 
                 collisionTable.append(row)
 
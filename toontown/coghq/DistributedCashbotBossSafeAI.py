@@ -13,7 +13,7 @@ class DistributedCashbotBossSafeAI(DistributedCashbotBossObjectAI.DistributedCas
         cn = CollisionNode('sphere')
         cs = CollisionSphere(0, 0, 0, 6)
         cn.addSolid(cs)
-        self.attachNewNode(cn)
+        self.sphere = self.attachNewNode(cn)
 
     def resetToInitialPosition(self):
         posHpr = ToontownGlobals.CashbotBossSafePosHprs[self.index]
@@ -0,0 +1,84 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import time
+
+parser = argparse.ArgumentParser(description='Open Toontown - Cog HQ level spec benchmark')
+parser.add_argument('--iterations', type=int, default=20, help='Number of facilities instantiated per spec.')
+args = parser.parse_args()
+# Facilities only fill in their entity defaults and send their specs to
+# clients in dev mode.
+loadPrcFileData('LevelSpecBenchmark', 'want-dev 1')
+
+
+class game:
+    name = 'toontown'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+import copy
+import importlib
+from otp.level import LevelSpec
+from toontown.coghq import CountryClubRoomSpecs, FactorySpecs, MintRoomSpecs, StageRoomSpecs
+from toontown.coghq.FactoryBase import FactoryBase
+from toontown.toonbase import ToontownGlobals
+
+
+def makeSpec(specDict, typeReg):
+    """A LevelSpec edited in place, as every facility's was."""
+    levelSpec = LevelSpec.LevelSpec(specDict)
+    levelSpec.setEntityTypeReg(typeReg)
+    return levelSpec
+
+
+def instantiateReread(specModule, typeReg):
+    """A facility's spec work as it was: read the module again and fill in every entity's defaults."""
+    importlib.reload(specModule)
+    levelSpec = makeSpec(specModule.levelSpec, typeReg)
+    specRepr = LevelSpec.LevelSpec.makeRepr(levelSpec.specDict, levelSpec.getScenario())
+    return LevelSpec.LevelSpec.makeStringHash(specRepr), specRepr
+
+
+def instantiateCompiled(specModule, typeReg):
+    """The same with the compiled spec: share it, and its repr for the client."""
+    levelSpec = LevelSpec.LevelSpec(specModule)
+    levelSpec.setEntityTypeReg(typeReg)
+    return levelSpec.stringHash(), repr(levelSpec)
+
+
+def timeInstantiate(instantiate, specModule, typeReg):
+    """Returns the ms the first instantiation took, the mean ms of the rest, and the last result."""
+    times = []
+    for i in range(args.iterations):
+        start = time.perf_counter()
+        result = instantiate(specModule, typeReg)
+        times.append((time.perf_counter() - start) * 1000.0)
+
+    return times[0], sum(times[1:]) / max(1, len(times) - 1), result
+
+
+typeReg = FactoryBase().getEntityTypeReg()
+specModules = [('factory', FactorySpecs.getFactorySpecModule(ToontownGlobals.SellbotFactoryInt)),
+               ('mint room', MintRoomSpecs.getMintRoomSpecModule(2)),
+               ('stage room', StageRoomSpecs.getStageRoomSpecModule(0)),
+               ('country club room', CountryClubRoomSpecs.getCountryClubRoomSpecModule(0))]
+print('%-22s %-36s %8s %10s %12s %12s' % ('facility', 'spec', 'entities', 'reread ms', 'compiled ms',
+                                          'first ms'))
+for name, specModule in specModules:
+    rereadTime = timeInstantiate(instantiateReread, specModule, typeReg)[1]
+    compiledFirst, compiledTime, result = timeInstantiate(instantiateCompiled, specModule, typeReg)
+    # Some specs are a little random, so check against the module as it
+    # was compiled, rather than as it was last reread.
+    levelSpec = makeSpec(copy.deepcopy(specModule.levelSpec), typeReg)
+    specRepr = LevelSpec.LevelSpec.makeRepr(levelSpec.specDict, levelSpec.getScenario())
+    if result != (LevelSpec.LevelSpec.makeStringHash(specRepr), specRepr):
+        print('The compiled %s spec differs from the reread one.' % name)
+        raise SystemExit(1)
+
+    numEntities = len(LevelSpec.LevelSpec(specModule).getAllEntIdsFromAllScenarios())
+    print('%-22s %-36s %8d %10.3f %12.3f %12.3f' % (name, specModule.__name__.split('.')[-1], numEntities,
+                                                 rereadTime, compiledTime, compiledFirst))
@@ -0,0 +1,60 @@
+from panda3d.core import loadPrcFileData
+
+from direct.directnotify import DirectNotifyGlobal
+from direct.task import Task
+
+
+class OutboundBatcher:
+    """
+    Opt-in (want-outbound-batching) batching of the datagrams an AI or
+    UberDOG sends to the message director.
+
+    Normally every datagram the repository sends is written to the socket
+    on its own, so a frame full of battle, suit and toon updates makes
+    as many small writes.  With batching on, the connection collects the
+    datagrams it is given instead (collect-tcp), and they are all written
+    together when the batcher flushes it, at the end of every frame.
+
+    The datagrams still go through the one connection in the order they
+    were sent, so the updates of every object keep their order.  Fields
+    named in outbound-batching-bypass-fields are latency-critical: the
+    connection is flushed as soon as one of them is sent, along with
+    everything sent before it.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('OutboundBatcher')
+    # The connection is only ever flushed by us; this just bounds how long
+    # a datagram can wait if the frame loop stalls.
+    CollectInterval = 0.5
+
+    def __init__(self, repository):
+        self.repository = repository
+        self.bypassFields = set(config.GetString('outbound-batching-bypass-fields', 'setTalk setTalkWhisper').split())
+        self.numFlushes = 0
+        self.flushTask = None
+
+        # This has to be set up before the repository connects.
+        loadPrcFileData('OutboundBatcher', 'collect-tcp 1\ncollect-tcp-interval %s' % self.CollectInterval)
+
+    def start(self):
+        # Just before AIBase's aiSleep task, so the frame's datagrams are
+        # written before we sleep.
+        self.flushTask = taskMgr.add(self.__flushTask, 'outboundBatcherFlush', priority=54)
+
+    def stop(self):
+        if self.flushTask:
+            taskMgr.remove(self.flushTask)
+            self.flushTask = None
+
+        self.flush()
+
+    def flush(self):
+        self.repository.flush()
+        self.numFlushes += 1
+
+    def sentField(self, fieldName):
+        if fieldName in self.bypassFields:
+            self.flush()
+
+    def __flushTask(self, task):
+        self.flush()
+        return Task.cont
@@ -0,0 +1,152 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import socket
+import struct
+import threading
+import time
+
+parser = argparse.ArgumentParser(description='Open Toontown - Outbound batching benchmark')
+parser.add_argument('--frames', type=int, default=300, help='Number of frames run with batching off and on.')
+parser.add_argument('--updates', type=int, default=200, help='Number of field updates sent each frame.')
+parser.add_argument('--objects', type=int, default=50, help='Number of objects the updates are sent for.')
+parser.add_argument('--bypass', type=float, default=0.01,
+                    help='Fraction of the updates that are sent with a bypass field.')
+args = parser.parse_args()
+loadPrcFileData('OutboundBatchingBenchmark', 'ai-sleep 0\nai-min-tick 0\n'
+                'outbound-batching-bypass-fields setTalk')
+
+
+class game:
+    name = 'toontown'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from direct.distributed.ConnectionRepository import ConnectionRepository
+from direct.distributed.MsgTypes import STATESERVER_OBJECT_SET_FIELD
+from direct.distributed.PyDatagram import PyDatagram
+from toontown.distributed.OutboundBatcher import OutboundBatcher
+
+
+class BenchmarkMessageDirector:
+    """
+    Stands in for the message director: reads everything sent to it on
+    one connection, counting its reads and checking that the updates of
+    every object arrive in order.
+    """
+
+    def __init__(self):
+        self.listenSocket = socket.socket()
+        self.listenSocket.bind(('127.0.0.1', 0))
+        self.listenSocket.listen(1)
+        self.port = self.listenSocket.getsockname()[1]
+        self.numReads = 0
+        self.numDatagrams = 0
+        self.outOfOrder = 0
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        connection, address = self.listenSocket.accept()
+        self.listenSocket.close()
+        lastSequence = {}
+        pending = b''
+        while True:
+            data = connection.recv(65536)
+            if not data:
+                break
+
+            self.numReads += 1
+            pending += data
+            offset = 0
+            while len(pending) - offset >= 2:
+                length, = struct.unpack_from('<H', pending, offset)
+                if len(pending) - offset - 2 < length:
+                    break
+
+                # Skip the length, recipient count, recipient, sender and
+                # message type to reach the doId and our sequence number.
+                doId, fieldId, sequence = struct.unpack_from('<IHI', pending, offset + 2 + 1 + 8 + 8 + 2)
+                if sequence <= lastSequence.get(doId, -1):
+                    self.outOfOrder += 1
+
+                lastSequence[doId] = sequence
+                self.numDatagrams += 1
+                offset += 2 + length
+
+            pending = pending[offset:]
+
+        connection.close()
+
+
+def makeUpdate(doId, sequence):
+    dg = PyDatagram()
+    dg.addServerHeader(doId, 4000, STATESERVER_OBJECT_SET_FIELD)
+    dg.addUint32(doId)
+    dg.addUint16(0)
+    dg.addUint32(sequence)
+    # About the size of a setSmPos.
+    dg.appendData(b'\0' * 16)
+    return dg
+
+
+def run(batching):
+    messageDirector = BenchmarkMessageDirector()
+    repository = ConnectionRepository(ConnectionRepository.CM_NET, config)
+    batcher = None
+    if batching:
+        batcher = OutboundBatcher(repository)
+        batcher.start()
+    else:
+        loadPrcFileData('OutboundBatchingBenchmark', 'collect-tcp 0')
+
+    if not repository.tryConnectNet(URLSpec('http://127.0.0.1:%d' % messageDirector.port)):
+        print('Could not connect to the benchmark message director.')
+        raise SystemExit(1)
+
+    bypassEvery = int(1 / args.bypass) if args.bypass > 0 else 0
+    updates = []
+    for i in range(args.updates):
+        doId = 100000000 + i % args.objects
+        fieldName = 'setTalk' if bypassEvery and i % bypassEvery == 0 else 'setSmPos'
+        updates.append((doId, fieldName))
+
+    numWrites = 0
+    sequence = 0
+    start = time.perf_counter()
+    for frame in range(args.frames):
+        for doId, fieldName in updates:
+            repository.send(makeUpdate(doId, sequence))
+            sequence += 1
+            if batcher:
+                batcher.sentField(fieldName)
+            else:
+                numWrites += 1
+
+        taskMgr.step()
+
+    sendTime = time.perf_counter() - start
+    if batcher:
+        batcher.stop()
+        numWrites = batcher.numFlushes
+
+    repository.disconnect()
+    messageDirector.thread.join()
+    if messageDirector.numDatagrams != sequence or messageDirector.outOfOrder:
+        print('The message director got %d of %d updates, %d out of order.' % (
+            messageDirector.numDatagrams, sequence, messageDirector.outOfOrder))
+        raise SystemExit(1)
+
+    print('%12s %14.0f %14.1f %14.1f' % ('on' if batching else 'off', sequence / sendTime,
+                                         numWrites / args.frames, messageDirector.numReads / args.frames))
+
+
+print('%d frames of %d updates to %d objects, %0.1f%% with a bypass field' % (
+    args.frames, args.updates, args.objects, args.bypass * 100.0))
+print('%12s %14s %14s %14s' % ('batching', 'datagrams/s', 'writes/frame', 'MD reads/frame'))
+run(False)
+run(True)
@@ -0,0 +1,222 @@
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from direct.directnotify import DirectNotifyGlobal
+
+
+class PerformanceCounters:
+    """
+    Counts and times the work done by an AI or UberDOG process:
+
+        * every task callback, by task name with the numbers taken out
+          (so battle-100000345-timer and battle-100000346-timer are both
+          counted as battle-#-timer);
+        * every field update received, by dclass and field;
+        * every field update sent with sendUpdate, sendUpdateToChannel or
+          sendUpdateToDoId, by dclass and field.
+
+    The counters are plain lists updated in place, so recording costs a
+    dict lookup and two perf_counter calls.  When perf-counters-port is
+    set, they are served in the Prometheus text format on
+    http://perf-counters-host:perf-counters-port/metrics by a daemon
+    thread, which only ever reads copies of the counter tables.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('PerformanceCounters')
+    TaskNumberPattern = re.compile(r'\d+')
+
+    def __init__(self, air, processName):
+        self.air = air
+        self.processName = processName
+        # task name prefix -> [calls, seconds]
+        self.taskCounters = {}
+        # (dclass name, field number) -> [updates, seconds]
+        self.receivedCounters = {}
+        # (dclass name, field name) -> [updates]
+        self.sentCounters = {}
+        self.startTime = time.time()
+        self.server = None
+        self.serverThread = None
+        self.taskMgr = None
+        self.taskMgrAdd = None
+        self.taskMgrDoMethodLater = None
+
+    def instrumentTasks(self, taskMgr):
+        """Times the callbacks of every task added to taskMgr from now on."""
+        self.taskMgr = taskMgr
+        self.taskMgrAdd = taskMgr.add
+        self.taskMgrDoMethodLater = taskMgr.doMethodLater
+
+        def add(*args, **kwargs):
+            task = self.taskMgrAdd(*args, **kwargs)
+            self.timeTask(task)
+            return task
+
+        def doMethodLater(*args, **kwargs):
+            task = self.taskMgrDoMethodLater(*args, **kwargs)
+            self.timeTask(task)
+            return task
+
+        taskMgr.add = add
+        taskMgr.doMethodLater = doMethodLater
+
+    def timeTask(self, task):
+        if not hasattr(task, 'getFunction'):
+            return
+
+        function = task.getFunction()
+        if not callable(function):
+            # Coroutines time themselves.
+            return
+
+        prefix = self.TaskNumberPattern.sub('#', task.getName())
+        counter = self.taskCounters.get(prefix)
+        if counter is None:
+            counter = self.taskCounters[prefix] = [0, 0.0]
+
+        def timedFunction(*args, perfCounter=time.perf_counter):
+            # A task that raises takes the process down anyway, so it's
+            # not worth a try/finally here.
+            startTime = perfCounter()
+            result = function(*args)
+            counter[0] += 1
+            counter[1] += perfCounter() - startTime
+            return result
+
+        task.setFunction(timedFunction)
+
+    def recordReceived(self, dclassName, fieldNumber, elapsed):
+        key = (dclassName, fieldNumber)
+        counter = self.receivedCounters.get(key)
+        if counter is None:
+            self.receivedCounters[key] = [1, elapsed]
+        else:
+            counter[0] += 1
+            counter[1] += elapsed
+
+    def recordSent(self, dclassName, fieldName):
+        key = (dclassName, fieldName)
+        counter = self.sentCounters.get(key)
+        if counter is None:
+            self.sentCounters[key] = [1]
+        else:
+            counter[0] += 1
+
+    def startServer(self, host, port):
+        counters = self
+
+        class MetricsRequestHandler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+
+                body = counters.formatMetrics().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        try:
+            self.server = HTTPServer((host, port), MetricsRequestHandler)
+        except OSError as e:
+            self.notify.warning('Could not serve the performance counters on %s:%d: %s' % (host, port, e))
+            return
+
+        self.serverThread = threading.Thread(target=self.server.serve_forever, name='PerformanceCounters')
+        self.serverThread.daemon = True
+        self.serverThread.start()
+        self.notify.info('Serving the performance counters on http://%s:%d/metrics' % (host, port))
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+            self.serverThread = None
+
+        if self.taskMgr:
+            del self.taskMgr.add
+            del self.taskMgr.doMethodLater
+            self.taskMgr = None
+
+    @staticmethod
+    def escapeLabel(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    def getFieldName(self, fieldNumber):
+        field = self.air.dcFile.getFieldByIndex(fieldNumber)
+        if field is None:
+            return str(fieldNumber)
+
+        return field.getName()
+
+    def formatMetrics(self):
+        """Returns the counters in the Prometheus text exposition format."""
+        # This may run on the server thread, so only work on copies.
+        taskCounters = dict(self.taskCounters)
+        receivedCounters = dict(self.receivedCounters)
+        sentCounters = dict(self.sentCounters)
+        process = self.escapeLabel(self.processName)
+        lines = []
+
+        def addMetric(name, metricType, help, samples):
+            lines.append('# HELP %s %s' % (name, help))
+            lines.append('# TYPE %s %s' % (name, metricType))
+            for labels, value in samples:
+                labelText = ','.join(['process="%s"' % process] +
+                                     ['%s="%s"' % (label, self.escapeLabel(labelValue))
+                                      for label, labelValue in labels])
+                lines.append('%s{%s} %r' % (name, labelText, value))
+
+        tasks = sorted(taskCounters.items())
+        addMetric('toontown_task_calls_total', 'counter', 'Task callbacks run, by task name prefix.',
+                  [((('task', prefix),), counter[0]) for prefix, counter in tasks])
+        addMetric('toontown_task_seconds_total', 'counter', 'Time spent in task callbacks, by task name prefix.',
+                  [((('task', prefix),), counter[1]) for prefix, counter in tasks])
+
+        received = sorted(((dclassName, self.getFieldName(fieldNumber)), counter)
+                          for (dclassName, fieldNumber), counter in receivedCounters.items())
+        addMetric('toontown_field_updates_received_total', 'counter', 'Field updates received, by dclass and field.',
+                  [((('dclass', dclassName), ('field', fieldName)), counter[0])
+                   for (dclassName, fieldName), counter in received])
+        addMetric('toontown_field_update_seconds_total', 'counter',
+                  'Time spent handling received field updates, by dclass and field.',
+                  [((('dclass', dclassName), ('field', fieldName)), counter[1])
+                   for (dclassName, fieldName), counter in received])
+
+        addMetric('toontown_field_updates_sent_total', 'counter', 'Field updates sent, by dclass and field.',
+                  [((('dclass', dclassName), ('field', fieldName)), counter[0])
+                   for (dclassName, fieldName), counter in sorted(sentCounters.items())])
+
+        # The frame loop histograms kept by AIBase; the ones that
+        # resetFrameStats and ~framestats clear would go backwards.
+        if hasattr(simbase, 'allFrameTimes'):
+            for name, help, buckets, total in (
+                    ('toontown_frame_seconds', 'Time spent working each frame.', simbase.allFrameTimes,
+                     simbase.allFrameTime),
+                    ('toontown_frame_sleep_seconds', 'Time slept between frames.', simbase.allSleepTimes,
+                     simbase.allSleepTime)):
+                buckets = list(buckets)
+                lines.append('# HELP %s %s' % (name, help))
+                lines.append('# TYPE %s histogram' % name)
+                count = 0
+                for upperBound, bucketCount in zip(simbase.FrameTimeBuckets, buckets):
+                    count += bucketCount
+                    lines.append('%s_bucket{process="%s",le="%r"} %d' % (name, process, upperBound / 1000.0, count))
+
+                count += buckets[-1]
+                lines.append('%s_bucket{process="%s",le="+Inf"} %d' % (name, process, count))
+                lines.append('%s_sum{process="%s"} %r' % (name, process, total))
+                lines.append('%s_count{process="%s"} %d' % (name, process, count))
+
+        lines.append('# HELP toontown_process_start_time_seconds Start time of the counters since the epoch.')
+        lines.append('# TYPE toontown_process_start_time_seconds gauge')
+        lines.append('toontown_process_start_time_seconds{process="%s"} %r' % (process, self.startTime))
+        return '\n'.join(lines) + '\n'
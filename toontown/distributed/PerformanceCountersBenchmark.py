@@ -0,0 +1,88 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import time
+
+parser = argparse.ArgumentParser(description='Open Toontown - Performance counters overhead benchmark')
+parser.add_argument('--tasks', type=int, default=500, help='Number of per-frame tasks.')
+parser.add_argument('--frames', type=int, default=200, help='Number of frames run with and without the counters.')
+parser.add_argument('--work', type=int, default=200,
+                    help='Size of the loop each task runs, as a stand-in for real work.')
+parser.add_argument('--updates', type=int, default=1000000, help='Number of field updates recorded.')
+args = parser.parse_args()
+loadPrcFileData('PerformanceCountersBenchmark', 'ai-sleep 0\nai-min-tick 0')
+
+
+class game:
+    name = 'toontown'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from panda3d.direct import DCFile
+from toontown.distributed.PerformanceCounters import PerformanceCounters
+
+
+class BenchmarkAir:
+
+    def __init__(self):
+        self.dcFile = DCFile()
+
+
+def work(task):
+    total = 0
+    for i in range(args.work):
+        total += i
+
+    return task.cont
+
+
+def timeFrames(counters):
+    if counters:
+        counters.instrumentTasks(taskMgr)
+
+    for i in range(args.tasks):
+        taskMgr.add(work, 'benchmarkTask-%d' % i)
+
+    taskMgr.step()
+    start = time.perf_counter()
+    for i in range(args.frames):
+        taskMgr.step()
+
+    elapsed = time.perf_counter() - start
+    taskMgr.removeTasksMatching('benchmarkTask-*')
+    if counters:
+        counters.stop()
+
+    return elapsed
+
+
+def timeUpdates(counters):
+    dclassNames = ['DistributedToonAI', 'DistributedSuitAI', 'DistributedBattleAI', 'DistributedNPCToonAI']
+    start = time.perf_counter()
+    for i in range(args.updates):
+        counters.recordReceived(dclassNames[i & 3], i & 63, 0.0001)
+        counters.recordSent(dclassNames[i & 3], 'setPos')
+
+    return time.perf_counter() - start
+
+
+counters = PerformanceCounters(BenchmarkAir(), 'benchmark')
+plainTime = timeFrames(None)
+countedTime = timeFrames(counters)
+numCalls = args.tasks * args.frames
+print('%d tasks, %d frames' % (args.tasks, args.frames))
+print('without counters: %8.2f ms per frame' % (plainTime * 1000.0 / args.frames))
+print('with counters:    %8.2f ms per frame (%+0.1f%%, %0.2f us per task callback)' % (
+    countedTime * 1000.0 / args.frames, (countedTime - plainTime) * 100.0 / plainTime,
+    (countedTime - plainTime) * 1000000.0 / numCalls))
+
+updateTime = timeUpdates(counters)
+print('recording a received and a sent update: %0.2f us' % (updateTime * 1000000.0 / args.updates))
+
+start = time.perf_counter()
+metrics = counters.formatMetrics()
+print('formatting %d lines of metrics: %0.2f ms' % (metrics.count('\n'), (time.perf_counter() - start) * 1000.0))
@@ -1,6 +1,11 @@
+import time
+
 from direct.directnotify import DirectNotifyGlobal
+from panda3d.core import DatagramIterator
 from otp.distributed.OTPInternalRepository import OTPInternalRepository
 from otp.distributed.OtpDoGlobals import *
+from toontown.distributed.OutboundBatcher import OutboundBatcher
+from toontown.distributed.PerformanceCounters import PerformanceCounters
 
 class ToontownInternalRepository(OTPInternalRepository):
     notify = DirectNotifyGlobal.directNotify.newCategory('ToontownInternalRepository')
@@ -8,12 +13,49 @@ class ToontownInternalRepository(OTPInternalRepository):
 
     def __init__(self, baseChannel, serverId=None, dcFileNames=None, dcSuffix='AI', connectMethod=None, threadedNet=None):
         OTPInternalRepository.__init__(self, baseChannel, serverId, dcFileNames, dcSuffix, connectMethod, threadedNet)
+        self.perfCounters = None
+        if config.GetBool('want-perf-counters', True):
+            self.perfCounters = PerformanceCounters(self, '%s-%d' % (dcSuffix.lower(), baseChannel))
+            self.perfCounters.instrumentTasks(taskMgr)
+            port = config.GetInt('perf-counters-port', 0)
+            if port:
+                self.perfCounters.startServer(config.GetString('perf-counters-host', '127.0.0.1'), port)
+
+        self.outboundBatcher = None
+        if config.GetBool('want-outbound-batching', False):
+            self.outboundBatcher = OutboundBatcher(self)
+            self.outboundBatcher.start()
 
     def _isValidPlayerLocation(self, parentId, zoneId):
         if zoneId < 1000 and zoneId != 1:
             return False
 
         return True
+
+    def handleObjUpdate(self, di):
+        if self.perfCounters is None:
+            OTPInternalRepository.handleObjUpdate(self, di)
+            return
+
+        # Peek at the object and field the update is for.
+        peek = DatagramIterator(di.getDatagram(), di.getCurrentIndex())
+        do = self.doId2do.get(peek.getUint32())
+        fieldNumber = peek.getUint16()
+        startTime = time.perf_counter()
+        try:
+            OTPInternalRepository.handleObjUpdate(self, di)
+        finally:
+            if do is not None:
+                self.perfCounters.recordReceived(do.dclass.getName(), fieldNumber, time.perf_counter() - startTime)
+
+    def sendUpdateToChannel(self, distObj, channelId, fieldName, args):
+        # sendUpdate goes through here too.
+        if self.perfCounters is not None:
+            self.perfCounters.recordSent(distObj.dclass.getName(), fieldName)
+
+        OTPInternalRepository.sendUpdateToChannel(self, distObj, channelId, fieldName, args)
+        if self.outboundBatcher is not None:
+            self.outboundBatcher.sentField(fieldName)
     
     # Anesidora
     def sendUpdateToDoId(self, dclassName, fieldName, doId, args,
@@ -31,6 +73,10 @@ class ToontownInternalRepository(OTPInternalRepository):
         if channelId is None:
             channelId=doId
         if dclass is not None:
+            if self.perfCounters is not None:
+                self.perfCounters.recordSent(dclass.getName(), fieldName)
             dg = dclass.aiFormatUpdate(
                     fieldName, doId, channelId, self.ourChannel, args)
             self.send(dg)
+            if self.outboundBatcher is not None:
+                self.outboundBatcher.sentField(fieldName)
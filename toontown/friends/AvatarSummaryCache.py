@@ -0,0 +1,51 @@
+from collections import OrderedDict
+
+
+class AvatarSummaryCache:
+    """
+    A least-recently-used cache of the avatar summaries (name, DNA string and
+    pet id) the friends manager sends in friends lists.
+
+    Every full database read of a toon made by the friends operations is
+    stored here, so a friends list can be built without querying the
+    database again for every friend.  The summary of a toon can change while
+    it is played, so the friends manager drops a toon's summary when it comes
+    online and when it goes offline, and never serves the summaries of
+    online toons from the cache.
+    """
+
+    def __init__(self, maxSize):
+        self.maxSize = maxSize
+        # avId -> (name, dnaString, petId)
+        self.summaries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, avId):
+        summary = self.summaries.get(avId)
+        if summary is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.summaries.move_to_end(avId)
+        return summary
+
+    def put(self, avId, fields):
+        """Stores the summary of avId from the fields of a DistributedToonUD database read."""
+        if self.maxSize <= 0:
+            return
+
+        self.summaries[avId] = (fields['setName'][0], fields['setDNAString'][0], fields['setPetId'][0])
+        self.summaries.move_to_end(avId)
+        while len(self.summaries) > self.maxSize:
+            self.summaries.popitem(last=False)
+
+    def invalidate(self, avId):
+        self.summaries.pop(avId, None)
+
+    def clear(self):
+        self.summaries.clear()
+
+    def __len__(self):
+        return len(self.summaries)
@@ -0,0 +1,126 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import time
+
+parser = argparse.ArgumentParser(description='Open Toontown - Friends list latency benchmark')
+parser.add_argument('--friends', default='50,200', help='Comma separated friends list sizes.')
+parser.add_argument('--latency', type=float, default=5.0,
+                    help='Milliseconds the fake database and state server take to answer each request.')
+parser.add_argument('--windows', default='1,8,32',
+                    help='Comma separated limits of requests in flight to compare; 1 is one request at a time.')
+parser.add_argument('--frame-sleep', type=float, default=1.0,
+                    help='Longest time, in milliseconds, the task loop sleeps between frames (ai-sleep).')
+args = parser.parse_args()
+loadPrcFileData('FriendsListBenchmark', 'ai-sleep %f' % (args.frame_sleep / 1000.0))
+
+
+class game:
+    name = 'toontown'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from toontown.friends.ToontownFriendsManagerUD import ToontownFriendsManagerUD
+
+
+class BenchmarkDClasses(dict):
+
+    def __missing__(self, className):
+        # Any name is a valid dclass; the operations only compare them.
+        return className
+
+
+class BenchmarkDBInterface:
+    """Answers queryObject after the configured latency, like a remote database would."""
+
+    def __init__(self, air):
+        self.air = air
+        self.numQueries = 0
+
+    def queryObject(self, dbId, doId, callback):
+        self.numQueries += 1
+        taskMgr.doMethodLater(self.air.latency, self.__respond, 'benchmarkQuery-%d' % self.numQueries,
+                              extraArgs=[doId, callback])
+
+    def __respond(self, doId, callback):
+        callback('DistributedToonUD', self.air.toons[doId])
+
+
+class BenchmarkAir:
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.dbId = 4003
+        self.dclassesByName = BenchmarkDClasses()
+        self.dbInterface = BenchmarkDBInterface(self)
+        self.toons = {}
+        self.numActivationChecks = 0
+
+    def getActivated(self, doId, callback):
+        self.numActivationChecks += 1
+        taskMgr.doMethodLater(self.latency, callback, 'benchmarkActivated-%d' % self.numActivationChecks,
+                              extraArgs=[doId, doId % 3 == 0])
+
+    def addToon(self, avId, friendsList):
+        self.toons[avId] = {'setName': ['Toon %d' % avId],
+                            'setDNAString': [b'dna'],
+                            'setPetId': [0],
+                            'setFriendsList': [friendsList]}
+
+
+class BenchmarkFriendsManager(ToontownFriendsManagerUD):
+
+    def __init__(self, air):
+        ToontownFriendsManagerUD.__init__(self, air)
+        self.response = None
+
+    def sendUpdateToAvatarId(self, avId, fieldName, args):
+        if fieldName == 'getFriendsListResponse':
+            self.response = args
+
+
+def timeFriendsList(friendsManager, senderId):
+    friendsManager.response = None
+    friendsManager.air.getAvatarIdFromSender = lambda: senderId
+    start = time.perf_counter()
+    friendsManager.getFriendsListRequest()
+    while friendsManager.response is None:
+        taskMgr.step()
+
+    elapsed = time.perf_counter() - start
+    success, friendsList = friendsManager.response
+    if not success:
+        print('The friends list request failed.')
+        raise SystemExit(1)
+
+    return elapsed, friendsList
+
+
+air = BenchmarkAir(args.latency / 1000.0)
+windows = [int(x) for x in args.windows.split(',')]
+print('%8s %8s %14s %14s' % ('friends', 'window', 'cold ms', 'cached ms'))
+for numFriends in [int(x) for x in args.friends.split(',')]:
+    senderId = 100000000 + numFriends * 1000
+    friendIds = [senderId + i + 1 for i in range(numFriends)]
+    air.addToon(senderId, [(friendId, 0) for friendId in friendIds])
+    for friendId in friendIds:
+        air.addToon(friendId, [(senderId, 0)])
+
+    expected = None
+    for window in windows:
+        friendsManager = BenchmarkFriendsManager(air)
+        friendsManager.maxRequestsInFlight = window
+        coldTime, friendsList = timeFriendsList(friendsManager, senderId)
+        cachedTime, cachedFriendsList = timeFriendsList(friendsManager, senderId)
+        if expected is None:
+            expected = friendsList
+
+        if friendsList != expected or cachedFriendsList != expected:
+            print('The friends list differs with %d requests in flight.' % window)
+            raise SystemExit(1)
+
+        print('%8d %8d %14.1f %14.1f' % (numFriends, window, coldTime * 1000.0, cachedTime * 1000.0))
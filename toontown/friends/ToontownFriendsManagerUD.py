@@ -7,6 +7,7 @@ import random
 import string
 import json
 from panda3d.direct import DCPacker
+from toontown.friends.AvatarSummaryCache import AvatarSummaryCache
 class FriendsOperation:
     """
     Base class for all friend-related operations.
@@ -41,6 +42,12 @@ class FriendsOperation:
 class GetFriendsListOperation(FriendsOperation):
     """
     Operation to retrieve the friends list of a sender.
+
+    Once the sender's friends list is known, the database queries for the
+    friends that aren't in the friends manager's summary cache and the
+    activation checks for every friend are all issued at once, up to the
+    friends manager's limit of requests in flight, instead of one after the
+    other.
     """
 
     def __init__(self, friendsManager, sender):
@@ -54,7 +61,10 @@ class GetFriendsListOperation(FriendsOperation):
         self.friendsList = None
         self.tempFriendsList = None
         self.onlineFriends = None
-        self.currentFriendIdx = None
+        self.pendingRequests = None
+        self.numInFlight = 0
+        self.numOutstanding = 0
+        self.finished = False
 
     def start(self):
         """
@@ -63,7 +73,7 @@ class GetFriendsListOperation(FriendsOperation):
         self.friendsList = []
         self.tempFriendsList = []
         self.onlineFriends = []
-        self.currentFriendIdx = 0
+        self.pendingRequests = []
         self.friendsManager.air.dbInterface.queryObject(self.friendsManager.air.dbId, self.sender,
                                                         self.__handleSenderRetrieved)
 
@@ -83,38 +93,73 @@ class GetFriendsListOperation(FriendsOperation):
             self._handleDone()
             return
 
-        self.friendsManager.air.dbInterface.queryObject(self.friendsManager.air.dbId, self.tempFriendsList[0][0],
-                                                        self.__handleFriendRetrieved)
+        self.friendsList = [None] * len(self.tempFriendsList)
+        for index, (friendId, _) in enumerate(self.tempFriendsList):
+            summary = self.friendsManager.getAvatarSummary(friendId)
+            if summary is None:
+                self.pendingRequests.append((self.__queryFriend, index, friendId))
+            else:
+                self.friendsList[index] = [friendId] + list(summary)
 
-    def __handleFriendRetrieved(self, dclass, fields):
+            self.pendingRequests.append((self.__checkFriendOnline, index, friendId))
+
+        self.numOutstanding = len(self.pendingRequests)
+        self.__sendPendingRequests()
+
+    def __sendPendingRequests(self):
+        """
+        Issue queued requests until the in-flight limit is reached.
+        """
+        maxInFlight = self.friendsManager.maxRequestsInFlight
+        while self.pendingRequests and not self.finished and (maxInFlight <= 0 or self.numInFlight < maxInFlight):
+            request, index, friendId = self.pendingRequests.pop(0)
+            self.numInFlight += 1
+            request(index, friendId)
+
+    def __handleResponse(self):
+        """
+        Account for a request that has been answered.
+        """
+        self.numInFlight -= 1
+        self.numOutstanding -= 1
+        if self.finished:
+            return
+
+        if self.numOutstanding <= 0:
+            self._handleDone()
+            return
+
+        self.__sendPendingRequests()
+
+    def __queryFriend(self, index, friendId):
+        self.friendsManager.air.dbInterface.queryObject(
+            self.friendsManager.air.dbId, friendId,
+            lambda dclass, fields: self.__handleFriendRetrieved(index, friendId, dclass, fields))
+
+    def __handleFriendRetrieved(self, index, friendId, dclass, fields):
         """
         Handle the retrieval of a friend's data.
 
+        :param index: The friend's index in the sender's friends list.
+        :param friendId: The friend's ID.
         :param dclass: The data class of the friend.
         :param fields: The fields of the friend.
         """
-        if dclass != self.friendsManager.air.dclassesByName['DistributedToonUD']:
-            self._handleError('Retrieved friend is not a DistributedToonUD!')
+        if self.finished:
+            self.__handleResponse()
             return
 
-        friendId = self.tempFriendsList[self.currentFriendIdx][0]
-        self.friendsList.append([friendId, fields['setName'][0], fields['setDNAString'][0], fields['setPetId'][0]])
-        if len(self.friendsList) >= len(self.tempFriendsList):
-            self.__checkFriendsOnline()
+        if dclass != self.friendsManager.air.dclassesByName['DistributedToonUD']:
+            self._handleError('Retrieved friend is not a DistributedToonUD!')
+            self.__handleResponse()
             return
 
-        self.currentFriendIdx += 1
-        self.friendsManager.air.dbInterface.queryObject(self.friendsManager.air.dbId,
-                                                        self.tempFriendsList[self.currentFriendIdx][0],
-                                                        self.__handleFriendRetrieved)
+        self.friendsManager.storeAvatarSummary(friendId, fields)
+        self.friendsList[index] = [friendId, fields['setName'][0], fields['setDNAString'][0], fields['setPetId'][0]]
+        self.__handleResponse()
 
-    def __checkFriendsOnline(self):
-        """
-        Check which friends are currently online.
-        """
-        self.currentFriendIdx = 0
-        for friendDetails in self.friendsList:
-            self.friendsManager.air.getActivated(friendDetails[0], self.__gotActivatedResp)
+    def __checkFriendOnline(self, index, friendId):
+        self.friendsManager.air.getActivated(friendId, self.__gotActivatedResp)
 
     def __gotActivatedResp(self, avId, activated):
         """
@@ -123,12 +168,10 @@ class GetFriendsListOperation(FriendsOperation):
         :param avId: The avatar ID.
         :param activated: Whether the friend is activated.
         """
-        self.currentFriendIdx += 1
-        if activated:
+        if activated and not self.finished:
             self.onlineFriends.append(avId)
 
-        if self.currentFriendIdx >= len(self.friendsList):
-            self._handleDone()
+        self.__handleResponse()
 
     def __sendFriendsList(self, success):
         """
@@ -144,6 +187,7 @@ class GetFriendsListOperation(FriendsOperation):
         """
         Handle the completion of the operation.
         """
+        self.finished = True
         self.__sendFriendsList(True)
         FriendsOperation._handleDone(self)
 
@@ -153,6 +197,9 @@ class GetFriendsListOperation(FriendsOperation):
 
         :param error: The error message.
         """
+        self.finished = True
+        self.pendingRequests = []
+        self.onlineFriends = []
         self.__sendFriendsList(False)
         FriendsOperation._handleError(self, error)
 
@@ -197,6 +244,9 @@ class GetAvatarDetailsOperation(FriendsOperation):
             self._handleError('Retrieved avatar is not a DistributedToonUD or DistributedPetAI!')
             return
 
+        if dclass == self.friendsManager.air.dclassesByName['DistributedToonUD']:
+            self.friendsManager.storeAvatarSummary(self.avId, fields)
+
         self.dclass = dclass
         self.fields = fields
         self.fields['avId'] = self.avId
@@ -355,6 +405,7 @@ class MakeFriendsOperation(FriendsOperation):
         """
         success, avatarAFriendsList = self.__handleMakeFriends(dclass, fields, self.avatarBId)
         if success:
+            self.friendsManager.storeAvatarSummary(self.avatarAId, fields)
             self.avatarAFriendsList = avatarAFriendsList
             self.friendsManager.air.dbInterface.queryObject(self.friendsManager.air.dbId, self.avatarBId,
                                                             self.__handleAvatarBRetrieved)
@@ -379,6 +430,7 @@ class MakeFriendsOperation(FriendsOperation):
         """
         success, avatarBFriendsList = self.__handleMakeFriends(dclass, fields, self.avatarAId)
         if success:
+            self.friendsManager.storeAvatarSummary(self.avatarBId, fields)
             self.avatarBFriendsList = avatarBFriendsList
             self._handleDone()
 
@@ -519,6 +571,7 @@ class RemoveFriendOperation(FriendsOperation):
         """
         success, senderFriendsList = self.__handleRemoveFriend(dclass, fields, self.friendId)
         if success:
+            self.friendsManager.storeAvatarSummary(self.sender, fields)
             self.senderFriendsList = senderFriendsList
             self.friendsManager.air.dbInterface.queryObject(self.friendsManager.air.dbId, self.friendId,
                                                             self.__handleFriendRetrieved)
@@ -532,6 +585,7 @@ class RemoveFriendOperation(FriendsOperation):
         """
         success, friendFriendsList = self.__handleRemoveFriend(dclass, fields, self.sender)
         if success:
+            self.friendsManager.storeAvatarSummary(self.friendId, fields)
             self.friendFriendsList = friendFriendsList
             self._handleDone()
 
@@ -759,6 +813,40 @@ class ToontownFriendsManagerUD(DistributedObjectGlobalUD):
         self.secret = None
         self.operations = []
         self.secrets = {}
+        self.avatarSummaries = AvatarSummaryCache(config.GetInt('friends-summary-cache-size', 10000))
+        self.maxRequestsInFlight = config.GetInt('friends-max-requests-in-flight', 32)
+        # The avatars that came online through this friends manager.
+        self.onlineAvatars = set()
+
+    def getAvatarSummary(self, avId):
+        """
+        Get the cached (name, DNA string, pet ID) of an avatar.
+
+        :param avId: The avatar ID.
+        :return: The summary, or None if it has to be queried.
+        """
+        if avId in self.onlineAvatars:
+            # It may be changing right now; ask the database.
+            return None
+
+        return self.avatarSummaries.get(avId)
+
+    def storeAvatarSummary(self, avId, fields):
+        """
+        Cache the summary of an avatar from a database read of it.
+
+        :param avId: The avatar ID.
+        :param fields: The fields of the DistributedToonUD.
+        """
+        self.avatarSummaries.put(avId, fields)
+
+    def invalidateAvatarSummary(self, avId):
+        """
+        Drop the cached summary of an avatar whose name, DNA or pet changed.
+
+        :param avId: The avatar ID.
+        """
+        self.avatarSummaries.invalidate(avId)
 
     def sendMakeFriendsResponse(self, avatarAId, avatarBId, result, context):
         """
@@ -941,6 +1029,8 @@ class ToontownFriendsManagerUD(DistributedObjectGlobalUD):
         :param avId: The avatar ID.
         :param friendsList: The friends list of the avatar.
         """
+        self.onlineAvatars.add(avId)
+        self.invalidateAvatarSummary(avId)
         self.runServerOperation(ComingOnlineOperation, avId, friendsList)
 
     def goingOffline(self, avId):
@@ -949,6 +1039,8 @@ class ToontownFriendsManagerUD(DistributedObjectGlobalUD):
 
         :param avId: The avatar ID.
         """
+        self.onlineAvatars.discard(avId)
+        self.invalidateAvatarSummary(avId)
         self.runServerOperation(GoingOfflineOperation, avId)
 
     def sendRequestSecretResponse(self, requesterId, success, secret):
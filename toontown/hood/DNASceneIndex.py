@@ -0,0 +1,202 @@
+from panda3d.core import *
+from panda3d.toontown import *
+from direct.directnotify import DirectNotifyGlobal
+
+import hashlib
+import json
+
+
+class DNASceneIndex:
+    """
+    Everything the AI looks up in a loaded DNA file, gathered in one walk.
+
+    The hood data classes, the suit planners and the building managers used
+    to recursively walk the same DNA tree once per kind of object they were
+    looking for.  A DNASceneIndex walks it once and records:
+
+    - every node whose name contains one of NodePatterns, as the path of
+      child indexes leading to it from the root, along with the zone of the
+      innermost vis group enclosing it,
+    - every vis group, with its battle cell positions and interactive props,
+    - the building type of every block in the DNAStorage.
+
+    Since nodes are recorded by path rather than by reference, an index is
+    only tied to the DNA file it was built from.  It can be shared by every
+    DNAData loaded from that file, and it can be saved next to the file,
+    keyed by the file's hash, so the next startup doesn't have to walk the
+    tree at all.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('DNASceneIndex')
+    Version = 1
+    NodePatterns = ('fishing_pond', 'party_gate', 'racing_pad', 'viewing_pad', 'leaderBoard',
+                    'game_table', 'picnic_table', 'golf_kart')
+    CacheSuffix = '.index.json'
+
+    def __init__(self, fileHash=None):
+        self.fileHash = fileHash
+        # pattern -> list of (path, name, visZoneId, outermost)
+        self.nodes = dict((pattern, []) for pattern in self.NodePatterns)
+        # list of (zoneName, battleCellPositions, interactiveProps)
+        self.visGroups = []
+        # list of (blockNumber, buildingType)
+        self.blocks = []
+
+    def build(self, dnaData, dnaStore=None):
+        """Walks dnaData once, and dnaStore's block list if given."""
+        # Iterative so deep streets don't hit the recursion limit; the stack
+        # holds (node, path, visZoneId, enclosing patterns).
+        stack = [(dnaData, (), None, frozenset())]
+        while stack:
+            node, path, visZoneId, enclosing = stack.pop()
+            name = node.getName()
+            matched = set()
+            for pattern in self.NodePatterns:
+                if pattern in name:
+                    self.nodes[pattern].append((path, name, visZoneId, pattern not in enclosing))
+                    matched.add(pattern)
+
+            if matched:
+                enclosing = enclosing.union(matched)
+
+            numChildren = node.getNumChildren()
+            if isinstance(node, DNAVisGroup):
+                visZoneId = int(name.split(':', 1)[0])
+                self.__addVisGroup(node, name, numChildren)
+
+            # Push the children backwards so they come off the stack in order.
+            for i in range(numChildren - 1, -1, -1):
+                stack.append((node.at(i), path + (i,), visZoneId, enclosing))
+
+        if dnaStore is not None:
+            for i in range(dnaStore.getNumBlockNumbers()):
+                blockNumber = dnaStore.getBlockNumberAt(i)
+                self.blocks.append((blockNumber, dnaStore.getBlockBuildingType(blockNumber)))
+
+    def __addVisGroup(self, visGroup, name, numChildren):
+        battleCells = []
+        for i in range(visGroup.getNumBattleCells()):
+            pos = visGroup.getBattleCell(i).getPos()
+            battleCells.append((pos[0], pos[1], pos[2]))
+
+        props = []
+        for i in range(numChildren):
+            child = visGroup.at(i)
+            if isinstance(child, DNAInteractiveProp):
+                props.append((child.getName(), child.getCellId()))
+
+        self.visGroups.append((name.split(':', 1)[0], battleCells, props))
+
+    def findNodes(self, dnaData, pattern, outermostOnly=False):
+        """
+        Returns a list of (node, visZoneId) for the nodes of dnaData whose
+        name contains pattern, in depth-first order.  visZoneId is the zone
+        from the name of the innermost enclosing vis group, or None.  With
+        outermostOnly, nodes inside another match of the same pattern are
+        skipped, as if the search stopped descending at each match.
+        """
+        found = []
+        for path, name, visZoneId, outermost in self.nodes[pattern]:
+            if outermostOnly and not outermost:
+                continue
+
+            node = dnaData
+            for i in path:
+                node = node.at(i)
+
+            found.append((node, visZoneId))
+
+        return found
+
+    def getVisGroups(self):
+        return self.visGroups
+
+    def getBlocks(self):
+        return self.blocks
+
+    def toDict(self):
+        return {'version': self.Version,
+                'hash': self.fileHash,
+                'nodes': self.nodes,
+                'visGroups': self.visGroups,
+                'blocks': self.blocks}
+
+    @classmethod
+    def fromDict(cls, data):
+        index = cls(data['hash'])
+        for pattern, nodes in data['nodes'].items():
+            index.nodes[pattern] = [(tuple(path), name, visZoneId, outermost) for path, name, visZoneId, outermost in nodes]
+
+        index.visGroups = [(zoneName, [tuple(pos) for pos in battleCells], [tuple(prop) for prop in props]) for zoneName, battleCells, props in data['visGroups']]
+        index.blocks = [tuple(block) for block in data['blocks']]
+        return index
+
+
+# dnaFileName -> DNASceneIndex, shared by every load of the same file.
+_indexes = {}
+
+
+def resolveDNAFileName(dnaFileName):
+    filename = Filename(dnaFileName)
+    vfs = VirtualFileSystem.getGlobalPtr()
+    if not vfs.resolveFilename(filename, getModelPath().getValue()):
+        return None
+
+    return filename
+
+
+def hashDNAFile(filename):
+    data = VirtualFileSystem.getGlobalPtr().readFile(filename, True)
+    return hashlib.sha1(data).hexdigest()
+
+
+def getDNASceneIndex(dnaFileName, dnaData, dnaStore=None):
+    """
+    Returns the DNASceneIndex for dnaFileName, building it from dnaData (and
+    dnaStore) only when neither this process nor the on-disk cache has one.
+    """
+    index = _indexes.get(dnaFileName)
+    if index is not None:
+        return index
+
+    useCache = config.GetBool('want-dna-index-cache', False)
+    filename = None
+    fileHash = None
+    if useCache:
+        filename = resolveDNAFileName(dnaFileName)
+        if filename is not None:
+            fileHash = hashDNAFile(filename)
+            index = _loadCachedIndex(filename, fileHash)
+
+    if index is None:
+        index = DNASceneIndex(fileHash)
+        index.build(dnaData, dnaStore)
+        if filename is not None:
+            _saveCachedIndex(filename, index)
+
+    _indexes[dnaFileName] = index
+    return index
+
+
+def _getCachePath(filename):
+    return filename.toOsSpecific() + DNASceneIndex.CacheSuffix
+
+
+def _loadCachedIndex(filename, fileHash):
+    try:
+        with open(_getCachePath(filename), 'r') as file:
+            data = json.load(file)
+    except (IOError, ValueError):
+        return None
+
+    if data.get('version') != DNASceneIndex.Version or data.get('hash') != fileHash:
+        return None
+
+    return DNASceneIndex.fromDict(data)
+
+
+def _saveCachedIndex(filename, index):
+    try:
+        with open(_getCachePath(filename), 'w') as file:
+            json.dump(index.toDict(), file)
+    except IOError as e:
+        DNASceneIndex.notify.warning('Could not save the DNA index of %s: %s' % (filename, e))
@@ -0,0 +1,138 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import json
+import time
+
+parser = argparse.ArgumentParser(description='Open Toontown - DNA scene index benchmark')
+parser.add_argument('--runs', type=int, default=5, help='Number of times each DNA file is loaded and searched; the best run counts.')
+parser.add_argument('config', nargs='*', default=['etc/Configrc.prc'],
+                    help='PRC file(s) to load; they set the model path the DNA is found on.')
+args = parser.parse_args()
+
+for prc in args.config:
+    loadPrcFile(prc)
+
+
+class game:
+    name = 'toontown'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from panda3d.toontown import *
+from toontown.ai.ToontownAIRepository import ToontownAIRepository
+from toontown.hood import DNASceneIndex
+from toontown.toonbase import ToontownGlobals
+
+# The finders that stopped descending at a match, like findFishingPonds.
+OutermostOnlyPatterns = ('fishing_pond',)
+
+
+def getDNAFileNames():
+    """The DNA files createZones loads, once each."""
+    dnaFileNames = []
+    for hoodId in ToontownGlobals.HoodsForTeleportAll:
+        # Bossbot HQ doesn't use DNA.
+        if hoodId == ToontownGlobals.BossbotHQ:
+            continue
+
+        for zoneId in (hoodId,) + tuple(ToontownGlobals.HoodHierarchy.get(hoodId, ())):
+            dnaFileName = ToontownAIRepository.genDNAFileName(None, zoneId)
+            if dnaFileName not in dnaFileNames:
+                dnaFileNames.append(dnaFileName)
+
+    return dnaFileNames
+
+
+def findNodesRecursively(dnaGroup, pattern, outermostOnly, visZoneId=None, found=None):
+    """A finder as they were: a recursive walk of the whole tree for one pattern."""
+    if found is None:
+        found = []
+
+    name = dnaGroup.getName()
+    if pattern in name:
+        found.append((name, visZoneId))
+        if outermostOnly:
+            return found
+
+    if isinstance(dnaGroup, DNAVisGroup):
+        visZoneId = int(name.split(':', 1)[0])
+
+    for i in range(dnaGroup.getNumChildren()):
+        findNodesRecursively(dnaGroup.at(i), pattern, outermostOnly, visZoneId, found)
+
+    return found
+
+
+def findAll(dnaIndex, dnaData):
+    found = {}
+    for pattern in DNASceneIndex.DNASceneIndex.NodePatterns:
+        found[pattern] = [(node.getName(), visZoneId) for node, visZoneId in
+                          dnaIndex.findNodes(dnaData, pattern, pattern in OutermostOnlyPatterns)]
+
+    return found
+
+
+def run(dnaFileName):
+    """
+    Returns the best ms, over args.runs, to load dnaFileName, to search
+    it as the old finders did, to build and search its index, and to read
+    and search its cached index, along with what each way found.
+    """
+    loadTimes, recursiveTimes, buildTimes, cachedTimes = [], [], [], []
+    filename = DNASceneIndex.resolveDNAFileName(dnaFileName)
+    for i in range(args.runs):
+        startTime = time.perf_counter()
+        dnaStore = DNAStorage()
+        dnaData = loadDNAFileAI(dnaStore, dnaFileName)
+        loadTimes.append(time.perf_counter() - startTime)
+
+        startTime = time.perf_counter()
+        recursiveFound = {}
+        for pattern in DNASceneIndex.DNASceneIndex.NodePatterns:
+            recursiveFound[pattern] = findNodesRecursively(dnaData, pattern, pattern in OutermostOnlyPatterns)
+
+        recursiveTimes.append(time.perf_counter() - startTime)
+
+        startTime = time.perf_counter()
+        dnaIndex = DNASceneIndex.DNASceneIndex()
+        dnaIndex.build(dnaData, dnaStore)
+        indexFound = findAll(dnaIndex, dnaData)
+        buildTimes.append(time.perf_counter() - startTime)
+
+        # What want-dna-index-cache does on a later startup, short of
+        # reading the file: hash the DNA, then parse the saved index.
+        dnaIndex.fileHash = DNASceneIndex.hashDNAFile(filename)
+        cached = json.dumps(dnaIndex.toDict())
+        startTime = time.perf_counter()
+        DNASceneIndex.hashDNAFile(filename)
+        cachedIndex = DNASceneIndex.DNASceneIndex.fromDict(json.loads(cached))
+        cachedFound = findAll(cachedIndex, dnaData)
+        cachedTimes.append(time.perf_counter() - startTime)
+
+    return ([min(times) * 1000.0 for times in (loadTimes, recursiveTimes, buildTimes, cachedTimes)],
+            recursiveFound, indexFound, cachedFound)
+
+
+print('%-40s %10s %12s %12s %12s' % ('DNA file', 'load ms', 'recursive ms', 'index ms', 'cached ms'))
+totals = [0.0] * 4
+failed = False
+for dnaFileName in getDNAFileNames():
+    times, recursiveFound, indexFound, cachedFound = run(dnaFileName)
+    print('%-40s %10.2f %12.2f %12.2f %12.2f' % ((dnaFileName,) + tuple(times)))
+    for i in range(len(totals)):
+        totals[i] += times[i]
+
+    if indexFound != recursiveFound or cachedFound != recursiveFound:
+        print('  The index finds different nodes than the recursive finders.')
+        failed = True
+
+print('%-40s %10.2f %12.2f %12.2f %12.2f' % (('total',) + tuple(totals)))
+print('DNA share of district startup: %0.1f ms with the recursive finders, %0.1f ms indexed, %0.1f ms from the index cache.' % (
+    totals[0] + totals[1], totals[0] + totals[2], totals[0] + totals[3]))
+if failed:
+    raise SystemExit(1)
@@ -45,11 +45,10 @@ class GSHoodDataAI(HoodDataAI.HoodDataAI):
         del self.leaderBoards
 
     def createLeaderBoards(self):
-        self.leaderBoards = []
-        dnaStore = DNAStorage()
-        dnaData = simbase.air.loadDNAFileAI(dnaStore, simbase.air.lookupDNAFileName('goofy_speedway_sz.dna'))
-        if isinstance(dnaData, DNAData):
-            self.leaderBoards = self.air.findLeaderBoards(dnaData, self.zoneId)
+        # The leader boards all live in the speedway's DNA; loadDNAZone only
+        # loads it once, however many hoods ask for it.
+        self.air.loadDNAZone(ToontownGlobals.GoofySpeedway)
+        self.leaderBoards = self.air.findLeaderBoards(ToontownGlobals.GoofySpeedway, self.zoneId)
         for distObj in self.leaderBoards:
             if distObj:
                 if distObj.getName().count('city'):
@@ -78,15 +77,13 @@ class GSHoodDataAI(HoodDataAI.HoodDataAI):
         self.foundViewingPadGroups = []
         for zone in self.air.zoneTable[self.canonicalHoodId]:
             zoneId = ZoneUtil.getTrueZoneId(zone[0], self.zoneId)
-            dnaData = self.air.dnaDataMap.get(zone[0], None)
-            if isinstance(dnaData, DNAData):
-                area = ZoneUtil.getCanonicalZoneId(zoneId)
-                foundRacingPads, foundRacingPadGroups = self.air.findRacingPads(dnaData, zoneId, area)
-                foundViewingPads, foundViewingPadGroups = self.air.findRacingPads(dnaData, zoneId, area, type='viewing_pad')
-                self.racingPads += foundRacingPads
-                self.foundRacingPadGroups += foundRacingPadGroups
-                self.viewingPads += foundViewingPads
-                self.foundViewingPadGroups += foundViewingPadGroups
+            area = ZoneUtil.getCanonicalZoneId(zoneId)
+            foundRacingPads, foundRacingPadGroups = self.air.findRacingPads(zone[0], zoneId, area)
+            foundViewingPads, foundViewingPadGroups = self.air.findRacingPads(zone[0], zoneId, area, type='viewing_pad')
+            self.racingPads += foundRacingPads
+            self.foundRacingPadGroups += foundRacingPadGroups
+            self.viewingPads += foundViewingPads
+            self.foundViewingPadGroups += foundViewingPadGroups
 
         self.startingBlocks = []
         for dnaGroup, distRacePad in zip(self.foundRacingPadGroups, self.racingPads):
@@ -33,11 +33,10 @@ class GZHoodDataAI(HoodDataAI.HoodDataAI):
         del self.leaderBoards
 
     def createLeaderBoards(self):
-        self.leaderBoards = []
-        dnaStore = DNAStorage()
-        dnaData = simbase.air.loadDNAFileAI(dnaStore, simbase.air.lookupDNAFileName('goofy_speedway_sz.dna'))
-        if isinstance(dnaData, DNAData):
-            self.leaderBoards = self.air.findLeaderBoards(dnaData, self.zoneId)
+        # The leader boards all live in the speedway's DNA; loadDNAZone only
+        # loads it once, however many hoods ask for it.
+        self.air.loadDNAZone(ToontownGlobals.GoofySpeedway)
+        self.leaderBoards = self.air.findLeaderBoards(ToontownGlobals.GoofySpeedway, self.zoneId)
         for distObj in self.leaderBoards:
             if distObj:
                 if distObj.getName().count('city'):
@@ -68,15 +67,13 @@ class GZHoodDataAI(HoodDataAI.HoodDataAI):
         self.golfKartPadGroups = []
         for zone in self.air.zoneTable[self.canonicalHoodId]:
             zoneId = ZoneUtil.getTrueZoneId(zone[0], self.zoneId)
-            dnaData = self.air.dnaDataMap.get(zone[0], None)
-            if isinstance(dnaData, DNAData):
-                area = ZoneUtil.getCanonicalZoneId(zoneId)
-                foundRacingPads, foundRacingPadGroups = self.air.findRacingPads(dnaData, zoneId, area, overrideDNAZone=True)
-                foundViewingPads, foundViewingPadGroups = self.air.findRacingPads(dnaData, zoneId, area, type='viewing_pad', overrideDNAZone=True)
-                self.racingPads += foundRacingPads
-                self.foundRacingPadGroups += foundRacingPadGroups
-                self.viewingPads += foundViewingPads
-                self.foundViewingPadGroups += foundViewingPadGroups
+            area = ZoneUtil.getCanonicalZoneId(zoneId)
+            foundRacingPads, foundRacingPadGroups = self.air.findRacingPads(zone[0], zoneId, area, overrideDNAZone=True)
+            foundViewingPads, foundViewingPadGroups = self.air.findRacingPads(zone[0], zoneId, area, type='viewing_pad', overrideDNAZone=True)
+            self.racingPads += foundRacingPads
+            self.foundRacingPadGroups += foundRacingPadGroups
+            self.viewingPads += foundViewingPads
+            self.foundViewingPadGroups += foundViewingPadGroups
 
         self.startingBlocks = []
         for dnaGroup, distRacePad in zip(self.foundRacingPadGroups, self.racingPads):
@@ -105,10 +102,13 @@ class GZHoodDataAI(HoodDataAI.HoodDataAI):
 
         return
 
-    def findAndCreateGolfKarts(self, dnaGroup, zoneId, area, overrideDNAZone = 0, type = 'golf_kart'):
+    def findAndCreateGolfKarts(self, dnaZoneId, zoneId, area, overrideDNAZone = 0, type = 'golf_kart'):
         golfKarts = []
         golfKartGroups = []
-        if isinstance(dnaGroup, DNAGroup) and dnaGroup.getName().find(type) >= 0:
+        for dnaGroup, visZoneId in self.air.findDNANodes(dnaZoneId, type, outermostOnly=True):
+            kartZoneId = zoneId
+            if visZoneId is not None and not overrideDNAZone:
+                kartZoneId = ZoneUtil.getTrueZoneId(visZoneId, zoneId)
             golfKartGroups.append(dnaGroup)
             if type == 'golf_kart':
                 nameInfo = dnaGroup.getName().split('_')
@@ -127,15 +127,8 @@ class GZHoodDataAI(HoodDataAI.HoodDataAI):
                 golfKart = DistributedGolfKartAI.DistributedGolfKartAI(self.air, golfCourse, pos[0], pos[1], pos[2], hpr[0], hpr[1], hpr[2])
             else:
                 self.notify.warning('unhandled case')
-            golfKart.generateWithRequired(zoneId)
+            golfKart.generateWithRequired(kartZoneId)
             golfKarts.append(golfKart)
-        else:
-            if isinstance(dnaGroup, DNAVisGroup) and not overrideDNAZone:
-                zoneId = ZoneUtil.getTrueZoneId(int(dnaGroup.getName().split(':')[0]), zoneId)
-            for i in range(dnaGroup.getNumChildren()):
-                childGolfKarts, childGolfKartGroups = self.findAndCreateGolfKarts(dnaGroup.at(i), zoneId, area, overrideDNAZone, type)
-                golfKarts += childGolfKarts
-                golfKartGroups += childGolfKartGroups
 
         return (golfKarts, golfKartGroups)
 
@@ -144,12 +137,10 @@ class GZHoodDataAI(HoodDataAI.HoodDataAI):
         self.golfKartGroups = []
         for zone in self.air.zoneTable[self.canonicalHoodId]:
             zoneId = ZoneUtil.getTrueZoneId(zone[0], self.zoneId)
-            dnaData = self.air.dnaDataMap.get(zone[0], None)
-            if isinstance(dnaData, DNAData):
-                area = ZoneUtil.getCanonicalZoneId(zoneId)
-                foundKarts, foundKartGroups = self.findAndCreateGolfKarts(dnaData, zoneId, area, overrideDNAZone=True)
-                self.golfKarts += foundKarts
-                self.golfKartGroups += foundKartGroups
+            area = ZoneUtil.getCanonicalZoneId(zoneId)
+            foundKarts, foundKartGroups = self.findAndCreateGolfKarts(zone[0], zoneId, area, overrideDNAZone=True)
+            self.golfKarts += foundKarts
+            self.golfKartGroups += foundKartGroups
 
         print(self.golfKarts, self.golfKartGroups)
         for golfKart in self.golfKarts:
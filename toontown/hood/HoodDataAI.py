@@ -66,10 +66,7 @@ class HoodDataAI:
         partyHats = []
         for zone in self.air.zoneTable[self.canonicalHoodId]:
             zoneId = ZoneUtil.getTrueZoneId(zone[0], self.zoneId)
-            dnaData = self.air.dnaDataMap.get(zone[0], None)
-            if isinstance(dnaData, DNAData):
-                foundPartyHats = self.air.findPartyHats(dnaData, zoneId)
-                partyHats += foundPartyHats
+            partyHats += self.air.findPartyHats(zone[0], zoneId)
 
         for distObj in partyHats:
             self.addDistObj(distObj)
@@ -81,12 +78,10 @@ class HoodDataAI:
         fishingPondGroups = []
         for zone in self.air.zoneTable[self.canonicalHoodId]:
             zoneId = ZoneUtil.getTrueZoneId(zone[0], self.zoneId)
-            dnaData = self.air.dnaDataMap.get(zone[0], None)
-            if isinstance(dnaData, DNAData):
-                area = ZoneUtil.getCanonicalZoneId(zoneId)
-                foundFishingPonds, foundFishingPondGroups = self.air.findFishingPonds(dnaData, zoneId, area)
-                self.fishingPonds += foundFishingPonds
-                fishingPondGroups += foundFishingPondGroups
+            area = ZoneUtil.getCanonicalZoneId(zoneId)
+            foundFishingPonds, foundFishingPondGroups = self.air.findFishingPonds(zone[0], zoneId, area)
+            self.fishingPonds += foundFishingPonds
+            fishingPondGroups += foundFishingPondGroups
 
         for distObj in self.fishingPonds:
             self.addDistObj(distObj)
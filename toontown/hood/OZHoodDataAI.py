@@ -59,11 +59,10 @@ class OZHoodDataAI(HoodDataAI.HoodDataAI):
         del self.leaderBoards
 
     def createLeaderBoards(self):
-        self.leaderBoards = []
-        dnaStore = DNAStorage()
-        dnaData = simbase.air.loadDNAFileAI(dnaStore, simbase.air.lookupDNAFileName('goofy_speedway_sz.dna'))
-        if isinstance(dnaData, DNAData):
-            self.leaderBoards = self.air.findLeaderBoards(dnaData, self.zoneId)
+        # The leader boards all live in the speedway's DNA; loadDNAZone only
+        # loads it once, however many hoods ask for it.
+        self.air.loadDNAZone(ToontownGlobals.GoofySpeedway)
+        self.leaderBoards = self.air.findLeaderBoards(ToontownGlobals.GoofySpeedway, self.zoneId)
         for distObj in self.leaderBoards:
             if distObj:
                 if distObj.getName().count('city'):
@@ -94,15 +93,13 @@ class OZHoodDataAI(HoodDataAI.HoodDataAI):
         self.golfKartPadGroups = []
         for zone in self.air.zoneTable[self.canonicalHoodId]:
             zoneId = ZoneUtil.getTrueZoneId(zone[0], self.zoneId)
-            dnaData = self.air.dnaDataMap.get(zone[0], None)
-            if isinstance(dnaData, DNAData):
-                area = ZoneUtil.getCanonicalZoneId(zoneId)
-                foundRacingPads, foundRacingPadGroups = self.air.findRacingPads(dnaData, zoneId, area, overrideDNAZone=True)
-                foundViewingPads, foundViewingPadGroups = self.air.findRacingPads(dnaData, zoneId, area, type='viewing_pad', overrideDNAZone=True)
-                self.racingPads += foundRacingPads
-                self.foundRacingPadGroups += foundRacingPadGroups
-                self.viewingPads += foundViewingPads
-                self.foundViewingPadGroups += foundViewingPadGroups
+            area = ZoneUtil.getCanonicalZoneId(zoneId)
+            foundRacingPads, foundRacingPadGroups = self.air.findRacingPads(zone[0], zoneId, area, overrideDNAZone=True)
+            foundViewingPads, foundViewingPadGroups = self.air.findRacingPads(zone[0], zoneId, area, type='viewing_pad', overrideDNAZone=True)
+            self.racingPads += foundRacingPads
+            self.foundRacingPadGroups += foundRacingPadGroups
+            self.viewingPads += foundViewingPads
+            self.foundViewingPadGroups += foundViewingPadGroups
 
         self.startingBlocks = []
         for dnaGroup, distRacePad in zip(self.foundRacingPadGroups, self.racingPads):
@@ -131,10 +128,12 @@ class OZHoodDataAI(HoodDataAI.HoodDataAI):
 
         return
 
-    def findAndCreateGameTables(self, dnaGroup, zoneId, area, overrideDNAZone = 0, type = 'game_table'):
+    def findAndCreateGameTables(self, dnaZoneId, zoneId, area, overrideDNAZone = 0, type = 'game_table'):
         picnicTables = []
-        picnicTableGroups = []
-        if isinstance(dnaGroup, DNAGroup) and dnaGroup.getName().find(type) >= 0:
+        for dnaGroup, visZoneId in self.air.findDNANodes(dnaZoneId, type, outermostOnly=True):
+            tableZoneId = zoneId
+            if visZoneId is not None and not overrideDNAZone:
+                tableZoneId = ZoneUtil.getTrueZoneId(visZoneId, zoneId)
             if type == 'game_table':
                 nameInfo = dnaGroup.getName().split('_')
                 pos = Point3(0, 0, 0)
@@ -146,21 +145,17 @@ class OZHoodDataAI(HoodDataAI.HoodDataAI):
                         hpr = childDnaGroup.getHpr()
                         break
 
-                picnicTable = DistributedPicnicTableAI.DistributedPicnicTableAI(self.air, zoneId, nameInfo[2], pos[0], pos[1], pos[2], hpr[0], hpr[1], hpr[2])
+                picnicTable = DistributedPicnicTableAI.DistributedPicnicTableAI(self.air, tableZoneId, nameInfo[2], pos[0], pos[1], pos[2], hpr[0], hpr[1], hpr[2])
                 picnicTables.append(picnicTable)
-        else:
-            if isinstance(dnaGroup, DNAVisGroup) and not overrideDNAZone:
-                zoneId = ZoneUtil.getTrueZoneId(int(dnaGroup.getName().split(':')[0]), zoneId)
-            for i in range(dnaGroup.getNumChildren()):
-                childPicnicTables = self.findAndCreateGameTables(dnaGroup.at(i), zoneId, area, overrideDNAZone, type)
-                picnicTables += childPicnicTables
 
         return picnicTables
 
-    def findAndCreatePicnicTables(self, dnaGroup, zoneId, area, overrideDNAZone = 0, type = 'picnic_table'):
+    def findAndCreatePicnicTables(self, dnaZoneId, zoneId, area, overrideDNAZone = 0, type = 'picnic_table'):
         picnicTables = []
-        picnicTableGroups = []
-        if isinstance(dnaGroup, DNAGroup) and dnaGroup.getName().find(type) >= 0:
+        for dnaGroup, visZoneId in self.air.findDNANodes(dnaZoneId, type, outermostOnly=True):
+            tableZoneId = zoneId
+            if visZoneId is not None and not overrideDNAZone:
+                tableZoneId = ZoneUtil.getTrueZoneId(visZoneId, zoneId)
             if type == 'picnic_table':
                 nameInfo = dnaGroup.getName().split('_')
                 pos = Point3(0, 0, 0)
@@ -173,14 +168,8 @@ class OZHoodDataAI(HoodDataAI.HoodDataAI):
                         break
 
                 picnicTable = DistributedPicnicBasketAI.DistributedPicnicBasketAI(self.air, nameInfo[2], pos[0], pos[1], pos[2], hpr[0], hpr[1], hpr[2])
-                picnicTable.generateWithRequired(zoneId)
+                picnicTable.generateWithRequired(tableZoneId)
                 picnicTables.append(picnicTable)
-        else:
-            if isinstance(dnaGroup, DNAVisGroup) and not overrideDNAZone:
-                zoneId = ZoneUtil.getTrueZoneId(int(dnaGroup.getName().split(':')[0]), zoneId)
-            for i in range(dnaGroup.getNumChildren()):
-                childPicnicTables = self.findAndCreatePicnicTables(dnaGroup.at(i), zoneId, area, overrideDNAZone, type)
-                picnicTables += childPicnicTables
 
         return picnicTables
 
@@ -188,11 +177,8 @@ class OZHoodDataAI(HoodDataAI.HoodDataAI):
         self.gameTables = []
         for zone in self.air.zoneTable[self.canonicalHoodId]:
             zoneId = ZoneUtil.getTrueZoneId(zone[0], self.zoneId)
-            dnaData = self.air.dnaDataMap.get(zone[0], None)
-            if isinstance(dnaData, DNAData):
-                area = ZoneUtil.getCanonicalZoneId(zoneId)
-                foundTables = self.findAndCreateGameTables(dnaData, zoneId, area, overrideDNAZone=True)
-                self.gameTables += foundTables
+            area = ZoneUtil.getCanonicalZoneId(zoneId)
+            self.gameTables += self.findAndCreateGameTables(zone[0], zoneId, area, overrideDNAZone=True)
 
         for picnicTable in self.gameTables:
             self.addDistObj(picnicTable)
@@ -203,11 +189,8 @@ class OZHoodDataAI(HoodDataAI.HoodDataAI):
         self.picnicTables = []
         for zone in self.air.zoneTable[self.canonicalHoodId]:
             zoneId = ZoneUtil.getTrueZoneId(zone[0], self.zoneId)
-            dnaData = self.air.dnaDataMap.get(zone[0], None)
-            if isinstance(dnaData, DNAData):
-                area = ZoneUtil.getCanonicalZoneId(zoneId)
-                foundTables = self.findAndCreatePicnicTables(dnaData, zoneId, area, overrideDNAZone=True)
-                self.picnicTables += foundTables
+            area = ZoneUtil.getCanonicalZoneId(zoneId)
+            self.picnicTables += self.findAndCreatePicnicTables(zone[0], zoneId, area, overrideDNAZone=True)
 
         for picnicTable in self.picnicTables:
             picnicTable.start()
@@ -78,6 +78,7 @@ class DistributedTagGameAI(DistributedMinigameAI):
         taskMgr.remove(self.taskName('clearTagBack'))
         self.tagTreasurePlanner.stop()
         self.tagTreasurePlanner.deleteAllTreasuresNow()
+        self.air.doPool.deleteZone(self.zoneId)
         del self.tagTreasurePlanner
 
     def enterCleanup(self):
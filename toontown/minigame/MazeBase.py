@@ -1,5 +1,6 @@
 from panda3d.core import VBase3
 from direct.showbase.RandomNumGen import RandomNumGen
+from .MazeCollisionTable import MazeCollisionTable
 
 class MazeBase:
 
@@ -11,6 +12,8 @@ class MazeBase:
         self.originTX = mazeData['originX']
         self.originTY = mazeData['originY']
         self.collisionTable = mazeData['collisionTable']
+        if isinstance(self.collisionTable, MazeCollisionTable):
+            self.collisionTable = self.collisionTable.getRows()
         self._initialCellWidth = cellWidth
         self.cellWidth = self._initialCellWidth
         self.maze = model
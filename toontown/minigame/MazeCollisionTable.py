@@ -0,0 +1,53 @@
+class MazeCollisionTable:
+    """
+    A maze's collision table, packed a bit per cell, and unpacked the
+    first time the maze is used.  Reads like the list of rows it
+    replaces: table[y][x] is 1 where the cell is a wall, and 0 where
+    it is open.
+    """
+
+    def __init__(self, width, height, packed):
+        self.width = width
+        self.height = height
+        self.__packed = packed
+        self.__rows = None
+
+    def getRows(self):
+        """Returns the rows, a bytes of cells each."""
+        if self.__rows is None:
+            packed = bytes.fromhex(self.__packed)
+            rowSize = (self.width + 7) >> 3
+            rows = []
+            for y in range(self.height):
+                bits = int.from_bytes(packed[y * rowSize:(y + 1) * rowSize], 'little')
+                rows.append(bytes([bits >> x & 1 for x in range(self.width)]))
+
+            self.__rows = tuple(rows)
+            self.__packed = None
+        return self.__rows
+
+    def __getitem__(self, y):
+        return self.getRows()[y]
+
+    def __iter__(self):
+        return iter(self.getRows())
+
+    def __len__(self):
+        return self.height
+
+    def __repr__(self):
+        return 'MazeCollisionTable(%s, %s, %r)' % (self.width, self.height, packCollisionTable(self))
+
+
+def packCollisionTable(collisionTable):
+    """Packs a list of rows of 0s and 1s into the hex string MazeCollisionTable reads."""
+    packed = []
+    for row in collisionTable:
+        bits = 0
+        for x, cell in enumerate(row):
+            if cell:
+                bits |= 1 << x
+
+        packed.append(bits.to_bytes((len(row) + 7) >> 3, 'little').hex())
+
+    return ''.join(packed)
@@ -0,0 +1,99 @@
+import argparse
+import marshal
+import pprint
+import re
+import sys
+import time
+import tracemalloc
+
+parser = argparse.ArgumentParser(description='Open Toontown - Maze collision table benchmark')
+parser.add_argument('--iterations', type=int, default=20, help='Number of times each module is loaded.')
+args = parser.parse_args()
+
+from toontown.cogdominium import CogdoMazeData
+from toontown.minigame import MazeData
+from toontown.minigame.MazeCollisionTable import MazeCollisionTable
+
+PackedTable = re.compile(r"MazeCollisionTable\((\d+), (\d+), ((?:'[0-9a-f]*'\s*)+)\)")
+TableImport = re.compile(r'^from \S+ import MazeCollisionTable\n', re.M)
+
+
+def unpackedSource(source):
+    """The module as it was, with every collision table written out as a list of lists."""
+    def unpack(match):
+        table = MazeCollisionTable(int(match.group(1)), int(match.group(2)), ''.join(re.findall("'([0-9a-f]*)'",
+                                                                                                match.group(3))))
+        return pprint.pformat([list(row) for row in table], width=1)
+
+    return PackedTable.sub(unpack, source)
+
+
+def runModule(code):
+    module = type(sys)('benchmark')
+    module.MazeCollisionTable = MazeCollisionTable
+    exec(code, module.__dict__)
+    return module
+
+
+def collisionTables(module):
+    if hasattr(module, 'mazeData'):
+        return [data['collisionTable'] for data in module.mazeData.values()]
+
+    return [table for tables in module.QuadrantCollisions.values() for table in tables.values()]
+
+
+def timeLoad(source, path):
+    """
+    Returns the mean ms to compile the module from source, and to load
+    and run it from its .pyc.
+    """
+    compileTime = 0.0
+    loadTime = 0.0
+    for i in range(args.iterations):
+        start = time.perf_counter()
+        code = compile(source, path, 'exec')
+        compileTime += time.perf_counter() - start
+        pyc = marshal.dumps(code)
+        start = time.perf_counter()
+        runModule(marshal.loads(pyc))
+        loadTime += time.perf_counter() - start
+
+    return compileTime / args.iterations * 1000.0, loadTime / args.iterations * 1000.0
+
+
+def measureModule(source, path, unpack=False):
+    """Returns the KB the module keeps once it has run, after every maze in it is used if unpack is set."""
+    code = compile(source, path, 'exec')
+    tracemalloc.start()
+    module = runModule(code)
+    if unpack:
+        for table in collisionTables(module):
+            table[0]
+
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / 1024.0
+
+
+print('%-14s %-8s %12s %12s %12s %14s' % ('module', 'tables', 'compile ms', 'pyc load ms', 'memory KB',
+                                           'all used KB'))
+for module in (MazeData, CogdoMazeData):
+    name = module.__name__.split('.')[-1]
+    path = module.__file__
+    with open(path) as file:
+        # Our stand-in modules are handed MazeCollisionTable directly.
+        source = TableImport.sub('', file.read())
+
+    listSource = unpackedSource(source)
+    # The tables must come back exactly as they were written out.
+    listModule = runModule(compile(listSource, path, 'exec'))
+    for packedTable, listTable in zip(collisionTables(module), collisionTables(listModule)):
+        if [list(row) for row in packedTable] != listTable:
+            print('A packed %s collision table differs from its lists.' % name)
+            raise SystemExit(1)
+
+    for tables, moduleSource in (('lists', listSource), ('packed', source)):
+        compileTime, loadTime = timeLoad(moduleSource, path)
+        memory = measureModule(moduleSource, path)
+        usedMemory = measureModule(moduleSource, path, unpack=True)
+        print('%-14s %-8s %12.2f %12.2f %12.1f %14.1f' % (name, tables, compileTime, loadTime, memory, usedMemory))
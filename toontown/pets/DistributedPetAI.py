@@ -72,8 +72,7 @@ class DistributedPetAI(DistributedSmoothNodeAI.DistributedSmoothNodeAI, PetLooke
         self.gaitFSM.enterInitialState()
         self.unstickFSM = ClassicFSM.ClassicFSM('unstickFSM', [State.State('off', self.unstickEnterOff, self.unstickExitOff), State.State('on', self.unstickEnterOn, self.unstickExitOn)], 'off', 'off')
         self.unstickFSM.enterInitialState()
-        if __dev__:
-            self.pscMoveResc = PStatCollector('App:Show code:petMove:Reschedule')
+        self.moveTimer = None
         return
 
     def setInactive(self):
@@ -524,7 +523,7 @@ class DistributedPetAI(DistributedSmoothNodeAI.DistributedSmoothNodeAI, PetLooke
         self.actionFSM = PetActionFSM.PetActionFSM(self)
         self.teleportIn()
         self.handleMoodChange(distribute=0)
-        taskMgr.doMethodLater(simbase.petMovePeriod * random.random(), self.move, self.getMoveTaskName())
+        self.moveTimer = simbase.air.timerWheel.addRecurring(simbase.petMovePeriod, self.move, 'petMove', firstDelay=simbase.petMovePeriod * random.random())
         self.startPosHprBroadcast()
         self.accept(PetObserve.getEventName(self.zoneId), self.brain.observe)
         self.accept(self.mood.getMoodChangeEvent(), self.handleMoodChange)
@@ -564,7 +563,7 @@ class DistributedPetAI(DistributedSmoothNodeAI.DistributedSmoothNodeAI, PetLooke
         taskMgr.remove(self.uniqueName('PetMovieClear'))
         taskMgr.remove(self.uniqueName('PetMovieComplete'))
         taskMgr.remove(self.getLockMoveTaskName())
-        taskMgr.remove(self.getMoveTaskName())
+        self.stopMoving()
         if hasattr(self, 'zoneId'):
             self.announceZoneChange(ToontownGlobals.QuietZone, self.zoneId)
         else:
@@ -617,8 +616,6 @@ class DistributedPetAI(DistributedSmoothNodeAI.DistributedSmoothNodeAI, PetLooke
             if self.unstickFSM:
                 self.unstickFSM.requestFinalState()
             del self.unstickFSM
-        if __dev__:
-            del self.pscMoveResc
         PetLookerAI.PetLookerAI.destroy(self)
         self.ignoreAll()
         self._hasCleanedUp = True
@@ -636,8 +633,6 @@ class DistributedPetAI(DistributedSmoothNodeAI.DistributedSmoothNodeAI, PetLooke
 
         del self.gaitFSM
         del self.unstickFSM
-        if __dev__:
-            del self.pscMoveResc
         PetLookerAI.PetLookerAI.destroy(self)
         self.doNotDeallocateChannel = True
         self.zoneId = None
@@ -689,7 +684,7 @@ class DistributedPetAI(DistributedSmoothNodeAI.DistributedSmoothNodeAI, PetLooke
             except:
                 pass
 
-            taskMgr.remove(task.name)
+            self.stopMoving()
             return Task.done
         if not self.isLockMoverEnabled():
             self.mover.move()
@@ -703,15 +698,16 @@ class DistributedPetAI(DistributedSmoothNodeAI.DistributedSmoothNodeAI, PetLooke
             DistributedPetAI.notify.warning('deleting pet %s before he wanders off too far' % self.doId)
             self._outOfBounds = True
             self.stopPosHprBroadcast()
+            self.stopMoving()
             self.requestDelete()
             return Task.done
-        if __dev__:
-            self.pscMoveResc.start()
-        taskMgr.doMethodLater(simbase.petMovePeriod, self.move, self.getMoveTaskName())
-        if __dev__:
-            self.pscMoveResc.stop()
         return Task.done
 
+    def stopMoving(self):
+        if self.moveTimer:
+            simbase.air.timerWheel.remove(self.moveTimer)
+            self.moveTimer = None
+
     def startPosHprBroadcast(self):
         if self._outOfBounds:
             return
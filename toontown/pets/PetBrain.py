@@ -20,6 +20,7 @@ class PetBrain(DirectObject.DirectObject, CPetBrain):
         self.pet = pet
         self.focus = None
         self.started = 0
+        self.thinkTimer = None
         self.inMovie = 0
         self.chaseNode = self.pet.getRender().attachNewNode('PetChaseNode')
         self.goalMgr = PetGoalMgr.PetGoalMgr(self.pet)
@@ -31,7 +32,6 @@ class PetBrain(DirectObject.DirectObject, CPetBrain):
         if __dev__:
             self.pscPrior = PStatCollector('App:Show code:petThink:UpdatePriorities')
             self.pscAware = PStatCollector('App:Show code:petThink:ShuffleAwareness')
-            self.pscResc = PStatCollector('App:Show code:petThink:Reschedule')
         return
 
     def destroy(self):
@@ -39,7 +39,6 @@ class PetBrain(DirectObject.DirectObject, CPetBrain):
         if __dev__:
             del self.pscPrior
             del self.pscAware
-            del self.pscResc
         self.stop()
         self.goalMgr.destroy()
         self.chaseNode.removeNode()
@@ -89,7 +88,7 @@ class PetBrain(DirectObject.DirectObject, CPetBrain):
             self._handleAvatarArrive(doId)
 
         self.tLastLonelinessUpdate = globalClock.getFrameTime()
-        taskMgr.doMethodLater(simbase.petThinkPeriod * random.random(), self._think, self.getThinkTaskName())
+        self.thinkTimer = simbase.air.timerWheel.addRecurring(simbase.petThinkPeriod, self._think, 'petThink', firstDelay=simbase.petThinkPeriod * random.random())
         self.started = 1
 
     def stop(self):
@@ -108,7 +107,8 @@ class PetBrain(DirectObject.DirectObject, CPetBrain):
 
         del self.globalGoals
         self.clearFocus()
-        taskMgr.remove(self.getThinkTaskName())
+        simbase.air.timerWheel.remove(self.thinkTimer)
+        self.thinkTimer = None
         self.ignore(PetLookerAI.getStartLookedAtByOtherEvent(self.pet.doId))
         self.ignore(PetLookerAI.getStopLookedAtByOtherEvent(self.pet.doId))
         self.ignore(PetLookerAI.getStartLookingAtOtherEvent(self.pet.doId))
@@ -149,11 +149,6 @@ class PetBrain(DirectObject.DirectObject, CPetBrain):
                     self.pet.lerpMood('loneliness', max(-1.0, dt * -.003 * numLookers))
                     if numLookers > 5:
                         self.pet.lerpMood('excitement', min(1.0, dt * 0.001 * numLookers))
-        if __dev__:
-            self.pscResc.start()
-        taskMgr.doMethodLater(simbase.petThinkPeriod, self._think, self.getThinkTaskName())
-        if __dev__:
-            self.pscResc.stop()
         return Task.done
 
     def _updatePriorities(self):
@@ -36,6 +36,8 @@ class PetMood:
     def __init__(self, pet = None):
         self.setPet(pet)
         self.started = 0
+        self.driftTimer = None
+        self.batch = None
         self.serialNum = PetMood.SerialNum
         PetMood.SerialNum += 1
         for comp in PetMood.Components:
@@ -111,6 +113,8 @@ class PetMood:
     def setComponent(self, compName, value, announce = 1):
         different = self.__dict__[compName] != value
         self.__dict__[compName] = value
+        if self.batch is not None:
+            self.batch.markDirty(self)
         if announce and different:
             self.announceChange([compName])
 
@@ -156,15 +160,23 @@ class PetMood:
         return other
 
     def start(self):
-        pet = self.getPet()
-        taskMgr.doMethodLater(simbase.petMoodDriftPeriod / simbase.petMoodTimescale * random.random(), self._driftMoodTask, self.getMoodDriftTaskName())
+        if simbase.air.petMoodBatch is not None:
+            simbase.air.petMoodBatch.addMood(self)
+            self.started = 1
+            return
+        period = simbase.petMoodDriftPeriod / simbase.petMoodTimescale
+        self.driftTimer = simbase.air.timerWheel.addRecurring(period, self._driftMoodTask, 'petMoodDrift', firstDelay=period * random.random())
         self.started = 1
 
     def stop(self):
         if not self.started:
             return
         self.started = 0
-        taskMgr.remove(self.getMoodDriftTaskName())
+        if self.batch is not None:
+            self.batch.removeMood(self)
+            return
+        simbase.air.timerWheel.remove(self.driftTimer)
+        self.driftTimer = None
 
     def driftMood(self, dt = None, curMood = None):
         now = globalClock.getFrameTime()
@@ -198,12 +210,13 @@ class PetMood:
         else:
             tAnger = lerp(PetMood.LONGTIME, self.tAngerInc, (abuse - tipPoint) / (1.0 - tipPoint))
         self.anger = doDrift(curMood.anger, tAnger)
+        if self.batch is not None:
+            self.batch.markDirty(self)
         self.announceChange()
         return
 
     def _driftMoodTask(self, task = None):
         self.driftMood()
-        taskMgr.doMethodLater(simbase.petMoodDriftPeriod / simbase.petMoodTimescale, self._driftMoodTask, self.getMoodDriftTaskName())
         return Task.done
 
     def __repr__(self):
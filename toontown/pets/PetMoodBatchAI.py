@@ -0,0 +1,216 @@
+import random
+
+from direct.directnotify import DirectNotifyGlobal
+from toontown.pets.PetMood import PetMood
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class PetMoodBatchAI:
+    """
+    Drifts the moods of every active pet on the district in one step.
+
+    Normally each PetMood runs its own drift timer, and every drift goes
+    through a dozen doDrift closures, clampScalar calls and a mood change
+    broadcast.  In batched mode the mood components, drift time constants and
+    trait thresholds of all active pets live in contiguous numpy arrays (one
+    row per pet, one column per PetMood.Components entry), and a single
+    recurring timer advances all of them at once.
+
+    Other code still reads and writes the components on the PetMood itself;
+    writes go through PetMood.setComponent, which flags the row so that it is
+    re-read before the next step.  After a step the new values are copied back
+    to each PetMood, but the mood change events are only sent for pets where
+    a component crossed its threshold or the dominant mood changed.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('PetMoodBatchAI')
+    # PetMood attribute holding the drift time constant of each component.
+    # Anger has its own rule and the rest do not drift on their own.
+    DriftConstants = {'boredom': 'tBoredom',
+                      'loneliness': 'tLoneliness',
+                      'sadness': 'tSadness',
+                      'fatigue': 'tFatigue',
+                      'hunger': 'tHunger',
+                      'confusion': 'tConfusion',
+                      'excitement': 'tExcitement',
+                      'surprise': 'tSurprise',
+                      'affection': 'tAffection'}
+    AngerTipPoint = 0.6
+
+    def __init__(self, air):
+        self.air = air
+        self.period = simbase.petMoodDriftPeriod / simbase.petMoodTimescale
+        self.verify = config.GetBool('verify-pet-mood-batch', False)
+        self.numComponents = len(PetMood.Components)
+        self.columns = dict((comp, i) for i, comp in enumerate(PetMood.Components))
+        self.angerColumn = self.columns['anger']
+        self.dominantColumns = [i for i, comp in enumerate(PetMood.Components) if comp not in PetMood.DisabledDominants]
+        self.assertiveColumns = set(self.columns[comp] for comp in PetMood.AssertiveDominants)
+        self.moods = []
+        self.moodToRow = {}
+        self.dirtyMoods = set()
+        self.values = numpy.zeros((0, self.numComponents))
+        self.driftTimes = numpy.zeros((0, self.numComponents))
+        self.thresholds = numpy.zeros((0, self.numComponents))
+        self.angerTimes = numpy.zeros((0, 2))
+        self.lastDriftTimes = numpy.zeros(0)
+        self.dominants = numpy.zeros(0, dtype=int)
+        self.numMismatches = 0
+        self.driftTimer = self.air.timerWheel.addRecurring(self.period, self.driftAll, 'petMoodDrift', firstDelay=self.period * random.random())
+
+    @staticmethod
+    def isAvailable():
+        return numpy is not None
+
+    def delete(self):
+        self.air.timerWheel.remove(self.driftTimer)
+        for mood in self.moods:
+            mood.batch = None
+
+        self.moods = []
+        self.moodToRow = {}
+        self.dirtyMoods = set()
+
+    def getNumPets(self):
+        return len(self.moods)
+
+    def addMood(self, mood):
+        if mood in self.moodToRow:
+            return
+
+        self.moodToRow[mood] = len(self.moods)
+        self.moods.append(mood)
+        mood.batch = self
+        if not hasattr(mood, 'lastDriftTime'):
+            mood.lastDriftTime = globalClock.getFrameTime()
+
+        pet = mood.getPet()
+        driftTimes = [getattr(mood, self.DriftConstants[comp]) if comp in self.DriftConstants else numpy.inf for comp in PetMood.Components]
+        thresholds = [pet.traits.__dict__[comp + 'Threshold'] for comp in PetMood.Components]
+        self.values = numpy.vstack((self.values, [self.__readRow(mood)]))
+        self.driftTimes = numpy.vstack((self.driftTimes, [driftTimes]))
+        self.thresholds = numpy.vstack((self.thresholds, [thresholds]))
+        self.angerTimes = numpy.vstack((self.angerTimes, [[mood.tAngerDec, mood.tAngerInc]]))
+        self.lastDriftTimes = numpy.append(self.lastDriftTimes, mood.lastDriftTime)
+        self.dominants = numpy.append(self.dominants, self.columns.get(mood.getDominantMood(), -1))
+
+    def removeMood(self, mood):
+        row = self.moodToRow.pop(mood, None)
+        if row is None:
+            return
+
+        mood.batch = None
+        self.dirtyMoods.discard(mood)
+
+        # Move the last row into the hole so the arrays stay contiguous.
+        last = len(self.moods) - 1
+        if row != last:
+            lastMood = self.moods[last]
+            self.moods[row] = lastMood
+            self.moodToRow[lastMood] = row
+            for array in (self.values, self.driftTimes, self.thresholds, self.angerTimes, self.lastDriftTimes, self.dominants):
+                array[row] = array[last]
+
+        self.moods.pop()
+        self.values = self.values[:last]
+        self.driftTimes = self.driftTimes[:last]
+        self.thresholds = self.thresholds[:last]
+        self.angerTimes = self.angerTimes[:last]
+        self.lastDriftTimes = self.lastDriftTimes[:last]
+        self.dominants = self.dominants[:last]
+
+    def markDirty(self, mood):
+        self.dirtyMoods.add(mood)
+
+    def __readRow(self, mood):
+        return [mood.__dict__[comp] for comp in PetMood.Components]
+
+    def __syncDirty(self):
+        for mood in self.dirtyMoods:
+            row = self.moodToRow[mood]
+            self.values[row] = self.__readRow(mood)
+            self.lastDriftTimes[row] = mood.lastDriftTime
+            self.dominants[row] = self.columns.get(mood.getDominantMood(), -1)
+
+        self.dirtyMoods = set()
+
+    def computeDrift(self, values, dt):
+        """
+        Returns the drifted copy of values after dt seconds.  This is
+        PetMood.driftMood applied to every row at once; rows with a
+        non-positive dt are left untouched, like driftMood does.
+        """
+        newValues = values + dt[:, None] / (self.driftTimes * 7200)
+        numpy.clip(newValues, 0.0, 1.0, out=newValues)
+        # driftMood drifts in place, so anger is driven by the already
+        # drifted hunger, boredom and loneliness.
+        hunger = newValues[:, self.columns['hunger']]
+        abuse = (hunger * 3 + newValues[:, self.columns['boredom']] + newValues[:, self.columns['loneliness']]) / 5.0
+        tipPoint = self.AngerTipPoint
+        tAngerDec = self.angerTimes[:, 0]
+        tAngerInc = self.angerTimes[:, 1]
+        tAnger = numpy.where(abuse < tipPoint,
+                             tAngerDec + (-PetMood.LONGTIME - tAngerDec) * (abuse / tipPoint),
+                             PetMood.LONGTIME + (tAngerInc - PetMood.LONGTIME) * ((abuse - tipPoint) / (1.0 - tipPoint)))
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            anger = values[:, self.angerColumn] + dt / (tAnger * 7200)
+
+        newValues[:, self.angerColumn] = numpy.clip(anger, 0.0, 1.0)
+        return numpy.where((dt > 0.0)[:, None], newValues, values)
+
+    def computeDominants(self, values):
+        """Vectorized PetMood.getDominantMood; returns column indexes, -1 for neutral."""
+        priorities = values / numpy.maximum(self.thresholds, 0.01)
+        dominants = numpy.full(len(values), -1, dtype=int)
+        best = numpy.ones(len(values))
+        for column in self.dominantColumns:
+            priority = priorities[:, column]
+            better = priority >= best
+            dominants[better] = column
+            best = numpy.where(better, priority, best)
+            if column in self.assertiveColumns:
+                dominants[~better & (priority >= 1.0)] = column
+
+        return dominants
+
+    def driftAll(self):
+        if not self.moods:
+            return
+
+        self.__syncDirty()
+        now = globalClock.getFrameTime()
+        dt = now - self.lastDriftTimes
+        oldValues = self.values
+        if self.verify:
+            expected = [self.__referenceDrift(mood, dt[row]) for row, mood in enumerate(self.moods)]
+
+        self.values = self.computeDrift(oldValues, dt)
+        self.lastDriftTimes[:] = now
+        oldDominants = self.dominants
+        self.dominants = self.computeDominants(self.values)
+        crossed = ((oldValues >= self.thresholds) != (self.values >= self.thresholds)).any(axis=1)
+        changed = crossed | (oldDominants != self.dominants)
+        for mood, row in zip(self.moods, self.values.tolist()):
+            mood.__dict__.update(zip(PetMood.Components, row))
+            mood.lastDriftTime = now
+
+        if self.verify:
+            self.__verify(expected)
+
+        for row in numpy.flatnonzero(changed).tolist():
+            self.moods[row].announceChange()
+
+    def __referenceDrift(self, mood, dt):
+        reference = mood.makeCopy()
+        reference.driftMood(dt=dt)
+        return reference
+
+    def __verify(self, expected):
+        for mood, reference in zip(self.moods, expected):
+            for comp in PetMood.Components:
+                if abs(mood.__dict__[comp] - reference.__dict__[comp]) > 1e-9:
+                    self.numMismatches += 1
+                    self.notify.warning('Batched drift of %s for pet %s is %s, driftMood gives %s.' % (comp, mood.getPet().doId, mood.__dict__[comp], reference.__dict__[comp]))
@@ -0,0 +1,101 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import random
+import time
+
+parser = argparse.ArgumentParser(description='Open Toontown - Batched pet mood drift benchmark')
+parser.add_argument('--sizes', default='100,1000,5000',
+                    help='Comma separated pet counts to benchmark.')
+parser.add_argument('--steps', type=int, default=20, help='Number of drift steps timed per pet count.')
+parser.add_argument('--tolerance', type=float, default=1e-9,
+                    help='Largest allowed difference between the batched and per-pet drift.')
+args = parser.parse_args()
+
+
+class game:
+    name = 'toontown'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from toontown.ai.TimerWheelAI import TimerWheelAI
+from toontown.pets.PetMood import PetMood
+from toontown.pets.PetMoodBatchAI import PetMoodBatchAI
+from toontown.pets.PetTraits import PetTraits
+from toontown.toonbase import ToontownGlobals
+
+
+class BenchmarkAir:
+
+    def __init__(self):
+        self.timerWheel = TimerWheelAI(self)
+        self.petMoodBatch = None
+
+
+class BenchmarkPet:
+
+    def __init__(self, doId):
+        self.doId = doId
+        self.traits = PetTraits(doId, ToontownGlobals.ToontownCentral)
+
+
+def makeMoods(numPets):
+    pets = [BenchmarkPet(i + 1) for i in range(numPets)]
+    moods = []
+    for pet in pets:
+        mood = PetMood(pet)
+        for comp in PetMood.Components:
+            mood.setComponent(comp, random.random(), announce=0)
+        moods.append(mood)
+
+    return pets, moods
+
+
+def copyMoods(moods):
+    return [mood.makeCopy() for mood in moods]
+
+
+if not PetMoodBatchAI.isAvailable():
+    print('numpy is not available, the batched pet mood drift cannot run.')
+    raise SystemExit(1)
+
+simbase.air = BenchmarkAir()
+period = simbase.petMoodDriftPeriod / simbase.petMoodTimescale
+print('%10s %16s %16s %16s' % ('pets', 'us/step per-pet', 'us/step batched', 'max difference'))
+for size in [int(x) for x in args.sizes.split(',')]:
+    pets, moods = makeMoods(size)
+    referenceMoods = copyMoods(moods)
+    batch = PetMoodBatchAI(simbase.air)
+    for mood in moods:
+        batch.addMood(mood)
+
+    perPetTime = 0.0
+    batchTime = 0.0
+    for step in range(args.steps):
+        start = time.perf_counter()
+        for mood in referenceMoods:
+            mood.driftMood(dt=period)
+        perPetTime += time.perf_counter() - start
+
+        # Both sides drift the same dt each step.
+        batch.lastDriftTimes[:] = globalClock.getFrameTime() - period
+        start = time.perf_counter()
+        batch.driftAll()
+        batchTime += time.perf_counter() - start
+
+    maxDifference = 0.0
+    for mood, reference in zip(moods, referenceMoods):
+        for comp in PetMood.Components:
+            maxDifference = max(maxDifference, abs(mood.getComponent(comp) - reference.getComponent(comp)))
+        if mood.getDominantMood() != reference.getDominantMood():
+            maxDifference = float('inf')
+
+    print('%10d %16.2f %16.2f %16.3g' % (size, perPetTime / args.steps * 1e6, batchTime / args.steps * 1e6, maxDifference))
+    batch.delete()
+    if maxDifference > args.tolerance:
+        print('Batched drift does not match PetMood.driftMood.')
+        raise SystemExit(1)
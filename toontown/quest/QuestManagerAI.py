@@ -3,7 +3,9 @@ from direct.task import Task
 from direct.directnotify import DirectNotifyGlobal
 from . import Quests
 from toontown.toon import NPCToons
+import bisect
 import random
+import time
 
 """
 TODO: (done, tested)
@@ -53,10 +55,57 @@ class QuestManagerAI:
     # table of requests for quests from specific avatars
     NextQuestDict = {}
 
+    # Upper bounds, in milliseconds, of the requestInteract latency
+    # histogram buckets; the last bucket catches everything slower.
+    InteractLatencyBuckets = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100)
+
     def __init__(self, air):
         self.air = air
+        self.resetInteractStats()
+        self.interactStatsPeriod = simbase.config.GetFloat("quest-interact-stats-period", 0)
+        if self.interactStatsPeriod > 0:
+            taskMgr.doMethodLater(self.interactStatsPeriod, self.__logInteractStats, "questInteractStats")
+
+    def resetInteractStats(self):
+        self.interactLatencies = [0] * (len(self.InteractLatencyBuckets) + 1)
+        self.interactTotalTime = 0.0
+        self.interactMaxTime = 0.0
+
+    def formatInteractStats(self):
+        numInteracts = sum(self.interactLatencies)
+        if not numInteracts:
+            return "requestInteract: no interactions"
+
+        lines = ["requestInteract: %d interactions, mean %0.3f ms, max %0.3f ms" %
+                 (numInteracts, self.interactTotalTime * 1000.0 / numInteracts, self.interactMaxTime * 1000.0)]
+        lowerBound = 0
+        for upperBound, count in zip(self.InteractLatencyBuckets + (None,), self.interactLatencies):
+            if count:
+                if upperBound is None:
+                    bucket = "> %s ms" % lowerBound
+                else:
+                    bucket = "%s - %s ms" % (lowerBound, upperBound)
+                lines.append("  %14s: %d (%0.1f%%)" % (bucket, count, count * 100.0 / numInteracts))
+            lowerBound = upperBound
+
+        return "\n".join(lines)
+
+    def __logInteractStats(self, task):
+        self.notify.info(self.formatInteractStats())
+        self.resetInteractStats()
+        return Task.again
 
     def requestInteract(self, avId, npc):
+        startTime = time.perf_counter()
+        try:
+            self.__requestInteract(avId, npc)
+        finally:
+            elapsed = time.perf_counter() - startTime
+            self.interactLatencies[bisect.bisect_left(self.InteractLatencyBuckets, elapsed * 1000.0)] += 1
+            self.interactTotalTime += elapsed
+            self.interactMaxTime = max(self.interactMaxTime, elapsed)
+
+    def __requestInteract(self, avId, npc):
         self.notify.debug("requestInteract: avId: %s npcId: %s" % (avId, npc.getNpcId()))
         av = self.air.doId2do.get(avId)
 
@@ -658,19 +707,32 @@ class QuestManagerAI:
         avId = av.getDoId()
         changed = 0
 
-        self.notify.debug("toonKilledCogs: avId: %s, avQuests: %s, cogList: %s, zoneId: %s" %
-                          (avId, avQuests, cogList, zoneId))
+        if self.notify.getDebug():
+            self.notify.debug("toonKilledCogs: avId: %s, avQuests: %s, cogList: %s, zoneId: %s" %
+                              (avId, avQuests, cogList, zoneId))
+
+        # The match keys of each regular cog, so that most quest/cog pairs
+        # are turned down by a set lookup before doesCogCount is called.
+        cogKeys = []
+        for cogDict in cogList:
+            if cogDict['isVP'] or cogDict['isCFO']:
+                cogKeys.append(None)
+            else:
+                cogKeys.append(Quests.getCogMatchKeys(cogDict))
 
         for questDesc in avQuests:
             quest = Quests.getQuest(questDesc[0])
             if quest != None:
-                for cogDict in cogList:
+                matchKey = quest.getCogMatchKey()
+                for cogDict, keys in zip(cogList, cogKeys):
                     if cogDict['isVP']:
                         num = quest.doesVPCount(avId, cogDict, zoneId, avList)
                     elif cogDict['isCFO']:
                         num = quest.doesCFOCount(avId, cogDict, zoneId, avList)
-                    else:
+                    elif matchKey in keys:
                         num = quest.doesCogCount(avId, cogDict, zoneId, avList)
+                    else:
+                        num = 0
                     if (num > 0):
                         questDesc[4] += num
                         changed = 1
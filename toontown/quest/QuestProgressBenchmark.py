@@ -0,0 +1,141 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import random
+import time
+
+parser = argparse.ArgumentParser(description='Open Toontown - Quest progress benchmark')
+parser.add_argument('--toons', type=int, default=1000, help='Number of toons finishing battles.')
+parser.add_argument('--battles', type=int, default=20, help='Number of battles each toon finishes.')
+parser.add_argument('--seed', type=int, default=0, help='Seed of the synthetic workload.')
+args = parser.parse_args()
+
+
+class game:
+    name = 'toontown'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from toontown.quest import Quests
+from toontown.quest.QuestManagerAI import QuestManagerAI
+from toontown.suit import SuitDNA
+from toontown.toonbase import ToontownGlobals
+
+# Zones the synthetic battles are fought in: playgrounds, streets and cog HQs.
+BattleZones = [ToontownGlobals.ToontownCentral, 2100, 2200, 2300, 1100, 1200, 1300, 3100, 3200,
+               4100, 4200, 4300, 5100, 5200, 5300, 9100, 9200,
+               ToontownGlobals.SellbotFactoryInt, ToontownGlobals.CashbotMintIntA, ToontownGlobals.LawbotStageIntA]
+
+
+class BenchmarkToon:
+
+    def __init__(self, doId, quests, maxHp):
+        self.doId = doId
+        self.quests = quests
+        self.maxHp = maxHp
+
+    def getDoId(self):
+        return self.doId
+
+    def getMaxHp(self):
+        return self.maxHp
+
+    def b_setQuests(self, quests):
+        self.quests = quests
+
+
+def makeCogDict(rng, activeToons):
+    cogType = rng.choice(SuitDNA.suitHeadTypes)
+    isSkelecog = rng.random() < 0.1
+    return {'type': cogType,
+            'level': rng.randint(1, 12),
+            'track': SuitDNA.getSuitDept(cogType),
+            'isSkelecog': isSkelecog,
+            'isForeman': rng.random() < 0.05,
+            'isVP': 0,
+            'isCFO': 0,
+            'isSupervisor': rng.random() < 0.05,
+            'isVirtual': 0,
+            'hasRevives': isSkelecog and rng.random() < 0.3,
+            'activeToons': activeToons}
+
+
+def makeWorkload(rng):
+    questIds = [questId for questId in Quests.QuestDict if Quests.getQuestClass(questId) is not None]
+    toons = []
+    for i in range(args.toons):
+        quests = [[questId, 0, 0, 0, 0] for questId in rng.sample(questIds, 4)]
+        toons.append(BenchmarkToon(100000000 + i, quests, rng.randint(15, 137)))
+
+    battles = []
+    for i in range(args.battles):
+        for toon in toons:
+            avList = [toon] + rng.sample(toons, 3)
+            activeToons = [av.getDoId() for av in avList]
+            cogList = [makeCogDict(rng, activeToons) for j in range(rng.randint(1, 4))]
+            battles.append((toon, cogList, rng.choice(BattleZones), avList))
+
+    return toons, battles
+
+
+def replayUncached(battles):
+    """The quest progress loop as it was, building a new Quest per lookup."""
+    for av, cogList, zoneId, avList in battles:
+        avId = av.getDoId()
+        for questDesc in av.quests:
+            questEntry = Quests.QuestDict.get(questDesc[0])
+            questDesc_ = questEntry[Quests.QuestDictDescIndex]
+            quest = questDesc_[0](questDesc[0], questDesc_[1:])
+            for cogDict in cogList:
+                if cogDict['isVP']:
+                    num = quest.doesVPCount(avId, cogDict, zoneId, avList)
+                elif cogDict['isCFO']:
+                    num = quest.doesCFOCount(avId, cogDict, zoneId, avList)
+                else:
+                    num = quest.doesCogCount(avId, cogDict, zoneId, avList)
+                if num > 0:
+                    questDesc[4] += num
+
+
+def replayManager(questManager, battles):
+    for av, cogList, zoneId, avList in battles:
+        questManager.toonKilledCogs(av, cogList, zoneId, avList)
+
+
+def snapshot(toons):
+    return [[questDesc[:] for questDesc in toon.quests] for toon in toons]
+
+
+def restore(toons, quests):
+    for toon, toonQuests in zip(toons, quests):
+        toon.quests = [questDesc[:] for questDesc in toonQuests]
+
+
+toons, battles = makeWorkload(random.Random(args.seed))
+initialQuests = snapshot(toons)
+
+start = time.perf_counter()
+replayUncached(battles)
+uncachedTime = time.perf_counter() - start
+expected = snapshot(toons)
+
+restore(toons, initialQuests)
+Quests.QuestCache.clear()
+Quests.CogMatchKeyCache.clear()
+questManager = QuestManagerAI(None)
+start = time.perf_counter()
+replayManager(questManager, battles)
+managerTime = time.perf_counter() - start
+
+mismatches = sum(1 for toonQuests, expectedQuests in zip(snapshot(toons), expected) if toonQuests != expectedQuests)
+print('%d toons, %d battle completions, %d cogs' % (len(toons), len(battles), sum(len(battle[1]) for battle in battles)))
+print('uncached quests, nested checks: %8.1f ms' % (uncachedTime * 1000.0))
+print('QuestManagerAI.toonKilledCogs:  %8.1f ms' % (managerTime * 1000.0))
+print('%d interned quests, %d distinct cogs' % (len(Quests.QuestCache), len(Quests.CogMatchKeyCache)))
+if mismatches:
+    print('%d toons ended up with different quest progress.' % mismatches)
+    raise SystemExit(1)
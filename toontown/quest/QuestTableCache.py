@@ -0,0 +1,161 @@
+"""
+Build-time cache of the tables Quests derives from QuestDict.
+
+On import, Quests walks every quest chain to fill Quest2RewardDict,
+Tier2Reward2QuestsDict and Quest2RemainingStepsDict, groups the starting
+quests by tier and indexes every quest by its giving and receiving NPC.
+Since those tables only depend on the contents of Quests.py, they can be
+compiled ahead of time:
+
+    python -m toontown.quest.QuestTableCache
+
+writes them to QuestTables.bin, next to Quests.py.  The start scripts run
+it before starting the game or a server; it returns at once when the file
+is already up to date.  The file records the size, modification time and
+SHA-1 of the Quests.py it was compiled from.  Quests loads it when the
+size and time still match, or failing that when the hash does, and
+recomputes the tables otherwise, so a stale or missing file only costs
+the time it was meant to save.
+"""
+
+import hashlib
+import marshal
+import os
+
+Version = 3
+CacheFileName = 'QuestTables.bin'
+
+
+def getSourcePath():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Quests.py')
+
+
+def getCachePath():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), CacheFileName)
+
+
+def getSourceStat():
+    """Returns (size, modification time in ns) of Quests.py, or None if the source isn't available."""
+    try:
+        stat = os.stat(getSourcePath())
+    except OSError:
+        return None
+
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def getSourceHash():
+    """Returns the SHA-1 of Quests.py, or None if the source isn't available."""
+    try:
+        with open(getSourcePath(), 'rb') as file:
+            return hashlib.sha1(file.read()).hexdigest()
+    except IOError:
+        return None
+
+
+def readTables():
+    """
+    Returns {tableName: table} from the compiled file, or None if there is
+    no file or it was compiled from a different Quests.py.
+    """
+    sourceStat = getSourceStat()
+    if sourceStat is None:
+        return None
+
+    try:
+        with open(getCachePath(), 'rb') as file:
+            version, fileStat, fileHash, tables = marshal.loads(file.read())
+    except (IOError, EOFError, ValueError, TypeError):
+        return None
+
+    if version != Version:
+        return None
+
+    # Only hash the source when it was touched since it was compiled.
+    if tuple(fileStat) != sourceStat and fileHash != getSourceHash():
+        return None
+
+    return tables
+
+
+def writeTables(tables):
+    # The AI, the UberDOG and the client may all be compiling at once, so
+    # never let one of them read a half-written file.
+    tempPath = '%s.%d.tmp' % (getCachePath(), os.getpid())
+    with open(tempPath, 'wb') as file:
+        marshal.dump((Version, getSourceStat(), getSourceHash(), tables), file)
+
+    os.replace(tempPath, getCachePath())
+
+
+if __name__ == '__main__':
+    import argparse
+    import builtins
+    import subprocess
+    import sys
+
+    parser = argparse.ArgumentParser(description='Open Toontown - Quest table compiler')
+    parser.add_argument('--force', action='store_true', help='Compile the tables even if the file is up to date.')
+    parser.add_argument('--measure', type=int, default=0, metavar='RUNS',
+                        help='Also time importing Quests on the AI and the client, with and without the compiled tables.')
+    args = parser.parse_args()
+
+    if args.force or readTables() is None:
+        class game:
+            name = 'toontown'
+            process = 'server'
+
+        builtins.game = game
+
+        from otp.ai.AIBaseGlobal import *
+        from toontown.quest import Quests
+
+        # Never write back tables that were themselves read from the file.
+        Quests.computeQuestTables()
+        writeTables(Quests.getQuestTables())
+        print('Wrote %s (%d bytes).' % (getCachePath(), os.path.getsize(getCachePath())))
+    else:
+        print('%s is up to date.' % getCachePath())
+
+    if args.measure:
+        # Each sample is a fresh interpreter importing Quests as the given
+        # process would, with the tables either loaded or recomputed.
+        script = '\n'.join(('import builtins, sys, time',
+                            'class game:',
+                            '    name = "toontown"',
+                            '    process = sys.argv[1]',
+                            'builtins.game = game',
+                            'if game.process == "server":',
+                            '    from otp.ai.AIBaseGlobal import *',
+                            'else:',
+                            '    from panda3d.core import loadPrcFileData',
+                            '    loadPrcFileData("", "window-type none")',
+                            '    from direct.showbase.ShowBase import ShowBase',
+                            '    ShowBase()',
+                            'from toontown.toon import NPCToons',
+                            'from toontown.quest import QuestTableCache',
+                            'if sys.argv[2] == "0":',
+                            '    QuestTableCache.readTables = lambda: None',
+                            'start = time.perf_counter()',
+                            'from toontown.quest import Quests',
+                            'print(time.perf_counter() - start, Quests.QuestTablesLoaded)'))
+        print('%8s %22s %22s' % ('process', 'recomputed ms min/med', 'compiled ms min/med'))
+        for process in ('server', 'client'):
+            results = []
+            for useTables in ('0', '1'):
+                samples = []
+                for i in range(args.measure):
+                    output = subprocess.check_output([sys.executable, '-c', script, process, useTables],
+                                                     stderr=subprocess.DEVNULL, universal_newlines=True)
+                    elapsed, loaded = output.strip().splitlines()[-1].split()
+                    if loaded != useTables:
+                        print('Quests %s the compiled tables in a %s import.' % (
+                            'ignored' if useTables == '1' else 'loaded', process))
+                        raise SystemExit(1)
+
+                    samples.append(float(elapsed) * 1000.0)
+
+                samples.sort()
+                results.extend((samples[0], samples[len(samples) // 2]))
+
+            print('%8s %11.2f %10.2f %11.2f %10.2f' % ((process,) + tuple(results)))
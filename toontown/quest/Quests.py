@@ -7,6 +7,7 @@ import random
 from toontown.toon import NPCToons
 import copy
 from toontown.hood import ZoneUtil
+from toontown.quest import QuestTableCache
 from direct.directnotify import DirectNotifyGlobal
 from toontown.toonbase import TTLocalizer
 from direct.showbase import PythonUtil
@@ -349,6 +350,11 @@ class Quest:
     def __repr__(self):
         return 'Quest type: %s id: %s params: %s' % (self.__class__.__name__, self.id, self.quest[0:])
 
+    def getCogMatchKey(self):
+        # The key a cog's getCogMatchKeys() must contain for doesCogCount
+        # to count it, or None if doesCogCount never counts any cog.
+        return None
+
     def doesCogCount(self, avId, cogDict, zoneId, avList):
         return 0
 
@@ -522,6 +528,12 @@ class CogQuest(LocationBasedQuest):
     def getHeadlineString(self):
         return TTLocalizer.QuestsCogQuestHeadline
 
+    def getCogMatchKey(self):
+        questCogType = self.getCogType()
+        if questCogType is Any:
+            return ('any',)
+        return ('type', questCogType)
+
     def doesCogCount(self, avId, cogDict, zoneId, avList):
         questCogType = self.getCogType()
         return (questCogType is Any or questCogType is cogDict['type']) and avId in cogDict['activeToons'] and self.isLocationMatch(zoneId)
@@ -611,6 +623,9 @@ class CogTrackQuest(CogQuest):
     def getHeadlineString(self):
         return TTLocalizer.QuestsCogTrackQuestHeadline
 
+    def getCogMatchKey(self):
+        return ('track', self.getCogTrack())
+
     def doesCogCount(self, avId, cogDict, zoneId, avList):
         questCogTrack = self.getCogTrack()
         return questCogTrack == cogDict['track'] and avId in cogDict['activeToons'] and self.isLocationMatch(zoneId)
@@ -671,6 +686,9 @@ class CogLevelQuest(CogQuest):
     def getHeadlineString(self):
         return TTLocalizer.QuestsCogLevelQuestHeadline
 
+    def getCogMatchKey(self):
+        return ('level', self.getCogLevel())
+
     def doesCogCount(self, avId, cogDict, zoneId, avList):
         questCogLevel = self.getCogLevel()
         return questCogLevel <= cogDict['level'] and avId in cogDict['activeToons'] and self.isLocationMatch(zoneId)
@@ -684,6 +702,9 @@ class SkelecogQBase:
         else:
             return TTLocalizer.SkeletonP
 
+    def getCogMatchKey(self):
+        return ('skelecog',)
+
     def doesCogCount(self, avId, cogDict, zoneId, avList):
         return cogDict['isSkelecog'] and avId in cogDict['activeToons'] and self.isLocationMatch(zoneId)
 
@@ -699,6 +720,9 @@ class SkelecogQuest(CogQuest, SkelecogQBase):
     def getCogNameString(self):
         return SkelecogQBase.getCogNameString(self)
 
+    def getCogMatchKey(self):
+        return SkelecogQBase.getCogMatchKey(self)
+
     def doesCogCount(self, avId, cogDict, zoneId, avList):
         return SkelecogQBase.doesCogCount(self, avId, cogDict, zoneId, avList)
 
@@ -739,6 +763,9 @@ class SkelecogTrackQuest(CogTrackQuest, SkelecogQBase):
     def getCogNameString(self):
         return SkelecogQBase.getCogNameString(self)
 
+    def getCogMatchKey(self):
+        return ('skelecogTrack', self.getCogTrack())
+
     def doesCogCount(self, avId, cogDict, zoneId, avList):
         return SkelecogQBase.doesCogCount(self, avId, cogDict, zoneId, avList) and self.getCogTrack() == cogDict['track']
 
@@ -755,6 +782,9 @@ class SkelecogLevelQuest(CogLevelQuest, SkelecogQBase):
     def getCogNameString(self):
         return SkelecogQBase.getCogNameString(self)
 
+    def getCogMatchKey(self):
+        return ('skelecogLevel', self.getCogLevel())
+
     def doesCogCount(self, avId, cogDict, zoneId, avList):
         return SkelecogQBase.doesCogCount(self, avId, cogDict, zoneId, avList) and self.getCogLevel() <= cogDict['level']
 
@@ -767,6 +797,9 @@ class SkeleReviveQBase:
         else:
             return TTLocalizer.v2CogP
 
+    def getCogMatchKey(self):
+        return ('revives',)
+
     def doesCogCount(self, avId, cogDict, zoneId, avList):
         return cogDict['hasRevives'] and avId in cogDict['activeToons'] and self.isLocationMatch(zoneId)
 
@@ -782,6 +815,9 @@ class SkeleReviveQuest(CogQuest, SkeleReviveQBase):
     def getCogNameString(self):
         return SkeleReviveQBase.getCogNameString(self)
 
+    def getCogMatchKey(self):
+        return SkeleReviveQBase.getCogMatchKey(self)
+
     def doesCogCount(self, avId, cogDict, zoneId, avList):
         return SkeleReviveQBase.doesCogCount(self, avId, cogDict, zoneId, avList)
 
@@ -801,6 +837,9 @@ class ForemanQuest(CogQuest):
         else:
             return TTLocalizer.ForemanP
 
+    def getCogMatchKey(self):
+        return ('foreman',)
+
     def doesCogCount(self, avId, cogDict, zoneId, avList):
         return bool(CogQuest.doesCogCount(self, avId, cogDict, zoneId, avList) and cogDict['isForeman'])
 
@@ -838,6 +877,9 @@ class VPQuest(CogQuest):
         else:
             return TTLocalizer.CogVPs
 
+    def getCogMatchKey(self):
+        return None
+
     def doesCogCount(self, avId, cogDict, zoneId, avList):
         return 0
 
@@ -878,6 +920,9 @@ class SupervisorQuest(CogQuest):
         else:
             return TTLocalizer.SupervisorP
 
+    def getCogMatchKey(self):
+        return ('supervisor',)
+
     def doesCogCount(self, avId, cogDict, zoneId, avList):
         return bool(CogQuest.doesCogCount(self, avId, cogDict, zoneId, avList) and cogDict['isSupervisor'])
 
@@ -915,6 +960,9 @@ class CFOQuest(CogQuest):
         else:
             return TTLocalizer.CogCFOs
 
+    def getCogMatchKey(self):
+        return None
+
     def doesCogCount(self, avId, cogDict, zoneId, avList):
         return 0
 
@@ -1094,6 +1142,9 @@ class BuildingQuest(CogQuest):
     def getHeadlineString(self):
         return TTLocalizer.QuestsBuildingQuestHeadline
 
+    def getCogMatchKey(self):
+        return None
+
     def doesCogCount(self, avId, cogDict, zoneId, avList):
         return 0
 
@@ -17676,17 +17727,14 @@ QuestDict = {
          TTLocalizer.QuestDialogDict[12032])}
 
 Tier2QuestsDict = {}
-for questId, questDesc in list(QuestDict.items()):
-    if questDesc[QuestDictStartIndex] == Start:
-        tier = questDesc[QuestDictTierIndex]
-        if tier in Tier2QuestsDict:
-            Tier2QuestsDict[tier].append(questId)
-        else:
-            Tier2QuestsDict[tier] = [questId]
-
 Quest2RewardDict = {}
 Tier2Reward2QuestsDict = {}
 Quest2RemainingStepsDict = {}
+# fromNpcId / toNpcId as written in QuestDict (so Any, Same, ToonHQ and
+# ToonTailor are keys of their own) -> the set of quest ids using it.
+FromNpc2QuestsDict = {}
+ToNpc2QuestsDict = {}
+QuestTablesLoaded = 0
 
 def getAllRewardIdsForReward(rewardId):
     if rewardId is AnyCashbotSuitPart:
@@ -17738,8 +17786,63 @@ def findFinalRewardId(questId):
     return (finalRewardId, remainingSteps)
 
 
-for questId in list(QuestDict.keys()):
-    findFinalRewardId(questId)
+def computeQuestTables():
+    for table in (Tier2QuestsDict, Quest2RewardDict, Tier2Reward2QuestsDict, Quest2RemainingStepsDict, FromNpc2QuestsDict, ToNpc2QuestsDict):
+        table.clear()
+
+    for questId, questDesc in list(QuestDict.items()):
+        if questDesc[QuestDictStartIndex] == Start:
+            tier = questDesc[QuestDictTierIndex]
+            if tier in Tier2QuestsDict:
+                Tier2QuestsDict[tier].append(questId)
+            else:
+                Tier2QuestsDict[tier] = [questId]
+        FromNpc2QuestsDict.setdefault(questDesc[QuestDictFromNpcIndex], set()).add(questId)
+        ToNpc2QuestsDict.setdefault(questDesc[QuestDictToNpcIndex], set()).add(questId)
+
+    for questId in list(QuestDict.keys()):
+        findFinalRewardId(questId)
+
+
+def getQuestTables():
+    return {'Tier2QuestsDict': Tier2QuestsDict,
+     'Quest2RewardDict': Quest2RewardDict,
+     'Tier2Reward2QuestsDict': Tier2Reward2QuestsDict,
+     'Quest2RemainingStepsDict': Quest2RemainingStepsDict,
+     'FromNpc2QuestsDict': FromNpc2QuestsDict,
+     'ToNpc2QuestsDict': ToNpc2QuestsDict}
+
+
+def loadQuestTables():
+    global QuestTablesLoaded
+    tables = QuestTableCache.readTables()
+    if tables is None:
+        computeQuestTables()
+        QuestTablesLoaded = 0
+    else:
+        for name, table in list(getQuestTables().items()):
+            table.clear()
+            table.update(tables[name])
+        QuestTablesLoaded = 1
+
+
+loadQuestTables()
+
+def getQuestsFromNpc(npc, questSet):
+    """Returns the quests of questSet whose fromNpcId matches npc, as in npcMatches."""
+    fromNpcIds = [npc.getNpcId(), Any]
+    if npc.getHq():
+        fromNpcIds.append(ToonHQ)
+    if npc.getTailor():
+        fromNpcIds.append(ToonTailor)
+    quests = set()
+    for fromNpcId in fromNpcIds:
+        npcQuests = FromNpc2QuestsDict.get(fromNpcId)
+        if npcQuests:
+            # & walks the smaller of the two sets.
+            quests |= npcQuests & questSet
+    return quests
+
 
 def getStartingQuests(tier = None):
     startingQuests = []
@@ -17818,52 +17921,59 @@ def getNextQuest(id, currentNpc, av):
 def filterQuests(entireQuestPool, currentNpc, av):
     if notify.getDebug():
         notify.debug('filterQuests: entireQuestPool: %s' % entireQuestPool)
-    validQuestPool = dict([ (questId, 1) for questId in entireQuestPool ])
     if isLoopingFinalTier(av.getRewardTier()):
-        history = [questDesc[0] for questDesc in av.quests]
+        history = set([questDesc[0] for questDesc in av.quests])
     else:
-        history = av.getQuestHistory()
+        history = av.getQuestHistorySet()
     if notify.getDebug():
         notify.debug('filterQuests: av quest history: %s' % history)
-    currentQuests = av.quests
+    validQuests = getQuestsFromNpc(currentNpc, set(entireQuestPool))
+    validQuests -= history
+    # Drop the quests that lead back to this NPC, or to an NPC one of the
+    # toon's current quests already leads to.
+    excludedToNpcs = set([currentNpc.getNpcId()])
+    for quest in av.quests:
+        toNpcId = quest[2]
+        if toNpcId != ToonHQ:
+            excludedToNpcs.add(toNpcId)
+
+    for toNpcId in excludedToNpcs:
+        npcQuests = ToNpc2QuestsDict.get(toNpcId)
+        if npcQuests:
+            validQuests -= npcQuests & validQuests
+
+    # filterFunc only depends on the toon, so ask each class once.
+    classFilters = {}
+    finalQuestPool = []
     for questId in entireQuestPool:
-        if questId in history:
-            if notify.getDebug():
-                notify.debug('filterQuests: Removed %s because in history' % questId)
-            validQuestPool[questId] = 0
-            continue
-        potentialFromNpc = getQuestFromNpcId(questId)
-        if not npcMatches(potentialFromNpc, currentNpc):
-            if notify.getDebug():
-                notify.debug('filterQuests: Removed %s: potentialFromNpc does not match currentNpc' % questId)
-            validQuestPool[questId] = 0
+        if questId not in validQuests:
             continue
-        potentialToNpc = getQuestToNpcId(questId)
-        if currentNpc.getNpcId() == potentialToNpc:
-            if notify.getDebug():
-                notify.debug('filterQuests: Removed %s because potentialToNpc is currentNpc' % questId)
-            validQuestPool[questId] = 0
-            continue
-        if not getQuestClass(questId).filterFunc(av):
-            if notify.getDebug():
-                notify.debug('filterQuests: Removed %s because of filterFunc' % questId)
-            validQuestPool[questId] = 0
-            continue
-        for quest in currentQuests:
-            fromNpcId = quest[1]
-            toNpcId = quest[2]
-            if potentialToNpc == toNpcId and toNpcId != ToonHQ:
-                validQuestPool[questId] = 0
-                if notify.getDebug():
-                    notify.debug('filterQuests: Removed %s because npc involved' % questId)
-                break
+        validQuests.remove(questId)
+        questClass = getQuestClass(questId)
+        allowed = classFilters.get(questClass)
+        if allowed is None:
+            allowed = classFilters[questClass] = questClass.filterFunc(av)
+        if allowed:
+            finalQuestPool.append(questId)
+        elif notify.getDebug():
+            notify.debug('filterQuests: Removed %s because of filterFunc' % questId)
 
-    finalQuestPool = [key for key in list(validQuestPool.keys()) if validQuestPool[key]]
     if notify.getDebug():
         notify.debug('filterQuests: finalQuestPool: %s' % finalQuestPool)
     return finalQuestPool
 
 
+def getValidQuests(quests, validQuestSet):
+    # The same as PythonUtil.intersection(quests, validQuestPool), in the
+    # order the quests are listed, without the quadratic list scans.
+    validQuests = []
+    for questId in quests:
+        if questId in validQuestSet and questId not in validQuests:
+            validQuests.append(questId)
+
+    return validQuests
+
+
 def chooseTrackChoiceQuest(tier, av, fixed = 0):
 
     def fixAndCallAgain():
@@ -17927,6 +18037,7 @@ def chooseTrackChoiceQuest(tier, av, fixed = 0):
 
 def chooseMatchingQuest(tier, validQuestPool, rewardId, npc, av):
     questsMatchingReward = Tier2Reward2QuestsDict[tier].get(rewardId, [])
+    validQuestSet = set(validQuestPool)
     if notify.getDebug():
         notify.debug('questsMatchingReward: %s tier: %s = %s' % (rewardId, tier, questsMatchingReward))
     if rewardId == 400 and QuestDict[questsMatchingReward[0]][QuestDictNextQuestIndex] == NA:
@@ -17938,7 +18049,7 @@ def chooseMatchingQuest(tier, validQuestPool, rewardId, npc, av):
              av.getTrackAccess(),
              bestQuest))
     else:
-        validQuestsMatchingReward = PythonUtil.intersection(questsMatchingReward, validQuestPool)
+        validQuestsMatchingReward = getValidQuests(questsMatchingReward, validQuestSet)
         if notify.getDebug():
             notify.debug('validQuestsMatchingReward: %s tier: %s = %s' % (rewardId, tier, validQuestsMatchingReward))
         if validQuestsMatchingReward:
@@ -17947,7 +18058,7 @@ def chooseMatchingQuest(tier, validQuestPool, rewardId, npc, av):
             questsMatchingReward = Tier2Reward2QuestsDict[tier].get(AnyCashbotSuitPart, [])
             if notify.getDebug():
                 notify.debug('questsMatchingReward: AnyCashbotSuitPart tier: %s = %s' % (tier, questsMatchingReward))
-            validQuestsMatchingReward = PythonUtil.intersection(questsMatchingReward, validQuestPool)
+            validQuestsMatchingReward = getValidQuests(questsMatchingReward, validQuestSet)
             if validQuestsMatchingReward:
                 if notify.getDebug():
                     notify.debug('validQuestsMatchingReward: AnyCashbotSuitPart tier: %s = %s' % (tier, validQuestsMatchingReward))
@@ -17956,7 +18067,7 @@ def chooseMatchingQuest(tier, validQuestPool, rewardId, npc, av):
                 questsMatchingReward = Tier2Reward2QuestsDict[tier].get(AnyLawbotSuitPart, [])
                 if notify.getDebug():
                     notify.debug('questsMatchingReward: AnyLawbotSuitPart tier: %s = %s' % (tier, questsMatchingReward))
-                validQuestsMatchingReward = PythonUtil.intersection(questsMatchingReward, validQuestPool)
+                validQuestsMatchingReward = getValidQuests(questsMatchingReward, validQuestSet)
                 if validQuestsMatchingReward:
                     if notify.getDebug():
                         notify.debug('validQuestsMatchingReward: AnyLawbotSuitPart tier: %s = %s' % (tier, validQuestsMatchingReward))
@@ -17968,7 +18079,7 @@ def chooseMatchingQuest(tier, validQuestPool, rewardId, npc, av):
                     if not questsMatchingReward:
                         notify.warning('chooseMatchingQuests, no questsMatchingReward')
                         return None
-                    validQuestsMatchingReward = PythonUtil.intersection(questsMatchingReward, validQuestPool)
+                    validQuestsMatchingReward = getValidQuests(questsMatchingReward, validQuestSet)
                     if not validQuestsMatchingReward:
                         notify.warning('chooseMatchingQuests, no validQuestsMatchingReward')
                         return None
@@ -18054,17 +18165,67 @@ def questExists(id):
     return id in QuestDict
 
 
+# Quest objects only hold their id and their QuestDict entry, so one
+# instance per quest id is shared by every caller of getQuest.
+QuestCache = {}
+
+
 def getQuest(id):
+    quest = QuestCache.get(id)
+    if quest is not None:
+        return quest
     questEntry = QuestDict.get(id)
     if questEntry:
         questDesc = questEntry[QuestDictDescIndex]
         questClass = questDesc[0]
-        return questClass(id, questDesc[1:])
+        quest = questClass(id, questDesc[1:])
+        QuestCache[id] = quest
+        return quest
     else:
         return None
     return None
 
 
+# (type, track, level, isSkelecog, hasRevives, isForeman, isSupervisor)
+# -> the frozenset of cog match keys of a cog like that.
+CogMatchKeyCache = {}
+
+
+def getCogMatchKeys(cogDict):
+    """
+    Returns the set of Quest.getCogMatchKey() values of the quests whose
+    doesCogCount could count the cog described by cogDict.  Whether it
+    actually counts still depends on the quest's location and the toons
+    that were active against the cog, so a quest whose key is in the set
+    must still be asked with doesCogCount.
+    """
+    cogType = cogDict['type']
+    cogTrack = cogDict['track']
+    cogLevel = cogDict['level']
+    isSkelecog = cogDict.get('isSkelecog')
+    hasRevives = cogDict.get('hasRevives')
+    signature = (cogType, cogTrack, cogLevel, bool(isSkelecog), bool(hasRevives), bool(cogDict.get('isForeman')), bool(cogDict.get('isSupervisor')))
+    keys = CogMatchKeyCache.get(signature)
+    if keys is not None:
+        return keys
+    keys = [('any',), ('type', cogType), ('track', cogTrack)]
+    levels = range(cogLevel + 1) if cogLevel is not None else ()
+    keys.extend([('level', level) for level in levels])
+    if isSkelecog:
+        keys.append(('skelecog',))
+        keys.append(('skelecogTrack', cogTrack))
+        keys.extend([('skelecogLevel', level) for level in levels])
+    if hasRevives:
+        keys.append(('revives',))
+    if signature[5]:
+        keys.append(('foreman',))
+    if signature[6]:
+        keys.append(('supervisor',))
+    keys = frozenset(keys)
+    CogMatchKeyCache[signature] = keys
+    return keys
+
+
 def getQuestClass(id):
     questEntry = QuestDict.get(id)
     if questEntry:
@@ -4,7 +4,7 @@ from direct.fsm import ClassicFSM, State
 from direct.fsm import State
 from direct.fsm import StateData
 from direct.distributed.ClockDelta import *
-from toontown.safezone import CheckersBoard
+from toontown.safezone import PicnicBitboards
 
 class DistributedCheckersAI(DistributedNodeAI):
 
@@ -17,7 +17,7 @@ class DistributedCheckersAI(DistributedNodeAI):
         self.myPos = (
          x, y, z)
         self.myHpr = (h, p, r)
-        self.board = CheckersBoard.CheckersBoard()
+        self.board = PicnicBitboards.CheckersBitboard()
         self.parent = self.air.doId2do[parent]
         self.parentDo = parent
         self.wantStart = []
@@ -61,7 +61,6 @@ class DistributedCheckersAI(DistributedNodeAI):
 
     def delete(self):
         self.fsm.requestFinalState()
-        self.board.delete()
         del self.fsm
         DistributedNodeAI.delete(self)
 
@@ -249,43 +248,12 @@ class DistributedCheckersAI(DistributedNodeAI):
             self.air.writeServerEvent('suspicious', avId, 'has requested an illegal move in Regular checkers - not possible')
 
     def checkLegalMoves(self, moveList):
-        if self.board.squareList[moveList[0]].getState() >= 3:
-            moveType = 'king'
-        else:
-            moveType = 'normal'
-        if len(moveList) == 2:
-            firstSquare = self.board.squareList[moveList[0]]
-            secondSquare = self.board.squareList[moveList[1]]
-            if self.checkLegalMove(firstSquare, secondSquare, moveType) == True:
-                return True
-            else:
-                for x in range(len(moveList) - 1):
-                    y = self.checkLegalJump(self.board.getSquare(moveList[x]), self.board.getSquare(moveList[x + 1]), moveType)
-                    if y == False:
-                        return False
-                    else:
-                        return True
-                    return False
-
-        elif len(moveList) > 2:
-            for x in range(len(moveList) - 1):
-                y = self.checkLegalJump(self.board.getSquare(moveList[x]), self.board.getSquare(moveList[x + 1]), moveType)
-                if y == False:
-                    return False
-
-            return True
+        return self.board.isLegalMove(moveList, self.playerNum)
 
     def makeMove(self, moveList):
-        for x in range(len(moveList) - 1):
-            firstSquare = self.board.squareList[moveList[x]]
-            secondSquare = self.board.squareList[moveList[x + 1]]
-            if firstSquare.getNum() in secondSquare.getAdjacent():
-                break
-            index = firstSquare.jumps.index(secondSquare.getNum())
-            self.board.squareList[firstSquare.getAdjacent()[index]].setState(0)
-
+        self.board.removeJumpedPieces(moveList)
         haveMoved = False
-        squareState = self.board.squareList[moveList[0]].getState()
+        squareState = self.board.getState(moveList[0])
         if squareState <= 2:
             piecetype = 'normal'
             if squareState == 1:
@@ -302,19 +270,19 @@ class DistributedCheckersAI(DistributedNodeAI):
             lastElement = moveList[len(moveList) - 1]
             if playerNum == 1:
                 if lastElement in self.kingPositions[0]:
-                    self.board.squareList[moveList[0]].setState(0)
-                    self.board.squareList[lastElement].setState(3)
+                    self.board.setState(moveList[0], 0)
+                    self.board.setState(lastElement, 3)
                     haveMoved = True
                     self.sendGameState(moveList)
             elif lastElement in self.kingPositions[1]:
-                self.board.squareList[moveList[0]].setState(0)
-                self.board.squareList[lastElement].setState(4)
+                self.board.setState(moveList[0], 0)
+                self.board.setState(lastElement, 4)
                 haveMoved = True
                 self.sendGameState(moveList)
         if haveMoved == False:
-            spot1 = self.board.squareList[moveList[0]].getState()
-            self.board.squareList[moveList[0]].setState(0)
-            self.board.squareList[moveList[len(moveList) - 1]].setState(spot1)
+            spot1 = self.board.getState(moveList[0])
+            self.board.setState(moveList[0], 0)
+            self.board.setState(moveList[len(moveList) - 1], spot1)
             self.sendGameState(moveList)
         temp = self.playerNum
         self.playerNum = 1
@@ -336,19 +304,7 @@ class DistributedCheckersAI(DistributedNodeAI):
         self.playerNum = temp
 
     def hasPeicesAndMoves(self, normalNum, kingNum):
-        for x in self.board.squareList:
-            if x.getState() == normalNum:
-                if self.existsLegalMovesFrom(x.getNum(), 'normal') == True:
-                    return True
-                if self.existsLegalJumpsFrom(x.getNum(), 'normal') == True:
-                    return True
-            elif x.getState() == kingNum:
-                if self.existsLegalMovesFrom(x.getNum(), 'king') == True:
-                    return True
-                if self.existsLegalJumpsFrom(x.getNum(), 'king') == True:
-                    return True
-
-        return False
+        return self.board.hasPiecesAndMoves(normalNum)
 
     def getState(self):
         return self.fsm.getCurrentState().getName()
@@ -365,162 +321,7 @@ class DistributedCheckersAI(DistributedNodeAI):
         self.sendUpdate('setGameState', [gameState, moveList])
 
     def clearBoard(self):
-        for x in self.board.squareList:
-            x.setState(0)
+        self.board.clear()
 
     def getPosHpr(self):
         return self.posHpr
-
-    def existsLegalJumpsFrom(self, index, peice):
-        if peice == 'king':
-            for x in range(4):
-                if self.board.squareList[index].getAdjacent()[x] != None and self.board.squareList[index].getJumps()[x] != None:
-                    adj = self.board.squareList[self.board.squareList[index].getAdjacent()[x]]
-                    jump = self.board.squareList[self.board.squareList[index].getJumps()[x]]
-                    if adj.getState() == 0:
-                        pass
-                    elif adj.getState() == self.playerNum or adj.getState() == self.playerNum + 2:
-                        pass
-                    elif jump.getState() == 0:
-                        return True
-
-            return False
-        else:
-            if peice == 'normal':
-                if self.playerNum == 1:
-                    moveForward = [
-                     1, 2]
-                else:
-                    if self.playerNum == 2:
-                        moveForward = [
-                         0, 3]
-                for x in moveForward:
-                    if self.board.squareList[index].getAdjacent()[x] != None and self.board.squareList[index].getJumps()[x] != None:
-                        adj = self.board.squareList[self.board.squareList[index].getAdjacent()[x]]
-                        jump = self.board.squareList[self.board.squareList[index].getJumps()[x]]
-                        if adj.getState() == 0:
-                            pass
-                        elif adj.getState() == self.playerNum or adj.getState() == self.playerNum + 2:
-                            pass
-                        elif jump.getState() == 0:
-                            return True
-
-                return False
-        return
-
-    def existsLegalMovesFrom(self, index, peice):
-        if peice == 'king':
-            for x in self.board.squareList[index].getAdjacent():
-                if x != None:
-                    if self.board.squareList[x].getState() == 0:
-                        return True
-
-            return False
-        else:
-            if peice == 'normal':
-                if self.playerNum == 1:
-                    moveForward = [
-                     1, 2]
-                else:
-                    if self.playerNum == 2:
-                        moveForward = [
-                         0, 3]
-                for x in moveForward:
-                    if self.board.squareList[index].getAdjacent()[x] != None:
-                        adj = self.board.squareList[self.board.squareList[index].getAdjacent()[x]]
-                        if adj.getState() == 0:
-                            return True
-
-                return False
-        return
-
-    def existsLegalJumpsFrom(self, index, peice):
-        if peice == 'king':
-            for x in range(4):
-                if self.board.squareList[index].getAdjacent()[x] != None and self.board.squareList[index].getJumps()[x] != None:
-                    adj = self.board.squareList[self.board.squareList[index].getAdjacent()[x]]
-                    jump = self.board.squareList[self.board.squareList[index].getJumps()[x]]
-                    if adj.getState() == 0:
-                        pass
-                    elif adj.getState() == self.playerNum or adj.getState() == self.playerNum + 2:
-                        pass
-                    elif jump.getState() == 0:
-                        return True
-
-            return False
-        else:
-            if peice == 'normal':
-                if self.playerNum == 1:
-                    moveForward = [
-                     1, 2]
-                else:
-                    if self.playerNum == 2:
-                        moveForward = [
-                         0, 3]
-                for x in moveForward:
-                    if self.board.squareList[index].getAdjacent()[x] != None and self.board.squareList[index].getJumps()[x] != None:
-                        adj = self.board.squareList[self.board.squareList[index].getAdjacent()[x]]
-                        jump = self.board.squareList[self.board.squareList[index].getJumps()[x]]
-                        if adj.getState() == 0:
-                            pass
-                        elif adj.getState() == self.playerNum or adj.getState() == self.playerNum + 2:
-                            pass
-                        elif jump.getState() == 0:
-                            return True
-
-                return False
-        return
-
-    def checkLegalMove(self, firstSquare, secondSquare, peice):
-        if self.playerNum == 1:
-            moveForward = [
-             1, 2]
-        else:
-            moveForward = [
-             0, 3]
-        if peice == 'king':
-            for x in range(4):
-                if firstSquare.getAdjacent()[x] != None:
-                    if self.board.squareList[firstSquare.getAdjacent()[x]].getState() == 0:
-                        return True
-
-            return False
-        else:
-            if peice == 'normal':
-                for x in moveForward:
-                    if firstSquare.getAdjacent()[x] != None:
-                        if self.board.squareList[firstSquare.getAdjacent()[x]].getState() == 0:
-                            return True
-
-                return False
-        return
-
-    def checkLegalJump(self, firstSquare, secondSquare, peice):
-        if self.playerNum == 1:
-            moveForward = [
-             1, 2]
-            opposingPeices = [2, 4]
-        else:
-            moveForward = [
-             0, 3]
-            opposingPeices = [1, 3]
-        if peice == 'king':
-            if secondSquare.getNum() in firstSquare.getJumps():
-                index = firstSquare.getJumps().index(secondSquare.getNum())
-                if self.board.squareList[firstSquare.getAdjacent()[index]].getState() in opposingPeices:
-                    return True
-                else:
-                    return False
-        else:
-            if peice == 'normal':
-                if secondSquare.getNum() in firstSquare.getJumps():
-                    index = firstSquare.getJumps().index(secondSquare.getNum())
-                    if index in moveForward:
-                        if self.board.squareList[firstSquare.getAdjacent()[index]].getState() in opposingPeices:
-                            return True
-                        else:
-                            return False
-                    else:
-                        return False
-                else:
-                    return False
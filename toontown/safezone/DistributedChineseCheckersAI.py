@@ -4,7 +4,7 @@ from direct.fsm import ClassicFSM, State
 from direct.fsm import State
 from direct.fsm import StateData
 from direct.distributed.ClockDelta import *
-from toontown.safezone import ChineseCheckersBoard
+from toontown.safezone import PicnicBitboards
 
 class DistributedChineseCheckersAI(DistributedNodeAI):
 
@@ -17,7 +17,7 @@ class DistributedChineseCheckersAI(DistributedNodeAI):
         self.myPos = (
          x, y, z)
         self.myHpr = (h, p, r)
-        self.board = ChineseCheckersBoard.ChineseCheckersBoard()
+        self.board = PicnicBitboards.ChineseCheckersBitboard()
         self.parent = self.air.doId2do[parent]
         self.parentDo = parent
         self.wantStart = []
@@ -39,6 +39,7 @@ class DistributedChineseCheckersAI(DistributedNodeAI):
         self.startingPositions = [
          [
           0, 1, 2, 3, 4, 5, 6, 7, 8, 9], [10, 11, 12, 13, 23, 24, 25, 35, 36, 46], [65, 75, 76, 86, 87, 88, 98, 99, 100, 101], [111, 112, 113, 114, 115, 116, 117, 118, 119, 120], [74, 84, 85, 95, 96, 97, 107, 108, 109, 110], [19, 20, 21, 22, 32, 33, 34, 44, 45, 55]]
+        self.startingMasks = [PicnicBitboards.makeMask(x) for x in self.startingPositions]
         self.timerStart = None
         self.fsm = ClassicFSM.ClassicFSM('ChineseCheckers', [
          State.State('waitingToBegin', self.enterWaitingToBegin, self.exitWaitingToBegin, [
@@ -58,7 +59,6 @@ class DistributedChineseCheckersAI(DistributedNodeAI):
 
     def delete(self):
         self.fsm.requestFinalState()
-        self.board.delete()
         self.playerSeatPos = None
         del self.fsm
         DistributedNodeAI.delete(self)
@@ -122,10 +122,7 @@ class DistributedChineseCheckersAI(DistributedNodeAI):
         if self.fsm.getCurrentState().getName() == 'playing':
             gamePos = self.playersGamePos.index(avId)
             self.playersGamePos[gamePos] = None
-            for x in self.board.squareList:
-                if x.getState() == gamePos + 1:
-                    x.setState(0)
-
+            self.board.clearPieces(gamePos + 1)
             self.sendGameState([])
             if self.playersTurn == gamePos:
                 self.advancePlayerTurn()
@@ -161,42 +158,38 @@ class DistributedChineseCheckersAI(DistributedNodeAI):
             self.air.writeServerEvent('suspicious', avId, 'Has requested a Chinese Checkers win and is NOT playing! SeatList of  the table - %s - PlayersGamePos - %s' % (self.parent.seats, self.playersGamePos))
             return
         requestWinGamePos = self.playersGamePos.index(avId) + 1
-        checkSquares = []
-        for x in self.board.squareList:
-            if x.getState() == requestWinGamePos:
-                checkSquares.append(x.getNum())
-
+        checkSquares = self.board.getPieces(requestWinGamePos)
         if requestWinGamePos == 1:
-            if checkSquares == self.startingPositions[3]:
+            if checkSquares == self.startingMasks[3]:
                 self.distributeLaffPoints()
                 self.fsm.request('gameOver')
                 self.parent.announceWinner('Chinese Checkers', avId)
         else:
             if requestWinGamePos == 2:
-                if checkSquares == self.startingPositions[4]:
+                if checkSquares == self.startingMasks[4]:
                     self.distributeLaffPoints()
                     self.fsm.request('gameOver')
                     self.parent.announceWinner('Chinese Checkers', avId)
             else:
                 if requestWinGamePos == 3:
-                    if checkSquares == self.startingPositions[5]:
+                    if checkSquares == self.startingMasks[5]:
                         self.distributeLaffPoints()
                         self.fsm.request('gameOver')
                         self.parent.announceWinner('Chinese Checkers', avId)
                 else:
                     if requestWinGamePos == 4:
-                        if checkSquares == self.startingPositions[0]:
+                        if checkSquares == self.startingMasks[0]:
                             self.distributeLaffPoints()
                             self.fsm.request('gameOver')
                             self.parent.announceWinner('Chinese Checkers', avId)
                     else:
                         if requestWinGamePos == 5:
-                            if checkSquares == self.startingPositions[1]:
+                            if checkSquares == self.startingMasks[1]:
                                 self.fsm.request('gameOver')
                                 self.parent.announceWinner('Chinese Checkers', avId)
                         else:
                             if requestWinGamePos == 6:
-                                if checkSquares == self.startingPositions[2]:
+                                if checkSquares == self.startingMasks[2]:
                                     self.distributeLaffPoints()
                                     self.fsm.request('gameOver')
                                     self.parent.announceWinner('Chinese Checkers', avId)
@@ -447,37 +440,10 @@ class DistributedChineseCheckersAI(DistributedNodeAI):
             self.sendUpdate('setTurnTimer', [globalClockDelta.localToNetworkTime(self.turnEnd)])
 
     def checkLegalMoves(self, moveList):
-        if not moveList:
-            return False
-        else:
-            if self.board.squareList[moveList[0]].getState() == 0:
-                return False
-        for x in range(len(moveList) - 1):
-            y = self.checkLegalMove(self.board.getSquare(moveList[x]), self.board.getSquare(moveList[x + 1]))
-            if y == False:
-                return False
-
-        return True
-
-    def checkLegalMove(self, firstSquare, secondSquare):
-        if secondSquare.getNum() in firstSquare.getAdjacent():
-            return True
-        else:
-            for x in firstSquare.getAdjacent():
-                if x == None:
-                    pass
-                elif self.board.squareList[x].getState() == 0:
-                    pass
-                elif self.board.squareList[x].getAdjacent()[firstSquare.getAdjacent().index(x)] == secondSquare.getNum():
-                    return True
-
-            return False
-        return
+        return self.board.isLegalMove(moveList)
 
     def makeMove(self, moveList):
-        spot1 = self.board.squareList[moveList[0]].getState()
-        self.board.squareList[moveList[0]].setState(0)
-        self.board.squareList[moveList[len(moveList) - 1]].setState(spot1)
+        self.board.makeMove(moveList)
         self.sendGameState(moveList)
 
     def getState(self):
@@ -495,8 +461,7 @@ class DistributedChineseCheckersAI(DistributedNodeAI):
         self.sendUpdate('setGameState', [gameState, moveList])
 
     def clearBoard(self):
-        for x in self.board.squareList:
-            x.setState(0)
+        self.board.clear()
 
     def getPosHpr(self):
         return self.posHpr
@@ -504,13 +469,13 @@ class DistributedChineseCheckersAI(DistributedNodeAI):
     def testWin(self):
         self.clearBoard()
         for x in self.startingPositions[0]:
-            self.board.squareList[x].setState(4)
+            self.board.setState(x, 4)
 
-        self.board.squareList[self.startingPositions[0][len(self.startingPositions[0]) - 1]].setState(0)
-        self.board.squareList[51].setState(4)
+        self.board.setState(self.startingPositions[0][len(self.startingPositions[0]) - 1], 0)
+        self.board.setState(51, 4)
         for x in self.startingPositions[3]:
-            self.board.squareList[x].setState(1)
+            self.board.setState(x, 1)
 
-        self.board.squareList[120].setState(0)
-        self.board.squareList[104].setState(1)
+        self.board.setState(120, 0)
+        self.board.setState(104, 1)
         self.sendGameState([])
@@ -5,6 +5,7 @@ from direct.fsm import State
 from direct.fsm import StateData
 from direct.distributed.ClockDelta import *
 from direct.interval.IntervalGlobal import *
+from toontown.safezone import PicnicBitboards
 
 class DistributedFindFourAI(DistributedNodeAI):
 
@@ -17,7 +18,7 @@ class DistributedFindFourAI(DistributedNodeAI):
         self.myPos = (
          x, y, z)
         self.myHpr = (h, p, r)
-        self.board = [[0, 0, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0]]
+        self.board = PicnicBitboards.FindFourBitboard()
         self.parent = self.air.doId2do[parent]
         self.parentDo = parent
         self.wantStart = []
@@ -242,15 +243,12 @@ class DistributedFindFourAI(DistributedNodeAI):
         if avId in self.playersGamePos:
             if self.playersGamePos.index(avId) != self.playersTurn:
                 pass
-        if self.board[0][moveColumn] != 0:
+        movePos = self.board.dropPiece(moveColumn, self.playersTurn + 1)
+        if movePos == None:
             self.sendUpdateToAvatarId(avId, 'illegalMove', [])
-        for x in range(6):
-            if self.board[x][moveColumn] == 0:
-                movePos = x
-
-        self.board[movePos][moveColumn] = self.playersTurn + 1
+            return
         if self.checkForTie() == True:
-            self.sendUpdate('setGameState', [self.board, moveColumn, movePos, turn])
+            self.sendUpdate('setGameState', [self.board.getStates(), moveColumn, movePos, turn])
             self.sendUpdate('tie', [])
             winnersSequence = Sequence(Wait(8.0), Func(self.fsm.request, 'gameOver'))
             winnersSequence.start()
@@ -260,14 +258,10 @@ class DistributedFindFourAI(DistributedNodeAI):
         self.setTurnCountdownTime()
         self.sendUpdate('setTurnTimer', [globalClockDelta.localToNetworkTime(self.turnEnd)])
         self.d_sendTurn(self.playersTurn + 1)
-        self.sendUpdate('setGameState', [self.board, moveColumn, movePos, turn])
+        self.sendUpdate('setGameState', [self.board.getStates(), moveColumn, movePos, turn])
 
     def checkForTie(self):
-        for x in range(7):
-            if self.board[0][x] == 0:
-                return False
-
-        return True
+        return self.board.isFull()
 
     def getState(self):
         return self.fsm.getCurrentState().getName()
@@ -277,151 +271,20 @@ class DistributedFindFourAI(DistributedNodeAI):
 
     def getGameState(self):
         return [
-         self.board, 0, 0, 0]
+         self.board.getStates(), 0, 0, 0]
 
     def clearBoard(self):
-        for x in self.board.squareList:
-            x.setState(0)
+        self.board.clear()
 
     def getPosHpr(self):
         return self.posHpr
 
     def tempSetBoardState(self):
-        self.board = [
+        self.board.setStates([
          [
-          0, 0, 0, 0, 0, 0, 0], [1, 2, 1, 2, 2, 2, 1], [2, 2, 1, 2, 1, 2, 1], [2, 1, 1, 2, 2, 1, 2], [1, 2, 2, 1, 2, 1, 1], [1, 2, 1, 2, 1, 2, 1]]
-        self.sendUpdate('setGameState', [self.board, 0, 0, 1])
+          0, 0, 0, 0, 0, 0, 0], [1, 2, 1, 2, 2, 2, 1], [2, 2, 1, 2, 1, 2, 1], [2, 1, 1, 2, 2, 1, 2], [1, 2, 2, 1, 2, 1, 1], [1, 2, 1, 2, 1, 2, 1]])
+        self.sendUpdate('setGameState', [self.board.getStates(), 0, 0, 1])
 
     def checkWin(self, rVal, cVal, playerNum):
-        if self.checkHorizontal(rVal, cVal, playerNum) == True:
-            self.winDirection = 0
-            return True
-        elif self.checkVertical(rVal, cVal, playerNum) == True:
-            self.winDirection = 1
-            return True
-        elif self.checkDiagonal(rVal, cVal, playerNum) == True:
-            self.winDirection = 2
-            return True
-        else:
-            self.winDirection = None
-            return False
-        return
-
-    def checkHorizontal(self, rVal, cVal, playerNum):
-        if cVal == 3:
-            for x in range(1, 4):
-                if self.board[rVal][cVal - x] != playerNum:
-                    break
-                if self.board[rVal][cVal - x] == playerNum and x == 3:
-                    return True
-
-            for x in range(1, 4):
-                if self.board[rVal][cVal + x] != playerNum:
-                    break
-                if self.board[rVal][cVal + x] == playerNum and x == 3:
-                    return True
-
-            return False
-        elif cVal == 2:
-            for x in range(1, 4):
-                if self.board[rVal][cVal + x] != playerNum:
-                    break
-                if self.board[rVal][cVal + x] == playerNum and x == 3:
-                    return True
-
-            return False
-        elif cVal == 4:
-            for x in range(1, 4):
-                if self.board[rVal][cVal - x] != playerNum:
-                    break
-                if self.board[rVal][cVal - x] == playerNum and x == 3:
-                    return True
-
-            return False
-        else:
-            return False
-
-    def checkVertical(self, rVal, cVal, playerNum):
-        if rVal == 2:
-            for x in range(1, 4):
-                if self.board[rVal + x][cVal] != playerNum:
-                    break
-                if self.board[rVal + x][cVal] == playerNum and x == 3:
-                    return True
-
-            return False
-        elif rVal == 3:
-            for x in range(1, 4):
-                if self.board[rVal - x][cVal] != playerNum:
-                    break
-                if self.board[rVal - x][cVal] == playerNum and x == 3:
-                    return True
-
-            return False
-        else:
-            return False
-
-    def checkDiagonal(self, rVal, cVal, playerNum):
-        if cVal <= 2:
-            if rVal == 2:
-                for x in range(1, 4):
-                    if self.board[rVal + x][cVal + x] != playerNum:
-                        break
-                    if self.board[rVal + x][cVal + x] == playerNum and x == 3:
-                        return True
-
-                return False
-            elif rVal == 3:
-                for x in range(1, 4):
-                    if self.board[rVal - x][cVal + x] != playerNum:
-                        break
-                    if self.board[rVal - x][cVal + x] == playerNum and x == 3:
-                        return True
-
-                return False
-        elif cVal >= 4:
-            if rVal == 2:
-                for x in range(1, 4):
-                    if self.board[rVal + x][cVal - x] != playerNum:
-                        break
-                    if self.board[rVal + x][cVal - x] == playerNum and x == 3:
-                        return True
-
-                return False
-            elif rVal == 3:
-                for x in range(1, 4):
-                    if self.board[rVal - x][cVal - x] != playerNum:
-                        break
-                    if self.board[rVal - x][cVal - x] == playerNum and x == 3:
-                        return True
-
-                return False
-        elif rVal == 3 or rVal == 4 or rVal == 5:
-            for x in range(1, 4):
-                if self.board[rVal - x][cVal - x] != playerNum:
-                    break
-                if self.board[rVal - x][cVal - x] == playerNum and x == 3:
-                    return True
-
-            for x in range(1, 4):
-                if self.board[rVal + x][cVal - x] != playerNum:
-                    break
-                if self.board[rVal + x][cVal - x] == playerNum and x == 3:
-                    return True
-
-            return False
-        elif rVal == 0 or rVal == 1 or rVal == 2:
-            for x in range(1, 4):
-                if self.board[rVal + x][cVal - x] != playerNum:
-                    break
-                if self.board[rVal + x][cVal - x] == playerNum and x == 3:
-                    return True
-
-            for x in range(1, 4):
-                if self.board[rVal + x][cVal + x] != playerNum:
-                    break
-                if self.board[rVal + x][cVal + x] == playerNum and x == 3:
-                    return True
-
-            return False
-        return False
+        self.winDirection = self.board.getWinDirection(rVal, cVal, playerNum)
+        return self.winDirection != None
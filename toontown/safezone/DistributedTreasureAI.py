@@ -8,6 +8,17 @@ class DistributedTreasureAI(DistributedObjectAI.DistributedObjectAI):
         DistributedObjectAI.DistributedObjectAI.__init__(self, air)
         self.treasurePlanner = treasurePlanner
         self.pos = (x, y, z)
+        self.grabbedAvId = 0
+
+    def recycle(self):
+        # Our planner keeps track of everything we do.
+        pass
+
+    def getRamFieldsSet(self):
+        # setGrab is our only ram field that isn't required.
+        if self.grabbedAvId:
+            return ['setGrab']
+        return []
 
     def requestGrab(self):
         avId = self.air.getAvatarIdFromSender()
@@ -17,6 +28,7 @@ class DistributedTreasureAI(DistributedObjectAI.DistributedObjectAI):
         return 1
 
     def d_setGrab(self, avId):
+        self.grabbedAvId = avId
         self.sendUpdate('setGrab', [avId])
 
     def d_setReject(self):
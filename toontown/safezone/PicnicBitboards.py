@@ -0,0 +1,388 @@
+from toontown.safezone import CheckersBoard
+from toontown.safezone import ChineseCheckersBoard
+
+
+def makeMask(squares):
+    mask = 0
+    for square in squares:
+        mask |= 1 << square
+
+    return mask
+
+
+def iterSquares(mask):
+    while mask:
+        bit = mask & -mask
+        yield bit.bit_length() - 1
+        mask ^= bit
+
+
+def makeShiftMap(pairs):
+    """
+    Groups (square, toSquare) pairs by how far apart the squares are,
+    so that shiftSquares can move a whole set of squares at once.
+    """
+    shifts = {}
+    for square, toSquare in pairs:
+        shifts[toSquare - square] = shifts.get(toSquare - square, 0) | 1 << square
+
+    return tuple(shifts.items())
+
+
+def shiftSquares(mask, shiftMap):
+    """Returns where the squares of the mask go to, for those that go anywhere."""
+    shifted = 0
+    for shift, squares in shiftMap:
+        if shift > 0:
+            shifted |= (mask & squares) << shift
+        else:
+            shifted |= (mask & squares) >> -shift
+
+    return shifted
+
+
+class PicnicBitboard:
+    """
+    The AI's board for a picnic table game.  Keeps the state of every
+    square in the order setGameState sends them, and a bitboard of the
+    squares in each state for checking moves against.
+    """
+    NumSquares = 0
+    NumStates = 0
+
+    def __init__(self):
+        self.states = bytearray(self.NumSquares)
+        self.pieces = [0] * self.NumStates
+        self.occupied = 0
+
+    def getState(self, square):
+        return self.states[square]
+
+    def setState(self, square, state):
+        bit = 1 << square
+        if self.states[square]:
+            self.pieces[self.states[square]] &= ~bit
+        if state:
+            self.pieces[state] |= bit
+            self.occupied |= bit
+        else:
+            self.occupied &= ~bit
+        self.states[square] = state
+
+    def getStates(self):
+        return list(self.states)
+
+    def setStates(self, states):
+        self.clear()
+        for square in range(self.NumSquares):
+            if states[square]:
+                self.setState(square, states[square])
+
+    def getPieces(self, state):
+        """Returns the bitboard of the squares in the given state."""
+        return self.pieces[state]
+
+    def clearPieces(self, state):
+        for square in iterSquares(self.pieces[state]):
+            self.setState(square, 0)
+
+    def clear(self):
+        self.states = bytearray(self.NumSquares)
+        self.pieces = [0] * self.NumStates
+        self.occupied = 0
+
+
+class ChineseCheckersBitboard(PicnicBitboard):
+    NumSquares = 121
+    NumStates = 7
+    # square -> the bitboard of its neighbours
+    AdjacentMasks = []
+    # square -> {square it hops to: the bitboard of the squares it hops over}
+    HopMasks = []
+
+    def isLegalMove(self, moveList):
+        """
+        A move is a piece followed by the squares it goes to, one step
+        or one hop over another piece at a time.
+        """
+        if not moveList or moveList[0] >= self.NumSquares or not self.states[moveList[0]]:
+            return False
+        adjacentMasks = self.AdjacentMasks
+        hopMasks = self.HopMasks
+        occupied = self.occupied
+        square = moveList[0]
+        for i in range(1, len(moveList)):
+            toSquare = moveList[i]
+            if not (adjacentMasks[square] >> toSquare & 1 or hopMasks[square].get(toSquare, 0) & occupied):
+                return False
+            square = toSquare
+
+        return True
+
+    def isLegalStep(self, square, toSquare):
+        if self.AdjacentMasks[square] >> toSquare & 1:
+            return True
+        return self.HopMasks[square].get(toSquare, 0) & self.occupied != 0
+
+    def makeMove(self, moveList):
+        state = self.states[moveList[0]]
+        self.setState(moveList[0], 0)
+        self.setState(moveList[-1], state)
+
+
+def __makeChineseCheckersMasks():
+    board = ChineseCheckersBoard.ChineseCheckersBoard()
+    for square in range(ChineseCheckersBitboard.NumSquares):
+        adjacent = board.getAdjacent(square)
+        ChineseCheckersBitboard.AdjacentMasks.append(makeMask([x for x in adjacent if x is not None]))
+        hops = {}
+        for over in adjacent:
+            if over is not None:
+                toSquare = board.getAdjacent(over)[adjacent.index(over)]
+                if toSquare is not None:
+                    hops[toSquare] = hops.get(toSquare, 0) | 1 << over
+
+        ChineseCheckersBitboard.HopMasks.append(hops)
+
+    board.delete()
+
+
+__makeChineseCheckersMasks()
+
+
+class CheckersBitboard(PicnicBitboard):
+    """
+    Pieces are 1 and 2 for each player's men, and 3 and 4 for their
+    kings.  Directions are the indices of CheckersBoard's adjacency and
+    jump lists; men only move in their player's forward ones.
+    """
+    NumSquares = 32
+    NumStates = 5
+    AllSquares = (1 << NumSquares) - 1
+    ForwardDirections = {1: (1, 2),
+     2: (0, 3)}
+    # square -> the bitboard of its neighbours
+    AdjacentMasks = []
+    # playerNum -> square -> the bitboard of its forward neighbours
+    ForwardMasks = {1: [],
+     2: []}
+    # square -> {square it jumps to: the square it jumps over}
+    JumpOvers = []
+    # playerNum -> square -> the same, forward only
+    ForwardJumpOvers = {1: [],
+     2: []}
+    # direction -> shift maps from the squares to those that have the
+    # neighbour, or the jump, in that direction
+    FromNeighbourMaps = []
+    FromJumpMaps = []
+
+    def isLegalMove(self, moveList, playerNum):
+        """
+        Checks a move of the piece on moveList[0] by playerNum, as the
+        AI always has: a single step only needs an empty square for the
+        piece to step to, and a king only has to jump an opponent where
+        it moves to a square it could jump to.
+        """
+        if len(moveList) < 2 or max(moveList) >= self.NumSquares:
+            return False
+        # Anyone but player 1 moves as player 2.
+        if playerNum == 1:
+            opponents = self.pieces[2] | self.pieces[4]
+        else:
+            playerNum = 2
+            opponents = self.pieces[1] | self.pieces[3]
+        if self.states[moveList[0]] >= 3:
+            if len(moveList) == 2 and self.AdjacentMasks[moveList[0]] & ~self.occupied:
+                return True
+            jumpOvers = self.JumpOvers
+            for i in range(len(moveList) - 1):
+                over = jumpOvers[moveList[i]].get(moveList[i + 1])
+                if over is not None and not opponents >> over & 1:
+                    return False
+
+        else:
+            if len(moveList) == 2 and self.ForwardMasks[playerNum][moveList[0]] & ~self.occupied:
+                return True
+            jumpOvers = self.ForwardJumpOvers[playerNum]
+            for i in range(len(moveList) - 1):
+                over = jumpOvers[moveList[i]].get(moveList[i + 1])
+                if over is None or not opponents >> over & 1:
+                    return False
+
+        return True
+
+    def removeJumpedPieces(self, moveList):
+        for i in range(len(moveList) - 1):
+            if self.AdjacentMasks[moveList[i + 1]] >> moveList[i] & 1:
+                break
+            over = self.JumpOvers[moveList[i]].get(moveList[i + 1])
+            if over is not None:
+                self.setState(over, 0)
+
+    def hasPiecesAndMoves(self, playerNum):
+        """Returns True if any of playerNum's pieces can step or jump."""
+        men = self.pieces[playerNum]
+        kings = self.pieces[playerNum + 2]
+        empty = self.AllSquares & ~self.occupied
+        opponents = self.occupied & ~(men | kings)
+        forwardDirections = self.ForwardDirections[playerNum]
+        for direction in range(4):
+            if direction in forwardDirections:
+                movers = men | kings
+            else:
+                movers = kings
+            if not movers:
+                continue
+            if movers & shiftSquares(empty, self.FromNeighbourMaps[direction]):
+                return True
+            jumpers = movers & shiftSquares(opponents, self.FromNeighbourMaps[direction])
+            if jumpers & shiftSquares(empty, self.FromJumpMaps[direction]):
+                return True
+
+        return False
+
+
+def __makeCheckersMasks():
+    board = CheckersBoard.CheckersBoard()
+    neighbourPairs = [[], [], [], []]
+    jumpPairs = [[], [], [], []]
+    for square in range(CheckersBitboard.NumSquares):
+        adjacent = board.getAdjacent(square)
+        jumps = board.getJumps(square)
+        CheckersBitboard.AdjacentMasks.append(makeMask([x for x in adjacent if x is not None]))
+        for playerNum, directions in CheckersBitboard.ForwardDirections.items():
+            CheckersBitboard.ForwardMasks[playerNum].append(makeMask([adjacent[x] for x in directions if adjacent[x] is not None]))
+
+        jumpOvers = {}
+        forwardJumpOvers = {1: {},
+         2: {}}
+        for toSquare in jumps:
+            if toSquare is not None and toSquare not in jumpOvers:
+                direction = jumps.index(toSquare)
+                jumpOvers[toSquare] = adjacent[direction]
+                for playerNum, directions in CheckersBitboard.ForwardDirections.items():
+                    if direction in directions:
+                        forwardJumpOvers[playerNum][toSquare] = adjacent[direction]
+
+        CheckersBitboard.JumpOvers.append(jumpOvers)
+        for playerNum in CheckersBitboard.ForwardDirections:
+            CheckersBitboard.ForwardJumpOvers[playerNum].append(forwardJumpOvers[playerNum])
+
+        for direction in range(4):
+            if adjacent[direction] is not None:
+                neighbourPairs[direction].append((adjacent[direction], square))
+                if jumps[direction] is not None:
+                    jumpPairs[direction].append((jumps[direction], square))
+
+    for direction in range(4):
+        CheckersBitboard.FromNeighbourMaps.append(makeShiftMap(neighbourPairs[direction]))
+        CheckersBitboard.FromJumpMaps.append(makeShiftMap(jumpPairs[direction]))
+
+    board.delete()
+
+
+__makeCheckersMasks()
+
+
+class FindFourBitboard(PicnicBitboard):
+    """
+    Square row * 7 + column, with row 0 at the top, and 1 and 2 for
+    each player's pieces.
+    """
+    NumRows = 6
+    NumColumns = 7
+    NumSquares = NumRows * NumColumns
+    NumStates = 3
+    ColumnMasks = []
+    TopRowMask = makeMask(range(NumColumns))
+    # (row, column) -> ((winDirection, the bitboard of three squares), ...)
+    # for the lines of four the clients report their wins with
+    WinMasks = {}
+
+    def getStates(self):
+        states = self.states
+        return [list(states[row * self.NumColumns:(row + 1) * self.NumColumns]) for row in range(self.NumRows)]
+
+    def setStates(self, rows):
+        PicnicBitboard.setStates(self, [state for row in rows for state in row])
+
+    def getState(self, row, column):
+        return self.states[row * self.NumColumns + column]
+
+    def dropPiece(self, column, state):
+        """Drops a piece down the column; returns the row it lands on, or None if the column is full."""
+        if not 0 <= column < self.NumColumns:
+            return None
+        empty = self.ColumnMasks[column] & ~self.occupied
+        if not empty:
+            return None
+        square = empty.bit_length() - 1
+        self.setState(square, state)
+        return square // self.NumColumns
+
+    def isColumnFull(self, column):
+        return self.occupied >> column & 1 != 0
+
+    def isFull(self):
+        return self.occupied & self.TopRowMask == self.TopRowMask
+
+    def getWinDirection(self, row, column, playerNum):
+        """
+        Returns the winDirection of the line of four the piece on row,
+        column finishes for playerNum: 0 across, 1 down, and 2 diagonal,
+        or None if it doesn't.
+        """
+        pieces = self.pieces[playerNum] if 0 < playerNum < self.NumStates else 0
+        for winDirection, mask in self.WinMasks.get((row, column), ()):
+            if pieces & mask == mask:
+                return winDirection
+
+        return None
+
+
+def __makeFindFourMasks():
+    numRows = FindFourBitboard.NumRows
+    numColumns = FindFourBitboard.NumColumns
+    for column in range(numColumns):
+        FindFourBitboard.ColumnMasks.append(makeMask(range(column, FindFourBitboard.NumSquares, numColumns)))
+
+    for row in range(numRows):
+        for column in range(numColumns):
+            # The lines of three squares from the piece, each
+            # (winDirection, row step, column step), that a win on it
+            # has always been checked along.
+            lines = []
+            if column == 3:
+                lines += [(0, 0, -1), (0, 0, 1)]
+            elif column == 2:
+                lines.append((0, 0, 1))
+            elif column == 4:
+                lines.append((0, 0, -1))
+            if row == 2:
+                lines.append((1, 1, 0))
+            elif row == 3:
+                lines.append((1, -1, 0))
+            if column <= 2:
+                if row == 2:
+                    lines.append((2, 1, 1))
+                elif row == 3:
+                    lines.append((2, -1, 1))
+            elif column >= 4:
+                if row == 2:
+                    lines.append((2, 1, -1))
+                elif row == 3:
+                    lines.append((2, -1, -1))
+            elif row >= 3:
+                lines += [(2, -1, -1), (2, 1, -1)]
+            else:
+                lines += [(2, 1, -1), (2, 1, 1)]
+            winMasks = []
+            for winDirection, rowStep, columnStep in lines:
+                squares = [(row + rowStep * x, column + columnStep * x) for x in range(1, 4)]
+                if all(0 <= r < numRows and 0 <= c < numColumns for r, c in squares):
+                    winMasks.append((winDirection, makeMask([r * numColumns + c for r, c in squares])))
+
+            FindFourBitboard.WinMasks[(row, column)] = tuple(winMasks)
+
+
+__makeFindFourMasks()
@@ -0,0 +1,634 @@
+import argparse
+import random
+import time
+
+parser = argparse.ArgumentParser(description='Open Toontown - Picnic table board game benchmark')
+parser.add_argument('--games', type=int, default=200, help='Number of random games checked for each board game.')
+parser.add_argument('--seed', type=int, default=0, help='Seed of the random games.')
+args = parser.parse_args()
+
+from toontown.safezone import CheckersBoard
+from toontown.safezone import ChineseCheckersBoard
+from toontown.safezone import PicnicBitboards
+
+
+class OldChineseCheckersRules:
+    """DistributedChineseCheckersAI's move checks as they were."""
+
+    def __init__(self, board):
+        self.board = board
+
+    def checkLegalMoves(self, moveList):
+        if not moveList:
+            return False
+        else:
+            if self.board.squareList[moveList[0]].getState() == 0:
+                return False
+        for x in range(len(moveList) - 1):
+            y = self.checkLegalMove(self.board.getSquare(moveList[x]), self.board.getSquare(moveList[x + 1]))
+            if y == False:
+                return False
+
+        return True
+
+    def checkLegalMove(self, firstSquare, secondSquare):
+        if secondSquare.getNum() in firstSquare.getAdjacent():
+            return True
+        else:
+            for x in firstSquare.getAdjacent():
+                if x == None:
+                    pass
+                elif self.board.squareList[x].getState() == 0:
+                    pass
+                elif self.board.squareList[x].getAdjacent()[firstSquare.getAdjacent().index(x)] == secondSquare.getNum():
+                    return True
+
+            return False
+        return
+
+class OldCheckersRules:
+    """DistributedCheckersAI's move checks and win detection as they were."""
+
+    def __init__(self, board, playerNum):
+        self.board = board
+        self.playerNum = playerNum
+
+    def checkLegalMoves(self, moveList):
+        if self.board.squareList[moveList[0]].getState() >= 3:
+            moveType = 'king'
+        else:
+            moveType = 'normal'
+        if len(moveList) == 2:
+            firstSquare = self.board.squareList[moveList[0]]
+            secondSquare = self.board.squareList[moveList[1]]
+            if self.checkLegalMove(firstSquare, secondSquare, moveType) == True:
+                return True
+            else:
+                for x in range(len(moveList) - 1):
+                    y = self.checkLegalJump(self.board.getSquare(moveList[x]), self.board.getSquare(moveList[x + 1]), moveType)
+                    if y == False:
+                        return False
+                    else:
+                        return True
+                    return False
+
+        elif len(moveList) > 2:
+            for x in range(len(moveList) - 1):
+                y = self.checkLegalJump(self.board.getSquare(moveList[x]), self.board.getSquare(moveList[x + 1]), moveType)
+                if y == False:
+                    return False
+
+            return True
+
+    def hasPeicesAndMoves(self, normalNum, kingNum):
+        for x in self.board.squareList:
+            if x.getState() == normalNum:
+                if self.existsLegalMovesFrom(x.getNum(), 'normal') == True:
+                    return True
+                if self.existsLegalJumpsFrom(x.getNum(), 'normal') == True:
+                    return True
+            elif x.getState() == kingNum:
+                if self.existsLegalMovesFrom(x.getNum(), 'king') == True:
+                    return True
+                if self.existsLegalJumpsFrom(x.getNum(), 'king') == True:
+                    return True
+
+        return False
+
+    def existsLegalMovesFrom(self, index, peice):
+        if peice == 'king':
+            for x in self.board.squareList[index].getAdjacent():
+                if x != None:
+                    if self.board.squareList[x].getState() == 0:
+                        return True
+
+            return False
+        else:
+            if peice == 'normal':
+                if self.playerNum == 1:
+                    moveForward = [
+                     1, 2]
+                else:
+                    if self.playerNum == 2:
+                        moveForward = [
+                         0, 3]
+                for x in moveForward:
+                    if self.board.squareList[index].getAdjacent()[x] != None:
+                        adj = self.board.squareList[self.board.squareList[index].getAdjacent()[x]]
+                        if adj.getState() == 0:
+                            return True
+
+                return False
+        return
+
+    def existsLegalJumpsFrom(self, index, peice):
+        if peice == 'king':
+            for x in range(4):
+                if self.board.squareList[index].getAdjacent()[x] != None and self.board.squareList[index].getJumps()[x] != None:
+                    adj = self.board.squareList[self.board.squareList[index].getAdjacent()[x]]
+                    jump = self.board.squareList[self.board.squareList[index].getJumps()[x]]
+                    if adj.getState() == 0:
+                        pass
+                    elif adj.getState() == self.playerNum or adj.getState() == self.playerNum + 2:
+                        pass
+                    elif jump.getState() == 0:
+                        return True
+
+            return False
+        else:
+            if peice == 'normal':
+                if self.playerNum == 1:
+                    moveForward = [
+                     1, 2]
+                else:
+                    if self.playerNum == 2:
+                        moveForward = [
+                         0, 3]
+                for x in moveForward:
+                    if self.board.squareList[index].getAdjacent()[x] != None and self.board.squareList[index].getJumps()[x] != None:
+                        adj = self.board.squareList[self.board.squareList[index].getAdjacent()[x]]
+                        jump = self.board.squareList[self.board.squareList[index].getJumps()[x]]
+                        if adj.getState() == 0:
+                            pass
+                        elif adj.getState() == self.playerNum or adj.getState() == self.playerNum + 2:
+                            pass
+                        elif jump.getState() == 0:
+                            return True
+
+                return False
+        return
+
+    def checkLegalMove(self, firstSquare, secondSquare, peice):
+        if self.playerNum == 1:
+            moveForward = [
+             1, 2]
+        else:
+            moveForward = [
+             0, 3]
+        if peice == 'king':
+            for x in range(4):
+                if firstSquare.getAdjacent()[x] != None:
+                    if self.board.squareList[firstSquare.getAdjacent()[x]].getState() == 0:
+                        return True
+
+            return False
+        else:
+            if peice == 'normal':
+                for x in moveForward:
+                    if firstSquare.getAdjacent()[x] != None:
+                        if self.board.squareList[firstSquare.getAdjacent()[x]].getState() == 0:
+                            return True
+
+                return False
+        return
+
+    def checkLegalJump(self, firstSquare, secondSquare, peice):
+        if self.playerNum == 1:
+            moveForward = [
+             1, 2]
+            opposingPeices = [2, 4]
+        else:
+            moveForward = [
+             0, 3]
+            opposingPeices = [1, 3]
+        if peice == 'king':
+            if secondSquare.getNum() in firstSquare.getJumps():
+                index = firstSquare.getJumps().index(secondSquare.getNum())
+                if self.board.squareList[firstSquare.getAdjacent()[index]].getState() in opposingPeices:
+                    return True
+                else:
+                    return False
+        else:
+            if peice == 'normal':
+                if secondSquare.getNum() in firstSquare.getJumps():
+                    index = firstSquare.getJumps().index(secondSquare.getNum())
+                    if index in moveForward:
+                        if self.board.squareList[firstSquare.getAdjacent()[index]].getState() in opposingPeices:
+                            return True
+                        else:
+                            return False
+                    else:
+                        return False
+                else:
+                    return False
+    def makeMove(self, moveList):
+        # Without the promotion and win announcements, which are still
+        # DistributedCheckersAI's.
+        for x in range(len(moveList) - 1):
+            firstSquare = self.board.squareList[moveList[x]]
+            secondSquare = self.board.squareList[moveList[x + 1]]
+            if firstSquare.getNum() in secondSquare.getAdjacent():
+                break
+            index = firstSquare.jumps.index(secondSquare.getNum())
+            self.board.squareList[firstSquare.getAdjacent()[index]].setState(0)
+
+        spot1 = self.board.squareList[moveList[0]].getState()
+        self.board.squareList[moveList[0]].setState(0)
+        self.board.squareList[moveList[len(moveList) - 1]].setState(spot1)
+
+
+class OldFindFourRules:
+    """DistributedFindFourAI's win and tie checks as they were."""
+
+    def __init__(self, board):
+        self.board = board
+        self.winDirection = None
+
+    def checkForTie(self):
+        for x in range(7):
+            if self.board[0][x] == 0:
+                return False
+
+        return True
+
+    def checkWin(self, rVal, cVal, playerNum):
+        if self.checkHorizontal(rVal, cVal, playerNum) == True:
+            self.winDirection = 0
+            return True
+        elif self.checkVertical(rVal, cVal, playerNum) == True:
+            self.winDirection = 1
+            return True
+        elif self.checkDiagonal(rVal, cVal, playerNum) == True:
+            self.winDirection = 2
+            return True
+        else:
+            self.winDirection = None
+            return False
+        return
+
+    def checkHorizontal(self, rVal, cVal, playerNum):
+        if cVal == 3:
+            for x in range(1, 4):
+                if self.board[rVal][cVal - x] != playerNum:
+                    break
+                if self.board[rVal][cVal - x] == playerNum and x == 3:
+                    return True
+
+            for x in range(1, 4):
+                if self.board[rVal][cVal + x] != playerNum:
+                    break
+                if self.board[rVal][cVal + x] == playerNum and x == 3:
+                    return True
+
+            return False
+        elif cVal == 2:
+            for x in range(1, 4):
+                if self.board[rVal][cVal + x] != playerNum:
+                    break
+                if self.board[rVal][cVal + x] == playerNum and x == 3:
+                    return True
+
+            return False
+        elif cVal == 4:
+            for x in range(1, 4):
+                if self.board[rVal][cVal - x] != playerNum:
+                    break
+                if self.board[rVal][cVal - x] == playerNum and x == 3:
+                    return True
+
+            return False
+        else:
+            return False
+
+    def checkVertical(self, rVal, cVal, playerNum):
+        if rVal == 2:
+            for x in range(1, 4):
+                if self.board[rVal + x][cVal] != playerNum:
+                    break
+                if self.board[rVal + x][cVal] == playerNum and x == 3:
+                    return True
+
+            return False
+        elif rVal == 3:
+            for x in range(1, 4):
+                if self.board[rVal - x][cVal] != playerNum:
+                    break
+                if self.board[rVal - x][cVal] == playerNum and x == 3:
+                    return True
+
+            return False
+        else:
+            return False
+
+    def checkDiagonal(self, rVal, cVal, playerNum):
+        if cVal <= 2:
+            if rVal == 2:
+                for x in range(1, 4):
+                    if self.board[rVal + x][cVal + x] != playerNum:
+                        break
+                    if self.board[rVal + x][cVal + x] == playerNum and x == 3:
+                        return True
+
+                return False
+            elif rVal == 3:
+                for x in range(1, 4):
+                    if self.board[rVal - x][cVal + x] != playerNum:
+                        break
+                    if self.board[rVal - x][cVal + x] == playerNum and x == 3:
+                        return True
+
+                return False
+        elif cVal >= 4:
+            if rVal == 2:
+                for x in range(1, 4):
+                    if self.board[rVal + x][cVal - x] != playerNum:
+                        break
+                    if self.board[rVal + x][cVal - x] == playerNum and x == 3:
+                        return True
+
+                return False
+            elif rVal == 3:
+                for x in range(1, 4):
+                    if self.board[rVal - x][cVal - x] != playerNum:
+                        break
+                    if self.board[rVal - x][cVal - x] == playerNum and x == 3:
+                        return True
+
+                return False
+        elif rVal == 3 or rVal == 4 or rVal == 5:
+            for x in range(1, 4):
+                if self.board[rVal - x][cVal - x] != playerNum:
+                    break
+                if self.board[rVal - x][cVal - x] == playerNum and x == 3:
+                    return True
+
+            for x in range(1, 4):
+                if self.board[rVal + x][cVal - x] != playerNum:
+                    break
+                if self.board[rVal + x][cVal - x] == playerNum and x == 3:
+                    return True
+
+            return False
+        elif rVal == 0 or rVal == 1 or rVal == 2:
+            for x in range(1, 4):
+                if self.board[rVal + x][cVal - x] != playerNum:
+                    break
+                if self.board[rVal + x][cVal - x] == playerNum and x == 3:
+                    return True
+
+            for x in range(1, 4):
+                if self.board[rVal + x][cVal + x] != playerNum:
+                    break
+                if self.board[rVal + x][cVal + x] == playerNum and x == 3:
+                    return True
+
+            return False
+        return False
+
+
+ChineseCheckersStarts = [[0, 1, 2, 3, 4, 5, 6, 7, 8, 9], [10, 11, 12, 13, 23, 24, 25, 35, 36, 46],
+                         [65, 75, 76, 86, 87, 88, 98, 99, 100, 101], [111, 112, 113, 114, 115, 116, 117, 118, 119, 120],
+                         [74, 84, 85, 95, 96, 97, 107, 108, 109, 110], [19, 20, 21, 22, 32, 33, 34, 44, 45, 55]]
+CheckersStarts = [list(range(12)), list(range(20, 32))]
+
+
+def check(name, expected, result, context):
+    if result != expected:
+        print('%s disagrees with the old rules: %r != %r for %r' % (name, result, expected, context))
+        raise SystemExit(1)
+
+
+def timeChecks(positions, setStates, checkMove):
+    """Returns how many of the positions' moves checkMove gets through a second."""
+    elapsed = 0.0
+    numMoves = 0
+    for states, moves in positions:
+        setStates(states)
+        start = time.perf_counter()
+        for move in moves:
+            checkMove(*move)
+
+        elapsed += time.perf_counter() - start
+        numMoves += len(moves)
+
+    return numMoves / elapsed
+
+
+def chineseCheckersMoves(rng, board, square):
+    """Moves from the square: steps, chains of hops, and nonsense."""
+    moves = []
+    for x in board.getAdjacent(square):
+        if x is not None:
+            moves.append([square, x])
+
+    for i in range(4):
+        moveList = [square]
+        for j in range(rng.randrange(1, 5)):
+            hops = list(PicnicBitboards.ChineseCheckersBitboard.HopMasks[moveList[-1]])
+            if not hops:
+                break
+            moveList.append(rng.choice(hops))
+
+        moves.append(moveList)
+
+    moves.append([square] + [rng.randrange(121) for i in range(rng.randrange(0, 3))])
+    return moves
+
+
+def checkChineseCheckers(rng):
+    oldBoard = ChineseCheckersBoard.ChineseCheckersBoard()
+    old = OldChineseCheckersRules(oldBoard)
+    new = PicnicBitboards.ChineseCheckersBitboard()
+    startingMasks = [PicnicBitboards.makeMask(x) for x in ChineseCheckersStarts]
+    positions = []
+    for game in range(args.games):
+        oldBoard.setStates([0] * 121)
+        players = rng.sample(range(1, 7), rng.randrange(2, 7))
+        for playerNum in players:
+            for square in ChineseCheckersStarts[playerNum - 1]:
+                oldBoard.setState(square, playerNum)
+
+        new.setStates(oldBoard.getStates())
+        for turn in range(rng.randrange(1, 120)):
+            playerNum = players[turn % len(players)]
+            squares = [x for x in range(121) if oldBoard.getState(x) == playerNum]
+            moves = [[]]
+            # Pieces can land on others, so a player can run out of them.
+            for square in rng.sample(squares, min(3, len(squares))):
+                moves += chineseCheckersMoves(rng, oldBoard, square)
+
+            legalMoves = []
+            for moveList in moves:
+                isLegal = old.checkLegalMoves(moveList)
+                check('ChineseCheckersBitboard.isLegalMove', isLegal, new.isLegalMove(moveList), moveList)
+                if isLegal:
+                    legalMoves.append(moveList)
+
+            positions.append((oldBoard.getStates(), [(moveList,) for moveList in moves]))
+            if legalMoves:
+                moveList = rng.choice(legalMoves)
+                state = oldBoard.getState(moveList[0])
+                oldBoard.setState(moveList[0], 0)
+                oldBoard.setState(moveList[-1], state)
+                new.makeMove(moveList)
+                check('ChineseCheckersBitboard.makeMove', oldBoard.getStates(), new.getStates(), moveList)
+
+        # Every step and hop from every square, as the game ended.
+        for square in range(121):
+            for toSquare in range(121):
+                check('ChineseCheckersBitboard.isLegalStep',
+                      old.checkLegalMove(oldBoard.getSquare(square), oldBoard.getSquare(toSquare)),
+                      new.isLegalStep(square, toSquare), (square, toSquare))
+
+        for playerNum in range(1, 7):
+            checkSquares = [x for x in range(121) if oldBoard.getState(x) == playerNum]
+            for k in range(6):
+                check('ChineseCheckersBitboard.getPieces', checkSquares == ChineseCheckersStarts[k],
+                      new.getPieces(playerNum) == startingMasks[k], (playerNum, k))
+
+    # A game over, for requestWin.
+    for k in range(6):
+        new.setStates([int(x in ChineseCheckersStarts[k]) for x in range(121)])
+        check('ChineseCheckersBitboard.getPieces', True, new.getPieces(1) == startingMasks[k], k)
+
+    return (timeChecks(positions, oldBoard.setStates, old.checkLegalMoves),
+            timeChecks(positions, new.setStates, new.isLegalMove))
+
+
+def checkCheckers(rng):
+    oldBoard = CheckersBoard.CheckersBoard()
+    old = OldCheckersRules(oldBoard, 1)
+    new = PicnicBitboards.CheckersBitboard()
+    moveChecks = []
+    winChecks = []
+    for game in range(args.games):
+        if game % 2:
+            # Anything goes, for kings and crowded boards.
+            oldBoard.setStates([rng.choice((0, 0, 1, 2, 3, 4)) for x in range(32)])
+        else:
+            oldBoard.setStates([0] * 32)
+            for playerNum in (1, 2):
+                for square in CheckersStarts[playerNum - 1]:
+                    oldBoard.setState(square, playerNum)
+
+        new.setStates(oldBoard.getStates())
+        for turn in range(rng.randrange(1, 80)):
+            playerNum = turn % 2 + 1
+            old.playerNum = playerNum
+            moves = [[square, toSquare] for square in range(32) for toSquare in range(32)]
+            for i in range(20):
+                moveList = [rng.randrange(32)]
+                for j in range(rng.randrange(1, 4)):
+                    jumps = [x for x in oldBoard.getJumps(moveList[-1]) if x is not None]
+                    moveList.append(rng.choice(jumps) if jumps and rng.random() < 0.8 else rng.randrange(32))
+
+                moves.append(moveList)
+
+            legalMoves = []
+            for moveList in moves:
+                isLegal = old.checkLegalMoves(moveList) == True
+                check('CheckersBitboard.isLegalMove', isLegal, new.isLegalMove(moveList, playerNum), (playerNum, moveList))
+                if isLegal:
+                    legalMoves.append(moveList)
+
+            moveChecks.append((oldBoard.getStates(), [(moveList, playerNum) for moveList in rng.sample(moves, 50)]))
+            for winner in (1, 2):
+                old.playerNum = winner
+                check('CheckersBitboard.hasPiecesAndMoves', old.hasPeicesAndMoves(winner, winner + 2),
+                      new.hasPiecesAndMoves(winner), (winner, oldBoard.getStates()))
+
+            winChecks.append((oldBoard.getStates(), [(1,), (2,)]))
+            old.playerNum = playerNum
+            rng.shuffle(legalMoves)
+            for moveList in legalMoves:
+                states = oldBoard.getStates()
+                try:
+                    old.makeMove(moveList)
+                except ValueError:
+                    # A king's move to a square it can't jump to got
+                    # this far, and no further.
+                    oldBoard.setStates(states)
+                    continue
+
+                new.removeJumpedPieces(moveList)
+                state = new.getState(moveList[0])
+                new.setState(moveList[0], 0)
+                new.setState(moveList[-1], state)
+                check('CheckersBitboard.removeJumpedPieces', oldBoard.getStates(), new.getStates(), moveList)
+                break
+
+    def oldHasPiecesAndMoves(playerNum):
+        old.playerNum = playerNum
+        return old.hasPeicesAndMoves(playerNum, playerNum + 2)
+
+    def oldIsLegalMove(moveList, playerNum):
+        old.playerNum = playerNum
+        return old.checkLegalMoves(moveList)
+
+    return (timeChecks(moveChecks, oldBoard.setStates, oldIsLegalMove),
+            timeChecks(moveChecks, new.setStates, new.isLegalMove),
+            timeChecks(winChecks, oldBoard.setStates, oldHasPiecesAndMoves),
+            timeChecks(winChecks, new.setStates, new.hasPiecesAndMoves))
+
+
+def checkFindFour(rng):
+    old = OldFindFourRules([[0] * 7 for row in range(6)])
+    new = PicnicBitboards.FindFourBitboard()
+    wins = [(row, column, playerNum) for row in range(6) for column in range(7) for playerNum in (1, 2)]
+    positions = []
+    numRaised = 0
+    for game in range(args.games):
+        old.board = [[0] * 7 for row in range(6)]
+        new.clear()
+        if game % 2:
+            # Anything goes, for more lines of four.
+            old.board = [[rng.choice((0, 1, 2)) for column in range(7)] for row in range(6)]
+            new.setStates(old.board)
+            turns = 0
+        else:
+            turns = 42
+        for turn in range(turns + 1):
+            for row, column, playerNum in wins:
+                try:
+                    isWin = old.checkWin(row, column, playerNum)
+                except IndexError:
+                    # The old checks looked off the board here.
+                    isWin = False
+                    old.winDirection = None
+                    numRaised += 1
+
+                check('FindFourBitboard.getWinDirection', old.winDirection,
+                      new.getWinDirection(row, column, playerNum), (old.board, row, column, playerNum))
+
+            check('FindFourBitboard.isFull', old.checkForTie(), new.isFull(), old.board)
+            positions.append((old.board, wins))
+            columns = [x for x in range(7) if old.board[0][x] == 0]
+            if turn == turns or not columns:
+                break
+            column = rng.choice(columns)
+            for x in range(6):
+                if old.board[x][column] == 0:
+                    movePos = x
+
+            old.board = [list(row) for row in old.board]
+            old.board[movePos][column] = turn % 2 + 1
+            check('FindFourBitboard.dropPiece', movePos, new.dropPiece(column, turn % 2 + 1), column)
+            check('FindFourBitboard.getStates', old.board, new.getStates(), column)
+
+        for column in range(7):
+            check('FindFourBitboard.isColumnFull', old.board[0][column] != 0, new.isColumnFull(column), column)
+
+    def oldSetStates(board):
+        old.board = board
+
+    def oldCheckWin(row, column, playerNum):
+        try:
+            old.checkWin(row, column, playerNum)
+        except IndexError:
+            pass
+
+    return (numRaised, timeChecks(positions, oldSetStates, oldCheckWin),
+            timeChecks(positions, new.setStates, new.getWinDirection))
+
+
+rng = random.Random(args.seed)
+print('%-40s %14s %14s' % ('check', 'old per s', 'bitboard per s'))
+oldMoves, newMoves = checkChineseCheckers(rng)
+print('%-40s %14d %14d' % ('chinese checkers moves', oldMoves, newMoves))
+oldMoves, newMoves, oldWins, newWins = checkCheckers(rng)
+print('%-40s %14d %14d' % ('checkers moves', oldMoves, newMoves))
+print('%-40s %14d %14d' % ('checkers hasPiecesAndMoves', oldWins, newWins))
+numRaised, oldWins, newWins = checkFindFour(rng)
+print('%-40s %14d %14d' % ('find four wins', oldWins, newWins))
+print('%d random games of each match the old rules; the old find four checks looked off the board %d times.' % (
+    args.games, numRaised))
@@ -13,6 +13,7 @@ class RegenTreasurePlannerAI(TreasurePlannerAI.TreasurePlannerAI):
         self.taskName = '%s-%s' % (taskName, zoneId)
         self.spawnInterval = spawnInterval
         self.maxTreasures = maxTreasures
+        self.spawnTimer = None
 
     def start(self):
         self.preSpawnTreasures()
@@ -22,16 +23,17 @@ class RegenTreasurePlannerAI(TreasurePlannerAI.TreasurePlannerAI):
         self.stopSpawning()
 
     def stopSpawning(self):
-        taskMgr.remove(self.taskName)
+        if self.spawnTimer:
+            simbase.air.timerWheel.remove(self.spawnTimer)
+            self.spawnTimer = None
 
     def startSpawning(self):
         self.stopSpawning()
-        taskMgr.doMethodLater(self.spawnInterval, self.upkeepTreasurePopulation, self.taskName)
+        self.spawnTimer = simbase.air.timerWheel.addRecurring(self.spawnInterval, self.upkeepTreasurePopulation, 'treasureUpkeep', extraArgs=[None])
 
     def upkeepTreasurePopulation(self, task):
         if self.numTreasures() < self.maxTreasures:
             self.placeRandomTreasure()
-        taskMgr.doMethodLater(self.spawnInterval, self.upkeepTreasurePopulation, self.taskName)
         return Task.done
 
     def placeRandomTreasure(self):
@@ -12,10 +12,7 @@ class TreasurePlannerAI(DirectObject.DirectObject):
         self.treasureConstructor = treasureConstructor
         self.callback = callback
         self.initSpawnPoints()
-        self.treasures = []
-        for spawnPoint in self.spawnPoints:
-            self.treasures.append(None)
-
+        self.clearSlots()
         self.deleteTaskNames = set()
         self.lastRequestId = None
         self.requestStartTime = None
@@ -26,42 +23,53 @@ class TreasurePlannerAI(DirectObject.DirectObject):
         self.spawnPoints = []
         return self.spawnPoints
 
-    def numTreasures(self):
-        counter = 0
-        for treasure in self.treasures:
-            if treasure:
-                counter += 1
+    def clearSlots(self):
+        self.treasures = [None] * len(self.spawnPoints)
+        # The empty slots in no particular order, and where each one is in
+        # that list, so that a slot can be filled or emptied in constant
+        # time and a random one picked just as fast.
+        self.emptyIndices = list(range(len(self.spawnPoints)))
+        self.emptyPositions = list(range(len(self.spawnPoints)))
+        # treasure doId -> the slot it is in
+        self.treasureIndices = {}
+
+    def fillSlot(self, index, treasure):
+        oldTreasure = self.treasures[index]
+        if oldTreasure:
+            del self.treasureIndices[oldTreasure.getDoId()]
+        else:
+            # The last empty slot takes this one's place in the list.
+            position = self.emptyPositions[index]
+            lastIndex = self.emptyIndices.pop()
+            if lastIndex != index:
+                self.emptyIndices[position] = lastIndex
+                self.emptyPositions[lastIndex] = position
+            self.emptyPositions[index] = None
+        self.treasures[index] = treasure
+        self.treasureIndices[treasure.getDoId()] = index
 
-        return counter
+    def emptySlot(self, index):
+        treasure = self.treasures[index]
+        if treasure == None:
+            return
+        del self.treasureIndices[treasure.getDoId()]
+        self.treasures[index] = None
+        self.emptyPositions[index] = len(self.emptyIndices)
+        self.emptyIndices.append(index)
 
-    def countEmptySpawnPoints(self):
-        counter = 0
-        for treasure in self.treasures:
-            if treasure == None:
-                counter += 1
+    def numTreasures(self):
+        return len(self.treasureIndices)
 
-        return counter
+    def countEmptySpawnPoints(self):
+        return len(self.emptyIndices)
 
     def nthEmptyIndex(self, n):
-        emptyCounter = -1
-        spawnPointCounter = -1
-        while emptyCounter < n:
-            spawnPointCounter += 1
-            if self.treasures[spawnPointCounter] == None:
-                emptyCounter += 1
-
-        return spawnPointCounter
+        # No longer the nth empty slot in spawn point order, but still a
+        # different one for each n, which is all a random pick needs.
+        return self.emptyIndices[n]
 
     def findIndexOfTreasureId(self, treasureId):
-        counter = 0
-        for treasure in self.treasures:
-            if treasure == None:
-                pass
-            elif treasureId == treasure.getDoId():
-                return counter
-            counter += 1
-
-        return
+        return self.treasureIndices.get(treasureId)
 
     def placeAllTreasures(self):
         index = 0
@@ -72,9 +80,9 @@ class TreasurePlannerAI(DirectObject.DirectObject):
 
     def placeTreasure(self, index):
         spawnPoint = self.spawnPoints[index]
-        treasure = self.treasureConstructor(simbase.air, self, spawnPoint[0], spawnPoint[1], spawnPoint[2])
-        treasure.generateWithRequired(self.zoneId)
-        self.treasures[index] = treasure
+        treasure = simbase.air.doPool.acquire(self.treasureConstructor, self.zoneId, self, spawnPoint[0], spawnPoint[1], spawnPoint[2])
+        simbase.air.doPool.generate(treasure, self.zoneId)
+        self.fillSlot(index, treasure)
 
     def grabAttempt(self, avId, treasureId):
         if self.lastRequestId == avId:
@@ -103,7 +111,7 @@ class TreasurePlannerAI(DirectObject.DirectObject):
             else:
                 treasure = self.treasures[index]
                 if treasure.validAvatar(av):
-                    self.treasures[index] = None
+                    self.emptySlot(index)
                     if self.callback:
                         self.callback(avId)
                     treasure.d_setGrab(avId)
@@ -120,22 +128,19 @@ class TreasurePlannerAI(DirectObject.DirectObject):
     def deleteAllTreasuresNow(self):
         for treasure in self.treasures:
             if treasure:
-                treasure.requestDelete()
+                simbase.air.doPool.release(treasure)
 
         for taskName in self.deleteTaskNames:
             tasks = taskMgr.getTasksNamed(taskName)
             if len(tasks):
                 treasure = tasks[0].getArgs()[0]
-                treasure.requestDelete()
+                simbase.air.doPool.release(treasure)
                 taskMgr.remove(taskName)
 
         self.deleteTaskNames = set()
-        self.treasures = []
-        for spawnPoint in self.spawnPoints:
-            self.treasures.append(None)
-
+        self.clearSlots()
         return
 
     def __deleteTreasureNow(self, treasure, taskName):
-        treasure.requestDelete()
+        simbase.air.doPool.release(treasure)
         self.deleteTaskNames.remove(taskName)
@@ -0,0 +1,240 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import math
+import random
+import time
+
+parser = argparse.ArgumentParser(description='Open Toontown - treasure planner slot benchmark')
+parser.add_argument('--spawn-points', default='21,500,5000', help='Comma separated spawn point counts to benchmark.')
+parser.add_argument('--cycles', type=int, default=20000,
+                    help='Number of times a treasure is placed and another grabbed per spawn point count.')
+parser.add_argument('--checks', type=int, default=5000,
+                    help='Number of random placements, grabs and clears after which the slots are checked.')
+parser.add_argument('--draws', type=int, default=200000, help='Number of random spawn points drawn to check they are uniform.')
+parser.add_argument('--seed', type=int, default=0, help='Seed of the treasures coming and going.')
+args = parser.parse_args()
+
+
+class game:
+    name = 'toontown'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from toontown.ai.DistributedObjectPoolAI import DistributedObjectPoolAI
+from toontown.safezone import DistributedTreasureAI, RegenTreasurePlannerAI
+
+
+class BenchmarkDClasses(dict):
+
+    def __missing__(self, className):
+        return className
+
+
+class BenchmarkAir:
+
+    def __init__(self):
+        self.doId2do = {}
+        self.dclassesByName = BenchmarkDClasses()
+        self.districtId = 1
+        self.nextDoId = 1000
+        self.doPool = DistributedObjectPoolAI(self)
+
+    def generateWithRequired(self, do, parentId, zoneId, optionalFields=[]):
+        do.doId = self.nextDoId
+        self.nextDoId += 1
+        do.parentId = parentId
+        do.zoneId = zoneId
+
+    def requestDelete(self, do):
+        do.delete()
+
+    def deallocateChannel(self, doId):
+        pass
+
+    def sendUpdate(self, do, fieldName, args):
+        pass
+
+    def writeServerEvent(self, eventType, who, description):
+        pass
+
+
+class BenchmarkTreasurePlanner(RegenTreasurePlannerAI.RegenTreasurePlannerAI):
+    """Keeps up to half as many treasures as it has spawn points, like the flying treasure planners."""
+
+    def __init__(self, numSpawnPoints):
+        self.numSpawnPoints = numSpawnPoints
+        RegenTreasurePlannerAI.RegenTreasurePlannerAI.__init__(self, 1000, DistributedTreasureAI.DistributedTreasureAI,
+                                                               'BenchmarkTreasurePlanner', 20,
+                                                               max(numSpawnPoints // 2, 1))
+
+    def initSpawnPoints(self):
+        self.spawnPoints = [(i, 0, 0) for i in range(self.numSpawnPoints)]
+        return self.spawnPoints
+
+
+class ScanningTreasurePlanner(BenchmarkTreasurePlanner):
+    """The slot lookups as they were, scanning every spawn point."""
+
+    def numTreasures(self):
+        counter = 0
+        for treasure in self.treasures:
+            if treasure:
+                counter += 1
+
+        return counter
+
+    def countEmptySpawnPoints(self):
+        counter = 0
+        for treasure in self.treasures:
+            if treasure == None:
+                counter += 1
+
+        return counter
+
+    def nthEmptyIndex(self, n):
+        emptyCounter = -1
+        spawnPointCounter = -1
+        while emptyCounter < n:
+            spawnPointCounter += 1
+            if self.treasures[spawnPointCounter] == None:
+                emptyCounter += 1
+
+        return spawnPointCounter
+
+    def findIndexOfTreasureId(self, treasureId):
+        counter = 0
+        for treasure in self.treasures:
+            if treasure == None:
+                pass
+            elif treasureId == treasure.getDoId():
+                return counter
+            counter += 1
+
+        return
+
+
+def checkSlots(planner):
+    """Returns what is wrong with the planner's slot index, checked against its slots."""
+    problems = []
+    empty = [index for index in range(len(planner.treasures)) if planner.treasures[index] == None]
+    if sorted(planner.emptyIndices) != empty:
+        problems.append('empty slots %s, not %s' % (sorted(planner.emptyIndices), empty))
+    for position in range(len(planner.emptyIndices)):
+        if planner.emptyPositions[planner.emptyIndices[position]] != position:
+            problems.append('empty slot %d is not at %d' % (planner.emptyIndices[position], position))
+    treasureIndices = dict((planner.treasures[index].getDoId(), index) for index in range(len(planner.treasures))
+                           if planner.treasures[index] != None)
+    if planner.treasureIndices != treasureIndices:
+        problems.append('treasure slots %s, not %s' % (planner.treasureIndices, treasureIndices))
+    for method in ('numTreasures', 'countEmptySpawnPoints'):
+        if getattr(planner, method)() != getattr(ScanningTreasurePlanner, method)(planner):
+            problems.append('%s is wrong' % method)
+    for treasureId in list(treasureIndices.keys()) + [1]:
+        if planner.findIndexOfTreasureId(treasureId) != ScanningTreasurePlanner.findIndexOfTreasureId(planner, treasureId):
+            problems.append('treasure %d is not found' % treasureId)
+
+    return problems
+
+
+def check(numSpawnPoints, rng):
+    """
+    Places, overwrites and grabs treasures at random, and now and then
+    clears them all, checking the slot index after every step.
+    """
+    planner = BenchmarkTreasurePlanner(numSpawnPoints)
+    for i in range(args.checks):
+        r = rng.random()
+        if r < 0.4:
+            if planner.countEmptySpawnPoints():
+                planner.placeRandomTreasure()
+        elif r < 0.5:
+            planner.placeTreasure(rng.randrange(numSpawnPoints))
+        elif r < 0.95:
+            if planner.treasureIndices:
+                treasureId = rng.choice(list(planner.treasureIndices.keys()))
+            else:
+                treasureId = 1
+            planner.grabAttempt(simbase.air.avId, treasureId)
+        else:
+            planner.deleteAllTreasuresNow()
+        problems = checkSlots(planner)
+        if problems:
+            print('With %d spawn points, after %d steps: %s' % (numSpawnPoints, i + 1, '; '.join(problems)))
+            raise SystemExit(1)
+
+    planner.deleteAllTreasuresNow()
+
+
+def drawSpread(plannerClass, numSpawnPoints, rng):
+    """
+    Returns the chi-square statistic of the spawn points drawn for a
+    random treasure, from a planner with every third slot filled, and
+    the number of empty slots it draws from.
+    """
+    planner = plannerClass(numSpawnPoints)
+    for index in range(0, numSpawnPoints, 3):
+        planner.placeTreasure(index)
+
+    counts = {}
+    numEmpty = planner.countEmptySpawnPoints()
+    for i in range(args.draws):
+        index = planner.nthEmptyIndex(rng.randrange(numEmpty))
+        counts[index] = counts.get(index, 0) + 1
+
+    expected = float(args.draws) / numEmpty
+    chiSquare = sum([(counts.get(index, 0) - expected) ** 2 / expected for index in planner.emptyIndices])
+    planner.deleteAllTreasuresNow()
+    if len(counts) != numEmpty:
+        chiSquare = float('inf')
+    return chiSquare, numEmpty
+
+
+def run(plannerClass, numSpawnPoints, rng):
+    """Returns the us it takes to keep the planner's treasures up and have one grabbed."""
+    planner = plannerClass(numSpawnPoints)
+    planner.preSpawnTreasures()
+    elapsed = 0.0
+    for i in range(args.cycles):
+        index = rng.randrange(numSpawnPoints)
+        treasure = planner.treasures[index]
+        start = time.perf_counter()
+        planner.upkeepTreasurePopulation(None)
+        if treasure:
+            planner.grabAttempt(simbase.air.avId, treasure.getDoId())
+        elapsed += time.perf_counter() - start
+
+    planner.deleteAllTreasuresNow()
+    return elapsed / args.cycles * 1000000.0
+
+
+simbase.air = BenchmarkAir()
+simbase.air.avId = 100000001
+simbase.air.doId2do[simbase.air.avId] = simbase.air
+rng = random.Random(args.seed)
+random.seed(args.seed)
+spawnPointCounts = [int(x) for x in args.spawn_points.split(',')]
+for numSpawnPoints in spawnPointCounts:
+    check(numSpawnPoints, rng)
+
+print('Slot index matches the slots after each of %d random steps.' % args.checks)
+print('%12s %12s %16s %16s' % ('spawn points', 'empty', 'scanning chi^2', 'indexed chi^2'))
+for numSpawnPoints in spawnPointCounts:
+    oldChiSquare, numEmpty = drawSpread(ScanningTreasurePlanner, numSpawnPoints, rng)
+    newChiSquare, numEmpty = drawSpread(BenchmarkTreasurePlanner, numSpawnPoints, rng)
+    print('%12d %12d %16.1f %16.1f' % (numSpawnPoints, numEmpty, oldChiSquare, newChiSquare))
+    # Far out in the tail of the chi-square distribution with numEmpty - 1
+    # degrees of freedom.
+    if newChiSquare > numEmpty + 6 * math.sqrt(2 * numEmpty):
+        print('Random treasures are not spread evenly over the empty spawn points.')
+        raise SystemExit(1)
+
+print('%12s %12s %14s %14s' % ('spawn points', 'cycles', 'scanning us', 'indexed us'))
+for numSpawnPoints in spawnPointCounts:
+    oldTime = run(ScanningTreasurePlanner, numSpawnPoints, rng)
+    newTime = run(BenchmarkTreasurePlanner, numSpawnPoints, rng)
+    print('%12d %12d %14.1f %14.1f' % (numSpawnPoints, args.cycles, oldTime, newTime))
@@ -838,6 +838,67 @@ class Fireworks(MagicWord):
             del self.fireworkShows[zoneId]
 
 
+class TimerStats(MagicWord):
+    aliases = ["timers", "timerwheel"]
+    desc = "Shows how many shared AI timers fired per subsystem and how long they took."
+    execLocation = MagicWordConfig.EXEC_LOC_SERVER
+    accessLevel = 'ADMIN'
+    arguments = [("reset", int, False, 0)]
+
+    def handleWord(self, invoker, avId, toon, *args):
+        stats = self.air.timerWheel.formatStats()
+        if args[0]:
+            self.air.timerWheel.resetStats()
+        return stats
+
+
+class QuestInteractStats(MagicWord):
+    aliases = ["queststats"]
+    desc = "Shows the latency histogram of NPC quest interactions."
+    execLocation = MagicWordConfig.EXEC_LOC_SERVER
+    accessLevel = 'ADMIN'
+    arguments = [("reset", int, False, 0)]
+
+    def handleWord(self, invoker, avId, toon, *args):
+        stats = self.air.questManager.formatInteractStats()
+        if args[0]:
+            self.air.questManager.resetInteractStats()
+        return stats
+
+
+class FrameStats(MagicWord):
+    desc = "Shows the frame time and sleep time histograms of this district's frame loop."
+    execLocation = MagicWordConfig.EXEC_LOC_SERVER
+    accessLevel = 'ADMIN'
+    arguments = [("reset", int, False, 0)]
+
+    def handleWord(self, invoker, avId, toon, *args):
+        stats = simbase.formatFrameStats()
+        if args[0]:
+            simbase.resetFrameStats()
+        return stats
+
+
+class SuitPathBench(MagicWord):
+    aliases = ["suitbench"]
+    desc = "Benchmarks suit destination picking on the target's street."
+    advancedDesc = "This Magic Word fills the target's street with up to the given number of Cogs, then times " \
+                   "chooseDestination with the full suit path scan and with the path reservation index."
+    execLocation = MagicWordConfig.EXEC_LOC_SERVER
+    accessLevel = 'ADMIN'
+    arguments = [("numSuits", int, False, 200), ("iterations", int, False, 500)]
+
+    def handleWord(self, invoker, avId, toon, *args):
+        from toontown.hood import ZoneUtil
+
+        streetId = ZoneUtil.getBranchZone(toon.zoneId)
+        sp = self.air.suitPlanners.get(streetId)
+        if not sp:
+            return "{} is not on a street with Cogs.".format(toon.getName())
+
+        return sp.benchmarkChooseDestination(args[0], args[1])
+
+
 # Instantiate all classes defined here to register them.
 # A bit hacky, but better than the old system
 for item in list(globals().values()):
@@ -0,0 +1,267 @@
+from panda3d.core import *
+from direct.directnotify import DirectNotifyGlobal
+import math
+
+
+class CashbotBossFeelerField:
+    """
+    What the goons in the CFO's arena feel with their feelers, worked
+    out on the floor of the arena rather than by a collision traversal
+    of the whole scene for every step a goon takes.
+
+    The walls around the CFO and the cranes' goon shields stand still
+    for the whole of battle three, so they are read out of their
+    collision nodes once, when the field is made, and the floor is
+    divided into cells that each know which of them a feeler from
+    inside the cell can reach.  The safes and the other goons move, so
+    they are read as they stand each time a goon feels its way.  Every
+    obstacle is tested against every feeler the way the collision
+    system tests a CollisionSegment, quirks and all, so a goon walks
+    exactly where it walked before.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('CashbotBossFeelerField')
+    CellSize = 4.0
+    MaxHeadings = 360
+
+    def __init__(self, boss):
+        self.boss = boss
+        self.spheres = []
+        self.__addSpheres(boss.walls)
+        for crane in boss.cranes or []:
+            if crane.goonShield.hasParent():
+                self.__addSpheres(crane.goonShield)
+
+        self.safes = []
+        for safe in boss.safes or []:
+            solid = safe.sphere.node().getSolid(0)
+            self.safes.append((safe, solid.getRadius()))
+
+        self.cells = {}
+        self.feelers = None
+        self.headings = {}
+
+    def __addSpheres(self, nodePath):
+        node = nodePath.node()
+        for i in range(node.getNumSolids()):
+            solid = node.getSolid(i)
+            if isinstance(solid, CollisionInvSphere):
+                inverse = 1
+            elif isinstance(solid, CollisionSphere):
+                inverse = 0
+            else:
+                self.notify.warning('Ignoring %s in %s' % (solid.getClassType().getName(), nodePath))
+                continue
+            center = self.boss.scene.getRelativePoint(nodePath, solid.getCenter())
+            self.spheres.append((center[0], center[1], center[2], solid.getRadius(), inverse))
+
+    def __getCellSpheres(self, x, y, end):
+        """Returns the walls and shields a feeler from the cell containing (x, y) can reach."""
+        cell = (int(math.floor(x / self.CellSize)), int(math.floor(y / self.CellSize)), end)
+        spheres = self.cells.get(cell)
+        if spheres == None:
+            centerX = (cell[0] + 0.5) * self.CellSize
+            centerY = (cell[1] + 0.5) * self.CellSize
+            reach = end + self.CellSize * 0.71
+            spheres = []
+            for sphere in self.spheres:
+                cx, cy, cz, radius, inverse = sphere
+                dist = math.sqrt((centerX - cx) ** 2 + (centerY - cy) ** 2)
+                if inverse:
+                    if dist + reach >= radius:
+                        spheres.append(sphere)
+                elif dist < reach + radius:
+                    spheres.append(sphere)
+
+            spheres = tuple(spheres)
+            self.cells[cell] = spheres
+        return spheres
+
+    def feel(self, goon, feelers, start, end):
+        """
+        Returns how far from the goon each of its feelers first touches
+        something, or end where it touches nothing.  feelers is a list
+        of (x, y) unit vectors in the goon's space, each feeling from
+        start to end along it.  Goons walk upright on the floor, so
+        only the goon's position and heading matter.
+        """
+        x = goon.getX()
+        y = goon.getY()
+        z = goon.getZ()
+        if feelers is not self.feelers:
+            self.feelers = feelers
+            self.headings = {}
+        # Goons turn in steps, so the same few headings come up again
+        # and again.
+        h = goon.getH()
+        dirs = self.headings.get(h)
+        if dirs == None:
+            rad = deg2Rad(h)
+            c = math.cos(rad)
+            s = math.sin(rad)
+            dirs = tuple([(fx * c - fy * s, fx * s + fy * c) for fx, fy in feelers])
+            if len(self.headings) >= self.MaxHeadings:
+                self.headings = {}
+            self.headings[h] = dirs
+        # Like the collision system, we keep the touch nearest the start
+        # of each feeler, and report how far it is from the goon.
+        keys = [end] * len(dirs)
+        hits = [end] * len(dirs)
+        for cx, cy, cz, radius, inverse in self.__getCellSpheres(x, y, end):
+            self.__feelSphere(x, y, z, dirs, keys, hits, start, end, cx, cy, cz, radius, inverse)
+
+        for safe, radius in self.safes:
+            if safe.isStashed():
+                continue
+            cx = safe.getX()
+            cy = safe.getY()
+            if (cx - x) * (cx - x) + (cy - y) * (cy - y) < (end + radius) * (end + radius):
+                self.__feelSphere(x, y, z, dirs, keys, hits, start, end, cx, cy, safe.getZ(), radius, 0)
+
+        for other in self.boss.goons or []:
+            if other is goon or other.tubeNodePath.isStashed():
+                continue
+            ax = other.getX()
+            ay = other.getY()
+            if other.isWalking:
+                bx = other.target[0]
+                by = other.target[1]
+            else:
+                bx = ax
+                by = ay
+            radius = other.tube.getRadius()
+            # Skip the tubes out of reach of every feeler.
+            mx = (ax + bx) * 0.5 - x
+            my = (ay + by) * 0.5 - y
+            reach = end + radius + math.sqrt((bx - ax) * (bx - ax) + (by - ay) * (by - ay)) * 0.5
+            if mx * mx + my * my < reach * reach:
+                self.__feelTube(x, y, z, dirs, keys, hits, start, end, ax, ay, bx, by, other.getZ(), radius)
+
+        return hits
+
+    def __feelSphere(self, x, y, z, dirs, keys, hits, start, end, cx, cy, cz, radius, inverse):
+        r2 = radius * radius - (z - cz) * (z - cz)
+        dx = x - cx
+        dy = y - cy
+        dd = dx * dx + dy * dy
+        if inverse:
+            if r2 > 0 and math.sqrt(dd) + end < math.sqrt(r2):
+                # Every feeler is well inside.
+                return
+        elif r2 <= 0 or dd >= (end + math.sqrt(r2)) ** 2:
+            return
+        q = dd - r2
+        for i in range(len(dirs)):
+            ux, uy = dirs[i]
+            b = dx * ux + dy * uy
+            disc = b * b - q
+            if inverse:
+                # An inverse sphere is touched where the feeler leaves
+                # it, or at the feeler's start if it starts outside;
+                # except that a feeler coming in from outside and
+                # ending inside touches it where it comes in.
+                if disc <= 0:
+                    t = start
+                else:
+                    root = math.sqrt(disc)
+                    t = -b + root
+                    if t <= end:
+                        t = max(t, start)
+                    elif -b - root < start:
+                        continue
+                    else:
+                        t = min(-b - root, end)
+            else:
+                if disc <= 0:
+                    continue
+                root = math.sqrt(disc)
+                t = -b - root
+                if t > end or -b + root < start:
+                    continue
+                t = max(t, start)
+            if t - start < keys[i]:
+                keys[i] = t - start
+                hits[i] = t
+
+    def __feelTube(self, x, y, z, dirs, keys, hits, start, end, ax, ay, bx, by, tz, radius):
+        dz = z - tz
+        r2 = radius * radius - dz * dz
+        if r2 <= 0:
+            return
+        r = math.sqrt(r2)
+        vx = bx - ax
+        vy = by - ay
+        length = math.sqrt(vx * vx + vy * vy)
+        dx = x - ax
+        dy = y - ay
+        ex = dx - vx
+        ey = dy - vy
+        if length > 0:
+            # The goon's place across and along the tube.
+            wx = vx / length
+            wy = vy / length
+            across = dx * -wy + dy * wx
+            along = dx * wx + dy * wy
+        # From outside the circle around the whole tube, only the
+        # feelers pointing into the circle can touch it.
+        mx = dx - vx * 0.5
+        my = dy - vy * 0.5
+        reach = length * 0.5 + r
+        q = mx * mx + my * my - reach * reach
+        for i in range(len(dirs)):
+            ux, uy = dirs[i]
+            if q > 0:
+                b = mx * ux + my * uy
+                if b >= 0 or b * b <= q:
+                    continue
+            if length > 0:
+                du = ux * -wy + uy * wx
+                pu = ux * wx + uy * wy
+                startAcross = across + du * start
+                startAlong = along + pu * start
+                p = min(max(startAlong, 0.0), length)
+            else:
+                du = 0
+                startAcross = 0
+                p = 0.0
+            sx = dx + ux * start
+            sy = dy + uy * start
+            px = vx * p / length if length > 0 else 0.0
+            py = vy * p / length if length > 0 else 0.0
+            e2 = (sx - px) * (sx - px) + (sy - py) * (sy - py)
+            if e2 < r2:
+                # A feeler that starts inside a tube touches it at the
+                # nearest point of the tube's surface.
+                e = math.sqrt(e2 + dz * dz)
+                if e == 0:
+                    continue
+                k = radius / e
+                hx = px - dx + (sx - px) * k
+                hy = py - dy + (sy - py) * k
+                hz = dz * k - dz
+                key = radius - e
+                if key < keys[i]:
+                    keys[i] = key
+                    hits[i] = math.sqrt(hx * hx + hy * hy + hz * hz)
+                continue
+            # Otherwise it touches the tube where it first comes into
+            # either end cap, or the straight part between them.
+            t = end + 1
+            b = dx * ux + dy * uy
+            disc = b * b - dx * dx - dy * dy + r2
+            if disc > 0:
+                t = -b - math.sqrt(disc)
+            b = ex * ux + ey * uy
+            disc = b * b - ex * ex - ey * ey + r2
+            if disc > 0 and -b - math.sqrt(disc) < t:
+                t = -b - math.sqrt(disc)
+            if startAcross > r and du < 0:
+                side = (r - across) / du
+            elif startAcross < -r and du > 0:
+                side = (-r - across) / du
+            else:
+                side = t
+            if side < t and 0 <= along + pu * side <= length:
+                t = side
+            if start <= t <= end and t - start < keys[i]:
+                keys[i] = t - start
+                hits[i] = t
@@ -0,0 +1,282 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import math
+import random
+import time
+
+parser = argparse.ArgumentParser(description='Open Toontown - CFO goon direction choice benchmark')
+parser.add_argument('--goons', default='8,16', help='Comma separated goon counts to benchmark.')
+parser.add_argument('--decisions', type=int, default=5000, help='Number of directions chosen per goon count.')
+parser.add_argument('--checks', type=int, default=200,
+                    help='Number of scattered arenas every goon feels its way around both ways.')
+parser.add_argument('--seed', type=int, default=0, help='Seed of the goons and safes moving around.')
+parser.add_argument('--tolerance', type=float, default=0.01,
+                    help='Largest allowed difference between a traversed and a felt feeler; '
+                         'the collision system works in single precision.')
+args = parser.parse_args()
+
+
+class game:
+    name = 'toontown'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from direct.showbase import PythonUtil
+from toontown.coghq import DistributedCashbotBossCraneAI, DistributedCashbotBossSafeAI
+from toontown.suit import DistributedCashbotBossAI, DistributedCashbotBossGoonAI
+from toontown.toonbase import ToontownGlobals
+
+
+class BenchmarkDClasses(dict):
+
+    def __missing__(self, className):
+        return className
+
+
+class BenchmarkAir:
+
+    def __init__(self):
+        self.doId2do = {}
+        self.dclassesByName = BenchmarkDClasses()
+
+
+class TraversedFeelers:
+    """
+    A goon's feelers as they were: collision segments, traversed through
+    the whole scene.  The goons' tubes change shape without their
+    collision nodes knowing, so their bounds are brought up to date
+    first; the goons used to be felt through whatever bounds their
+    tubes had when they were first traversed.
+    """
+
+    def __init__(self, goon):
+        self.goon = goon
+        cn = CollisionNode('feelerNode')
+        self.feelers = []
+        for heading, weight in goon.directionTable:
+            rad = deg2Rad(heading)
+            x = -math.sin(rad)
+            y = math.cos(rad)
+            seg = CollisionSegment(x * goon.feelerStart, y * goon.feelerStart, 0, x * goon.feelerLength,
+                                   y * goon.feelerLength, 0)
+            cn.addSolid(seg)
+            self.feelers.append(seg)
+
+        cn.setIntoCollideMask(BitMask32(0))
+        self.feelerNodePath = goon.attachNewNode(cn)
+        self.cTrav = CollisionTraverser('goon')
+        self.cQueue = CollisionHandlerQueue()
+        self.cTrav.addCollider(self.feelerNodePath, self.cQueue)
+
+    def feel(self, staleBounds=False):
+        goon = self.goon
+        if not staleBounds:
+            for other in goon.boss.goons:
+                other.tubeNode.markInternalBoundsStale()
+
+        goon.tubeNode.setIntoCollideMask(BitMask32(0))
+        self.cTrav.traverse(goon.boss.scene)
+        goon.tubeNode.setIntoCollideMask(CollisionNode.getDefaultCollideMask())
+        entries = {}
+        self.cQueue.sortEntries()
+        for i in range(self.cQueue.getNumEntries() - 1, -1, -1):
+            entry = self.cQueue.getEntry(i)
+            dist = Vec3(entry.getSurfacePoint(goon)).length()
+            if dist < 1.2:
+                dist = 0
+            entries[entry.getFrom()] = dist
+
+        return [entries.get(seg, goon.feelerLength) for seg in self.feelers]
+
+    def chooseDirection(self, staleBounds=False):
+        """DistributedCashbotBossGoonAI.__chooseDirection as it was."""
+        goon = self.goon
+        hits = self.feel(staleBounds)
+        netScore = 0
+        scoreTable = []
+        for i in range(len(goon.directionTable)):
+            heading, weight = goon.directionTable[i]
+            score = hits[i] * weight
+            netScore += score
+            scoreTable.append(score)
+
+        if netScore == 0:
+            return None
+        s = random.uniform(0, netScore)
+        for i in range(len(goon.directionTable)):
+            s -= scoreTable[i]
+            if s <= 0:
+                heading, weight = goon.directionTable[i]
+                return (heading, hits[i])
+
+        return (0, goon.legLength)
+
+
+def feltHits(goon):
+    hits = goon.boss.getFeelerField().feel(goon, goon.feelers, goon.feelerStart, goon.feelerLength)
+    return [0 if hit < 1.2 else hit for hit in hits]
+
+
+def emerge(goon, boss, rng):
+    """Sends the goon out from under the CFO, as enterEmergeA and enterEmergeB do."""
+    goon.setPosHpr(boss.getPos(), VBase3(rng.choice((0, 180)), 0, 0))
+    walk(goon, boss, 0, 15)
+
+
+def walk(goon, boss, heading, dist):
+    """Starts the goon walking, as __chooseTarget and __startWalk do."""
+    goon.setH(PythonUtil.reduceAngle(goon.getH() + heading))
+    goon.target = boss.scene.getRelativePoint(goon, Point3(0, dist, 0))
+    goon.tube.setPointB(goon.getRelativePoint(boss.scene, goon.target))
+    goon.isWalking = 1
+
+
+def arrive(goon):
+    """Stops the goon where it was walking to, as __stopWalk does."""
+    goon.setPos(goon.target)
+    goon.tube.setPointB(0, 0, 0)
+    goon.isWalking = 0
+
+
+def moveSafe(safe, rng):
+    """Drops the safe somewhere around the arena, or puts it back."""
+    if rng.random() < 0.2:
+        safe.resetToInitialPosition()
+        return
+    angle = rng.uniform(0, 2 * math.pi)
+    dist = rng.uniform(12, 40)
+    x, y = ToontownGlobals.CashbotBossBattleThreePosHpr[:2]
+    safe.setPosHpr(x + dist * math.cos(angle), y + dist * math.sin(angle), rng.choice((0, 0, 0, 4, 10)),
+                   rng.uniform(0, 360), 0, 0)
+
+
+def scatter(boss, rng):
+    """Puts every goon anywhere in the arena facing any way, most of them walking, and moves the safes."""
+    x, y = ToontownGlobals.CashbotBossBattleThreePosHpr[:2]
+    for goon in boss.goons:
+        angle = rng.uniform(0, 2 * math.pi)
+        dist = rng.uniform(10, 44)
+        goon.setPosHpr(x + dist * math.cos(angle), y + dist * math.sin(angle), 0, rng.uniform(-180, 180), 0, 0)
+        goon.target = goon.getPos()
+        arrive(goon)
+        if rng.random() < 0.7:
+            walk(goon, boss, 0, rng.uniform(0, goon.legLength))
+
+    for safe in boss.safes[1:]:
+        moveSafe(safe, rng)
+
+
+def makeBoss(air):
+    boss = DistributedCashbotBossAI.DistributedCashbotBossAI(air)
+    boss.setPosHpr(*ToontownGlobals.CashbotBossBattleThreePosHpr)
+    boss.cranes = []
+    for index in range(len(ToontownGlobals.CashbotBossCranePosHprs)):
+        crane = DistributedCashbotBossCraneAI.DistributedCashbotBossCraneAI(air, boss, index)
+        crane.goonShield.reparentTo(boss.scene)
+        boss.cranes.append(crane)
+
+    boss.safes = []
+    for index in range(len(ToontownGlobals.CashbotBossSafePosHprs)):
+        safe = DistributedCashbotBossSafeAI.DistributedCashbotBossSafeAI(air, boss, index)
+        safe.resetToInitialPosition()
+        if index == 0:
+            safe.stash()
+        boss.safes.append(safe)
+
+    boss.goons = []
+    return boss
+
+
+def makeGoons(boss, numGoons, rng):
+    traversed = {}
+    for i in range(numGoons):
+        goon = DistributedCashbotBossGoonAI.DistributedCashbotBossGoonAI(boss.air, boss)
+        goon.doId = i + 1
+        boss.goons.append(goon)
+        traversed[goon] = TraversedFeelers(goon)
+        emerge(goon, boss, rng)
+
+    return traversed
+
+
+def check(numGoons, rng):
+    """
+    Returns the largest difference between a traversed and a felt
+    feeler, over every goon in a number of scattered arenas.
+    """
+    boss = makeBoss(BenchmarkAir())
+    traversed = makeGoons(boss, numGoons, rng)
+    worst = 0.0
+    for i in range(args.checks):
+        scatter(boss, rng)
+        for goon in boss.goons:
+            for oldHit, newHit in zip(traversed[goon].feel(), feltHits(goon)):
+                worst = max(worst, abs(oldHit - newHit))
+
+    return worst
+
+
+def run(numGoons, rng):
+    """
+    Walks the goons around the arena, each choosing its next direction
+    the old way and the new way in turn.  Returns the us each way took
+    per direction, and how many directions came out differently.
+    Goons walk the same few lines out from under the CFO and turn in
+    steps of 10 degrees, so now and then a feeler touches two things
+    exactly as far away, and which one the traversal finds first is
+    down to rounding.
+    """
+    boss = makeBoss(BenchmarkAir())
+    traversed = makeGoons(boss, numGoons, rng)
+    oldTime = 0.0
+    newTime = 0.0
+    differences = 0
+    chooseDirection = DistributedCashbotBossGoonAI.DistributedCashbotBossGoonAI._DistributedCashbotBossGoonAI__chooseDirection
+    for decision in range(args.decisions):
+        if rng.random() < 0.05:
+            moveSafe(rng.choice(boss.safes[1:]), rng)
+        goon = rng.choice(boss.goons)
+        arrive(goon)
+        old = traversed[goon]
+        state = random.getstate()
+        start = time.perf_counter()
+        old.chooseDirection(staleBounds=True)
+        oldTime += time.perf_counter() - start
+        random.setstate(state)
+        oldDirection = old.chooseDirection()
+        random.setstate(state)
+        start = time.perf_counter()
+        newDirection = chooseDirection(goon)
+        newTime += time.perf_counter() - start
+        if (oldDirection == None) != (newDirection == None) or \
+           oldDirection and (oldDirection[0] != newDirection[0] or
+                             abs(oldDirection[1] - newDirection[1]) > args.tolerance):
+            differences += 1
+        if newDirection == None:
+            emerge(goon, boss, rng)
+        else:
+            walk(goon, boss, newDirection[0], min(newDirection[1], goon.legLength))
+
+    return oldTime / args.decisions * 1000000.0, newTime / args.decisions * 1000000.0, differences
+
+
+DistributedCashbotBossGoonAI.DistributedCashbotBossGoonAI.notify.setInfo(0)
+rng = random.Random(args.seed)
+random.seed(args.seed)
+goonCounts = [int(x) for x in args.goons.split(',')]
+for numGoons in goonCounts:
+    worst = check(numGoons, rng)
+    if worst > args.tolerance:
+        print('With %d goons, the felt feelers differ from the traversed ones by %s.' % (numGoons, worst))
+        raise SystemExit(1)
+
+print('Felt feelers match the traversed ones within %s in %d scattered arenas.' % (args.tolerance, args.checks))
+print('%8s %10s %14s %14s %12s' % ('goons', 'decisions', 'traversed us', 'felt us', 'different'))
+for numGoons in goonCounts:
+    oldTime, newTime, differences = run(numGoons, rng)
+    print('%8d %10d %14.1f %14.1f %12d' % (numGoons, args.decisions, oldTime, newTime, differences))
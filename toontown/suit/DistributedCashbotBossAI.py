@@ -4,6 +4,7 @@ from toontown.toonbase import ToontownGlobals
 from toontown.coghq import DistributedCashbotBossCraneAI
 from toontown.coghq import DistributedCashbotBossSafeAI
 from toontown.suit import DistributedCashbotBossGoonAI
+from toontown.suit import CashbotBossFeelerField
 from toontown.coghq import DistributedCashbotBossTreasureAI
 from toontown.battle import BattleExperienceAI
 from toontown.chat import ResistanceChat
@@ -35,7 +36,8 @@ class DistributedCashbotBossAI(DistributedBossCogAI.DistributedBossCogAI, FSM.FS
         cn.addSolid(cs)
         cs = CollisionInvSphere(0, 0, 0, 42)
         cn.addSolid(cs)
-        self.attachNewNode(cn)
+        self.walls = self.attachNewNode(cn)
+        self.feelerField = None
         self.heldObject = None
         self.waitingForHelmet = 0
         self.avatarHelmets = {}
@@ -117,6 +119,7 @@ class DistributedCashbotBossAI(DistributedBossCogAI.DistributedBossCogAI, FSM.FS
             for safe in self.safes:
                 safe.request('Initial')
 
+        self.feelerField = None
         return
 
     def __deleteBattleThreeObjects(self):
@@ -138,6 +141,7 @@ class DistributedCashbotBossAI(DistributedBossCogAI.DistributedBossCogAI, FSM.FS
                 goon.requestDelete()
 
             self.goons = None
+        self.feelerField = None
         return
 
     def doNextAttack(self, task):
@@ -253,6 +257,11 @@ class DistributedCashbotBossAI(DistributedBossCogAI.DistributedBossCogAI, FSM.FS
                         else:
                             return self.maxGoons + 8
 
+    def getFeelerField(self):
+        if self.feelerField == None:
+            self.feelerField = CashbotBossFeelerField.CashbotBossFeelerField(self)
+        return self.feelerField
+
     def makeGoon(self, side=None):
         if side == None:
             side = random.choice(['EmergeA', 'EmergeB'])
@@ -15,8 +15,9 @@ class DistributedCashbotBossGoonAI(DistributedGoonAI.DistributedGoonAI, Distribu
     legLength = 10
     directionTable = [
      (0, 15), (10, 10), (-10, 10), (20, 8), (-20, 8), (40, 5), (-40, 5), (60, 4), (-60, 4), (80, 3), (-80, 3), (120, 2), (-120, 2), (180, 1)]
-    offMask = BitMask32(0)
-    onMask = CollisionNode.getDefaultCollideMask()
+    feelerStart = 1
+    feelerLength = legLength * 1.5
+    feelers = [(-math.sin(deg2Rad(heading)), math.cos(deg2Rad(heading))) for heading, weight in directionTable]
 
     def __init__(self, air, boss):
         DistributedGoonAI.DistributedGoonAI.__init__(self, air, 0)
@@ -26,24 +27,7 @@ class DistributedCashbotBossGoonAI(DistributedGoonAI.DistributedGoonAI, Distribu
         cn.addSolid(self.tube)
         self.tubeNode = cn
         self.tubeNodePath = self.attachNewNode(self.tubeNode)
-        self.feelers = []
-        cn = CollisionNode('feelerNode')
-        self.feelerLength = self.legLength * 1.5
-        feelerStart = 1
-        for heading, weight in self.directionTable:
-            rad = deg2Rad(heading)
-            x = -math.sin(rad)
-            y = math.cos(rad)
-            seg = CollisionSegment(x * feelerStart, y * feelerStart, 0, x * self.feelerLength, y * self.feelerLength, 0)
-            cn.addSolid(seg)
-            self.feelers.append(seg)
-
-        cn.setIntoCollideMask(self.offMask)
-        self.feelerNodePath = self.attachNewNode(cn)
         self.isWalking = 0
-        self.cTrav = CollisionTraverser('goon')
-        self.cQueue = CollisionHandlerQueue()
-        self.cTrav.addCollider(self.feelerNodePath, self.cQueue)
 
     def requestBattle(self, pauseTime):
         avId = self.air.getAvatarIdFromSender()
@@ -90,25 +74,16 @@ class DistributedCashbotBossGoonAI(DistributedGoonAI.DistributedGoonAI, Distribu
         return
 
     def __chooseDirection(self):
-        self.tubeNode.setIntoCollideMask(self.offMask)
-        self.cTrav.traverse(self.boss.scene)
-        self.tubeNode.setIntoCollideMask(self.onMask)
-        entries = {}
-        self.cQueue.sortEntries()
-        for i in range(self.cQueue.getNumEntries() - 1, -1, -1):
-            entry = self.cQueue.getEntry(i)
-            dist = Vec3(entry.getSurfacePoint(self)).length()
-            if dist < 1.2:
-                dist = 0
-            entries[entry.getFrom()] = dist
+        hits = self.boss.getFeelerField().feel(self, self.feelers, self.feelerStart, self.feelerLength)
+        for i in range(len(hits)):
+            if hits[i] < 1.2:
+                hits[i] = 0
 
         netScore = 0
         scoreTable = []
         for i in range(len(self.directionTable)):
             heading, weight = self.directionTable[i]
-            seg = self.feelers[i]
-            dist = entries.get(seg, self.feelerLength)
-            score = dist * weight
+            score = hits[i] * weight
             netScore += score
             scoreTable.append(score)
 
@@ -120,10 +95,8 @@ class DistributedCashbotBossGoonAI(DistributedGoonAI.DistributedGoonAI, Distribu
             s -= scoreTable[i]
             if s <= 0:
                 heading, weight = self.directionTable[i]
-                seg = self.feelers[i]
-                dist = entries.get(seg, self.feelerLength)
                 return (
-                 heading, dist)
+                 heading, hits[i])
 
         self.notify.warning('Fell off end of weighted table.')
         return (
@@ -216,11 +189,9 @@ class DistributedCashbotBossGoonAI(DistributedGoonAI.DistributedGoonAI, Distribu
 
     def enterOff(self):
         self.tubeNodePath.stash()
-        self.feelerNodePath.stash()
 
     def exitOff(self):
         self.tubeNodePath.unstash()
-        self.feelerNodePath.unstash()
 
     def enterGrabbed(self, avId, craneId):
         DistributedCashbotBossObjectAI.DistributedCashbotBossObjectAI.enterGrabbed(self, avId, craneId)
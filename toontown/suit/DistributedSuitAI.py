@@ -41,12 +41,18 @@ class DistributedSuitAI(DistributedSuitBaseAI.DistributedSuitBaseAI):
         self.takeoverIsCogdo = False
         self.buildingDestination = None
         self.buildingDestinationIsCogdo = False
+        self.moveTimer = None
         return
 
     def stopTasks(self):
         taskMgr.remove(self.taskName('flyAwayNow'))
         taskMgr.remove(self.taskName('danceNowFlyAwayLater'))
-        taskMgr.remove(self.taskName('move'))
+        self.stopPathNow()
+
+    def recycle(self):
+        self.stopTasks()
+        self.detachNode()
+        self.clearTransform()
 
     def pointInMyPath(self, point, elapsedTime):
         if self.pathState != 1:
@@ -204,6 +210,7 @@ class DistributedSuitAI(DistributedSuitBaseAI.DistributedSuitBaseAI):
         self.currentLeg = 0
         self.zoneId = ZoneUtil.getTrueZoneId(self.legList.getZoneId(0), self.branchId)
         self.legType = self.legList.getType(0)
+        self.sp.pathReservations.reserve(self)
         if self.notify.getDebug():
             self.notify.debug('creating suit in zone %d' % self.zoneId)
 
@@ -237,8 +244,8 @@ class DistributedSuitAI(DistributedSuitBaseAI.DistributedSuitBaseAI):
         if nextLeg < numLegs:
             nextTime = self.legList.getStartTime(nextLeg)
             delay = nextTime - elapsed
-            taskMgr.remove(self.taskName('move'))
-            taskMgr.doMethodLater(delay, self.moveToNextLeg, self.taskName('move'))
+            self.stopPathNow()
+            self.moveTimer = self.air.timerWheel.doMethodLater(delay, self.moveToNextLeg, 'suitMove', [None])
         else:
             if self.attemptingTakeover:
                 self.startTakeOver()
@@ -246,7 +253,9 @@ class DistributedSuitAI(DistributedSuitBaseAI.DistributedSuitBaseAI):
         return Task.done
 
     def stopPathNow(self):
-        taskMgr.remove(self.taskName('move'))
+        if self.moveTimer:
+            self.air.timerWheel.remove(self.moveTimer)
+            self.moveTimer = None
 
     def __enterZone(self, zoneId):
         if zoneId != self.zoneId:
@@ -285,7 +294,9 @@ class DistributedSuitAI(DistributedSuitBaseAI.DistributedSuitBaseAI):
         self.b_setPathState(0)
 
     def interruptMove(self):
-        SuitBase.SuitBase.interruptMove(self)
+        self.stopPathNow()
+        if self.sp:
+            self.sp.pathReservations.release(self)
 
     def checkBuildingState(self):
         blockNumber = self.buildingDestination
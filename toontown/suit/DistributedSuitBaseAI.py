@@ -45,7 +45,7 @@ class DistributedSuitBaseAI(DistributedAvatarAI.DistributedAvatarAI, SuitBase.Su
         else:
             self.level = SuitBattleGlobals.pickFromFreqList(attributes['freq'])
         self.notify.debug('Assigning level ' + str(lvl))
-        if hasattr(self, 'doId'):
+        if hasattr(self, 'doId') and not self.air.doPool.isPending(self):
             self.d_setLevelDist(self.level)
         hp = attributes['hp'][self.level]
         self.maxHP = hp
@@ -2,6 +2,7 @@ from panda3d.toontown import *
 from otp.ai.AIBaseGlobal import *
 from direct.distributed import DistributedObjectAI
 from . import SuitPlannerBase, DistributedSuitAI
+from .SuitPathReservations import SuitPathReservations
 from toontown.battle import BattleManagerAI
 from direct.task import Task
 from direct.directnotify import DirectNotifyGlobal
@@ -78,6 +79,8 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
         TOTAL_BWEIGHT_PER_HEIGHT[3] += weight * heights[3]
         TOTAL_BWEIGHT_PER_HEIGHT[4] += weight * heights[4]
 
+    WANT_PATH_RESERVATIONS = config.GetBool('want-suit-path-reservations', 1)
+    VERIFY_PATH_RESERVATIONS = config.GetBool('verify-suit-path-reservations', 0)
     defaultSuitName = simbase.config.GetString('suit-type', 'random')
     if defaultSuitName == 'random':
         defaultSuitName = None
@@ -121,6 +124,9 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
         self.pendingBuildingHeights = []
         self.pendingCogdoHeights = []
         self.suitList = []
+        self.pathReservations = SuitPathReservations()
+        self.numPathChecksVerified = 0
+        self.numPathChecksMismatched = 0
         self.numFlyInSuits = 0
         self.numBuildingSuits = 0
         self.numAttemptingTakeover = 0
@@ -166,6 +172,8 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
                 suit.requestDelete()
 
         self.suitList = []
+        self.air.doPool.deleteZone(self.zoneId)
+        self.pathReservations.clear()
         self.numFlyInSuits = 0
         self.numBuildingSuits = 0
         self.numAttemptingTakeover = 0
@@ -333,7 +341,7 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
 
         if startPoint == None:
             return
-        newSuit = DistributedSuitAI.DistributedSuitAI(simbase.air, self)
+        newSuit = self.air.doPool.acquire(DistributedSuitAI.DistributedSuitAI, self.zoneId, self)
         newSuit.startPoint = startPoint
         if blockNumber != None:
             newSuit.buildingSuit = 1
@@ -393,8 +401,11 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
         gotDestination = self.chooseDestination(newSuit, startTime, toonBlockTakeover=toonBlockTakeover, cogdoTakeover=cogdoTakeover, minPathLen=minPathLen, maxPathLen=maxPathLen)
         if not gotDestination:
             self.notify.debug("Couldn't get a destination in %d!" % self.zoneId)
-            newSuit.doNotDeallocateChannel = None
-            newSuit.delete()
+            if newSuit.isGenerated():
+                self.air.doPool.release(newSuit)
+            else:
+                newSuit.doNotDeallocateChannel = None
+                newSuit.delete()
             return
         newSuit.initializePath()
         self.zoneChange(newSuit, None, newSuit.zoneId)
@@ -402,7 +413,7 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
             newSuit.setSkelecog(skelecog)
         if revives:
             newSuit.setSkeleRevives(revives)
-        newSuit.generateWithRequired(newSuit.zoneId)
+        self.air.doPool.generate(newSuit, newSuit.zoneId)
         newSuit.moveToNextLeg(None)
         self.suitList.append(newSuit)
         if newSuit.flyInSuit:
@@ -521,9 +532,8 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
         return result
 
     def pointCollision(self, point, adjacentPoint, elapsedTime):
-        for suit in self.suitList:
-            if suit.pointInMyPath(point, elapsedTime):
-                return 1
+        if self.suitPathCollision(point, elapsedTime):
+            return 1
 
         if adjacentPoint != None:
             return self.battleCollision(point, adjacentPoint)
@@ -539,6 +549,29 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
 
         return 0
 
+    def suitPathCollision(self, point, elapsedTime):
+        if not self.WANT_PATH_RESERVATIONS:
+            return self.scanSuitPaths(point, elapsedTime)
+
+        then = globalClock.getFrameTime() + elapsedTime
+        collision = self.pathReservations.isPointReserved(point.getIndex(), then - self.PATH_COLLISION_BUFFER, then + self.PATH_COLLISION_BUFFER)
+        if self.VERIFY_PATH_RESERVATIONS:
+            expected = self.scanSuitPaths(point, elapsedTime)
+            self.numPathChecksVerified += 1
+            if bool(collision) != bool(expected):
+                self.numPathChecksMismatched += 1
+                self.notify.warning('Path reservation mismatch in zone %d for point %d at +%0.2f: index says %s, suits say %s (%d/%d mismatched).' % (self.zoneId, point.getIndex(), elapsedTime, collision, expected, self.numPathChecksMismatched, self.numPathChecksVerified))
+                collision = expected
+
+        return collision
+
+    def scanSuitPaths(self, point, elapsedTime):
+        for suit in self.suitList:
+            if suit.pointInMyPath(point, elapsedTime):
+                return 1
+
+        return 0
+
     def battleCollision(self, point, adjacentPoint):
         zoneName = self.dnaStore.getSuitEdgeZone(point.getIndex(), adjacentPoint.getIndex())
         zoneId = int(self.extractGroupName(zoneName))
@@ -546,6 +579,7 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
 
     def removeSuit(self, suit):
         self.zoneChange(suit, suit.zoneId)
+        self.pathReservations.release(suit)
         if self.suitList.count(suit) > 0:
             self.suitList.remove(suit)
             if suit.flyInSuit:
@@ -556,7 +590,7 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
                 self.numAttemptingTakeover -= 1
                 if suit.takeoverIsCogdo:
                     self.numAttemptingCogdoTakeover -= 1
-        suit.requestDelete()
+        self.air.doPool.release(suit)
 
     def countTakeovers(self):
         count = 0
@@ -1153,6 +1187,30 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
         return (
          level, type, track)
 
+    def benchmarkChooseDestination(self, numSuits, iterations):
+        streetPoints = self.streetPointList[:]
+        while len(self.suitList) < numSuits:
+            if not self.createNewSuit([], streetPoints):
+                break
+
+        suit = DistributedSuitAI.DistributedSuitAI(simbase.air, self)
+        suit.setupSuitDNA(*self.pickLevelTypeAndTrack())
+        startPoints = [random.choice(self.streetPointList) for i in range(iterations)]
+        results = []
+        for wantReservations in (0, 1):
+            self.WANT_PATH_RESERVATIONS = wantReservations
+            start = time.perf_counter()
+            for startPoint in startPoints:
+                suit.startPoint = startPoint
+                self.chooseDestination(suit, SuitTimings.fromSky)
+
+            results.append((time.perf_counter() - start) / iterations)
+
+        del self.WANT_PATH_RESERVATIONS
+        suit.doNotDeallocateChannel = None
+        suit.delete()
+        return 'Zone %d, %d suits: scan %0.1f us, reservations %0.1f us per chooseDestination.' % (self.zoneId, len(self.suitList), results[0] * 1000000.0, results[1] * 1000000.0)
+
     @classmethod
     def dump(cls):
         s = ''
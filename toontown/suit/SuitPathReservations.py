@@ -0,0 +1,80 @@
+from direct.directnotify import DirectNotifyGlobal
+
+
+class SuitPathReservations:
+    """
+    Spatio-temporal index of the suit points each active suit's path occupies.
+
+    When a suit's path is initialized, every leg of its SuitLegList reserves
+    both of its end points for the time window in which the suit is on that
+    leg.  A collision query for a point then only has to look at the suits
+    that pass through that point, instead of asking every suit on the street
+    to scan its own leg list.
+
+    The windows mirror SuitLegList.isPointInRange: a leg is considered
+    occupied from its own start time until the next leg starts, and the
+    first and last legs extend indefinitely before and after the path.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('SuitPathReservations')
+
+    def __init__(self):
+        # pointIndex -> list of (startTime, endTime, suit), in absolute frame time.
+        self.pointReservations = {}
+        # suit -> list of point indexes reserved by that suit
+        self.suitPoints = {}
+
+    def reserve(self, suit):
+        self.release(suit)
+        legList = suit.legList
+        numLegs = legList.getNumLegs()
+        pathStartTime = suit.pathStartTime
+        points = []
+        for i in range(numLegs):
+            leg = legList.getLeg(i)
+            if i == 0:
+                startTime = float('-inf')
+            else:
+                startTime = pathStartTime + legList.getStartTime(i)
+
+            if i == numLegs - 1:
+                endTime = float('inf')
+            else:
+                endTime = pathStartTime + legList.getStartTime(i + 1)
+
+            for pointIndex in (leg.getPointA(), leg.getPointB()):
+                self.pointReservations.setdefault(pointIndex, []).append((startTime, endTime, suit))
+                points.append(pointIndex)
+
+        self.suitPoints[suit] = points
+
+    def release(self, suit):
+        points = self.suitPoints.pop(suit, None)
+        if not points:
+            return
+
+        for pointIndex in set(points):
+            reservations = self.pointReservations.get(pointIndex)
+            if reservations is None:
+                continue
+
+            reservations[:] = [reservation for reservation in reservations if reservation[2] is not suit]
+            if not reservations:
+                del self.pointReservations[pointIndex]
+
+    def clear(self):
+        self.pointReservations = {}
+        self.suitPoints = {}
+
+    def isPointReserved(self, pointIndex, lowTime, highTime):
+        """
+        Returns true if any suit that is currently walking its path occupies
+        pointIndex at some point between lowTime and highTime.
+        """
+        for startTime, endTime, suit in self.pointReservations.get(pointIndex, ()):
+            if startTime <= highTime and endTime > lowTime and suit.pathState == 1:
+                return True
+
+        return False
+
+    def getNumReservations(self):
+        return sum(len(reservations) for reservations in self.pointReservations.values())
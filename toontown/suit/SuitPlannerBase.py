@@ -7,6 +7,7 @@ from toontown.hood import ZoneUtil
 from toontown.toonbase import ToontownGlobals
 from toontown.toonbase import ToontownBattleGlobals
 from toontown.hood import HoodUtil
+from toontown.hood.DNASceneIndex import getDNASceneIndex
 from toontown.building import SuitBuildingGlobals
 
 class SuitPlannerBase:
@@ -484,6 +485,7 @@ class SuitPlannerBase:
     def __init__(self):
         self.suitWalkSpeed = ToontownGlobals.SuitWalkSpeed
         self.dnaStore = None
+        self.dnaIndex = None
         self.pointIndexes = {}
         return
 
@@ -493,10 +495,12 @@ class SuitPlannerBase:
         self.dnaStore = DNAStorage()
         dnaFileName = self.genDNAFileName()
         try:
-            simbase.air.loadDNAFileAI(self.dnaStore, dnaFileName)
+            dnaData = simbase.air.loadDNAFileAI(self.dnaStore, dnaFileName)
         except:
-            loader.loadDNAFileAI(self.dnaStore, dnaFileName)
+            dnaData = loader.loadDNAFileAI(self.dnaStore, dnaFileName)
 
+        # On the AI the hood has usually indexed this file already.
+        self.dnaIndex = getDNASceneIndex(dnaFileName, dnaData, self.dnaStore)
         self.initDNAInfo()
         return None
 
@@ -529,32 +533,26 @@ class SuitPlannerBase:
             self.notify.info('zone %s has %s disconnected suit paths.' % (self.zoneId, numGraphs))
         self.battlePosDict = {}
         self.cellToGagBonusDict = {}
-        for i in range(self.dnaStore.getNumDNAVisGroupsAI()):
-            vg = self.dnaStore.getDNAVisGroupAI(i)
-            zoneId = int(self.extractGroupName(vg.getName()))
-            if vg.getNumBattleCells() == 1:
-                battleCell = vg.getBattleCell(0)
-                self.battlePosDict[zoneId] = vg.getBattleCell(0).getPos()
-            elif vg.getNumBattleCells() > 1:
+        for zoneName, battleCells, props in self.dnaIndex.getVisGroups():
+            zoneId = int(zoneName)
+            if len(battleCells) == 1:
+                self.battlePosDict[zoneId] = Point3(*battleCells[0])
+            elif len(battleCells) > 1:
                 self.notify.warning('multiple battle cells for zone: %d' % zoneId)
-                self.battlePosDict[zoneId] = vg.getBattleCell(0).getPos()
+                self.battlePosDict[zoneId] = Point3(*battleCells[0])
             if True:
-                for i in range(vg.getNumChildren()):
-                    childDnaGroup = vg.at(i)
-                    if isinstance(childDnaGroup, DNAInteractiveProp):
-                        self.notify.debug('got interactive prop %s' % childDnaGroup)
-                        battleCellId = childDnaGroup.getCellId()
-                        if battleCellId == -1:
-                            self.notify.warning('interactive prop %s  at %s not associated with a a battle' % (childDnaGroup, zoneId))
-                        elif battleCellId == 0:
-                            if zoneId in self.cellToGagBonusDict:
-                                self.notify.error('FIXME battle cell at zone %s has two props %s %s linked to it' % (zoneId, self.cellToGagBonusDict[zoneId], childDnaGroup))
-                            else:
-                                name = childDnaGroup.getName()
-                                propType = HoodUtil.calcPropType(name)
-                                if propType in ToontownBattleGlobals.PropTypeToTrackBonus:
-                                    trackBonus = ToontownBattleGlobals.PropTypeToTrackBonus[propType]
-                                    self.cellToGagBonusDict[zoneId] = trackBonus
+                for name, battleCellId in props:
+                    self.notify.debug('got interactive prop %s' % name)
+                    if battleCellId == -1:
+                        self.notify.warning('interactive prop %s  at %s not associated with a a battle' % (name, zoneId))
+                    elif battleCellId == 0:
+                        if zoneId in self.cellToGagBonusDict:
+                            self.notify.error('FIXME battle cell at zone %s has two props %s %s linked to it' % (zoneId, self.cellToGagBonusDict[zoneId], name))
+                        else:
+                            propType = HoodUtil.calcPropType(name)
+                            if propType in ToontownBattleGlobals.PropTypeToTrackBonus:
+                                trackBonus = ToontownBattleGlobals.PropTypeToTrackBonus[propType]
+                                self.cellToGagBonusDict[zoneId] = trackBonus
 
         self.dnaStore.resetDNAGroups()
         self.dnaStore.resetDNAVisGroups()
@@ -76,12 +76,15 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
         if simbase.wantPets:
             PetLookerAI.PetLookerAI.__init__(self)
         self.air = air
+        self.toonUpTimer = None
         self.dna = ToonDNA.ToonDNA()
         self.inventory = None
         self.fishCollection = None
         self.fishTank = None
         self.experience = None
         self.quests = []
+        self.questHistory = []
+        self.questHistorySet = None
         self.cogs = []
         self.cogCounts = []
         self.NPCFriendsDict = {}
@@ -1937,13 +1940,21 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
     def setQuestHistory(self, questList):
         self.notify.debug('setting quest history to %s' % questList)
         self.questHistory = questList
+        self.questHistorySet = None
 
     def getQuestHistory(self):
         return self.questHistory
 
+    def getQuestHistorySet(self):
+        # Quest choice tests every candidate quest against the history.
+        if self.questHistorySet is None:
+            self.questHistorySet = set(self.questHistory)
+        return self.questHistorySet
+
     def removeQuestFromHistory(self, questId):
         if questId in self.questHistory:
             self.questHistory.remove(questId)
+            self.questHistorySet = None
             self.d_setQuestHistory(self.questHistory)
             return 1
         else:
@@ -2545,7 +2556,9 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
         self.sendUpdate('setTrophyScore', [score])
 
     def stopToonUp(self):
-        taskMgr.remove(self.uniqueName('safeZoneToonUp'))
+        if self.toonUpTimer:
+            self.air.timerWheel.remove(self.toonUpTimer)
+            self.toonUpTimer = None
         self.ignore(self.air.getAvatarExitEvent(self.getDoId()))
 
     def startToonUp(self, healFrequency):
@@ -2554,11 +2567,10 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
         self.__waitForNextToonUp()
 
     def __waitForNextToonUp(self):
-        taskMgr.doMethodLater(self.healFrequency, self.toonUpTask, self.uniqueName('safeZoneToonUp'))
+        self.toonUpTimer = self.air.timerWheel.addRecurring(self.healFrequency, self.toonUpTask, 'toonUp', extraArgs=[None])
 
     def toonUpTask(self, task):
         self.toonUp(1)
-        self.__waitForNextToonUp()
         return Task.done
 
     def toonUp(self, hpGained, quietly = 0, sendTotal = 1):
@@ -1,13 +1,19 @@
+import itertools
+
 from panda3d.core import *
 from toontown.toonbase import ToontownGlobals
 from toontown.toonbase.ToontownBattleGlobals import *
 from direct.showbase import DirectObject
 from direct.directnotify import DirectNotifyGlobal
-from direct.distributed.PyDatagram import PyDatagram
-from direct.distributed.PyDatagramIterator import PyDatagramIterator
 
 class InventoryBase(DirectObject.DirectObject):
     notify = DirectNotifyGlobal.directNotify.newCategory('InventoryBase')
+    # The net string is one uint8 count per gag, track by track.  These are
+    # the (start, end) offsets of each track's counts in it.
+    _trackEnds = list(itertools.accumulate(len(Levels[track]) for track in range(0, len(Tracks))))
+    NetStringTracks = tuple(zip([0] + _trackEnds[:-1], _trackEnds))
+    NetStringSize = _trackEnds[-1]
+    del _trackEnds
 
     def __init__(self, toon, invStr = None):
         self._createStack = str(StackTrace().compact())
@@ -47,47 +53,22 @@ class InventoryBase(DirectObject.DirectObject):
 
     def makeNetString(self):
         dataList = self.inventory
-        datagram = PyDatagram()
-        for track in range(0, len(Tracks)):
-            for level in range(0, len(Levels[track])):
-                datagram.addUint8(dataList[track][level])
+        counts = []
+        for track, (start, end) in enumerate(self.NetStringTracks):
+            counts += dataList[track][:end - start]
 
-        dgi = PyDatagramIterator(datagram)
-        return dgi.getRemainingBytes()
+        return bytes(counts)
 
     def makeFromNetString(self, netString):
-        dataList = []
-        dg = PyDatagram(netString)
-        dgi = PyDatagramIterator(dg)
-        for track in range(0, len(Tracks)):
-            subList = []
-            for level in range(0, len(Levels[track])):
-                if dgi.getRemainingSize() > 0:
-                    value = dgi.getUint8()
-                else:
-                    value = 0
-                subList.append(value)
-
-            dataList.append(subList)
-
-        return dataList
+        # Missing counts are zero, as they were when a short string was read
+        # a byte at a time, and anything past the last gag is ignored.
+        netString = bytes(netString[:self.NetStringSize]).ljust(self.NetStringSize, b'\0')
+        return [list(netString[start:end]) for start, end in self.NetStringTracks]
 
     def makeFromNetStringForceSize(self, netString, numTracks, numLevels):
-        dataList = []
-        dg = PyDatagram(netString)
-        dgi = PyDatagramIterator(dg)
-        for track in range(0, numTracks):
-            subList = []
-            for level in range(0, numLevels):
-                if dgi.getRemainingSize() > 0:
-                    value = dgi.getUint8()
-                else:
-                    value = 0
-                subList.append(value)
-
-            dataList.append(subList)
-
-        return dataList
+        size = numTracks * numLevels
+        netString = bytes(netString[:size]).ljust(size, b'\0')
+        return [list(netString[start:start + numLevels]) for start in range(0, size, numLevels)]
 
     def addItem(self, track, level):
         return self.addItems(track, level, 1)
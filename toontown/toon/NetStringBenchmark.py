@@ -0,0 +1,142 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import random
+import time
+
+parser = argparse.ArgumentParser(description='Open Toontown - Inventory and ToonDNA net string benchmark')
+parser.add_argument('--iterations', type=int, default=100000, help='Number of times each codec is timed.')
+parser.add_argument('--checks', type=int, default=20000,
+                    help='Number of random inventories and DNAs checked against the datagram codecs.')
+parser.add_argument('--seed', type=int, default=0, help='Seed of the random inventories and DNAs.')
+args = parser.parse_args()
+
+
+class game:
+    name = 'toontown'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from direct.distributed.PyDatagram import PyDatagram
+from direct.distributed.PyDatagramIterator import PyDatagramIterator
+from toontown.toon import ToonDNA
+from toontown.toon.InventoryBase import InventoryBase
+from toontown.toonbase.ToontownBattleGlobals import CarryLimits, Levels, Tracks
+
+
+def makeInventoryDatagram(dataList):
+    """InventoryBase.makeNetString as it was, a byte at a time."""
+    datagram = PyDatagram()
+    for track in range(0, len(Tracks)):
+        for level in range(0, len(Levels[track])):
+            datagram.addUint8(dataList[track][level])
+
+    dgi = PyDatagramIterator(datagram)
+    return dgi.getRemainingBytes()
+
+
+def readInventoryDatagram(netString):
+    """InventoryBase.makeFromNetString as it was."""
+    dataList = []
+    dg = PyDatagram(netString)
+    dgi = PyDatagramIterator(dg)
+    for track in range(0, len(Tracks)):
+        subList = []
+        for level in range(0, len(Levels[track])):
+            if dgi.getRemainingSize() > 0:
+                value = dgi.getUint8()
+            else:
+                value = 0
+            subList.append(value)
+
+        dataList.append(subList)
+
+    return dataList
+
+
+def makeDNADatagram(dna):
+    """ToonDNA.makeNetString as it was, field by field."""
+    dg = PyDatagram()
+    dg.addFixedString(dna.type, 1)
+    for value in (ToonDNA.toonHeadTypes.index(dna.head), dna.eyelashes, ToonDNA.toonTorsoTypes.index(dna.torso),
+                  ToonDNA.toonLegTypes.index(dna.legs), dna.topTex, dna.topTexColor, dna.sleeveTex,
+                  dna.sleeveTexColor, dna.botTex, dna.botTexColor, dna.armColor, dna.gloveColor, dna.legColor,
+                  dna.headColor):
+        dg.addUint8(value)
+
+    return dg.getMessage()
+
+
+def readDNADatagram(string):
+    """ToonDNA.makeFromNetString as it was; returns the fields it set."""
+    dg = PyDatagram(string)
+    dgi = PyDatagramIterator(dg)
+    dnaType = dgi.getFixedString(1)
+    headIndex = dgi.getUint8()
+    eyelashes = dgi.getUint8()
+    torsoIndex = dgi.getUint8()
+    legsIndex = dgi.getUint8()
+    return (dnaType, ToonDNA.toonHeadTypes[headIndex], eyelashes, ToonDNA.toonTorsoTypes[torsoIndex],
+            ToonDNA.toonLegTypes[legsIndex]) + tuple(dgi.getUint8() for i in range(10))
+
+
+def dnaFields(dna):
+    return (dna.type, dna.head, dna.eyelashes, dna.torso, dna.legs, dna.topTex, dna.topTexColor, dna.sleeveTex,
+            dna.sleeveTexColor, dna.botTex, dna.botTexColor, dna.armColor, dna.gloveColor, dna.legColor,
+            dna.headColor)
+
+
+def check(name, expected, result):
+    if result != expected:
+        print('%s disagrees with the datagram codec: %r != %r' % (name, result, expected))
+        raise SystemExit(1)
+
+
+def timeCall(function, arg):
+    start = time.perf_counter()
+    for i in range(args.iterations):
+        function(arg)
+
+    return (time.perf_counter() - start) / args.iterations * 1000000.0
+
+
+rng = random.Random(args.seed)
+inventory = InventoryBase(None)
+dna = ToonDNA.ToonDNA()
+for i in range(args.checks):
+    dataList = [[rng.randrange(256) for level in Levels[track]] for track in range(len(Tracks))]
+    inventory.inventory = dataList
+    netString = inventory.makeNetString()
+    check('InventoryBase.makeNetString', makeInventoryDatagram(dataList), netString)
+    check('InventoryBase.makeFromNetString', dataList, inventory.makeFromNetString(netString))
+    # Short and long strings are padded with zeros and cut off.
+    cut = netString[:rng.randrange(len(netString) + 1)] + bytes(rng.randrange(3))
+    check('InventoryBase.makeFromNetString', readInventoryDatagram(cut), inventory.makeFromNetString(cut))
+
+    dna.newToonRandom(seed=rng.randrange(1, 1 << 30), eyelashes=rng.randrange(2))
+    netString = dna.makeNetString()
+    check('ToonDNA.makeNetString', makeDNADatagram(dna), netString)
+    expected = readDNADatagram(netString)
+    dna.makeFromNetString(netString)
+    check('ToonDNA.makeFromNetString', expected, dnaFields(dna))
+    check('ToonDNA.isValidNetString', True, dna.isValidNetString(netString))
+    check('ToonDNA.isValidNetString', False, dna.isValidNetString(netString[:-1]))
+
+print('%d random inventories and DNAs match the datagram codecs.' % args.checks)
+
+# Every gag at the carry limit of a maxed-out track.
+inventory.inventory = [list(CarryLimits[track][-1]) for track in range(len(Tracks))]
+inventoryString = inventory.makeNetString()
+dnaString = dna.makeNetString()
+print('%34s %12s %12s' % ('codec', 'datagram us', 'new us'))
+for name, old, new, arg in (
+        ('InventoryBase.makeNetString', makeInventoryDatagram, lambda dataList: inventory.makeNetString(),
+         inventory.inventory),
+        ('InventoryBase.makeFromNetString', readInventoryDatagram, inventory.makeFromNetString, inventoryString),
+        ('ToonDNA.makeNetString', makeDNADatagram, lambda dna: dna.makeNetString(), dna),
+        ('ToonDNA.makeFromNetString', readDNADatagram, dna.makeFromNetString, dnaString)):
+    print('%34s %12.2f %12.2f' % (name, timeCall(old, arg), timeCall(new, arg)))
@@ -4,8 +4,12 @@ from direct.directnotify.DirectNotifyGlobal import *
 import random
 from direct.distributed.PyDatagram import PyDatagram
 from direct.distributed.PyDatagramIterator import PyDatagramIterator
+import struct
 from otp.avatar import AvatarDNA
 notify = directNotify.newCategory('ToonDNA')
+# The type, then a uint8 for each of the head, eyelashes, torso, legs,
+# the six clothing textures and colors and the four body colors.
+ToonNetString = struct.Struct('c14B')
 toonSpeciesTypes = ['d',
  'c',
  'h',
@@ -1968,44 +1972,23 @@ class ToonDNA(AvatarDNA.AvatarDNA):
         return d
 
     def makeNetString(self):
-        dg = PyDatagram()
-        dg.addFixedString(self.type, 1)
         if self.type == 't':
-            headIndex = toonHeadTypes.index(self.head)
-            torsoIndex = toonTorsoTypes.index(self.torso)
-            legsIndex = toonLegTypes.index(self.legs)
-            dg.addUint8(headIndex)
-            dg.addUint8(self.eyelashes)
-            dg.addUint8(torsoIndex)
-            dg.addUint8(legsIndex)
-            dg.addUint8(self.topTex)
-            dg.addUint8(self.topTexColor)
-            dg.addUint8(self.sleeveTex)
-            dg.addUint8(self.sleeveTexColor)
-            dg.addUint8(self.botTex)
-            dg.addUint8(self.botTexColor)
-            dg.addUint8(self.armColor)
-            dg.addUint8(self.gloveColor)
-            dg.addUint8(self.legColor)
-            dg.addUint8(self.headColor)
+            return ToonNetString.pack(b't', toonHeadTypes.index(self.head), self.eyelashes,
+                                      toonTorsoTypes.index(self.torso), toonLegTypes.index(self.legs), self.topTex,
+                                      self.topTexColor, self.sleeveTex, self.sleeveTexColor, self.botTex,
+                                      self.botTexColor, self.armColor, self.gloveColor, self.legColor, self.headColor)
         elif self.type == 'u':
             notify.error('undefined avatar')
         else:
             notify.error('unknown avatar type: ', self.type)
-        return dg.getMessage()
 
     def isValidNetString(self, string):
-        dg = PyDatagram(string)
-        dgi = PyDatagramIterator(dg)
-        if dgi.getRemainingSize() != 15:
+        if len(string) != ToonNetString.size:
             return False
-        type = dgi.getFixedString(1)
-        if type not in ('t',):
+        type, headIndex, eyelashes, torsoIndex, legsIndex, topTex, topTexColor, sleeveTex, sleeveTexColor, botTex, \
+            botTexColor, armColor, gloveColor, legColor, headColor = ToonNetString.unpack(string)
+        if type not in (b't',):
             return False
-        headIndex = dgi.getUint8()
-        eyelashes = dgi.getUint8()
-        torsoIndex = dgi.getUint8()
-        legsIndex = dgi.getUint8()
         if headIndex >= len(toonHeadTypes):
             return False
         if eyelashes > 1 or eyelashes < 0:
@@ -2014,16 +1997,6 @@ class ToonDNA(AvatarDNA.AvatarDNA):
             return False
         if legsIndex >= len(toonLegTypes):
             return False
-        topTex = dgi.getUint8()
-        topTexColor = dgi.getUint8()
-        sleeveTex = dgi.getUint8()
-        sleeveTexColor = dgi.getUint8()
-        botTex = dgi.getUint8()
-        botTexColor = dgi.getUint8()
-        armColor = dgi.getUint8()
-        gloveColor = dgi.getUint8()
-        legColor = dgi.getUint8()
-        headColor = dgi.getUint8()
         if topTex >= len(Shirts):
             return False
         if topTexColor >= len(ClothesColors):
@@ -2047,6 +2020,17 @@ class ToonDNA(AvatarDNA.AvatarDNA):
         return True
 
     def makeFromNetString(self, string):
+        if string[:1] == b't' and len(string) >= ToonNetString.size:
+            type, headIndex, self.eyelashes, torsoIndex, legsIndex, self.topTex, self.topTexColor, self.sleeveTex, \
+                self.sleeveTexColor, self.botTex, self.botTexColor, self.armColor, self.gloveColor, self.legColor, \
+                self.headColor = ToonNetString.unpack_from(string)
+            self.type = 't'
+            self.head = toonHeadTypes[headIndex]
+            self.torso = toonTorsoTypes[torsoIndex]
+            self.legs = toonLegTypes[legsIndex]
+            return None
+
+        # Anything else gets the errors it always has.
         dg = PyDatagram(string)
         dgi = PyDatagramIterator(dg)
         self.type = dgi.getFixedString(1)
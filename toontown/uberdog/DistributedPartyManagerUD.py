@@ -5,8 +5,7 @@
 
 import time
 import math
-import json
-import os 
+import bisect
 from direct.distributed.DistributedObjectGlobalUD import DistributedObjectGlobalUD
 from direct.directnotify import DirectNotifyGlobal
 from direct.distributed.AsyncRequest import AsyncRequest
@@ -16,45 +15,78 @@ from toontown.toonbase import ToontownGlobals
 from toontown.parties import PartyGlobals
 from toontown.parties import PartyUtils
 from toontown.ai.ToontownAIMsgTypes import PARTY_MANAGER_UD_TO_ALL_AI
+from toontown.uberdog.JournaledStore import JournaledStore
 from datetime import timedelta  # Used for testing, to create random test party
 from datetime import datetime   # Used for testing, to create random test party
 
 class PartyDb:
     """
      PartyDB is the base class for all party database interface implementations.
+
+     Parties live in memory and are persisted through a JournaledStore, so
+     queries never touch the disk.  Secondary indexes by hostId and by
+     statusId (sorted on startTime) keep the per-query cost independent of
+     the total number of parties.
     """
     def __init__(self, partyManager):
         self.partyManager = partyManager
-        # setup partyToId dictionary
         self.partyDbFilePath = config.GetString('partydb-local-file', 'astron/databases/parties.json')
-        # Load the JSON file if it exists.
-        if os.path.exists(self.partyDbFilePath):
-            with open(self.partyDbFilePath, 'r') as file:
-                self.partyToId = json.load(file)
-        else:
-            # If not, create a blank file.
-            self.partyToId = {}
-            with open(self.partyDbFilePath, 'w') as file:
-                json.dump(self.partyToId, file)
-        
+        self.store = JournaledStore(self.partyDbFilePath,
+                                    compactThreshold=config.GetInt('partydb-compact-threshold', 1000),
+                                    compactPeriod=config.GetInt('partydb-compact-period', 300))
+        self.partyToId = self.store.records
+        self.buildIndexes()
+
+    def buildIndexes(self):
+        """Rebuild the secondary indexes from scratch."""
+        # hostId -> list of partyIds, in creation order
+        self.hostIdToPartyIds = {}
+        # statusId -> list of (startTime, partyId), kept sorted
+        self.statusToParties = {}
+        for partyId in sorted(self.partyToId):
+            self._indexParty(self.partyToId[partyId])
+
+    def _indexParty(self, party):
+        self.hostIdToPartyIds.setdefault(party['hostId'], []).append(party['partyId'])
+        bisect.insort(self.statusToParties.setdefault(party['statusId'], []),
+                      (party['startTime'], party['partyId']))
+
+    def _unindexStatus(self, party):
+        entries = self.statusToParties.get(party['statusId'])
+        if not entries:
+            return
+        key = (party['startTime'], party['partyId'])
+        index = bisect.bisect_left(entries, key)
+        if index < len(entries) and entries[index] == key:
+            del entries[index]
 
+    def _setStatus(self, party, newPartyStatus):
+        if party['statusId'] == newPartyStatus:
+            return
+        self._unindexStatus(party)
+        self.store.update(party['partyId'], statusId=newPartyStatus)
+        bisect.insort(self.statusToParties.setdefault(newPartyStatus, []),
+                      (party['startTime'], party['partyId']))
+
+    def _partiesWithStatus(self, statusId):
+        for startTime, partyId in self.statusToParties.get(statusId, ()):
+            yield self.partyToId[partyId]
 
     def save(self):
-        """Save the current state of the partyToId dictionary to the JSON file."""
-        with open(self.partyDbFilePath, 'w') as file:
-            json.dump(self.partyToId, file)
+        """Fold the journal into the snapshot on disk."""
+        self.store.compact()
 
     def load(self):
-        """Load the current state of the partyToId dictionary from the JSON file."""
-        with open(self.partyDbFilePath, 'r') as file:
-            self.partyToId = json.load(file)
+        """Reload the parties from disk."""
+        self.store.load()
+        self.partyToId = self.store.records
+        self.buildIndexes()
 
     def putParty(self, hostId, startTime, endTime, isPrivate, inviteTheme, activities, decorations, status):
         """
         Add a party to the database.
         """
-        self.load()
-        partyId = len(self.partyToId) + 1  # Generate a new party ID
+        partyId = self.store.allocateId()
         party = {
             'partyId': partyId,
             'hostId': hostId,
@@ -66,38 +98,54 @@ class PartyDb:
             'decorations': decorations,
             'statusId': status
         }
-        self.partyToId[partyId] = party
-        self.save()
+        self.store.put(partyId, party)
+        self._indexParty(party)
         return True
-    
 
     def getPartiesOfHost(self, hostId):
         """
         Get all parties of a host.
         """
-        self.load()
-        for party in self.partyToId.values():
-            if party['hostId'] == hostId:
-                yield party
-        
+        for partyId in self.hostIdToPartyIds.get(hostId, ()):
+            yield self.partyToId[partyId]
 
     def getPartiesOfHostThatCanStart(self, hostId):
         """
         Get all parties of a host that can start.
         """
-        self.load()
-        for party in self.partyToId.values():
-            if party['hostId'] == hostId and party['statusId'] == PartyGlobals.PartyStatus.Pending:
+        for party in self.getPartiesOfHost(hostId):
+            if party['statusId'] == PartyGlobals.PartyStatus.Pending:
                 yield party
 
     def getPartiesAvailableToStart(self, thresholdTime):
         """
         Get all parties that can start.
         """
-        self.load()
-        for party in self.partyToId.values():
-            if party['startTime'] <= thresholdTime and party['statusId'] == PartyGlobals.PartyStatus.Pending:
-                yield party
+        entries = self.statusToParties.get(PartyGlobals.PartyStatus.Pending, [])
+        # Everything up to and including thresholdTime, the partyId half of the
+        # key can never be larger than this sentinel.
+        end = bisect.bisect_right(entries, (thresholdTime, math.inf))
+        for startTime, partyId in entries[:end]:
+            yield self.partyToId[partyId]
+
+    def _filterPrioritized(self, parties, thresholdTime, limit, future, cancelled):
+        if cancelled:
+            wantedStatus = PartyGlobals.PartyStatus.Cancelled
+        elif future:
+            wantedStatus = PartyGlobals.PartyStatus.Pending
+        else:
+            wantedStatus = PartyGlobals.PartyStatus.Finished
+
+        count = 0
+        for party in parties:
+            if limit is not None and count >= limit:
+                return
+            if party is None or party['statusId'] != wantedStatus:
+                continue
+            if (party['startTime'] >= thresholdTime) != future:
+                continue
+            count += 1
+            yield party
 
     def getPrioritizedParties(self, partyIds, thresholdTime, limit, future, cancelled):
         """
@@ -111,26 +159,8 @@ class PartyDb:
 
         Returns a list of partyInfo dictionaries.
         """
-        self.load()
-        for partyId in partyIds:
-            party = self.partyToId[partyId]
-            if future:
-                if party['startTime'] >= thresholdTime:
-                    if not cancelled:
-                        if party['statusId'] == PartyGlobals.PartyStatus.Pending:
-                            yield party
-                    else:
-                        if party['statuId'] == PartyGlobals.PartyStatus.Cancelled:
-                            yield party
-            else:
-                if party['startTime'] < thresholdTime:
-                    if not cancelled:
-                        if party['statusId'] == PartyGlobals.PartyStatus.Finished:
-                            yield party
-                    else:
-                        if party['statusId'] == PartyGlobals.PartyStatus.Cancelled:
-                            yield party
-
+        return self._filterPrioritized((self.partyToId.get(partyId) for partyId in partyIds),
+                                       thresholdTime, limit, future, cancelled)
 
     def getHostPrioritizedParties(self, hostId, thresholdTime, limit, future, cancelled):
         """
@@ -144,148 +174,125 @@ class PartyDb:
 
         Returns a list of partyInfo dictionaries.
         """
-        self.load()
-        for party in self.partyToId.values():
-            if party['hostId'] == hostId:
-                if future:
-                    if party['startTime'] >= thresholdTime:
-                        if not cancelled:
-                            if party['statusId'] == PartyGlobals.PartyStatus.Pending:
-                                yield party
-                        else:
-                            if party['statusId'] == PartyGlobals.PartyStatus.Cancelled:
-                                yield party
-                else:
-                    if party['startTime'] < thresholdTime:
-                        if not cancelled:
-                            if party['statusId'] == PartyGlobals.PartyStatus.Finished:
-                                yield party
-                        else:
-                            if party['statusId'] == PartyGlobals.PartyStatus.Cancelled:
-                                yield party
-
+        return self._filterPrioritized(self.getPartiesOfHost(hostId), thresholdTime, limit, future, cancelled)
 
     def getParty(self, partyId):
         """
         Get a party by partyId.
         """
-        self.load()
         return self.partyToId.get(partyId, None)
-    
+
     def changePrivate(self, partyId, newPrivateStatus):
         """
         Change a party to public or private.
         """
-        self.load()
-        if partyId in self.partyToId.values():
-            self.partyToId[partyId]['isPrivate'] = newPrivateStatus
-            self.save()
-            return True
-        return False
+        return self.store.update(partyId, isPrivate=newPrivateStatus)
 
     def deleteParty(self, partyId):
         """
         Delete a party.
         """
-        self.load()
-        if partyId in self.partyToId.values():
-            del self.partyToId[partyId]
-            self.save()
-            return True
-        return False
-    
+        party = self.partyToId.get(partyId)
+        if party is None:
+            return False
+
+        self._unindexStatus(party)
+        self.hostIdToPartyIds[party['hostId']].remove(partyId)
+        return self.store.delete(partyId)
+
     def changePartyStatus(self, partyId, newPartyStatus):
         """
         Change the status of a party.
         """
-        self.load()
-        if partyId in self.partyToId.values():
-            self.partyToId[partyId]['statusId'] = newPartyStatus
-            self.save()
-            return True
-        return False
-    
+        party = self.partyToId.get(partyId)
+        if party is None:
+            return False
+
+        self._setStatus(party, newPartyStatus)
+        return True
+
     def forceFinishForStarted(self, thresholdTime):
         """
         Force finish all started parties.
         """
-        self.load()
-        for party in self.partyToId.values():
-            if party['endTime'] < thresholdTime and party['statusId'] == PartyGlobals.PartyStatus.Started:
-                party['statusId'] = PartyGlobals.PartyStatus.Finished
-        self.save()
+        for party in tuple(self._partiesWithStatus(PartyGlobals.PartyStatus.Started)):
+            if party['endTime'] < thresholdTime:
+                self._setStatus(party, PartyGlobals.PartyStatus.Finished)
 
     def forceNeverStartedForCanStart(self, thresholdTime):
         """
         Force never started all parties that can start.
         """
-        self.load()
-        for party in self.partyToId.values():
-            if party['endTime'] < thresholdTime and party['statusId'] == PartyGlobals.PartyStatus.Pending:
-                party['statusId'] = PartyGlobals.PartyStatus.NeverStarted
-        self.save()
+        # A party can't end before it starts, so only pending parties that
+        # started before the threshold need their endTime checked.
+        for party in tuple(self.getPartiesAvailableToStart(thresholdTime)):
+            if party['endTime'] < thresholdTime:
+                self._setStatus(party, PartyGlobals.PartyStatus.NeverStarted)
 
     def getMultipleParties(self, partyIds):
         """
         Get multiple parties by partyId.
         """
-        self.load()
         for partyId in partyIds:
             yield self.partyToId.get(partyId, None)
-            
+
     def changeMultiplePartiesStatus(self, partyIds, newPartyStatus):
         """
         Change the status of multiple parties.
         """
-        self.load()
         for partyId in partyIds:
-            if partyId in self.partyToId.values():
-                self.partyToId[partyId]['statusId'] = newPartyStatus
-        self.save()
+            self.changePartyStatus(partyId, newPartyStatus)
 
 class InviteDB():
     """
     InviteDB is the base class for all invite database interface implementations.
+
+    Like PartyDb, invites are kept in memory behind a JournaledStore and
+    indexed by inviteeId and by partyId.
     """
     def __init__(self, partyManager):
-        self.partyMsanager = partyManager
+        self.partyManager = partyManager
         self.inviteDbFilePath = config.GetString('invitedb-local-file', 'astron/databases/invites.json')
-        # Load the JSON file if it exists.
-        if os.path.exists(self.inviteDbFilePath):
-            with open(self.inviteDbFilePath, 'r') as file:
-                self.inviteToId = json.load(file)
-        else:
-            # If not, create a blank file.
-            self.inviteToId = {}
-            with open(self.inviteDbFilePath, 'w') as file:
-                json.dump(self.inviteToId, file)
+        self.store = JournaledStore(self.inviteDbFilePath,
+                                    compactThreshold=config.GetInt('invitedb-compact-threshold', 1000),
+                                    compactPeriod=config.GetInt('invitedb-compact-period', 300))
+        self.inviteToId = self.store.records
+        self.buildIndexes()
+
+    def buildIndexes(self):
+        """Rebuild the secondary indexes from scratch."""
+        self.inviteeIdToInviteKeys = {}
+        self.partyIdToInviteKeys = {}
+        for inviteKey in sorted(self.inviteToId):
+            self._indexInvite(self.inviteToId[inviteKey])
+
+    def _indexInvite(self, invite):
+        self.inviteeIdToInviteKeys.setdefault(invite['inviteeId'], []).append(invite['inviteKey'])
+        self.partyIdToInviteKeys.setdefault(invite['partyId'], []).append(invite['inviteKey'])
 
     def save(self):
-        """Save the current state of the inviteToId dictionary to the JSON file."""
-        with open(self.inviteDbFilePath, 'w') as file:
-            json.dump(self.inviteToId, file)
-                      
+        """Fold the journal into the snapshot on disk."""
+        self.store.compact()
+
     def putInvite(self, partyId, inviteeId):
         """
         Add an invite to the database.
         """
-        inviteKey = len(self.inviteToId) + 1
+        inviteKey = self.store.allocateId()
         invite = {
             'inviteKey': inviteKey,
             'partyId': partyId,
             'inviteeId': inviteeId,
             'statusId': PartyGlobals.InviteStatus.NotRead
         }
-        self.inviteToId[inviteKey] = invite
-        self.save()
+        self.store.put(inviteKey, invite)
+        self._indexInvite(invite)
 
     def getInvites(self, avatarId):
         """
         Get all invites for an avatar.
         """
-        for invite in self.inviteToId:
-            if invite['inviteeId'] == avatarId:
-                yield invite
+        return tuple(self.inviteToId[inviteKey] for inviteKey in self.inviteeIdToInviteKeys.get(avatarId, ()))
 
     def getOneInvite(self, inviteKey):
         """
@@ -297,37 +304,31 @@ class InviteDB():
         """
         Update the status of an invite.
         """
-        if inviteKey in self.inviteToId:
-            self.inviteToId[inviteKey]['statusId'] = newStatus
-            self.save()
-            return True
-        return False
+        return self.store.update(inviteKey, statusId=newStatus)
 
     def getReplies(self, partyId):
         """
         Get all replies for a party.
         """
-        for invite in self.inviteToId:
-            if invite['partyId'] == partyId:
-                yield invite
+        return tuple(self.inviteToId[inviteKey] for inviteKey in self.partyIdToInviteKeys.get(partyId, ()))
 
     def deleteInvite(self, inviteKey):
         """
         Delete an invite.
         """
-        if inviteKey in self.inviteToId:
-            del self.inviteToId[inviteKey]
-            self.save()
-            return True
-        return False
+        invite = self.inviteToId.get(inviteKey)
+        if invite is None:
+            return False
+
+        self.inviteeIdToInviteKeys[invite['inviteeId']].remove(inviteKey)
+        self.partyIdToInviteKeys[invite['partyId']].remove(inviteKey)
+        return self.store.delete(inviteKey)
 
     def getInviteesOfParty(self, partyId):
         """
         Get all invitees of a party.
         """
-        for invite in self.inviteToId:
-            if invite['partyId'] == partyId:
-                yield invite
+        return self.getReplies(partyId)
 
 class DistributedPartyManagerUD(DistributedObjectGlobalUD):
     """UD side class for the party manager."""
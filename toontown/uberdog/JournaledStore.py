@@ -0,0 +1,168 @@
+import json
+import os
+
+from direct.directnotify import DirectNotifyGlobal
+from direct.task import Task
+
+
+class JournaledStore:
+    """
+    An in-memory record store persisted through an append-only journal.
+
+    Records are dictionaries keyed by an integer id.  Every mutation is
+    appended to <filePath>.journal as a single JSON line, so a write costs one
+    small append instead of rewriting the whole database.  Periodically (and
+    whenever the journal grows past compactThreshold entries, or past the
+    number of records if that is larger) the journal is folded back into the
+    snapshot at filePath and truncated.  Since a compaction rewrites every
+    record, scaling its threshold with the records keeps bulk growth linear.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('JournaledStore')
+
+    def __init__(self, filePath, compactThreshold=1000, compactPeriod=300):
+        self.filePath = filePath
+        self.journalPath = filePath + '.journal'
+        self.compactThreshold = compactThreshold
+        self.compactPeriod = compactPeriod
+        self.records = {}
+        self.nextId = 1
+        self.journalLength = 0
+        self.numCompactions = 0
+        self.journal = None
+        self.taskName = 'JournaledStore-compact-%s' % filePath
+        self.load()
+        if self.compactPeriod:
+            taskMgr.doMethodLater(self.compactPeriod, self.__compactTask, self.taskName)
+
+    def load(self):
+        """Rebuild the in-memory records from the snapshot and the journal."""
+        self.closeJournal()
+        self.records = {}
+        if os.path.exists(self.filePath):
+            with open(self.filePath, 'r') as file:
+                snapshot = json.load(file)
+
+            # JSON object keys are always strings, our ids are not.
+            for recordId, record in snapshot.items():
+                self.records[int(recordId)] = record
+
+        replayed = 0
+        if os.path.exists(self.journalPath):
+            with open(self.journalPath, 'r') as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Only the last entry can be torn by a crash mid-write,
+                        # everything before it is still good.
+                        self.notify.warning('Ignoring torn journal entry in %s.' % self.journalPath)
+                        break
+
+                    self.__apply(entry)
+                    replayed += 1
+
+        if self.records:
+            self.nextId = max(self.records) + 1
+        else:
+            self.nextId = 1
+
+        self.journalLength = 0
+        if replayed or not os.path.exists(self.filePath):
+            # Fold what we replayed into a fresh snapshot right away.
+            self.compact()
+        else:
+            self.openJournal()
+
+    def openJournal(self):
+        if self.journal is None:
+            self.journal = open(self.journalPath, 'a')
+
+    def closeJournal(self):
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+
+    def __apply(self, entry):
+        op = entry['op']
+        recordId = entry['id']
+        if op == 'put':
+            self.records[recordId] = entry['record']
+        elif op == 'update':
+            record = self.records.get(recordId)
+            if record is not None:
+                record.update(entry['fields'])
+        elif op == 'delete':
+            self.records.pop(recordId, None)
+        else:
+            self.notify.warning('Unknown journal op %s in %s.' % (op, self.journalPath))
+
+    def __append(self, entry):
+        self.openJournal()
+        self.journal.write(json.dumps(entry, separators=(',', ':')) + '\n')
+        self.journal.flush()
+        self.journalLength += 1
+        if self.compactThreshold and self.journalLength >= max(self.compactThreshold, len(self.records)):
+            self.compact()
+
+    def allocateId(self):
+        recordId = self.nextId
+        self.nextId += 1
+        return recordId
+
+    def get(self, recordId):
+        return self.records.get(recordId)
+
+    def put(self, recordId, record):
+        self.records[recordId] = record
+        self.nextId = max(self.nextId, recordId + 1)
+        self.__append({'op': 'put', 'id': recordId, 'record': record})
+
+    def update(self, recordId, **fields):
+        record = self.records.get(recordId)
+        if record is None:
+            return False
+
+        record.update(fields)
+        self.__append({'op': 'update', 'id': recordId, 'fields': fields})
+        return True
+
+    def delete(self, recordId):
+        if recordId not in self.records:
+            return False
+
+        del self.records[recordId]
+        self.__append({'op': 'delete', 'id': recordId})
+        return True
+
+    def compact(self):
+        """Write a fresh snapshot and truncate the journal."""
+        self.closeJournal()
+        tempPath = self.filePath + '.tmp'
+        with open(tempPath, 'w') as file:
+            json.dump(self.records, file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        # os.replace is atomic, so a crash leaves either the old snapshot plus
+        # its journal or the new snapshot; replaying the old journal over the
+        # new snapshot is harmless since every entry is idempotent.
+        os.replace(tempPath, self.filePath)
+        self.journal = open(self.journalPath, 'w')
+        self.journalLength = 0
+        self.numCompactions += 1
+
+    def __compactTask(self, task):
+        if self.journalLength:
+            self.compact()
+
+        return Task.again
+
+    def close(self):
+        taskMgr.remove(self.taskName)
+        if self.journalLength:
+            self.compact()
+
+        self.closeJournal()
@@ -0,0 +1,81 @@
+from panda3d.core import *
+import builtins
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+parser = argparse.ArgumentParser(description='Open Toontown - Party database benchmark')
+parser.add_argument('--sizes', default='1000,10000,50000',
+                    help='Comma separated party counts to benchmark.')
+parser.add_argument('--queries', type=int, default=2000, help='Number of queries timed per party count.')
+parser.add_argument('--invites-per-party', type=int, default=5)
+args = parser.parse_args()
+
+tempDir = tempfile.mkdtemp(prefix='partydb-bench-')
+loadPrcFileData('Party DB Benchmark', 'partydb-compact-period 0\n'
+                                      'invitedb-compact-period 0\n')
+
+
+class game:
+    name = 'uberDog'
+    process = 'server'
+
+
+builtins.game = game
+
+from otp.ai.AIBaseGlobal import *
+from toontown.parties import PartyGlobals
+from toontown.uberdog.DistributedPartyManagerUD import PartyDb, InviteDB
+
+
+def makeDbs(numParties):
+    loadPrcFileData('Party DB Benchmark Files',
+                    'partydb-local-file %s\n' % os.path.join(tempDir, 'parties-%d.json' % numParties) +
+                    'invitedb-local-file %s\n' % os.path.join(tempDir, 'invites-%d.json' % numParties))
+    partyDb = PartyDb(None)
+    inviteDb = InviteDB(None)
+    numHosts = max(1, numParties // 3)
+    for i in range(numParties):
+        day = 1 + (i % 28)
+        startTime = '2030-%02d-%02d %02d:00:00' % (1 + (i % 12), day, i % 24)
+        endTime = '2030-%02d-%02d %02d:30:00' % (1 + (i % 12), day, i % 24)
+        partyDb.putParty(100000000 + (i % numHosts), startTime, endTime, False, 0, [], [],
+                         PartyGlobals.PartyStatus.Pending)
+        for j in range(args.invites_per_party):
+            inviteDb.putInvite(i + 1, 200000000 + random.randrange(numHosts))
+
+    return partyDb, inviteDb, numHosts
+
+
+def timeQueries(partyDb, inviteDb, numHosts):
+    hostIds = [100000000 + random.randrange(numHosts) for i in range(args.queries)]
+    inviteeIds = [200000000 + random.randrange(numHosts) for i in range(args.queries)]
+    start = time.perf_counter()
+    for hostId, inviteeId in zip(hostIds, inviteeIds):
+        tuple(partyDb.getHostPrioritizedParties(hostId, '2030-06-01 00:00:00', 10, True, False))
+        invites = inviteDb.getInvites(inviteeId)
+        tuple(partyDb.getPrioritizedParties([invite['partyId'] for invite in invites],
+                                            '2030-06-01 00:00:00', 10, True, False))
+    queryTime = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for hostId in hostIds:
+        partyDb.changePrivate(partyDb.hostIdToPartyIds[hostId][0], True)
+    writeTime = time.perf_counter() - start
+    return queryTime, writeTime
+
+
+print('%10s %10s %12s %16s %16s' % ('parties', 'setup s', 'compactions', 'us/login query', 'us/write'))
+for size in [int(x) for x in args.sizes.split(',')]:
+    start = time.perf_counter()
+    partyDb, inviteDb, numHosts = makeDbs(size)
+    setupTime = time.perf_counter() - start
+    queryTime, writeTime = timeQueries(partyDb, inviteDb, numHosts)
+    print('%10d %10.2f %12d %16.2f %16.2f' % (size, setupTime,
+                                             partyDb.store.numCompactions + inviteDb.store.numCompactions,
+                                             queryTime / args.queries * 1e6, writeTime / args.queries * 1e6))
+    partyDb.store.close()
+    inviteDb.store.close()
@@ -5,6 +5,9 @@ cd..
 rem Read the contents of PPYTHON_PATH into %PPYTHON_PATH%:
 set /P PPYTHON_PATH=<PPYTHON_PATH
 
+rem Compile the quest tables, if Quests.py changed since they last were:
+%PPYTHON_PATH% -m toontown.quest.QuestTableCache
+
 :main
 %PPYTHON_PATH% -m toontown.ai.AIStart --base-channel 401000000 ^
                --max-channels 999999 --stateserver 4002 ^
@@ -0,0 +1,10 @@
+@echo off
+title Open Toontown - Astron Stand-in
+cd..
+
+rem Read the contents of PPYTHON_PATH into %PPYTHON_PATH%:
+set /P PPYTHON_PATH=<PPYTHON_PATH
+
+%PPYTHON_PATH% -m otp.astron.AstronStart --messagedirector-ip 127.0.0.1:7199 ^
+               --clientagent-ip 0.0.0.0:7198
+pause
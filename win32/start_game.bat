@@ -5,6 +5,9 @@ cd..
 rem Read the contents of PPYTHON_PATH into %PPYTHON_PATH%:
 set /P PPYTHON_PATH=<PPYTHON_PATH
 
+rem Compile the quest tables, if Quests.py changed since they last were:
+%PPYTHON_PATH% -m toontown.quest.QuestTableCache
+
 set LOGIN_TOKEN=dev
 
 %PPYTHON_PATH% -m toontown.launcher.QuickStartLauncher
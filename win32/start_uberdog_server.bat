@@ -5,6 +5,9 @@ cd..
 rem Read the contents of PPYTHON_PATH into %PPYTHON_PATH%:
 set /P PPYTHON_PATH=<PPYTHON_PATH
 
+rem Compile the quest tables, if Quests.py changed since they last were:
+%PPYTHON_PATH% -m toontown.quest.QuestTableCache
+
 %PPYTHON_PATH% -m toontown.uberdog.UDStart --base-channel 1000000 ^
                --max-channels 999999 --stateserver 4002 ^
                --messagedirector-ip 127.0.0.1:7199 ^